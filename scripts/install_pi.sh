@@ -117,6 +117,14 @@ create_symlink "$PROMPTS_LINK" "$PROMPTS_SRC"
 create_symlink "$SKILLS_LINK" "$SKILLS_SRC"
 create_symlink "$AGENTS_LINK" "$AGENTS_SRC"
 
+# Pre-compile the skill scripts so CLI invocations (e.g.
+# `python3 -m skill.implement.scripts.implement`) start from cached bytecode.
+if command -v python3 >/dev/null 2>&1; then
+  python3 -m compileall -q "$SKILLS_SRC" >/dev/null 2>&1 \
+    && echo "Pre-compiled skill scripts in $SKILLS_SRC" \
+    || echo "Warning: could not pre-compile skill scripts (continuing)" >&2
+fi
+
 # --- Pi global config installation / export --------------------------------
 # Repo-side pi config directory (relative to repo root)
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
@@ -62,9 +62,7 @@ import subprocess
 import sys
 import threading
 import time
-import urllib.request
 from collections.abc import Callable, Sequence
-from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -84,6 +82,7 @@ from skill.shared.process_semaphore import (
     ENV_MAX_WORKERS,
     Semaphore,
 )
+from skill.shared import worktree_registry
 from skill.shared.status_lifecycle import (
     SIBLING_SCAN_ROOT as SHARED_SIBLING_SCAN_ROOT,
 )
@@ -425,6 +424,7 @@ _SCANNING_BLOCK = (
     "- Worklog lookups: `wl search <keywords> --json` or `wl list <term> --json` for substring matching, `scan.py find-workitem <id>` for exact match (never `grep -r` over .worklog/).\n"
     "- Code search: `python3 skill/audit/scripts/scan.py search-code <pattern> --path <dir> --type py` (bounded rg with prunes).\n"
     "- File listing: `python3 skill/audit/scripts/scan.py list-files --path <dir> --type py`.\n"
+    "- Files related to a topic: `python3 skill/audit/scripts/scan.py related-files <term>... --path <dir>` (indexed, milliseconds).\n"
     "- NEVER run unbounded recursive grep over the repo root or .worklog/ (e.g. `grep -r ... .` or `grep -r ... .worklog/`).\n\n"
 )
 """Canonical bounded-scanning guidance injected into every audit prompt.
@@ -742,7 +742,7 @@ def _cwd_aware_runner(git_root: Path,
     (SA-0MSLLGDW00098UCC).
     """
     base = base_runner if base_runner is not None else _default_runner
-    launch_root = TARGET_PROJECT_ROOT.resolve()
+    launch_root = _target_project_root().resolve()
     git_root = git_root.resolve()
     if git_root == launch_root:
         return base
@@ -859,15 +859,32 @@ def _detect_project_root() -> Path:
         return Path.cwd()
 
 
-TARGET_PROJECT_ROOT: Path = _detect_project_root()
+TARGET_PROJECT_ROOT: Path
 """Project root targeted by the audit runner.
 
-Defaults to the git root (or ``Path.cwd()`` as fallback) at import time.
-This may differ from ``REPO_ROOT`` when the audit runner's framework
-repository is not the working directory.
+The git root (or ``Path.cwd()`` as fallback), detected on first use rather
+than at import time so that importing the module — and ``--help`` — never
+spawns git. Read it through ``_target_project_root()`` inside this module;
+``audit_runner.TARGET_PROJECT_ROOT`` (and ``mock.patch.object`` on it) still
+works via the module ``__getattr__``. This may differ from ``REPO_ROOT``
+when the audit runner's framework repository is not the working directory.
 """
 
 
+def _target_project_root() -> Path:
+    """Return ``TARGET_PROJECT_ROOT``, detecting and caching it on first use."""
+    root = globals().get("TARGET_PROJECT_ROOT")
+    if root is None:
+        root = globals()["TARGET_PROJECT_ROOT"] = _detect_project_root()
+    return root
+
+
+def __getattr__(name: str) -> Path:
+    if name == "TARGET_PROJECT_ROOT":
+        return _target_project_root()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 SIBLING_SCAN_ROOT: Path = SHARED_SIBLING_SCAN_ROOT
 """Compatibility alias for the shared prefix-to-sibling scan root.
 
@@ -929,25 +946,14 @@ def _resolve_owning_project_root(issue_id: str,
 def _same_git_repository(root_a: Path, root_b: Path) -> bool:
     """True when *root_a* and *root_b* are checkouts of the same git repo.
 
-    Compares resolved ``git rev-parse --git-common-dir`` outputs so a
-    worktree of the owning project (e.g. ``<owning>/.worklog/worktrees/``)
-    counts as the owning project. Returns False on any git failure — callers
-    fall back to direct path comparison.
+    Compares the git common directories (resolved from the ``.git`` files by
+    ``worktree_registry.git_common_dir``, which only falls back to ``git
+    rev-parse``) so a worktree of the owning project (e.g.
+    ``<owning>/.worklog/worktrees/``) counts as the owning project. Returns
+    False when either is not a git checkout — callers fall back to direct
+    path comparison.
     """
-    try:
-        def _common_dir(root: Path) -> str | None:
-            proc = subprocess.run(
-                ["git", "-C", str(root), "rev-parse", "--git-common-dir"],
-                capture_output=True, text=True, check=False, timeout=30,
-            )
-            if proc.returncode != 0 or not proc.stdout.strip():
-                return None
-            return str((root / proc.stdout.strip()).resolve())
-        a = _common_dir(root_a)
-        b = _common_dir(root_b)
-        return a is not None and a == b
-    except (OSError, subprocess.SubprocessError):
-        return False
+    return worktree_registry.same_repository(root_a, root_b)
 
 
 def _verify_launch_context(issue_id: str,
@@ -968,7 +974,7 @@ def _verify_launch_context(issue_id: str,
     owning_root = _resolve_owning_project_root(issue_id, worklog_dir=worklog_dir)
     if owning_root is None:
         return None
-    launch_root = TARGET_PROJECT_ROOT.resolve()
+    launch_root = _target_project_root().resolve()
     if launch_root == owning_root.resolve():
         return None
     if _same_git_repository(launch_root, owning_root):
@@ -1736,7 +1742,7 @@ def _classify_full_suite_cache(
     if head_sha is None:
         return _FULL_SUITE_CACHE_ERROR, None, []
 
-    project_root = Path(cwd or TARGET_PROJECT_ROOT).resolve()
+    project_root = Path(cwd or _target_project_root()).resolve()
     if commands is None:
         commands = full_suite_commands(project_root)
     if not commands:
@@ -1806,7 +1812,7 @@ def _auto_green_run_outcome(
             return None, None, status
         if head_sha is None:
             return None, None, status
-        commands = full_suite_commands(Path(cwd or TARGET_PROJECT_ROOT).resolve())
+        commands = full_suite_commands(Path(cwd or _target_project_root()).resolve())
         print(
             "Automatic full-suite verification unavailable: "
             f"{len(problems)} of {len(commands)} suite command(s) not "
@@ -1884,8 +1890,8 @@ def _run_tests_via_test_skill(
     audits auto-verify read-only).
 
     Failures are triaged per the test skill, never silently ignored: each
-    structured failure record is passed to the triage helper
-    (``check_or_create``), which links/creates a critical ``test-failure``
+    structured failure record is passed to the triage helper in one batch
+    (``check_or_create_batch``), which links/creates a critical ``test-failure``
     work item for the failing test (as a child of *parent_work_item_id* when
     provided). A triage helper failure is recorded but never crashes the run.
 
@@ -1898,7 +1904,7 @@ def _run_tests_via_test_skill(
       triaged   — triage helper results per failure
       notice    — error string when the suite could not be executed at all
     """
-    project_root = Path(cwd or TARGET_PROJECT_ROOT).resolve()
+    project_root = Path(cwd or _target_project_root()).resolve()
     # The extension file's timeoutPerCommand (F2 AC1) overrides the default
     # per-command timeout — single source of truth via run_tests.py.
     timeout = suite_timeout_per_command(project_root) or timeout
@@ -1953,32 +1959,36 @@ def _run_tests_via_test_skill(
     success = bool(results) and not notice and not failures
 
     # Triage failures per the test skill (AC4) — never silently ignored.
+    # One batch call: the candidate listing is fetched once for the run and
+    # failures matching the same issue share one evidence comment.
     if failures:
         try:
-            from skill.triage.scripts.check_or_create import check_or_create
+            from skill.triage.scripts.check_or_create import check_or_create_batch
         except ImportError:
-            check_or_create = None
-        for failure in failures:
-            if check_or_create is None:
-                triaged.append({
-                    "test_name": failure.get("test_name", ""),
-                    "error": "triage helper unavailable",
-                })
-                continue
+            check_or_create_batch = None
+        if check_or_create_batch is None:
+            triaged = [
+                {"test_name": f.get("test_name", ""), "error": "triage helper unavailable"}
+                for f in failures
+            ]
+        else:
             try:
-                triaged.append(check_or_create({
-                    "test_name": failure.get("test_name", ""),
-                    "stdout_excerpt": failure.get("stdout_excerpt", ""),
-                    "stack_trace": failure.get("stack_trace", ""),
-                    "repo_path": str(project_root),
-                    "parent_work_item_id": parent_work_item_id,
-                    "commit_hash": head_sha,
-                }))
+                triaged = check_or_create_batch([
+                    {
+                        "test_name": failure.get("test_name", ""),
+                        "stdout_excerpt": failure.get("stdout_excerpt", ""),
+                        "stack_trace": failure.get("stack_trace", ""),
+                        "repo_path": str(project_root),
+                        "parent_work_item_id": parent_work_item_id,
+                        "commit_hash": head_sha,
+                    }
+                    for failure in failures
+                ])
             except Exception as exc:  # noqa: BLE001 -- triage must never crash the audit
-                triaged.append({
-                    "test_name": failure.get("test_name", ""),
-                    "error": str(exc),
-                })
+                triaged = [
+                    {"test_name": f.get("test_name", ""), "error": str(exc)}
+                    for f in failures
+                ]
 
     print(
         f"Test skill run completed: success={success} commands={len(results)} "
@@ -2107,6 +2117,8 @@ def _query_slot_status(url: str | None = None,
     """
     target = url or os.environ.get(AUDIT_SLOT_STATUS_URL_ENV, AUDIT_SLOT_STATUS_URL_DEFAULT)
     try:
+        import urllib.request  # deferred: ~50 ms of http/email/ssl imports
+
         with urllib.request.urlopen(target, timeout=timeout) as resp:
             data = json.loads(resp.read().decode("utf-8"))
         available = data.get("available_slots")
@@ -2139,6 +2151,8 @@ def _query_proxy_mode(base_url: str | None = None,
     )
     endpoint = target.rstrip("/") + "/admin/mode"
     try:
+        import urllib.request  # deferred: ~50 ms of http/email/ssl imports
+
         with urllib.request.urlopen(endpoint, timeout=timeout) as resp:
             if resp.status != 200:
                 return None
@@ -3092,7 +3106,7 @@ def _repo_index(runner: Runner, max_entries: int = _FILE_SCOPE_MAX_INDEX) -> lis
     if not buckets:
         # Best-effort fallback: list top-level dirs of TARGET_PROJECT_ROOT
         try:
-            root = TARGET_PROJECT_ROOT
+            root = _target_project_root()
             for entry in sorted(root.iterdir()):
                 if entry.is_dir() and not entry.name.startswith("."):
                     buckets[entry.name] = len(list(entry.iterdir()))
@@ -3822,7 +3836,7 @@ def _debug_log_dir() -> Path:
     The directory is created lazily by callers via ``_write_debug_log``.
     """
     home = Path.home()
-    slug = "".join(c if (c.isalnum() or c in "-_") else "-" for c in TARGET_PROJECT_ROOT.name)
+    slug = "".join(c if (c.isalnum() or c in "-_") else "-" for c in _target_project_root().name)
     return home / ".audit_debug" / (slug or "project")
 
 
@@ -5385,6 +5399,8 @@ def _run_phase2_deep_analysis(
             child_timeout_occurred = True
 
     if pending and parallelism > 1 and len(pending) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
         # Bounded-concurrency parallel execution of independent child calls.
         # The parent deep-analysis call above already ran first; children are
         # independent of each other so they may run concurrently up to the cap.
@@ -5677,8 +5693,8 @@ def _phase_gate(ctx: _AuditContext) -> int | None:
     # and stays byte-identical otherwise (zero regression for owning
     # launches).
     git_root = owning_root
-    if _same_git_repository(TARGET_PROJECT_ROOT, owning_root):
-        git_root = TARGET_PROJECT_ROOT
+    if _same_git_repository(_target_project_root(), owning_root):
+        git_root = _target_project_root()
     runner = _cwd_aware_runner(git_root, runner)
     ctx.runner = runner
 
@@ -5706,7 +5722,7 @@ def _phase_gate(ctx: _AuditContext) -> int | None:
     test_skill_run_sha = None
     if green_run_sha is None:
         auto_block, auto_sha, auto_status = _auto_green_run_outcome(
-            runner, cwd=str(TARGET_PROJECT_ROOT),
+            runner, cwd=str(_target_project_root()),
         )
         if auto_sha is not None:
             green_run_block = auto_block
@@ -5729,7 +5745,7 @@ def _phase_gate(ctx: _AuditContext) -> int | None:
             # explicit override that executes on ANY non-green state.
             head_sha = _resolve_audited_head(runner)
             test_run = _run_tests_via_test_skill(
-                cwd=TARGET_PROJECT_ROOT,
+                cwd=_target_project_root(),
                 parent_work_item_id=issue_id,
                 head_sha=head_sha,
             )
@@ -6463,7 +6479,7 @@ def _phase_fetch_and_cq(ctx: _AuditContext) -> int | None:
         # git scan is issued here.
         cq_scope_files = _git_changed_files(runner)
         cq_result = run_code_quality(
-            project_root=TARGET_PROJECT_ROOT, runner=runner, fix=False,
+            project_root=_target_project_root(), runner=runner, fix=False,
             files=cq_scope_files or None,
         )
         if cq_result.get("success", False):
@@ -6531,7 +6547,7 @@ def _phase_fetch_and_cq(ctx: _AuditContext) -> int | None:
         debug_log=ctx.debug_log,
         timeout=ctx.timeout,
         ac_fallback_used=ctx.ac_fallback_used,
-        project_root=TARGET_PROJECT_ROOT,
+        project_root=_target_project_root(),
         worklog_dir=worklog_dir,
         work_item=work_item,
         content_fingerprint=content_fingerprint,
@@ -6891,6 +6907,8 @@ def _phase_children(ctx: _AuditContext) -> int | None:
             if pending_children:
                 parallelism = _resolve_child_concurrency()
                 if parallelism > 1 and len(pending_children) > 1:
+                    from concurrent.futures import ThreadPoolExecutor
+
                     with ThreadPoolExecutor(max_workers=parallelism) as executor:
                         futures = [
                             executor.submit(
@@ -7356,6 +7374,8 @@ def _phase_children(ctx: _AuditContext) -> int | None:
             if pending_children:
                 parallelism = _resolve_child_concurrency()
                 if parallelism > 1 and len(pending_children) > 1:
+                    from concurrent.futures import ThreadPoolExecutor
+
                     with ThreadPoolExecutor(max_workers=parallelism) as executor:
                         futures = [
                             executor.submit(
@@ -22,19 +22,32 @@ required-and-efficient operations:
     scan.py list-files [--path PATH] [--type TYPE] [--maxdepth N]
         Bounded file listing with maxdepth (default 2) and the same prunes.
 
-All subcommands run offline (stdlib + wl/rg only), never scan the repo root
-implicitly, and exit non-zero with a clear message when nothing is found.
+    scan.py related-files TERM... [--path PATH] [--exact] [--limit N]
+        Files mentioning any of the terms (whole terms, or term prefixes
+        unless --exact), ranked by how many distinct terms they contain.
+        Answered from the shared per-repo term index
+        (skill/shared/repo_index.py) in milliseconds — no file is re-read.
+
+All subcommands run offline (stdlib + wl/rg/git only), never scan the repo
+root implicitly, and exit non-zero with a clear message when nothing is found.
 See ``docs/dev/audit-grep-scan-patterns.md`` for the recipe catalogue.
 """  # noqa: EXE001
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from skill.shared.repo_index import open_repo_index
+
 # Fixed prunes shared by search-code and list-files. These keep scans out of
 # the dirs that made legacy `grep -r .` slow (node_modules, .git) and out of
 # the 9.5 GB .worklog audit_debug dump. Each is an rg `-g` glob pair; the
@@ -206,13 +219,38 @@ def cmd_list_files(args: argparse.Namespace) -> int:
     return 2
 
 
+def cmd_related_files(args: argparse.Namespace) -> int:
+    """Rank files under --path by the query terms they contain (indexed)."""
+    path = Path(args.path or ".")
+    index = open_repo_index(path)
+    if index is None:
+        print(f"error: {path} is not inside a git work tree; "
+              "use `search-code` instead", file=sys.stderr)
+        return 2
+    with index:
+        index.refresh()
+        hits = index.search(args.terms, prefix=not args.exact)
+        prefix = os.path.relpath(path.resolve(), index.repo_root).replace(os.sep, "/")
+    if prefix != ".":
+        hits = [h for h in hits if h["file"].startswith(prefix + "/")]
+    if not hits:
+        print(f"No files mention {' '.join(args.terms)!r} under {path}.", file=sys.stderr)
+        return 1
+    limit = min(args.limit, MAX_MATCH_LINES)
+    for hit in hits[:limit]:
+        print(f"{hit['file']}\t{','.join(hit['matches'])}")
+    if len(hits) > limit:
+        print(f"... ({len(hits) - limit} more files truncated)", file=sys.stderr)
+    return 0
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="scan.py",
         description=(
             "Bounded-scan helper for audit agents: find-workitem / "
-            "search-code / list-files. Replaces slow unbounded grep -r "
-            "scans with pruned, bounded operations."
+            "search-code / list-files / related-files. Replaces slow "
+            "unbounded grep -r scans with pruned, bounded operations."
         ),
     )
     sub = parser.add_subparsers(dest="subcommand", required=True)
@@ -238,6 +276,17 @@ def build_parser() -> argparse.ArgumentParser:
                         help=f"Max directory depth (default {DEFAULT_MAXDEPTH})")
     p_list.set_defaults(func=cmd_list_files)
 
+    p_related = sub.add_parser("related-files",
+                               help="Files mentioning the given terms (indexed)")
+    p_related.add_argument("terms", nargs="+", help="Terms to look up, e.g. semaphore fanout")
+    p_related.add_argument("--path", default=None,
+                           help="Restrict results to this directory (default: current dir)")
+    p_related.add_argument("--exact", action="store_true",
+                           help="Match whole terms only (default also matches term prefixes)")
+    p_related.add_argument("--limit", type=int, default=20,
+                           help="Maximum files listed (default 20)")
+    p_related.set_defaults(func=cmd_related_files)
+
     return parser
 
 
@@ -1392,8 +1392,8 @@ class TestRunTestsViaTestSkill:
         with mock.patch.object(
             audit_runner, "run_cached", side_effect=_side_effect
         ), mock.patch(
-            "skill.triage.scripts.check_or_create.check_or_create",
-            return_value={"issueId": "SA-TRIAGE-1", "created": True},
+            "skill.triage.scripts.check_or_create.check_or_create_batch",
+            return_value=[{"issueId": "SA-TRIAGE-1", "created": True}],
         ) as mock_triage:
             result = audit_runner._run_tests_via_test_skill(
                 cwd=tmp_path, parent_work_item_id="TEST-1", head_sha="abc123",
@@ -1402,7 +1402,7 @@ class TestRunTestsViaTestSkill:
         assert len(result["failures"]) == 1
         assert result["failures"][0]["test_name"] == "tests/test_x.py::test_boom"
         assert mock_triage.call_count == 1
-        payload = mock_triage.call_args.args[0]
+        payload = mock_triage.call_args.args[0][0]
         assert payload["test_name"] == "tests/test_x.py::test_boom"
         assert payload["parent_work_item_id"] == "TEST-1"
         assert payload["commit_hash"] == "abc123"
@@ -1431,8 +1431,8 @@ class TestRunTestsViaTestSkill:
         with mock.patch.object(
             audit_runner, "run_cached", side_effect=_side_effect
         ), mock.patch(
-            "skill.triage.scripts.check_or_create.check_or_create",
-            return_value={"issueId": "SA-TRIAGE-1", "created": True},
+            "skill.triage.scripts.check_or_create.check_or_create_batch",
+            return_value=[{"issueId": "SA-TRIAGE-1", "created": True}],
         ) as mock_triage:
             result = audit_runner._run_tests_via_test_skill(cwd=tmp_path)
         assert result["success"] is False
@@ -1493,7 +1493,7 @@ class TestRunTestsViaTestSkill:
         with mock.patch.object(
             audit_runner, "run_cached", side_effect=_side_effect
         ), mock.patch(
-            "skill.triage.scripts.check_or_create.check_or_create",
+            "skill.triage.scripts.check_or_create.check_or_create_batch",
             side_effect=RuntimeError("triage boom"),
         ):
             result = audit_runner._run_tests_via_test_skill(cwd=tmp_path)
@@ -733,6 +733,30 @@ class TestPhase2FileScopeManifest:
         assert isinstance(manifest, str)
         assert manifest  # non-empty
 
+    def test_repo_index_counts_git_ls_files(self, tmp_path):
+        """The repo index buckets `git ls-files` output per top-level path
+        and builds no term index (a cold build costs seconds)."""
+        import subprocess
+
+        git = ["git", "-C", str(tmp_path), "-c", "user.name=t",
+               "-c", "user.email=t@example.invalid"]
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / "src").mkdir()
+        for name in ("a.py", "b.py"):
+            (tmp_path / "src" / name).write_text("x = 1\n")
+        (tmp_path / "README.md").write_text("readme\n")
+        subprocess.run([*git, "add", "-A"], check=True)
+        subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+
+        def runner(cmd):
+            return subprocess.run(cmd, cwd=tmp_path, check=False, text=True,
+                                  capture_output=True)
+
+        assert audit_runner._repo_index(runner) == [
+            "src/ (2 files)", "(root)/ (1 files)",
+        ]
+        assert not list(tmp_path.rglob("*.sqlite3"))
+
     def test_child_prompt_includes_file_scope(self):
         """AC2: child deep-analysis prompts also carry the FILE SCOPE section."""
         issue = self._make_issue()
@@ -343,3 +343,53 @@ def test_scan_script_has_cli_help() -> None:
     assert proc.returncode == 0
     for sub in ("find-workitem", "search-code", "list-files"):
         assert sub in proc.stdout
+
+
+# ===========================================================================
+# related-files (shared repo term index)
+# ===========================================================================
+
+
+def _load_scan():
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("scan", SCAN_SCRIPT)
+    scan = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(scan)
+    return scan
+
+
+def _make_git_fixture(tmp_path: Path) -> Path:
+    git = ["git", "-C", str(tmp_path), "-c", "user.name=t", "-c", "user.email=t@example.invalid"]
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "fanout.py").write_text("semaphore = bound_fanout()\n")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "notes.md").write_text("The semaphores guide.\n")
+    subprocess.run([*git, "add", "-A"], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+    return tmp_path
+
+
+def test_related_files_ranks_by_distinct_terms(tmp_path: Path, capsys) -> None:
+    root = _make_git_fixture(tmp_path)
+    rc = _load_scan().main(["related-files", "semaphore", "fanout", "--path", str(root)])
+    assert rc == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "src/fanout.py\tfanout,semaphore",
+        "docs/notes.md\tsemaphore",
+    ]
+
+
+def test_related_files_exact_and_path_scope(tmp_path: Path, capsys) -> None:
+    root = _make_git_fixture(tmp_path)
+    scan = _load_scan()
+    assert scan.main(["related-files", "semaphore", "--exact",
+                      "--path", str(root / "docs")]) == 1
+    assert scan.main(["related-files", "semaphore", "--path", str(root / "docs")]) == 0
+    assert capsys.readouterr().out.splitlines() == ["docs/notes.md\tsemaphore"]
+
+
+def test_related_files_outside_git_fails_clearly(tmp_path: Path, capsys) -> None:
+    assert _load_scan().main(["related-files", "x", "--path", str(tmp_path)]) == 2
+    assert "search-code" in capsys.readouterr().err
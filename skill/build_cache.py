@@ -0,0 +1,191 @@
+"""Per-worktree cache for the implement finish build step.
+
+``implement.py finish`` ran ``npm run build`` on every finish and every fix
+retry, even when nothing the build reads had changed since the last
+successful build in that worktree. This module records the last successful
+build per worktree and lets the caller skip a rebuild whose inputs are
+unchanged:
+
+- **Keyed by command + input fingerprint**: the build command (including
+  the ``scripts.build`` body) plus a hash of the tracked input files — index
+  blob ids from ``git ls-files -s`` and the content of modified or
+  untracked (non-ignored) files. Inputs are every tracked file, or the
+  pathspec globs in ``IMPLEMENT_BUILD_INPUT_GLOBS`` (comma-separated,
+  ``:(glob)`` semantics) plus the root manifest and lockfiles;
+  ``.worklog/`` and the implement state file are never inputs.
+- **Stored next to the test cache**: ``build-cache.json`` in
+  :func:`skill.test_cache.cache_dir` of the worktree. In a git worktree
+  without ``.worklog`` that is the worktree's own git admin directory, which
+  moves with the worktree when the worktree pool parks and re-claims it, so
+  a recycled worktree keeps its last build record along with its (ignored)
+  build outputs.
+- **Outputs must still exist**: the record lists the git-ignored paths
+  present after the build (``git ls-files -o -i --directory``, so ``dist/``
+  or ``node_modules/`` is one entry). A record whose outputs were removed —
+  ``git clean -fdx``, a deleted ``dist/`` — is a miss even when the inputs
+  match.
+- **Successful builds only**: failed builds are never recorded, and outside
+  a git work tree nothing is cached.
+
+Entry layout::
+
+    {"version": 2, "command": ..., "inputs": <sha256>,
+     "outputs": [<ignored path>, ...], "completed_at": <epoch>}
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import subprocess
+import time
+from pathlib import Path
+from typing import Any
+
+from skill.test_cache import cache_dir
+
+BUILD_CACHE_FILENAME = "build-cache.json"
+BUILD_INPUT_GLOBS_ENV = "IMPLEMENT_BUILD_INPUT_GLOBS"
+_CACHE_VERSION = 2
+
+# Always part of the inputs when globs are configured.
+MANIFEST_FILES = (
+    "package.json",
+    "package-lock.json",
+    "npm-shrinkwrap.json",
+    "yarn.lock",
+    "pnpm-lock.yaml",
+)
+
+
+def _git_bytes(cwd: str, *args: str) -> bytes | None:
+    """Run a git command in *cwd*, returning raw stdout or None on failure."""
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            timeout=60,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def input_globs() -> list[str]:
+    """Configured input globs (``IMPLEMENT_BUILD_INPUT_GLOBS``); empty = all files."""
+    raw = os.environ.get(BUILD_INPUT_GLOBS_ENV, "")
+    return [g.strip() for g in raw.split(",") if g.strip()]
+
+
+def compute_input_hash(cwd: str | Path, globs: list[str] | None = None) -> str | None:
+    """Fingerprint the build inputs of the work tree at *cwd*.
+
+    Args:
+        cwd: Work tree root.
+        globs: Input pathspec globs (defaults to :func:`input_globs`); empty
+            means every tracked file.
+
+    Returns:
+        A sha256 hex digest, or None outside a git work tree.
+    """
+    cwd = str(Path(cwd).resolve())
+    globs = input_globs() if globs is None else globs
+    if globs:
+        pathspecs = [f":(glob){g}" for g in globs] + list(MANIFEST_FILES)
+    else:
+        pathspecs = ["."]
+    # Worklog state and the implement state file are not build inputs (and
+    # the build record itself may live under .worklog/cache).
+    pathspecs += [":(exclude).worklog", ":(exclude).implement_state.json"]
+    staged = _git_bytes(cwd, "ls-files", "-s", "-z", "--", *pathspecs)
+    changed = _git_bytes(
+        cwd, "ls-files", "-m", "-o", "--exclude-standard", "-z", "--", *pathspecs
+    )
+    if staged is None or changed is None:
+        return None
+
+    digest = hashlib.sha256(staged)
+    for rel in sorted(set(changed.split(b"\0")) - {b""}):
+        digest.update(b"\0" + rel + b"\0")
+        try:
+            digest.update(hashlib.sha256(Path(cwd, os.fsdecode(rel)).read_bytes()).digest())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def ignored_outputs(cwd: str | Path) -> list[str] | None:
+    """Git-ignored paths in the work tree at *cwd* (wholly ignored dirs collapsed).
+
+    Returns:
+        Sorted relative paths (directories end in ``/``), or None outside a
+        git work tree.
+    """
+    out = _git_bytes(
+        str(cwd), "ls-files", "-o", "-i", "--exclude-standard", "--directory", "-z",
+        "--", ".", ":(exclude).worklog",
+    )
+    if out is None:
+        return None
+    return sorted(os.fsdecode(rel) for rel in set(out.split(b"\0")) - {b""})
+
+
+def cache_path(cwd: str | Path) -> Path:
+    """Location of the build record for the work tree at *cwd*."""
+    return cache_dir(cwd) / BUILD_CACHE_FILENAME
+
+
+def lookup(command: str, inputs: str, *, cwd: str | Path) -> dict[str, Any] | None:
+    """Return the last successful build record if it matches *command* and *inputs*.
+
+    Corrupt or unreadable records are a miss, and so is a record whose
+    build outputs no longer all exist.
+    """
+    try:
+        entry = json.loads(cache_path(cwd).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("version") != _CACHE_VERSION:
+        return None
+    if entry.get("command") != command or entry.get("inputs") != inputs:
+        return None
+    outputs = entry.get("outputs")
+    if not isinstance(outputs, list):
+        return None
+    if not all(Path(cwd, rel).exists() for rel in outputs):
+        return None
+    return entry
+
+
+def store(command: str, inputs: str, *, cwd: str | Path) -> Path | None:
+    """Record a successful build of *command* over *inputs* (atomic write).
+
+    The ignored paths present now are recorded as the build outputs.
+
+    Returns:
+        The record path, or None when it could not be written.
+    """
+    outputs = ignored_outputs(cwd)
+    if outputs is None:
+        return None
+    path = cache_path(cwd)
+    entry = {
+        "version": _CACHE_VERSION,
+        "command": command,
+        "inputs": inputs,
+        "outputs": outputs,
+        "completed_at": time.time(),
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.tmp")
+        tmp.write_text(json.dumps(entry, indent=2))
+        os.replace(tmp, path)
+    except OSError:
+        return None
+    return path
@@ -11,6 +11,7 @@ if REPO_ROOT not in sys.path:
     sys.path.insert(0, REPO_ROOT)
 
 from skill.cleanup.scripts import lib
+from skill.shared import worktree_registry
 
 PROTECTED_BRANCHES = {"main", "master", "develop"}
 
@@ -122,6 +123,12 @@ def main(argv: list[str] | None = None) -> int:
         lib.write_report(report, args.report, print_output=not args.quiet)
         return 0
 
+    # Branches checked out by implement worktrees cannot be deleted.
+    worktree_branches = {
+        entry["branch"]: entry["path"]
+        for entry in worktree_registry.entries(os.getcwd()).values()
+    }
+
     actions: list[dict[str, Any]] = []
     for branch in unique_branches:
         if not branch_exists(runner, branch):
@@ -133,6 +140,14 @@ def main(argv: list[str] | None = None) -> int:
         if branch == current_branch:
             actions.append({"branch": branch, "action": "skip", "result": "current"})
             continue
+        if branch in worktree_branches:
+            actions.append({
+                "branch": branch,
+                "action": "skip",
+                "result": "in_worktree",
+                "worktree": worktree_branches[branch],
+            })
+            continue
         merged = is_merged(runner, branch, default_ref)
         if not merged:
             actions.append({"branch": branch, "action": "skip", "result": "not_merged"})
@@ -19,9 +19,11 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
 import sys
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -47,6 +49,13 @@ SEVERITY_TO_PRIORITY: dict[str, str] = {
 # Priority order from highest to lowest
 PRIORITY_ORDER = ["critical", "high", "medium", "low"]
 
+# Concurrent ``wl`` writes issued by one flush of the batched write path.
+# Worklog has no bulk create endpoint, so N new findings still mean N
+# ``wl create`` calls — but they are dispatched together, bounded by this
+# ceiling (``QUALITY_EPIC_WL_WORKERS`` overrides; 1 serialises them).
+WL_WRITE_WORKERS_ENV = "QUALITY_EPIC_WL_WORKERS"
+_WL_WRITE_WORKERS_DEFAULT = 4
+
 # ---------------------------------------------------------------------------
 # Types
 # ---------------------------------------------------------------------------
@@ -99,6 +108,61 @@ def _run_wl(runner: Runner, cmd: list[str]) -> dict[str, Any]:
     return data
 
 
+def _wl_write_workers() -> int:
+    """Resolve the write-batch ceiling (env override, default 4, min 1)."""
+    env_value = os.environ.get(WL_WRITE_WORKERS_ENV)
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            print(
+                f"Warning: invalid {WL_WRITE_WORKERS_ENV} value {env_value!r}; "
+                "using default",
+                file=sys.stderr,
+            )
+    return _WL_WRITE_WORKERS_DEFAULT
+
+
+class WorklogWriteBatch:
+    """Queue of ``wl`` write commands flushed together.
+
+    Commands are queued with :meth:`add` and executed by :meth:`flush` on a
+    bounded thread pool. Each outcome is reported per command (in queue
+    order) so one failed write never aborts the rest of the batch.
+    """
+
+    def __init__(self, runner: Runner, max_workers: int | None = None) -> None:
+        self._runner = runner
+        self._max_workers = max_workers or _wl_write_workers()
+        self._pending: list[tuple[str, list[str]]] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, label: str, cmd: list[str]) -> None:
+        """Queue *cmd*; *label* identifies it in the flush outcomes."""
+        self._pending.append((label, cmd))
+
+    def flush(self) -> list[tuple[str, dict[str, Any] | None, str | None]]:
+        """Run every queued command; return ``(label, data, error)`` tuples."""
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+
+        def _one(item: tuple[str, list[str]]):
+            label, cmd = item
+            try:
+                return label, _run_wl(self._runner, cmd), None
+            except RuntimeError as exc:
+                return label, None, str(exc)
+
+        workers = min(self._max_workers, len(pending))
+        if workers <= 1:
+            return [_one(item) for item in pending]
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(_one, pending))
+
+
 # ---------------------------------------------------------------------------
 # Epic management
 # ---------------------------------------------------------------------------
@@ -237,6 +301,58 @@ def find_or_create_epic(
     return epic_id, True
 
 
+def _child_create_cmd(epic_id: str, finding: dict[str, Any]) -> list[str]:
+    """Build the ``wl create`` command for one finding's child task."""
+    severity = finding.get("severity", "medium")
+    priority = _severity_to_priority(severity)
+
+    description_lines = [
+        "## Code quality finding",
+        "",
+        f"- **Severity**: {severity}",
+        f"- **File**: {finding.get('file', '?')}",
+        f"- **Line**: {finding.get('line', 0)}",
+        f"- **Message**: {finding.get('message', '')}",
+        f"- **Linter**: {finding.get('linter', '?')}",
+        f"- **Code**: {finding.get('code', '')}",
+        "",
+        "Discovered during automated code quality review.",
+    ]
+    description = "\n".join(description_lines)
+
+    return [
+        "wl", "create",
+        "--parent", epic_id,
+        "--title", _finding_title(finding),
+        "--description", description,
+        "--issue-type", "task",
+        "--priority", priority,
+        "--stage", "intake_complete",
+        "--tags", "Refactor",
+        "--json",
+    ]
+
+
+def _new_findings(
+    findings: list[dict[str, Any]],
+    existing_titles: set[str],
+) -> list[dict[str, Any]]:
+    """Return the findings whose titles are not in *existing_titles*.
+
+    Duplicates within *findings* itself are also dropped (first one wins),
+    so a single run never queues two creates for the same title.
+    """
+    seen = set(existing_titles)
+    fresh: list[dict[str, Any]] = []
+    for finding in findings:
+        title = _finding_title(finding)
+        if title in seen:
+            continue
+        seen.add(title)
+        fresh.append(finding)
+    return fresh
+
+
 def create_child_tasks(
     epic_id: str,
     findings: list[dict[str, Any]],
@@ -252,58 +368,30 @@ def create_child_tasks(
         existing_titles: Optional set of already-existing child task titles
                          to avoid duplicates.
 
+    The creates go out through :class:`WorklogWriteBatch`, so they are
+    dispatched together instead of one blocking ``wl create`` at a time.
+
     Returns:
         The number of child tasks created.
     """
     if existing_titles is None:
         existing_titles = set()
 
-    created = 0
+    batch = WorklogWriteBatch(runner)
+    for finding in _new_findings(findings, existing_titles):
+        batch.add(_finding_title(finding), _child_create_cmd(epic_id, finding))
 
-    for finding in findings:
-        title = _finding_title(finding)
-
-        # Idempotency check: skip if title already exists
-        if title in existing_titles:
-            continue
-
-        severity = finding.get("severity", "medium")
-        priority = _severity_to_priority(severity)
-
-        description_lines = [
-            "## Code quality finding",
-            "",
-            f"- **Severity**: {severity}",
-            f"- **File**: {finding.get('file', '?')}",
-            f"- **Line**: {finding.get('line', 0)}",
-            f"- **Message**: {finding.get('message', '')}",
-            f"- **Linter**: {finding.get('linter', '?')}",
-            f"- **Code**: {finding.get('code', '')}",
-            "",
-            "Discovered during automated code quality review.",
-        ]
-        description = "\n".join(description_lines)
-
-        try:
-            _run_wl(runner, [
-                "wl", "create",
-                "--parent", epic_id,
-                "--title", title,
-                "--description", description,
-                "--issue-type", "task",
-                "--priority", priority,
-                "--stage", "intake_complete",
-                "--tags", "Refactor",
-                "--json",
-            ])
-            created += 1
-            existing_titles.add(title)
-        except RuntimeError as exc:
+    created = 0
+    for title, _data, error in batch.flush():
+        if error is not None:
             print(
                 f"Warning: failed to create child task for finding '{title}': "
-                f"{exc}",
+                f"{error}",
                 file=sys.stderr,
             )
+            continue
+        created += 1
+        existing_titles.add(title)
 
     return created
 
@@ -384,6 +472,125 @@ def _update_epic_priority(
                 )
 
 
+# Batch label of the epic priority update (never a valid finding title,
+# which always starts with ``[SEVERITY]``).
+_PRIORITY_LABEL = "\x00epic-priority"
+
+
+class QualityEpicStore:
+    """In-memory snapshot of the quality epic and its existing children.
+
+    :meth:`load` resolves the epic (``find_or_create_epic``) and, for a
+    reused epic, reads its priority and children in a single
+    ``wl show <epic> --children --json``. Findings are then diffed against
+    the snapshot in memory and the resulting creates go out through one
+    :class:`WorklogWriteBatch` flush, followed by the priority update when
+    needed, so the number of Worklog reads per run is constant regardless
+    of the findings count.
+    """
+
+    def __init__(
+        self,
+        runner: Runner,
+        epic_id: str,
+        was_created: bool,
+        priority: str | None,
+        child_titles: set[str],
+    ) -> None:
+        self.runner = runner
+        self.epic_id = epic_id
+        self.was_created = was_created
+        self.priority = priority
+        self.child_titles = child_titles
+
+    @classmethod
+    def load(cls, runner: Runner, priority: str = "medium") -> QualityEpicStore:
+        """Resolve the epic and snapshot its priority and child titles.
+
+        A newly created epic has no children and already carries
+        *priority*, so no further read is made for it. If the read of a
+        reused epic fails its priority is unknown (None) and is never
+        escalated.
+        """
+        epic_id, was_created = find_or_create_epic(runner, priority=priority)
+        if was_created:
+            return cls(runner, epic_id, True, priority, set())
+
+        try:
+            result = _run_wl(runner, [
+                "wl", "show", epic_id, "--children", "--json",
+            ])
+        except RuntimeError:
+            return cls(runner, epic_id, False, None, set())
+
+        work_item = result.get("workItem", {})
+        current = (work_item.get("priority") if isinstance(work_item, dict)
+                   else None) or "medium"
+
+        children = result.get("children", [])
+        if isinstance(children, dict):
+            children = [children]
+        titles = {
+            (child.get("title") or "").strip()
+            for child in children
+            if isinstance(child, dict)
+        }
+        titles.discard("")
+        return cls(runner, epic_id, False, current, titles)
+
+    def new_findings(self, findings: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the findings that have no child task in the snapshot yet."""
+        return _new_findings(findings, self.child_titles)
+
+    def apply(self, findings: list[dict[str, Any]], priority: str) -> int:
+        """Create children for new *findings* and escalate the epic priority.
+
+        The priority update is sent after the creates are flushed, and only
+        when at least one child was created for a reused epic whose snapshot
+        priority is known and lower than *priority* (escalation only).
+
+        Returns:
+            The number of child tasks created.
+        """
+        batch = WorklogWriteBatch(self.runner)
+        for finding in self.new_findings(findings):
+            batch.add(_finding_title(finding),
+                      _child_create_cmd(self.epic_id, finding))
+
+        created = 0
+        for label, _data, error in batch.flush():
+            if error is not None:
+                print(
+                    f"Warning: failed to create child task for finding "
+                    f"'{label}': {error}",
+                    file=sys.stderr,
+                )
+                continue
+            created += 1
+            self.child_titles.add(label)
+
+        if (
+            created
+            and not self.was_created
+            and priority in PRIORITY_ORDER
+            and self.priority in PRIORITY_ORDER
+            and PRIORITY_ORDER.index(priority) < PRIORITY_ORDER.index(self.priority)
+        ):
+            batch.add(_PRIORITY_LABEL, [
+                "wl", "update", self.epic_id, "--priority", priority, "--json",
+            ])
+            for _label, _data, error in batch.flush():
+                if error is not None:
+                    print(
+                        f"Warning: failed to update epic {self.epic_id} priority "
+                        f"to {priority}: {error}",
+                        file=sys.stderr,
+                    )
+                else:
+                    self.priority = priority
+        return created
+
+
 def create_epics_for_findings(
     findings: list[dict[str, Any]],
     runner: Runner | None = None,
@@ -396,6 +603,9 @@ def create_epics_for_findings(
     epic's priority is escalated to match the highest severity (priority
     escalation only — never reduced).
 
+    Worklog reads are bounded (epic lookup plus one ``wl show --children``)
+    and writes go out through :class:`QualityEpicStore.apply`'s batch.
+
     Args:
         findings: List of finding dicts (must have ``severity``, ``file``,
                   ``line``, ``message``, ``linter``, ``code`` keys).
@@ -414,21 +624,15 @@ def create_epics_for_findings(
     # 0. Compute the highest priority from findings
     highest_priority = _highest_priority(findings)
 
-    # 1. Find or create epic (pass the computed priority for new epics)
-    epic_id, was_created = find_or_create_epic(runner, priority=highest_priority)
+    # 1. Find or create the epic and snapshot its children + priority
+    #    (constant number of Worklog reads, independent of len(findings))
+    store = QualityEpicStore.load(runner, priority=highest_priority)
 
-    # 2. Get existing child titles for idempotency
-    existing_titles = get_existing_child_titles(epic_id, runner)
-
-    # 3. Create child tasks
-    children_created = create_child_tasks(
-        epic_id, findings, runner, existing_titles=existing_titles,
-    )
+    # 2. Diff findings against the snapshot in memory, then create the new
+    #    children and escalate the epic priority in one batched flush
+    children_created = store.apply(findings, highest_priority)
 
-    # 4. If reusing an existing epic and new children were created,
-    #    escalate the epic's priority if the computed priority is higher
-    if not was_created and children_created > 0:
-        _update_epic_priority(epic_id, highest_priority, runner)
+    epic_id, was_created = store.epic_id, store.was_created
 
     return {
         "epic_id": epic_id,
@@ -4,11 +4,14 @@ Provides:
   - detect_languages(): Scan a project directory for known file extensions
     and return a list of detected language names.
   - probe_linter(): Check if a linter tool is available on PATH and return
-    structured availability information.
+    structured availability information. Results are memoized per process
+    and persisted to a small host-wide JSON cache (see "Probe cache").
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import shutil
 from pathlib import Path
@@ -38,6 +41,118 @@ LANGUAGE_LINTERS: dict[str, list[str]] = {
     "csharp": ["dotnet-format"],
 }
 
+# ---------------------------------------------------------------------------
+# Probe cache
+# ---------------------------------------------------------------------------
+# ``probe_linter`` is called for every linter on every detection, run and
+# smell-detection pass. Results are memoized per process, keyed by linter
+# name and the current ``PATH``, and persisted to a small JSON file so a new
+# process on the same host skips the ``PATH`` resolution entirely:
+#
+# - a positive entry is reused while the resolved binary's mtime is
+#   unchanged (an upgraded or removed linter invalidates it);
+# - a negative entry is reused while every ``PATH`` directory's mtime is
+#   unchanged (installing a binary into one of them invalidates it).
+#
+# The cache lives at ``$XDG_CACHE_HOME/sorra-agents/linter-probe.json``
+# (``~/.cache`` when unset). ``CODE_QUALITY_PROBE_CACHE`` overrides the
+# path; an empty value disables persistence (the per-process memo remains).
+# Unreadable or corrupt cache files are ignored and rewritten.
+
+PROBE_CACHE_ENV = "CODE_QUALITY_PROBE_CACHE"
+
+_PROBE_CACHE_VERSION = 1
+
+_probe_memo: dict[tuple[str, str], dict[str, object]] = {}
+_disk_entries: dict[str, dict[str, object]] | None = None
+
+
+def _probe_cache_path() -> Path | None:
+    """Resolve the persisted probe cache file, or None when disabled."""
+    override = os.environ.get(PROBE_CACHE_ENV)
+    if override is not None:
+        return Path(override).expanduser() if override.strip() else None
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "sorra-agents" / "linter-probe.json"
+
+
+def _mtime(path: str) -> float | None:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _path_fingerprint(search_path: str) -> str:
+    """Hash ``PATH`` together with the mtime of each of its directories."""
+    parts = [
+        f"{d}={_mtime(d)}" for d in search_path.split(os.pathsep) if d
+    ]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()[:16]
+
+
+def _cache_key(linter_name: str, search_path: str) -> str:
+    digest = hashlib.sha256(search_path.encode()).hexdigest()[:16]
+    return f"{digest}:{linter_name}"
+
+
+def _load_disk_entries() -> dict[str, dict[str, object]]:
+    global _disk_entries
+    if _disk_entries is not None:
+        return _disk_entries
+    _disk_entries = {}
+    path = _probe_cache_path()
+    if path is None:
+        return _disk_entries
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return _disk_entries
+    if isinstance(data, dict) and data.get("version") == _PROBE_CACHE_VERSION:
+        entries = data.get("entries")
+        if isinstance(entries, dict):
+            _disk_entries = {
+                k: v for k, v in entries.items() if isinstance(v, dict)
+            }
+    return _disk_entries
+
+
+def _save_disk_entries() -> None:
+    """Write the probe entries atomically (temp file + ``os.replace``)."""
+    path = _probe_cache_path()
+    if path is None or _disk_entries is None:
+        return
+    payload = {"version": _PROBE_CACHE_VERSION, "entries": _disk_entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _disk_entry_valid(entry: dict[str, object], search_path: str) -> bool:
+    binary = entry.get("binary")
+    if binary:
+        return entry.get("mtime") == _mtime(str(binary))
+    return entry.get("path_fingerprint") == _path_fingerprint(search_path)
+
+
+def clear_probe_cache(*, persisted: bool = False) -> None:
+    """Forget memoized probe results (and the persisted file when asked)."""
+    global _disk_entries
+    _probe_memo.clear()
+    _disk_entries = None
+    if persisted:
+        path = _probe_cache_path()
+        if path is not None:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -101,12 +216,43 @@ def probe_linter(linter_name: str) -> dict[str, object]:
         linter_name: The name of the linter executable (e.g. ``"ruff"``,
                      ``"eslint"``).
 
+    Results are memoized per process and persisted across processes (see
+    "Probe cache" above), so ``PATH`` is only resolved on a cache miss.
+
     Returns:
         A dict with keys ``name`` (str) and ``available`` (bool).
         Example: ``{"name": "ruff", "available": True}``
     """
-    available = shutil.which(linter_name) is not None
-    return {"name": linter_name, "available": available}
+    search_path = os.environ.get("PATH", "")
+    memo_key = (linter_name, search_path)
+    cached = _probe_memo.get(memo_key)
+    if cached is not None:
+        return dict(cached)
+
+    entries = _load_disk_entries()
+    key = _cache_key(linter_name, search_path)
+    entry = entries.get(key)
+    if entry is not None and _disk_entry_valid(entry, search_path):
+        result = {"name": linter_name, "available": bool(entry.get("binary"))}
+        _probe_memo[memo_key] = result
+        return dict(result)
+
+    binary = shutil.which(linter_name)
+    result = {"name": linter_name, "available": binary is not None}
+    _probe_memo[memo_key] = result
+
+    if binary is not None:
+        mtime = _mtime(binary)
+        if mtime is not None:
+            entries[key] = {"binary": binary, "mtime": mtime}
+            _save_disk_entries()
+    else:
+        entries[key] = {
+            "binary": None,
+            "path_fingerprint": _path_fingerprint(search_path),
+        }
+        _save_disk_entries()
+    return dict(result)
 
 
 def get_linters_for_language(language: str) -> list[str]:
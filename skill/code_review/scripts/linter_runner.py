@@ -44,6 +44,7 @@ import json
 import os
 import subprocess
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -339,11 +340,11 @@ def _run_eslint_findings_check(
     Returns:
         A list of finding dicts.
     """
-    if files:
-        cmd = ["eslint", *[str(f) for f in files], "-f", "json", "--quiet"]
-    else:
-        cmd = ["eslint", str(root), "-f", "json", "--quiet"]
-    result = runner(cmd)
+    result = _run_batched(
+        runner,
+        lambda targets: ["eslint", *targets, "-f", "json", "--quiet"],
+        _lint_targets(root, files),
+    )
 
     if result.returncode not in (0, 1):
         return []
@@ -367,12 +368,12 @@ def _run_ruff_check(
     """
     findings: list[dict[str, Any]] = []
 
-    if files:
-        cmd = ["ruff", "check", *[str(f) for f in files],
-               "--output-format", "json", "--quiet"]
-    else:
-        cmd = ["ruff", "check", str(root), "--output-format", "json", "--quiet"]
-    result = runner(cmd)
+    result = _run_batched(
+        runner,
+        lambda targets: ["ruff", "check", *targets,
+                         "--output-format", "json", "--quiet"],
+        _lint_targets(root, files),
+    )
 
     if result.returncode not in (0, 1):
         return []
@@ -504,6 +505,192 @@ def _run_subprocess(cmd: list[str], cwd: str | Path | None = None) -> subprocess
         )
 
 
+# ---------------------------------------------------------------------------
+# Batched execution (argument-length-aware chunking)
+# ---------------------------------------------------------------------------
+#
+# A scoped scan (``files=``) used to put every path on one command line.
+# Large change sets either hit ARG_MAX or serialise into one huge linter
+# process. ``_run_batched`` splits the target list into chunks bounded by
+# command-line bytes and an estimated cost (file size), runs the chunks in
+# parallel and merges their JSON array outputs back into one result, so
+# the existing parsers and severity classifiers consume it unchanged.
+
+LINT_WORKERS_ENV = "CODE_QUALITY_LINT_WORKERS"
+
+_LINT_WORKERS_DEFAULT = 4
+
+
+def _arg_bytes_budget() -> int:
+    """Return the command-line byte budget for one linter invocation.
+
+    Half of ``SC_ARG_MAX`` (the environment shares the same space), capped
+    at 256 KiB so one chunk never becomes a pathological single process.
+    Windows' ``CreateProcess`` limit is 32,767 characters.
+    """
+    if os.name == "nt":
+        return 30_000
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        arg_max = 131_072
+    if arg_max <= 0:
+        arg_max = 131_072
+    return min(arg_max // 2, 262_144)
+
+
+# Chunks smaller than this (in estimated cost bytes) are not worth a
+# separate process: a small change set still runs as one invocation.
+_CHUNK_MIN_COST = 512 * 1024
+
+# shellcheck is much slower per byte than the JS/Markdown linters, so its
+# chunks are split at a lower cost floor to actually use the workers.
+_SHELLCHECK_MIN_COST = 32 * 1024
+
+
+def _lint_workers() -> int:
+    """Resolve the parallel chunk ceiling.
+
+    Precedence: ``CODE_QUALITY_LINT_WORKERS`` env var (integer >= 1) >
+    ``min(_LINT_WORKERS_DEFAULT, cpu_count)``. An invalid value is ignored.
+    """
+    env_value = os.environ.get(LINT_WORKERS_ENV)
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            pass
+    return max(1, min(_LINT_WORKERS_DEFAULT, os.cpu_count() or 1))
+
+
+def _file_cost(path: str) -> int:
+    """Estimate the lint cost of *path* as its size in bytes (min 1)."""
+    try:
+        return max(1, os.stat(path).st_size)
+    except OSError:
+        return 1
+
+
+def _chunk_files(
+    targets: list[str],
+    base_cmd_bytes: int,
+    *,
+    max_bytes: int | None = None,
+    workers: int | None = None,
+    min_cost: int = _CHUNK_MIN_COST,
+) -> list[list[str]]:
+    """Split *targets* into chunks bounded by argv bytes and estimated cost.
+
+    Order is preserved. A chunk is closed when adding the next path would
+    exceed the byte budget (``base_cmd_bytes`` plus each path and its NUL
+    terminator) or the per-chunk cost target, which spreads the total
+    estimated cost evenly over *workers* (never below *min_cost*).
+    """
+    if not targets:
+        return []
+    if max_bytes is None:
+        max_bytes = _arg_bytes_budget()
+    if workers is None:
+        workers = _lint_workers()
+    costs = [_file_cost(t) for t in targets]
+    cost_target = max(sum(costs) // max(1, workers) + 1, min_cost)
+
+    chunks: list[list[str]] = []
+    current: list[str] = []
+    current_bytes = base_cmd_bytes
+    current_cost = 0
+    for target, cost in zip(targets, costs, strict=True):
+        arg_bytes = len(os.fsencode(target)) + 1
+        if current and (current_bytes + arg_bytes > max_bytes
+                        or current_cost + cost > cost_target):
+            chunks.append(current)
+            current, current_bytes, current_cost = [], base_cmd_bytes, 0
+        current.append(target)
+        current_bytes += arg_bytes
+        current_cost += cost
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _merge_json_results(results: list[Any]) -> Any:
+    """Merge per-chunk linter results into one CompletedProcess.
+
+    Chunks whose return code is not 0/1 (linter error) are dropped, as the
+    single-process path would have dropped them. The JSON array outputs of
+    the remaining chunks are concatenated and the merged return code is the
+    highest remaining one (1 when any chunk reported findings). When every
+    chunk failed, the first failure is returned unchanged so callers bail
+    out exactly as before.
+    """
+    ok = [r for r in results if r.returncode in (0, 1)]
+    if not ok:
+        return results[0]
+    merged: list[Any] = []
+    for r in ok:
+        output = (r.stdout or "").strip()
+        if not output:
+            continue
+        try:
+            raw = json.loads(output)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(raw, list):
+            merged.extend(raw)
+        else:
+            merged.append(raw)
+    return subprocess.CompletedProcess(
+        args=[a for r in ok for a in (r.args or [])],
+        returncode=max(r.returncode for r in ok),
+        stdout=json.dumps(merged) if merged else "",
+        stderr="".join(r.stderr or "" for r in ok),
+    )
+
+
+def _run_batched(
+    runner: Callable,
+    cmd_builder: Callable[[list[str]], list[str]],
+    targets: list[str],
+    *,
+    min_cost: int = _CHUNK_MIN_COST,
+    split_failed: bool = False,
+) -> Any:
+    """Run ``cmd_builder(chunk)`` over *targets* in bounded parallel chunks.
+
+    A target list that fits in one chunk (including the whole-project
+    ``[root]`` case) runs exactly one command, as before. Otherwise the
+    chunks run on a thread pool and their JSON outputs are merged with
+    :func:`_merge_json_results`. Chunks never share a file, so concurrent
+    ``--fix`` runs touch disjoint paths.
+
+    With *split_failed*, a multi-file chunk whose return code is not 0/1 is
+    re-run one file per command, so a file the linter cannot process only
+    loses its own findings instead of the whole chunk's.
+    """
+    def run_chunk(chunk: list[str]) -> list[Any]:
+        result = runner(cmd_builder(chunk))
+        if not split_failed or len(chunk) < 2 or result.returncode in (0, 1):
+            return [result]
+        return [runner(cmd_builder([target])) for target in chunk]
+
+    base_cmd_bytes = sum(len(os.fsencode(a)) + 1 for a in cmd_builder([]))
+    chunks = _chunk_files(targets, base_cmd_bytes, min_cost=min_cost)
+    if len(chunks) <= 1:
+        results = run_chunk(targets)
+        return results[0] if len(results) == 1 else _merge_json_results(results)
+    workers = min(len(chunks), _lint_workers())
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = [r for rs in pool.map(run_chunk, chunks) for r in rs]
+    return _merge_json_results(results)
+
+
+def _lint_targets(root: Path, files: list[str] | None) -> list[str]:
+    """Return the lint targets: the scoped *files*, else the project root."""
+    if files:
+        return [str(f) for f in files]
+    return [str(root)]
+
+
 def _commit_changes(
     root: Path,
     linter_name: str,
@@ -552,11 +739,12 @@ def _run_linter_fix_mode(
     root: Path,
     runner: Callable,
     *,
-    fix_cmd_builder: Callable[[Path], list[str]],
-    rescan_cmd_builder: Callable[[Path], list[str]],
+    fix_cmd_builder: Callable[[list[str]], list[str]],
+    rescan_cmd_builder: Callable[[list[str]], list[str]],
     fixes_detected: Callable[[Any, str], bool],
     rescan_parser: Callable[[Any], list[dict[str, Any]]],
     commit_after_fix: bool = False,
+    files: list[str] | None = None,
 ) -> tuple[list[dict[str, Any]], bool]:
     """Run a linter in fix mode: fix → detect → optionally commit → rescan.
 
@@ -564,19 +752,23 @@ def _run_linter_fix_mode(
         linter_name: The linter name (for logging/commit messages).
         root: The project root path.
         runner: Subprocess runner callable.
-        fix_cmd_builder: Builds the fix command from the project root.
+        fix_cmd_builder: Builds the fix command from a list of lint targets.
         rescan_cmd_builder: Builds the rescan (post-fix) command.
         fixes_detected: Callable that checks if fixes were applied,
                         receives (result, stdout_output) and returns bool.
         rescan_parser: Parses the rescan output into finding dicts.
         commit_after_fix: Whether to commit changes after fixing.
+        files: Optional scoped file list; the targets are ``[root]`` when
+               omitted. Fix and rescan both run through :func:`_run_batched`,
+               and the commit happens once after every fix chunk finished.
 
     Returns:
         A tuple of (findings, fixes_applied).
     """
+    targets = _lint_targets(root, files)
+
     # Step 1: Run fix
-    cmd = fix_cmd_builder(root)
-    result = runner(cmd)
+    result = _run_batched(runner, fix_cmd_builder, targets)
 
     if result.returncode not in (0, 1):
         return [], False
@@ -590,8 +782,7 @@ def _run_linter_fix_mode(
         _commit_changes(root, linter_name, runner=runner)
 
     # Step 4: Rescan
-    cmd = rescan_cmd_builder(root)
-    result = runner(cmd)
+    result = _run_batched(runner, rescan_cmd_builder, targets)
 
     findings = rescan_parser(result)
     return findings, bool(applied)
@@ -603,17 +794,12 @@ def _run_ruff_fix_mode(
     files: list[str] | None = None,
 ) -> tuple[list[dict[str, Any]], bool]:
     """Run ruff check --fix and return remaining findings."""
-    def fix_cmd(root: Path) -> list[str]:
-        if files:
-            return ["ruff", "check", *[str(f) for f in files], "--fix",
-                    "--output-format", "json", "--quiet"]
-        return ["ruff", "check", str(root), "--fix", "--output-format", "json", "--quiet"]
-
-    def rescan_cmd(root: Path) -> list[str]:
-        if files:
-            return ["ruff", "check", *[str(f) for f in files],
-                    "--output-format", "json", "--quiet"]
-        return ["ruff", "check", str(root), "--output-format", "json", "--quiet"]
+    def fix_cmd(targets: list[str]) -> list[str]:
+        return ["ruff", "check", *targets, "--fix",
+                "--output-format", "json", "--quiet"]
+
+    def rescan_cmd(targets: list[str]) -> list[str]:
+        return ["ruff", "check", *targets, "--output-format", "json", "--quiet"]
 
     def fixes_detected(result: Any, output: str) -> bool:
         if result.returncode == 1:
@@ -662,6 +848,7 @@ def _run_ruff_fix_mode(
         fixes_detected=fixes_detected,
         rescan_parser=rescan_parser,
         commit_after_fix=False,
+        files=files,
     )
 
 
@@ -671,15 +858,11 @@ def _run_eslint_fix_mode(
     files: list[str] | None = None,
 ) -> tuple[list[dict[str, Any]], bool]:
     """Run eslint --fix and return remaining findings."""
-    def fix_cmd(root: Path) -> list[str]:
-        if files:
-            return ["eslint", *[str(f) for f in files], "-f", "json", "--fix", "--quiet"]
-        return ["eslint", str(root), "-f", "json", "--fix", "--quiet"]
+    def fix_cmd(targets: list[str]) -> list[str]:
+        return ["eslint", *targets, "-f", "json", "--fix", "--quiet"]
 
-    def rescan_cmd(root: Path) -> list[str]:
-        if files:
-            return ["eslint", *[str(f) for f in files], "-f", "json", "--quiet"]
-        return ["eslint", str(root), "-f", "json", "--quiet"]
+    def rescan_cmd(targets: list[str]) -> list[str]:
+        return ["eslint", *targets, "-f", "json", "--quiet"]
 
     def fixes_detected(result: Any, output: str) -> bool:
         if result.returncode == 1:
@@ -707,6 +890,7 @@ def _run_eslint_fix_mode(
         fixes_detected=fixes_detected,
         rescan_parser=rescan_parser,
         commit_after_fix=True,
+        files=files,
     )
 
 
@@ -792,9 +976,9 @@ def run_eslint(
         runner = _run_subprocess
 
     if fix:
-        findings, fixes_applied = _run_eslint_fix_mode(root, runner)
+        findings, fixes_applied = _run_eslint_fix_mode(root, runner, files=files)
     else:
-        findings = _run_eslint_findings_check(root, runner)
+        findings = _run_eslint_findings_check(root, runner, files=files)
         fixes_applied = False
 
     return {"findings": findings, "fixes_applied": fixes_applied}
@@ -840,33 +1024,21 @@ def run_markdownlint(
         runner = _run_subprocess
 
     fixes_applied = False
+    targets = _lint_targets(root, files)
 
     if fix:
-        # Run markdownlint with --fix to auto-fix issues
-        if files:
-            cmd = ["markdownlint", "--fix", "--json", *[str(f) for f in files]]
-        else:
-            cmd = ["markdownlint", "--fix", "--json", str(root)]
-        result = runner(cmd)
+        # Run markdownlint with --fix to auto-fix issues (chunks in parallel)
+        result = _run_batched(
+            runner, lambda t: ["markdownlint", "--fix", "--json", *t], targets,
+        )
 
         # markdownlint may exit 0 or 1; check if fixes were applied by
-        # looking at git changes
+        # looking at git changes. Committed once, after every chunk.
         _commit_changes(root, "markdownlint", runner=runner)
         fixes_applied = True
 
-        # Re-scan to get remaining issues
-        if files:
-            cmd = ["markdownlint", "--json", *[str(f) for f in files]]
-        else:
-            cmd = ["markdownlint", "--json", str(root)]
-        result = runner(cmd)
-    else:
-        # Normal check mode
-        if files:
-            cmd = ["markdownlint", "--json", *[str(f) for f in files]]
-        else:
-            cmd = ["markdownlint", "--json", str(root)]
-        result = runner(cmd)
+    # Scan (or re-scan after fixing) to get remaining issues
+    result = _run_batched(runner, lambda t: ["markdownlint", "--json", *t], targets)
 
     findings: list[dict[str, Any]] = []
     if result.returncode not in (0, 1):
@@ -951,36 +1123,44 @@ def run_shellcheck(
         if not shell_files:
             return []
 
-    for shell_file in shell_files:
-        cmd = ["shellcheck", "-f", "json", str(shell_file)]
-        result = runner(cmd)
+    # shellcheck is single-threaded: batch the files into argv-bounded
+    # chunks and run the chunks in parallel instead of one process per file.
+    # A chunk shellcheck fails on is re-run per file to keep the others'
+    # findings.
+    result = _run_batched(
+        runner,
+        lambda t: ["shellcheck", "-f", "json", *t],
+        [str(p) for p in shell_files],
+        min_cost=_SHELLCHECK_MIN_COST,
+        split_failed=True,
+    )
 
-        if result.returncode not in (0, 1):
-            continue
+    if result.returncode not in (0, 1):
+        return []
 
-        output = result.stdout.strip()
-        if not output:
-            continue
+    output = result.stdout.strip()
+    if not output:
+        return []
 
-        try:
-            raw = json.loads(output)
-        except json.JSONDecodeError:
-            continue
+    try:
+        raw = json.loads(output)
+    except json.JSONDecodeError:
+        return []
 
-        # shellcheck -f json outputs a list of diagnostics
-        diagnostics = raw if isinstance(raw, list) else [raw]
-        for diag in diagnostics:
-            if not isinstance(diag, dict):
-                continue
-            severity = classify_finding("shellcheck", diag.get("severity", "warning"))
-            findings.append({
-                "file": str(diag.get("file", "")),
-                "line": diag.get("line", 0),
-                "severity": severity,
-                "message": diag.get("message", ""),
-                "linter": "shellcheck",
-                "code": str(diag.get("code", "")),
-            })
+    # shellcheck -f json outputs a list of diagnostics
+    diagnostics = raw if isinstance(raw, list) else [raw]
+    for diag in diagnostics:
+        if not isinstance(diag, dict):
+            continue
+        severity = classify_finding("shellcheck", diag.get("severity", "warning"))
+        findings.append({
+            "file": str(diag.get("file", "")),
+            "line": diag.get("line", 0),
+            "severity": severity,
+            "message": diag.get("message", ""),
+            "linter": "shellcheck",
+            "code": str(diag.get("code", "")),
+        })
 
     return findings
 
@@ -13,10 +13,16 @@ Usage:
 
 import argparse
 import json
+import math
+import mmap
+import os
 import re
+import sqlite3
 import subprocess
 import sys
 import traceback
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -31,6 +37,8 @@ from skill.shared.status_lifecycle import (
     resolve_worklog_dir,
     resolve_worklog_flags,
 )
+from skill.shared.repo_index import open_repo_index
+from skill.shared.worklog_index import WorklogIndex, load_worklog_index
 
 # ---------------------------------------------------------------------------
 # Stop words
@@ -80,6 +88,39 @@ MAX_REPO_FILE_RESULTS: int = 3
 # is preserved in the persisted sidecar full report (see write_full_report).
 MAX_KEYWORDS_PER_FILE: int = 5
 
+# Number of top BM25 candidates from the local Worklog index that are
+# re-ranked with a single `wl search --semantic` query when semantic search
+# is available.
+SEMANTIC_RERANK_TOP_K: int = 10
+
+# Maximum number of keywords joined into the semantic re-rank query.
+SEMANTIC_QUERY_TERMS: int = 12
+
+# Reciprocal-rank-fusion constant used when fusing per-query ranks (the
+# `wl search` fallback) and BM25 with semantic ranks (local index re-rank).
+RRF_K: int = 60
+
+# Maximum number of TF-IDF-ranked terms used to query Worklog. Long
+# descriptions otherwise produce dozens of keywords, each of which cost one
+# `wl search` subprocess on the fallback path.
+MAX_QUERY_TERMS: int = 6
+
+# Maximum number of adjacent title-term pairs added as phrase queries.
+MAX_TITLE_BIGRAMS: int = 2
+
+# Title terms count this many times when weighting keywords (matches the
+# title weight of the local Worklog index).
+TITLE_TERM_WEIGHT: int = 3
+
+# Number of selected terms OR-combined into one `wl search` query on the
+# fallback path. 1 keeps one term per query, which every `wl search`
+# backend understands; raise it where the backend supports `OR` to cut the
+# number of subprocesses further.
+SEARCH_TERMS_PER_QUERY: int = 1
+
+# Maximum number of `wl search` subprocesses run concurrently.
+SEARCH_WORKERS: int = 4
+
 
 # ---------------------------------------------------------------------------
 # CLI helpers
@@ -163,6 +204,99 @@ def extract_keywords(title: str, description: str) -> list[str]:
     return keywords
 
 
+def _content_tokens(text: str) -> list[str]:
+    """Tokenize *text* the way :func:`extract_keywords` does, keeping order."""
+    tokens = re.sub(r"[^a-z0-9]", " ", text.lower()).split()
+    return [t for t in tokens if t not in STOP_WORDS and len(t) >= 3]
+
+
+def weight_keywords(
+    title: str,
+    description: str,
+    idf: Callable[[str], float] | None = None,
+) -> dict[str, float]:
+    """Weight the keywords of a work item by TF-IDF.
+
+    Term frequency is sublinear (``1 + log tf``) with title occurrences
+    counted ``TITLE_TERM_WEIGHT`` times. *idf* maps a term to its inverse
+    document frequency in a reference corpus (e.g.
+    :meth:`WorklogIndex.idf`); without one every term has IDF 1.0, so the
+    weights reduce to title-boosted term frequency.
+
+    Returns:
+        ``{term: weight}`` for every keyword :func:`extract_keywords` yields.
+    """
+    tf: dict[str, int] = {}
+    for term in _content_tokens(title):
+        tf[term] = tf.get(term, 0) + TITLE_TERM_WEIGHT
+    for term in _content_tokens(description):
+        tf[term] = tf.get(term, 0) + 1
+    return {
+        term: (1.0 + math.log(count)) * (idf(term) if idf else 1.0)
+        for term, count in tf.items()
+    }
+
+
+def select_keyword_weights(
+    title: str,
+    description: str,
+    idf: Callable[[str], float] | None = None,
+    limit: int = MAX_QUERY_TERMS,
+) -> dict[str, float]:
+    """Return the *limit* most discriminative keywords with their weights.
+
+    Terms are ranked by :func:`weight_keywords` (ties broken alphabetically
+    for deterministic output) and returned best first as ``{term: weight}``.
+    Terms with zero weight — absent from every other document of the IDF
+    corpus — are never selected.
+    """
+    weights = weight_keywords(title, description, idf)
+    ranked = sorted(
+        (term for term, weight in weights.items() if weight > 0),
+        key=lambda term: (-weights[term], term),
+    )
+    return {term: weights[term] for term in ranked[:limit]}
+
+
+def select_keywords(
+    title: str,
+    description: str,
+    idf: Callable[[str], float] | None = None,
+    limit: int = MAX_QUERY_TERMS,
+) -> list[str]:
+    """Return the terms of :func:`select_keyword_weights`, best first."""
+    return list(select_keyword_weights(title, description, idf, limit))
+
+
+def title_bigrams(title: str, limit: int = MAX_TITLE_BIGRAMS) -> list[str]:
+    """Return up to *limit* unique adjacent keyword pairs from *title*.
+
+    Pairs such as ``"status lifecycle"`` are far more specific than either
+    term alone and are searched as phrases alongside the selected terms.
+    """
+    tokens = _content_tokens(title)
+    pairs = [f"{a} {b}" for a, b in zip(tokens, tokens[1:]) if a != b]
+    return list(dict.fromkeys(pairs))[:limit]
+
+
+def build_search_queries(
+    terms: list[str],
+    bigrams: list[str] | None = None,
+    terms_per_query: int = SEARCH_TERMS_PER_QUERY,
+) -> list[str]:
+    """Group selected *terms* into OR-combined `wl search` queries.
+
+    Terms are chunked ``terms_per_query`` at a time in rank order; title
+    *bigrams* follow as phrase queries. The number of queries is therefore
+    bounded by ``MAX_QUERY_TERMS / terms_per_query + MAX_TITLE_BIGRAMS``
+    regardless of description length.
+    """
+    size = max(1, terms_per_query)
+    queries = [" OR ".join(terms[i:i + size]) for i in range(0, len(terms), size)]
+    queries.extend(bigrams or [])
+    return list(dict.fromkeys(queries))
+
+
 # ---------------------------------------------------------------------------
 # Worklog CLI helpers
 # ---------------------------------------------------------------------------
@@ -258,6 +392,43 @@ def run_wl_update(work_item_id: str, description: str,
         return False
 
 
+def run_wl_list(worklog_flags: list[str] | None = None) -> list[dict[str, Any]] | None:
+    """Export every work item of the store via a single `wl list --json`.
+
+    ``worklog_flags`` pins the target worklog store. Returns the list of
+    work items, or None when the command fails or the output is not a
+    recognisable work-item list.
+    """
+    try:
+        cmd = ["wl"]
+        cmd.extend(worklog_flags or [])
+        cmd.extend(["list", "--json"])
+        out = subprocess.check_output(cmd, encoding="utf-8", stderr=subprocess.PIPE)
+        data = json.loads(out)
+        items = data.get("workItems", data.get("items")) if isinstance(data, dict) else data
+        if isinstance(items, list):
+            return [item for item in items if isinstance(item, dict)]
+        return None
+    except Exception:  # noqa: BLE001 -- export failure falls back to wl search
+        return None
+
+
+def load_local_index(work_item_id: str,
+                     worklog_flags: list[str] | None = None) -> WorklogIndex | None:
+    """Return the local BM25 index for the work item's store, or None.
+
+    The index lives in the git dir of the repo holding the store and is
+    refreshed from one `wl list --json` export only when the store changed
+    since it was built (see :mod:`skill.shared.worklog_index`). None means no usable index
+    (unresolved store, failed or empty export) — callers fall back to
+    per-keyword `wl search`.
+    """
+    return load_worklog_index(
+        resolve_worklog_dir(work_item_id),
+        export=lambda: run_wl_list(worklog_flags),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Semantic search availability detection
 # ---------------------------------------------------------------------------
@@ -301,41 +472,124 @@ def _score_key(item: dict[str, Any]) -> float:
     return float(score)
 
 
+def _semantic_rerank(
+    candidates: list[dict[str, Any]],
+    keywords: list[str],
+    worklog_flags: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Re-rank local BM25 *candidates* with one `wl search --semantic` query.
+
+    BM25 and semantic ranks are fused with reciprocal-rank fusion
+    (``1 / (RRF_K + rank)`` per list); candidates the semantic search did
+    not return keep only their BM25 contribution. Items the semantic search
+    returns that are not candidates are ignored — the re-rank never widens
+    the candidate set.
+    """
+    query = " ".join(keywords[:SEMANTIC_QUERY_TERMS])
+    semantic = run_wl_search(query, use_semantic=True, worklog_flags=worklog_flags)
+    semantic_rank = {}
+    for rank, item in enumerate(semantic, start=1):
+        item_id = item.get("id")
+        if item_id and item_id not in semantic_rank:
+            semantic_rank[item_id] = rank
+
+    def fused(entry: tuple[int, dict[str, Any]]) -> float:
+        rank, item = entry
+        score = 1.0 / (RRF_K + rank)
+        if item.get("id") in semantic_rank:
+            score += 1.0 / (RRF_K + semantic_rank[item["id"]])
+        return score
+
+    ranked = sorted(enumerate(candidates, start=1), key=fused, reverse=True)
+    return [item for _rank, item in ranked]
+
+
+def search_local_index(
+    index: WorklogIndex,
+    keywords: Mapping[str, float] | list[str],
+    use_semantic: bool = False,
+    worklog_flags: list[str] | None = None,
+    exclude_ids: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    """Rank work items with one weighted BM25 query against the local index.
+
+    All keywords go into a single query (no per-keyword subprocesses).
+    *keywords* maps each term to its query weight (best first, as from
+    :func:`select_keyword_weights`); a plain list weights every term 1.0.
+    When *use_semantic* is True the top ``SEMANTIC_RERANK_TOP_K`` candidates
+    are re-ranked with a single `wl search --semantic` call. The result is
+    capped at MAX_WORK_ITEM_RESULTS.
+    """
+    if not keywords:
+        return []
+    candidates = index.search(
+        keywords,
+        limit=max(SEMANTIC_RERANK_TOP_K, MAX_WORK_ITEM_RESULTS),
+        exclude=exclude_ids or (),
+    )
+    if use_semantic and candidates:
+        candidates = _semantic_rerank(candidates, list(keywords), worklog_flags)
+    return candidates[:MAX_WORK_ITEM_RESULTS]
+
+
 def search_and_dedup(
     keywords: list[str],
     use_semantic: bool = False,
     worklog_flags: list[str] | None = None,
 ) -> list[dict[str, Any]]:
-    """Search Worklog for each keyword, aggregate results, deduplicate, rank, and limit.
+    """Search Worklog for each query, fuse the rankings, deduplicate, and limit.
+
+    This is the fallback path when no local index is available (see
+    :func:`search_local_index`). Each entry of *keywords* is one `wl search`
+    query — normally the output of :func:`build_search_queries`, so the
+    number of subprocesses is bounded. Queries run concurrently on at most
+    ``SEARCH_WORKERS`` threads.
 
-    Results are ranked by descending score (the `score` field from
-    `wl search --json`, which is BM25 or hybrid BM25+semantic). Items
-    without a score sort last. The final list is capped at
-    MAX_WORK_ITEM_RESULTS.
+    Ranking heuristic: within each query, results are ordered by descending
+    `score` (BM25 or hybrid BM25+semantic from `wl search --json`; unscored
+    items last). Per-query ranks are fused with reciprocal-rank fusion
+    (``1 / (RRF_K + rank)`` summed over the queries returning an item), so
+    items matching several queries rise; ties fall back to the best raw
+    score. The final list is capped at MAX_WORK_ITEM_RESULTS.
 
     ``worklog_flags`` pins the target worklog store (resolved from the
     work-item id being analyzed) so every search targets the same store.
-
-    Ranking heuristic: scored items are sorted by descending score
-    (higher = more relevant). Unscored items sort after all scored items.
     """
-    seen: set = set()
-    results: list[dict[str, Any]] = []
+    if not keywords:
+        return []
 
-    for keyword in keywords:
-        items = run_wl_search(keyword, use_semantic=use_semantic,
-                              worklog_flags=worklog_flags)
-        for item in items:
+    def search(query: str) -> list[dict[str, Any]]:
+        return run_wl_search(query, use_semantic=use_semantic,
+                             worklog_flags=worklog_flags)
+
+    workers = max(1, min(SEARCH_WORKERS, len(keywords)))
+    if workers == 1:
+        per_query = [search(query) for query in keywords]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            per_query = list(pool.map(search, keywords))
+
+    fused: dict[str, float] = {}
+    items_by_id: dict[str, dict[str, Any]] = {}
+    for items in per_query:
+        seen: set[str] = set()
+        for item in sorted(items, key=_score_key, reverse=True):
             item_id = item.get("id")
-            if item_id and item_id not in seen:
-                seen.add(item_id)
-                results.append(item)
-
-    # Rank by descending score (unscored items sort last)
-    results.sort(key=_score_key, reverse=True)
-
-    # Limit to configured maximum
-    return results[:MAX_WORK_ITEM_RESULTS]
+            if not item_id or item_id in seen:
+                continue
+            seen.add(item_id)
+            rank = len(seen)
+            fused[item_id] = fused.get(item_id, 0.0) + 1.0 / (RRF_K + rank)
+            best = items_by_id.get(item_id)
+            if best is None or _score_key(item) > _score_key(best):
+                items_by_id[item_id] = item
+
+    ordered = sorted(
+        items_by_id,
+        key=lambda item_id: (fused[item_id], _score_key(items_by_id[item_id])),
+        reverse=True,
+    )
+    return [items_by_id[item_id] for item_id in ordered[:MAX_WORK_ITEM_RESULTS]]
 
 
 # ---------------------------------------------------------------------------
@@ -351,6 +605,121 @@ EXCLUDED_DIRS: set = {".git", "node_modules", "__pycache__", ".pytest_cache",
                       "dist", "build", ".next"}
 
 
+# Files larger than this are skipped (generated bundles, data dumps, logs).
+MAX_REPO_FILE_BYTES: int = 2 * 1024 * 1024
+
+# Leading bytes inspected for a NUL byte to detect binary files.
+BINARY_SNIFF_BYTES: int = 8192
+
+# Threads scanning file contents; small repos are scanned inline.
+REPO_SCAN_WORKERS: int = 8
+REPO_SCAN_PARALLEL_THRESHOLD: int = 64
+
+
+def _is_candidate(rel: str) -> bool:
+    """Return True for paths with an allowed extension outside excluded dirs."""
+    if os.path.splitext(rel)[1].lower() not in ALLOWED_EXTENSIONS:
+        return False
+    return not any(part in EXCLUDED_DIRS for part in rel.split("/")[:-1])
+
+
+def _git_listed_files(root: Path) -> list[str] | None:
+    """List tracked and untracked, non-ignored files under *root* via git.
+
+    Returns None when *root* is not inside a git work tree (or git is
+    unavailable); callers then fall back to :func:`_walk_files`.
+    """
+    try:
+        out = subprocess.run(
+            ["git", "-C", str(root), "ls-files", "-z", "--cached", "--others",
+             "--exclude-standard"],
+            capture_output=True, check=True, timeout=60,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return [p for p in out.decode("utf-8", "surrogateescape").split("\0") if p]
+
+
+def _walk_files(root: Path) -> list[str]:
+    """Walk *root* with ``os.scandir``, pruning EXCLUDED_DIRS before descending."""
+    files: list[str] = []
+    stack = [(str(root), "")]
+    while stack:
+        path, prefix = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    rel = prefix + entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in EXCLUDED_DIRS:
+                                stack.append((entry.path, rel + "/"))
+                        elif entry.is_file():
+                            files.append(rel)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return files
+
+
+def _match_keywords(data: bytes | mmap.mmap, keywords: frozenset[str]) -> set[str]:
+    """Return the lowercased *keywords* occurring anywhere in *data*.
+
+    The file is decoded and lowercased once, then each keyword is a plain
+    substring test (as in the legacy scan). Queries carry hundreds of
+    keywords (``extract_keywords`` yields ~800 for a long SKILL.md), where
+    this is an order of magnitude faster than a regex alternation.
+    """
+    text = data[:].decode("utf-8", "ignore").lower()
+    return {kw for kw in keywords if kw in text}
+
+
+def _scan_file(path: str, keywords: frozenset[str]) -> set[str]:
+    """Match *keywords* against one file; binary, huge and unreadable files yield nothing."""
+    try:
+        with open(path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size == 0 or size > MAX_REPO_FILE_BYTES:
+                return set()
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if b"\0" in data[:BINARY_SNIFF_BYTES]:
+                    return set()
+                return _match_keywords(data, keywords)
+    except (OSError, ValueError):
+        return set()
+
+
+def _search_repo_index(root: Path, keywords: list[str]) -> list[dict[str, Any]] | None:
+    """Answer a repo search from the shared repo term index.
+
+    Keywords match indexed terms by prefix (``script`` finds ``scripts``).
+    Returns unranked ``{"file", "matches"}`` dicts relative to *root*, or
+    None when *root* is not in a git work tree or the index is unusable
+    (callers then scan the files directly).
+    """
+    index = open_repo_index(root)
+    if index is None:
+        return None
+    try:
+        with index:
+            index.refresh()
+            hits = index.search(keywords, prefix=True)
+    except (OSError, sqlite3.Error):
+        return None
+    prefix = os.path.relpath(root.resolve(), index.repo_root).replace(os.sep, "/")
+    prefix = "" if prefix == "." else prefix + "/"
+    results = []
+    for hit in hits:
+        rel = hit["file"]
+        if not rel.startswith(prefix):
+            continue
+        rel = rel[len(prefix):]
+        if _is_candidate(rel):
+            results.append({"file": str(Path(rel)), "matches": hit["matches"]})
+    return results
+
+
 def search_repo(repo_path: str, keywords: list[str]) -> list[dict[str, Any]]:
     """Search repository files for matching keywords.
 
@@ -359,6 +728,17 @@ def search_repo(repo_path: str, keywords: list[str]) -> list[dict[str, Any]]:
       - file: relative path from repo root
       - matches: list of keywords found in the file
 
+    In a git work tree the search is answered from the shared repo term
+    index (:mod:`skill.shared.repo_index`, refreshed incrementally from
+    ``git diff``/``git status``), where keywords match whole terms or term
+    prefixes. Otherwise files come from ``git ls-files --cached --others
+    --exclude-standard`` (so ``.gitignore`` is honoured) or, outside git,
+    an ``os.scandir`` walk that never descends into EXCLUDED_DIRS; each
+    file is memory-mapped, lowercased once and tested for each keyword as
+    a substring, spread over REPO_SCAN_WORKERS threads. Binary
+    files (NUL in the first BINARY_SNIFF_BYTES) and files over
+    MAX_REPO_FILE_BYTES are skipped on both paths.
+
     Results are ranked by descending number of distinct keyword matches
     (higher = more relevant). Ties are broken alphabetically for
     deterministic ordering. The final list is capped at
@@ -374,37 +754,41 @@ def search_repo(repo_path: str, keywords: list[str]) -> list[dict[str, Any]]:
     if not root.is_dir():
         return []
 
-    results: list[dict[str, Any]] = []
-
-    for file_path in root.rglob("*"):
-        # Skip directories
-        if not file_path.is_file():
-            continue
-
-        # Check extension
-        if file_path.suffix.lower() not in ALLOWED_EXTENSIONS:
-            continue
-
-        # Check if file is inside an excluded directory
-        rel = file_path.relative_to(root)
-        parts = rel.parts
-        if any(part in EXCLUDED_DIRS for part in parts):
-            continue
-
-        # Read and search file content
-        try:
-            content = file_path.read_text(encoding="utf-8", errors="ignore").lower()
-        except Exception:  # noqa: S112, BLE001 -- skip unreadable files
-            continue
+    originals: dict[str, list[str]] = {}
+    for kw in keywords:
+        if kw:
+            originals.setdefault(kw.lower(), []).append(kw)
+    if not originals:
+        return []
+    wanted = frozenset(originals)
 
-        found = [kw for kw in keywords if kw.lower() in content]
-        if found:
-            results.append({
-                "file": str(rel),
-                "matches": sorted(found),
-                # Number of distinct keyword matches — used for ranking
-                "_match_count": len(found),
-            })
+    results: list[dict[str, Any]] = []
+    indexed = _search_repo_index(root, sorted(wanted))
+    if indexed is not None:
+        matches = [(m["file"], m["matches"]) for m in indexed]
+    else:
+        listed = _git_listed_files(root) or _walk_files(root)
+        rel_files = [rel for rel in listed if _is_candidate(rel)]
+
+        def scan(rel: str) -> set[str]:
+            return _scan_file(os.path.join(root, rel), wanted)
+
+        if len(rel_files) >= REPO_SCAN_PARALLEL_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=REPO_SCAN_WORKERS) as pool:
+                hits = list(pool.map(scan, rel_files))
+        else:
+            hits = [scan(rel) for rel in rel_files]
+        matches = [(str(Path(rel)), sorted(found))
+                   for rel, found in zip(rel_files, hits) if found]
+
+    for rel, found in matches:
+        matched = [kw for low in found for kw in originals[low]]
+        results.append({
+            "file": rel,
+            "matches": sorted(matched),
+            # Number of distinct keyword matches — used for ranking
+            "_match_count": len(matched),
+        })
 
     # Rank by descending match count, then alphabetically for determinism
     results.sort(key=lambda m: (-m["_match_count"], m["file"]))
@@ -642,9 +1026,33 @@ def _main() -> None:
         if args.verbose:
             print(f"[find-related] Semantic search available: {use_semantic}", file=sys.stderr)
 
-        # Search Worklog (with semantic ranking when available)
-        related_items = search_and_dedup(keywords, use_semantic=use_semantic,
-                                         worklog_flags=wl_flags)
+        # Query Worklog with the MAX_QUERY_TERMS most discriminative terms
+        # (TF-IDF, with IDF from the local index minus this item when one
+        # exists, so terms only this item uses are dropped): one BM25
+        # query against the local index (semantic re-rank of the top-k when
+        # available), or a bounded set of concurrent `wl search` queries
+        # fused with RRF when no local index could be built.
+        local_index = load_local_index(args.work_item_id, worklog_flags=wl_flags)
+        query_weights = select_keyword_weights(
+            title, description,
+            idf=(lambda term: local_index.idf(term, exclude=[args.work_item_id]))
+            if local_index is not None else None,
+        )
+        query_terms = list(query_weights)
+        if args.verbose:
+            print(f"[find-related] Query terms: {query_terms}", file=sys.stderr)
+        if local_index is not None:
+            if args.verbose:
+                print(f"[find-related] Local index: {len(local_index)} items",
+                      file=sys.stderr)
+            related_items = search_local_index(
+                local_index, query_weights, use_semantic=use_semantic,
+                worklog_flags=wl_flags, exclude_ids=[args.work_item_id],
+            )
+        else:
+            queries = build_search_queries(query_terms, title_bigrams(title))
+            related_items = search_and_dedup(queries, use_semantic=use_semantic,
+                                             worklog_flags=wl_flags)
 
         # Search repository (ranked and limited)
         repo_matches = search_repo(args.repo_path, keywords)
@@ -683,6 +1091,7 @@ def _main() -> None:
             "addedIds": added_ids,
             "reportInserted": update_success,
             "keywords": keywords,
+            "queryTerms": query_terms,
             "relatedItemCount": len(related_items),
             "repoMatchCount": len(repo_matches),
             "fullReportPath": str(full_report_path) if full_report_path else None,
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""Benchmark find_related.search_repo against the legacy rglob scan.
+
+The legacy scan (kept below as ``legacy_search_repo``) walked the whole tree
+with ``Path.rglob("*")`` and filtered ``EXCLUDED_DIRS`` only after yielding
+each path, so it descended into ``node_modules`` and stat'ed every file in
+it, then read and lowercased every candidate in Python.
+
+The fixture is a small project (``--source-files`` modules and docs, a few
+containing the keywords) next to a large ``node_modules`` tree
+(``--node-modules-files`` ``.js``/``.md`` files that also contain the
+keywords, so a scan that fails to prune them returns wrong results), a
+binary file and an oversized generated bundle. Both scans run against the
+plain directory (scandir walk). When git is available the tree is then
+committed with ``node_modules/`` in ``.gitignore`` and searched through the
+shared repo term index: once cold (index build) and once warm (the
+steady-state cost). The plain-directory scans are repeated with
+``MANY_KEYWORDS`` (hundreds of terms, as real queries carry). Output is
+JSON with wall-clock seconds per scan and a result-equivalence check.
+
+Run (from repo root):
+
+    python3 skill/find-related/tests/benchmark_search_repo.py
+    python3 skill/find-related/tests/benchmark_search_repo.py --node-modules-files 20000
+    FIND_RELATED_BENCH_NODE_MODULES=5000 python3 skill/find-related/tests/benchmark_search_repo.py
+
+No network access is required. The fixture is generated in a temp dir and
+removed on exit.
+"""  # noqa: EXE001
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+_SCRIPT_PATH = REPO_ROOT / "skill" / "find-related" / "scripts" / "find_related.py"
+_spec = importlib.util.spec_from_file_location("find_related", _SCRIPT_PATH)
+find_related = importlib.util.module_from_spec(_spec)
+assert _spec.loader is not None
+_spec.loader.exec_module(find_related)
+
+DEFAULT_NODE_MODULES_FILES = int(
+    os.environ.get("FIND_RELATED_BENCH_NODE_MODULES", "50000")
+)
+DEFAULT_SOURCE_FILES = 400
+
+KEYWORDS = ["semaphore", "fanout", "lifecycle", "worktree", "reconcile"]
+
+# A query the size find_related builds from a long work item (extract_keywords
+# yields ~800 terms for skill/implement/SKILL.md): KEYWORDS plus filler terms,
+# a few of which ("handler", "value", "module") occur in every source file.
+MANY_KEYWORDS = KEYWORDS + ["handler", "value", "module"] + [
+    f"term{i:03d}" for i in range(800)
+]
+
+# Every HIT_EVERY-th source file mentions a growing subset of KEYWORDS so
+# the ranking has distinct match counts.
+HIT_EVERY = 25
+
+# Files per node_modules package directory.
+FILES_PER_PACKAGE = 50
+
+# Keyword-bearing files the current scan skips on purpose (binary, oversized);
+# the legacy scan reports them.
+SKIPPED_FILES = {"src/logo.py", "src/bundle.js"}
+
+
+def _source_text(i: int) -> str:
+    body = f"# Module {i}\n\n" + "def handler_{0}(value):\n    return value * {0}\n".format(i) * 20
+    if i % HIT_EVERY == 0:
+        body += "\n# " + " ".join(KEYWORDS[: 1 + (i // HIT_EVERY) % len(KEYWORDS)]) + "\n"
+    return body
+
+
+def generate_fixture(root: Path, source_files: int, node_modules_files: int) -> dict[str, Any]:
+    """Write the project and its node_modules trap under *root*."""
+    for i in range(source_files):
+        ext = ".md" if i % 4 == 0 else ".py"
+        path = root / "src" / f"pkg{i // 100:02d}" / f"mod_{i:05d}{ext}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_source_text(i))
+
+    trap = "/* " + " ".join(KEYWORDS) + " */\nmodule.exports = function () {};\n"
+    for i in range(node_modules_files):
+        pkg = root / "node_modules" / f"pkg{i // FILES_PER_PACKAGE:05d}"
+        if i % FILES_PER_PACKAGE == 0:
+            pkg.mkdir(parents=True, exist_ok=True)
+        (pkg / (f"index{i}.js" if i % 2 else f"README{i}.md")).write_text(trap)
+
+    (root / "src" / "logo.py").write_bytes(b"\x89PNG\0\0" + " ".join(KEYWORDS).encode())
+    (root / "src" / "bundle.js").write_text(
+        " ".join(KEYWORDS) + "\n" + "x" * (find_related.MAX_REPO_FILE_BYTES + 1)
+    )
+    return {"source_files": source_files, "node_modules_files": node_modules_files}
+
+
+def legacy_search_repo(repo_path: str, keywords: list[str]) -> list[dict[str, Any]]:
+    """The pre-optimisation scan (rglob, post-hoc exclusion, full reads)."""
+    root = Path(repo_path)
+    results: list[dict[str, Any]] = []
+    for file_path in root.rglob("*"):
+        if not file_path.is_file():
+            continue
+        if file_path.suffix.lower() not in find_related.ALLOWED_EXTENSIONS:
+            continue
+        rel = file_path.relative_to(root)
+        if any(part in find_related.EXCLUDED_DIRS for part in rel.parts):
+            continue
+        try:
+            content = file_path.read_text(encoding="utf-8", errors="ignore").lower()
+        except Exception:  # noqa: S112, BLE001 -- skip unreadable files
+            continue
+        found = [kw for kw in keywords if kw.lower() in content]
+        if found:
+            results.append({"file": str(rel), "matches": sorted(found), "_n": len(found)})
+    results.sort(key=lambda m: (-m["_n"], m["file"]))
+    for m in results:
+        del m["_n"]
+    return results[: find_related.MAX_REPO_FILE_RESULTS]
+
+
+def _timed(fn):
+    t0 = time.monotonic()
+    result = fn()
+    return result, round(time.monotonic() - t0, 4)
+
+
+def _init_git(root: Path) -> bool:
+    if shutil.which("git") is None:
+        return False
+    (root / ".gitignore").write_text("node_modules/\n")
+    git = ["git", "-C", str(root), "-c", "user.name=bench", "-c", "user.email=bench@example.invalid"]
+    try:
+        subprocess.run(["git", "init", "-q", str(root)], check=True, capture_output=True)
+        subprocess.run([*git, "add", "-A"], check=True, capture_output=True)
+        subprocess.run([*git, "commit", "-q", "-m", "fixture"], check=True, capture_output=True)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return True
+
+
+def run_benchmark(root: Path, source_files: int, node_modules_files: int) -> dict[str, Any]:
+    """Generate a fixture under *root* and time both scans."""
+    fixture = generate_fixture(root, source_files, node_modules_files)
+    report: dict[str, Any] = {
+        "fixture": fixture, "keywords": KEYWORDS,
+        "many_keywords": len(MANY_KEYWORDS), "seconds": {},
+    }
+
+    # Compare full rankings, not just the top MAX_REPO_FILE_RESULTS.
+    cap = find_related.MAX_REPO_FILE_RESULTS
+    find_related.MAX_REPO_FILE_RESULTS = sys.maxsize
+    try:
+        legacy, report["seconds"]["legacy_walk"] = _timed(
+            lambda: legacy_search_repo(str(root), KEYWORDS)
+        )
+        current, report["seconds"]["scandir_walk"] = _timed(
+            lambda: find_related.search_repo(str(root), KEYWORDS)
+        )
+        expected = [m for m in legacy if m["file"] not in SKIPPED_FILES]
+        report["equivalent"] = expected == current
+        legacy_many, report["seconds"]["legacy_walk_many_keywords"] = _timed(
+            lambda: legacy_search_repo(str(root), MANY_KEYWORDS)
+        )
+        current_many, report["seconds"]["scandir_walk_many_keywords"] = _timed(
+            lambda: find_related.search_repo(str(root), MANY_KEYWORDS)
+        )
+        report["equivalent"] = report["equivalent"] and current_many == [
+            m for m in legacy_many if m["file"] not in SKIPPED_FILES
+        ]
+        if _init_git(root):
+            for label in ("repo_index_build", "repo_index_warm"):
+                indexed, report["seconds"][label] = _timed(
+                    lambda: find_related.search_repo(str(root), KEYWORDS)
+                )
+                report["equivalent"] = report["equivalent"] and indexed == current
+    finally:
+        find_related.MAX_REPO_FILE_RESULTS = cap
+    report["node_modules_leaked"] = any("node_modules" in m["file"] for m in current)
+    report["skipped_files_reported"] = sorted(
+        {m["file"] for m in current} & SKIPPED_FILES
+    )
+
+    report["speedup_x"] = {}
+    for name, secs in report["seconds"].items():
+        if name.startswith("legacy_walk"):
+            continue
+        many = name.endswith("_many_keywords")
+        legacy_s = report["seconds"]["legacy_walk_many_keywords" if many else "legacy_walk"]
+        report["speedup_x"][name] = round(legacy_s / secs, 1) if secs > 0 else None
+    report["matched_files"] = len(current)
+    report["top_matches"] = current[:cap]
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--node-modules-files", type=int, default=DEFAULT_NODE_MODULES_FILES,
+                        help=f"Files under node_modules (default {DEFAULT_NODE_MODULES_FILES})")
+    parser.add_argument("--source-files", type=int, default=DEFAULT_SOURCE_FILES,
+                        help=f"Project source files (default {DEFAULT_SOURCE_FILES})")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="find-related-bench-") as tmp:
+        report = run_benchmark(Path(tmp), args.source_files, args.node_modules_files)
+    print(json.dumps(report, indent=2))
+    ok = (report["equivalent"] and not report["node_modules_leaked"]
+          and not report["skipped_files_reported"])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Tests for the find_related.search_repo benchmark harness.
+
+Runs the harness on a small fixture: the pruned scan must return the same
+ranking as the legacy rglob scan (minus the binary and oversized files it
+skips on purpose) and never report node_modules files.
+"""  # noqa: EXE001
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import benchmark_search_repo as bench
+
+
+def test_benchmark_small_fixture_is_equivalent(tmp_path: Path) -> None:
+    report = bench.run_benchmark(tmp_path, source_files=60, node_modules_files=200)
+    assert report["equivalent"] is True
+    assert report["node_modules_leaked"] is False
+    assert report["skipped_files_reported"] == []
+    assert report["matched_files"] > 0
+    assert {
+        "legacy_walk", "scandir_walk",
+        "legacy_walk_many_keywords", "scandir_walk_many_keywords",
+    } <= set(report["seconds"])
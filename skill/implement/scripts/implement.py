@@ -18,10 +18,16 @@ Optional flags:
   --commit-msg <msg>        Commit message override
   --parent-branch <branch>  Override parent branch (default: dev)
   --worktree-path <path>    Override worktree path
+  --max-parallel N          parent: start up to N independent children (default: 1)
+  --from-step STEP          finish: start at STEP (default: resume from checkpoint)
+  --defer-push              parent: stack children locally, push once at the end
   -v, --verbose             Verbose logging
 
 Environment:
-  IMPLEMENT_TEST_COMMAND    Override the finish test-step command (shell string)
+  IMPLEMENT_TEST_COMMAND        Override the finish test-step command (shell string)
+  IMPLEMENT_WORKTREE_POOL_SIZE  Warm worktrees kept for reuse (default: 0, off)
+  IMPLEMENT_BUILD_INPUT_GLOBS   Build-cache input globs (default: all tracked files)
+  IMPLEMENT_NO_BUILD_CACHE      Set to 1 to always run the build step
 
 Exit codes:
   0 – success
@@ -32,6 +38,7 @@ Exit codes:
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import logging
 import os
@@ -40,9 +47,10 @@ import shutil
 import signal
 import subprocess
 import sys
+import tempfile
 import time
 import traceback
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -51,6 +59,7 @@ _REPO_ROOT = Path(__file__).resolve().parents[3]
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
+from skill.shared import worktree_registry
 from skill.shared.code_freeze import is_code_freeze_active
 from skill.shared.status_lifecycle import StatusLifecycle, worklog_dir_flag
 from skill.test_cache import run_cached
@@ -71,13 +80,34 @@ LOG = logging.getLogger("implement.scripts.implement")
 REPO_ROOT = Path.cwd().resolve()
 DEFAULT_PARENT_BRANCH = "dev"
 DEFAULT_WORKTREE_DIR = ".worklog/worktrees"
+WORKTREE_POOL_DIR = f"{DEFAULT_WORKTREE_DIR}/.pool"
+WORKTREE_POOL_SIZE_ENV = "IMPLEMENT_WORKTREE_POOL_SIZE"
+DEFAULT_WORKTREE_POOL_SIZE = 0
 DEFAULT_MAX_RETRY = 3
+DEP_FETCH_WORKERS = 8
+# Worktree process cleanup: SIGTERM grace period and exit polling interval.
+PROCESS_TERM_GRACE_SECONDS = 2.0
+PROCESS_EXIT_POLL_INTERVAL = 0.05
+_PROC_ROOT = "/proc"
 SLUG_MAX_LENGTH = 40
 WORK_ITEM_ID_PATTERN = re.compile(r"^[A-Z]+-\w+$")
 
+# Separates the build command from the ``scripts.build`` body in build-cache keys
+_BUILD_CACHE_SEPARATOR = "\x00"
+
 # State file name stored inside the worktree
 STATE_FILE_NAME = ".implement_state.json"
 
+# Scheduler state for parent items, stored under DEFAULT_WORKTREE_DIR
+PARENT_STATE_FILE_NAME = ".implement_parent_{work_item_id}.json"
+
+# Finish steps in pipeline order, and the checkpoint copy of the state file
+# kept in the main checkout (the worktree is removed before the push step).
+FINISH_STEPS = (
+    "refactor", "build", "tests", "commit", "cleanup", "remove_worktree", "restore", "push",
+)
+FINISH_STATE_FILE_NAME = ".implement_finish_{work_item_id}.json"
+
 
 # ---------------------------------------------------------------------------
 # Data classes
@@ -98,6 +128,12 @@ class ImplementState:
     parent_branch: str = DEFAULT_PARENT_BRANCH
     commit_msg: str = ""
     started_at: str = ""
+    # Parent whose deferred-push stack this child joins (phase_parent
+    # --defer-push); empty for standalone items.
+    parent_id: str = ""
+    # Completed finish steps: step name -> completed_at plus the step's
+    # input fingerprint / commit (see _finish_resume_step).
+    finish_steps: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -107,6 +143,8 @@ class ImplementState:
             "parent_branch": self.parent_branch,
             "commit_msg": self.commit_msg,
             "started_at": self.started_at,
+            "parent_id": self.parent_id,
+            "finish_steps": self.finish_steps,
         }
 
     @classmethod
@@ -118,6 +156,8 @@ class ImplementState:
             parent_branch=data.get("parent_branch", DEFAULT_PARENT_BRANCH),
             commit_msg=data.get("commit_msg", ""),
             started_at=data.get("started_at", ""),
+            parent_id=data.get("parent_id", ""),
+            finish_steps=dict(data.get("finish_steps") or {}),
         )
 
 
@@ -375,6 +415,29 @@ def wl_dep_blockers(work_item_id: str) -> list[dict[str, Any]]:
     return outbound if isinstance(outbound, list) else []
 
 
+def wl_dep_blockers_many(work_item_ids: list[str]) -> dict[str, list[dict[str, Any]]]:
+    """Fetch the outbound dependency edges of several work items at once.
+
+    ``wl`` has no bulk dependency endpoint, so the per-item ``wl dep list``
+    calls (:func:`wl_dep_blockers`) run concurrently on up to
+    ``DEP_FETCH_WORKERS`` threads.
+
+    Args:
+        work_item_ids: Work item IDs (duplicates and empty IDs are ignored).
+
+    Returns:
+        Mapping work item ID → outbound dependency-edge dicts (empty lists
+        for items without dependencies or whose fetch failed).
+    """
+    ids = list(dict.fromkeys(i for i in work_item_ids if i))
+    if len(ids) <= 1:
+        return {i: wl_dep_blockers(i) for i in ids}
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(DEP_FETCH_WORKERS, len(ids))) as executor:
+        return dict(zip(ids, executor.map(wl_dep_blockers, ids)))
+
+
 def wl_add_comment(work_item_id: str, comment: str) -> bool:
     """Add a comment to a work item.
 
@@ -519,16 +582,17 @@ def _resolve_implementation_order(
     def _key(cid: str) -> tuple[int, str]:
         return (int(child_by_id[cid].get("sortIndex") or 0), cid)
 
-    ready = sorted((cid for cid in child_ids if in_degree[cid] == 0), key=_key)
+    # Ready queue as a heap of (sortIndex, id): O(log n) per push/pop.
+    ready = [_key(cid) for cid in child_ids if in_degree[cid] == 0]
+    heapq.heapify(ready)
     ordered: list[str] = []
     while ready:
-        cid = ready.pop(0)
+        _, cid = heapq.heappop(ready)
         ordered.append(cid)
         for dep in dependents[cid]:
             in_degree[dep] -= 1
             if in_degree[dep] == 0:
-                ready.append(dep)
-        ready.sort(key=_key)
+                heapq.heappush(ready, _key(dep))
 
     if len(ordered) != len(child_ids):
         remaining = sorted(child_ids - set(ordered), key=_key)
@@ -564,6 +628,29 @@ def _next_child_to_implement(
         remaining child is terminal, in progress elsewhere, or blocked by a
         non-terminal sibling).
     """
+    ready = _ready_children(children, blockers_map)
+    return ready[0] if ready else None
+
+
+def _ready_children(
+    children: list[dict[str, Any]],
+    blockers_map: dict[str, list[dict[str, Any]]] | None = None,
+) -> list[dict[str, Any]]:
+    """Return the ready frontier: every child that could start right now.
+
+    Applies the same rules as :func:`_next_child_to_implement` to all
+    children instead of stopping at the first: terminal and in-progress
+    children are skipped, and a child is ready only when every in-chain
+    blocker is terminal. Ready children never block one another.
+
+    Args:
+        children: List of child work-item dicts in dependency order.
+        blockers_map: Mapping child id → outbound dependency-edge dicts from
+            ``wl dep list`` (defaults to {}).
+
+    Returns:
+        The ready children, in dependency order.
+    """
     blockers_map = blockers_map or {}
     child_ids = {str(c.get("id")) for c in children}
     terminal_ids = {
@@ -571,6 +658,7 @@ def _next_child_to_implement(
         for c in children
         if _is_terminal_status(str(c.get("status", "")))
     }
+    ready: list[dict[str, Any]] = []
     for child in children:
         action = _classify_child(child)
         if action == "skip-terminal":
@@ -584,11 +672,11 @@ def _next_child_to_implement(
             if str(b.get("id")) in child_ids
         ]
         if all(bid in terminal_ids for bid in in_chain_blockers):
-            return child
+            ready.append(child)
         # else: blocked by a non-terminal sibling — dependents come later
         # in the order and are transitively blocked; keep scanning for an
         # independent sibling that is startable.
-    return None
+    return ready
 
 
 # ---------------------------------------------------------------------------
@@ -746,6 +834,48 @@ def git_get_commit_hash(cwd: str) -> str:
     return "unknown"
 
 
+def git_worktree_tree_id(cwd: str) -> str | None:
+    """Fingerprint the working tree at *cwd* as a git tree id.
+
+    Stages every change (tracked and untracked, not ignored) into a scratch
+    copy of the index and writes it as a tree, so the id only depends on
+    file contents: it is the same before and after the changes are committed.
+    The implement state file and ``.worklog/`` are excluded.
+
+    Args:
+        cwd: Worktree root.
+
+    Returns:
+        The tree id, or None when it cannot be computed.
+    """
+    index = run_cmd(["git", "rev-parse", "--git-path", "index"], cwd=cwd, check=False)
+    if index.returncode != 0:
+        return None
+    fd, scratch = tempfile.mkstemp(prefix="implement-index-")
+    os.close(fd)
+    try:
+        index_path = Path(cwd, index.stdout.strip())
+        if index_path.is_file():
+            shutil.copyfile(index_path, scratch)
+        else:
+            os.unlink(scratch)
+        env = {"GIT_INDEX_FILE": scratch}
+        added = run_cmd(["git", "add", "-A"], cwd=cwd, check=False, env=env)
+        if added.returncode != 0:
+            return None
+        # Dropped afterwards rather than excluded by pathspec: git refuses
+        # an explicit pathspec that names an ignored file.
+        run_cmd(
+            ["git", "rm", "-r", "-q", "--cached", "--ignore-unmatch", "--",
+             STATE_FILE_NAME, ".worklog"],
+            cwd=cwd, check=False, env=env,
+        )
+        tree = run_cmd(["git", "write-tree"], cwd=cwd, check=False, env=env)
+        return tree.stdout.strip() if tree.returncode == 0 else None
+    finally:
+        Path(scratch).unlink(missing_ok=True)
+
+
 def _get_repo_root(cwd: str | None = None) -> str | None:
     """Get the absolute path to the MAIN git repository root.
 
@@ -946,44 +1076,411 @@ def _remove_worktree(worktree_path: str, repo_root: str | None = None) -> bool:
 def _restore_repo_state(repo_root: str) -> None:
     """Restore the repo to the dev branch.
 
+    Skipped when the main checkout is already on dev and dev matches
+    ``origin`` (nothing changed upstream): the checkout and pull would only
+    rewrite the index, invalidating index-based cache fingerprints.
+
     Args:
         repo_root: Path to the repo root.
     """
+    current = run_cmd(["git", "symbolic-ref", "--short", "-q", "HEAD"], cwd=repo_root, check=False)
+    if current.stdout.strip() == DEFAULT_PARENT_BRANCH:
+        remote = run_cmd(
+            ["git", "ls-remote", "origin", f"refs/heads/{DEFAULT_PARENT_BRANCH}"],
+            cwd=repo_root, check=False, timeout=60,
+        )
+        remote_sha = remote.stdout.split()[0] if remote.returncode == 0 and remote.stdout else None
+        if remote_sha and remote_sha == _branch_commit(repo_root, DEFAULT_PARENT_BRANCH):
+            LOG.info("Main checkout already at origin/%s; skipping restore", DEFAULT_PARENT_BRANCH)
+            return
     run_cmd(["git", "checkout", DEFAULT_PARENT_BRANCH], cwd=repo_root, check=False)
     run_cmd(["git", "pull", "origin", DEFAULT_PARENT_BRANCH], cwd=repo_root, check=False)
 
 
+# ---------------------------------------------------------------------------
+# Worktree pool
+# ---------------------------------------------------------------------------
+#
+# ``git worktree add`` checks out the full tree and every new worktree starts
+# with cold build outputs. With ``IMPLEMENT_WORKTREE_POOL_SIZE`` > 0, finished
+# worktrees are reset and parked (detached) under ``WORKTREE_POOL_DIR``
+# instead of being removed, and ``start`` claims a parked worktree by moving
+# it to the canonical path and switching it to the new branch. Ignored files
+# (build outputs, dependency symlinks) survive the reset, so only the files
+# that differ between the two commits are rewritten.
+
+
+def worktree_pool_size() -> int:
+    """Return the configured pool size (``IMPLEMENT_WORKTREE_POOL_SIZE``).
+
+    Returns:
+        The number of warm worktrees to keep; 0 (pool disabled) when the
+        variable is unset or not a non-negative integer.
+    """
+    raw = os.environ.get(WORKTREE_POOL_SIZE_ENV, "").strip()
+    if not raw:
+        return DEFAULT_WORKTREE_POOL_SIZE
+    try:
+        return max(0, int(raw))
+    except ValueError:
+        LOG.warning("Ignoring invalid %s=%r", WORKTREE_POOL_SIZE_ENV, raw)
+        return DEFAULT_WORKTREE_POOL_SIZE
+
+
+def _pool_entries(repo_root: str) -> list[Path]:
+    """Parked worktrees in the pool of *repo_root*, oldest slot first."""
+    pool_dir = Path(repo_root) / WORKTREE_POOL_DIR
+    if not pool_dir.is_dir():
+        return []
+    return sorted(p for p in pool_dir.iterdir() if p.is_dir())
+
+
+def _pool_worktree_healthy(path: Path) -> bool:
+    """True when *path* is a usable linked worktree with no tracked changes.
+
+    Args:
+        path: Candidate pool entry.
+
+    Returns:
+        False for anything that is not a linked worktree (``.git`` must be a
+        file), whose git metadata was pruned, or whose tracked files differ
+        from ``HEAD``.
+    """
+    if not _is_worktree(path):
+        return False
+    status = run_cmd(
+        ["git", "status", "--porcelain", "--untracked-files=no"],
+        cwd=str(path),
+        check=False,
+        timeout=60,
+    )
+    return status.returncode == 0 and not status.stdout.strip()
+
+
+def _discard_pool_worktree(path: Path, repo_root: str) -> None:
+    """Remove an unusable pool entry (never fatal)."""
+    LOG.info("Discarding unhealthy pooled worktree %s", path)
+    try:
+        _remove_worktree(str(path), repo_root=repo_root)
+    except RuntimeError as exc:
+        LOG.warning("Could not discard pooled worktree %s: %s", path, exc)
+
+
+def _claim_pooled_worktree(
+    branch: str,
+    worktree_path: str,
+    parent_branch: str,
+    repo_root: str,
+) -> bool:
+    """Turn a parked worktree into the worktree for a new branch.
+
+    The first healthy pool entry is moved to *worktree_path* (``git worktree
+    move``), switched to a new *branch* tracking *parent_branch* and reset
+    hard to it, with untracked (but not ignored) files removed. Unhealthy
+    entries are discarded along the way.
+
+    Args:
+        branch: Name for the new branch.
+        worktree_path: Target path for the worktree directory.
+        parent_branch: Source branch to fork from.
+        repo_root: Main repo root owning the pool.
+
+    Returns:
+        True if a pooled worktree now serves *branch* at *worktree_path*;
+        False when the pool is empty or claiming failed (the caller falls
+        back to ``git worktree add``).
+    """
+    target = str(Path(repo_root) / worktree_path)
+    for entry in _pool_entries(repo_root):
+        if not _pool_worktree_healthy(entry):
+            _discard_pool_worktree(entry, repo_root)
+            continue
+        moved = run_cmd(
+            ["git", "worktree", "move", str(entry), target],
+            cwd=repo_root,
+            check=False,
+            timeout=60,
+        )
+        if moved.returncode != 0:
+            # Claimed concurrently, locked, or the target exists: try the next.
+            LOG.debug("git worktree move %s failed: %s", entry, moved.stderr.strip())
+            continue
+        switched = run_cmd(
+            ["git", "switch", "--discard-changes", "-c", branch, "--track", parent_branch],
+            cwd=target,
+            check=False,
+            timeout=120,
+        )
+        if switched.returncode == 0:
+            run_cmd(["git", "reset", "--hard", parent_branch], cwd=target, check=False, timeout=120)
+            run_cmd(["git", "clean", "-fdq"], cwd=target, check=False, timeout=120)
+            LOG.info("Claimed pooled worktree %s for %s", entry.name, branch)
+            return True
+        LOG.warning(
+            "Could not switch pooled worktree to %s: %s", branch, switched.stderr.strip()
+        )
+        # Park it again (e.g. the branch already exists); it is still warm.
+        back = run_cmd(
+            ["git", "worktree", "move", target, str(entry)],
+            cwd=repo_root,
+            check=False,
+            timeout=60,
+        )
+        if back.returncode != 0:
+            _discard_pool_worktree(Path(target), repo_root)
+        return False
+    return False
+
+
+def _recycle_worktree(worktree_path: str, repo_root: str) -> bool:
+    """Park a finished worktree in the pool instead of removing it.
+
+    The worktree is reset to its ``HEAD`` (uncommitted changes and untracked
+    files are discarded, ignored files are kept), detached from its branch
+    and moved into ``WORKTREE_POOL_DIR``.
+
+    Args:
+        worktree_path: Absolute path to the finished worktree.
+        repo_root: Main repo root owning the pool.
+
+    Returns:
+        True if the worktree was parked; False when the pool is disabled or
+        full, or recycling failed (the caller removes the worktree).
+    """
+    size = worktree_pool_size()
+    if size <= 0 or len(_pool_entries(repo_root)) >= size:
+        return False
+    path = Path(worktree_path).resolve()
+    if not _is_worktree(path) or path == Path(repo_root).resolve():
+        return False
+
+    # Step out of the worktree before moving it (see _remove_worktree).
+    try:
+        current_cwd = Path.cwd().resolve()
+    except OSError:
+        current_cwd = None
+    if current_cwd is not None and (current_cwd == path or path in current_cwd.parents):
+        os.chdir(repo_root)
+
+    for cmd in (
+        ["git", "reset", "--hard", "-q"],
+        ["git", "clean", "-fdq"],
+        ["git", "switch", "--detach", "-q"],
+    ):
+        if run_cmd(cmd, cwd=str(path), check=False, timeout=120).returncode != 0:
+            return False
+
+    pool_dir = Path(repo_root) / WORKTREE_POOL_DIR
+    pool_dir.mkdir(parents=True, exist_ok=True)
+    slot = pool_dir / f"wt-{time.time_ns()}-{os.getpid()}"
+    moved = run_cmd(
+        ["git", "worktree", "move", str(path), str(slot)],
+        cwd=repo_root,
+        check=False,
+        timeout=60,
+    )
+    if moved.returncode != 0:
+        LOG.warning("Could not park worktree %s: %s", path, moved.stderr.strip())
+        return False
+    LOG.info("Parked worktree %s in the pool as %s", path.name, slot.name)
+    return True
+
+
+def _release_worktree(worktree_path: str, repo_root: str | None = None) -> bool:
+    """Recycle *worktree_path* into the pool, or remove it.
+
+    Args:
+        worktree_path: Path to the worktree.
+        repo_root: Optional explicit main repo root.
+
+    Returns:
+        True if the worktree was parked or removed.
+    """
+    root = repo_root or _get_repo_root()
+    if root and _recycle_worktree(worktree_path, root):
+        return True
+    return _remove_worktree(worktree_path, repo_root=repo_root)
+
+
 # ---------------------------------------------------------------------------
 # Process cleanup helpers
 # ---------------------------------------------------------------------------
 
 
+def _proc_stat(pid: int) -> tuple[str, int, int] | None:
+    """Return ``(state, ppid, pgid)`` of *pid* from ``/proc``, or None if gone."""
+    try:
+        raw = Path(_PROC_ROOT, str(pid), "stat").read_text()
+    except OSError:
+        return None
+    # comm (field 2) may contain spaces and parentheses; fields resume after
+    # the last ")".
+    fields = raw[raw.rfind(")") + 2:].split()
+    try:
+        return fields[0], int(fields[1]), int(fields[2])
+    except (IndexError, ValueError):
+        return None
+
+
+def _own_ancestors() -> set[int]:
+    """PIDs of this process and its ancestors (never cleanup targets)."""
+    pids = {os.getpid()}
+    pid = os.getppid()
+    while pid > 1 and pid not in pids:
+        pids.add(pid)
+        stat = _proc_stat(pid)
+        if stat is None:
+            break
+        pid = stat[1]
+    return pids
+
+
+def _rooted_in(link: str, abs_path: str) -> bool:
+    return link == abs_path or link.startswith(abs_path + os.sep)
+
+
+def _worktree_pids(abs_path: str) -> set[int]:
+    """PIDs whose cwd or any open file descriptor lies inside *abs_path*.
+
+    Walks ``/proc/<pid>/cwd`` and ``/proc/<pid>/fd/*``; processes owned by
+    other users (unreadable links) are skipped. This process and its
+    ancestors — e.g. the shell that ran ``implement.py`` from inside the
+    worktree — are excluded.
+    """
+    excluded = _own_ancestors()
+    pids: set[int] = set()
+    for entry in os.scandir(_PROC_ROOT):
+        if not entry.name.isdigit() or int(entry.name) in excluded:
+            continue
+        try:
+            if _rooted_in(os.readlink(f"{entry.path}/cwd"), abs_path):
+                pids.add(int(entry.name))
+                continue
+        except OSError:
+            continue
+        try:
+            fds = os.scandir(f"{entry.path}/fd")
+        except OSError:
+            continue
+        with fds:
+            for fd in fds:
+                try:
+                    if _rooted_in(os.readlink(fd.path), abs_path):
+                        pids.add(int(entry.name))
+                        break
+                except OSError:
+                    continue
+    return pids
+
+
+def _process_groups_to_kill(pids: set[int]) -> set[int]:
+    """Process groups led by one of *pids* (e.g. a test runner and its workers).
+
+    A group is only signalled as a whole when its leader is itself rooted in
+    the worktree, and never when it is this process's own group.
+    """
+    own_group = os.getpgrp()
+    groups = set()
+    for pid in pids:
+        stat = _proc_stat(pid)
+        if stat is not None and stat[2] == pid and pid != own_group:
+            groups.add(pid)
+    return groups
+
+
+def _pid_alive(pid: int) -> bool:
+    """True while *pid* exists and is not a zombie."""
+    stat = _proc_stat(pid)
+    if stat is not None:
+        return stat[0] != "Z"
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    # Without /proc a zombie still answers signal 0; it is harmless either way.
+    return not Path(_PROC_ROOT).is_dir()
+
+
+def _wait_for_exit(pids: set[int], timeout: float) -> set[int]:
+    """Poll until every pid in *pids* has exited; return the survivors."""
+    deadline = time.monotonic() + timeout
+    alive = {pid for pid in pids if _pid_alive(pid)}
+    while alive and time.monotonic() < deadline:
+        time.sleep(PROCESS_EXIT_POLL_INTERVAL)
+        alive = {pid for pid in alive if _pid_alive(pid)}
+    return alive
+
+
+def _signal_targets(pids: set[int], groups: set[int], sig: int) -> None:
+    """Send *sig* to each process group in *groups* and each pid in *pids*."""
+    for pgid in groups:
+        try:
+            os.killpg(pgid, sig)
+        except OSError:
+            pass
+    for pid in pids:
+        try:
+            os.kill(pid, sig)
+        except OSError:
+            pass
+
+
+def _terminate_pids(pids: set[int], groups: set[int]) -> int:
+    """SIGTERM *pids* and *groups*, poll for exit, SIGKILL the survivors.
+
+    Returns immediately once everything has exited; waits at most
+    ``PROCESS_TERM_GRACE_SECONDS`` before escalating.
+
+    Returns:
+        Number of processes that had to be SIGKILLed.
+    """
+    _signal_targets(pids, groups, signal.SIGTERM)
+    survivors = _wait_for_exit(pids, PROCESS_TERM_GRACE_SECONDS)
+    if not survivors:
+        return 0
+    LOG.warning("Force-killing %d process(es) that ignored SIGTERM", len(survivors))
+    _signal_targets(survivors, groups, signal.SIGKILL)
+    _wait_for_exit(survivors, PROCESS_TERM_GRACE_SECONDS)
+    return len(survivors)
+
+
 def cleanup_worktree_processes(worktree_path: str) -> dict[str, Any]:
     """Terminate processes associated with the given worktree path.
 
-    Attempts ``wl cleanup-worktree <path>`` first. Falls back to finding
-    and killing processes with the worktree path in their cwd.
+    Attempts ``wl cleanup-worktree <path>`` first. Falls back to a ``/proc``
+    scan for processes whose cwd or open files are inside the worktree
+    (``pgrep -f <path>`` where there is no ``/proc``). Matches get SIGTERM —
+    whole process groups when the group leader is itself in the worktree, so
+    test-runner workers go too — and are polled until they exit; survivors
+    are SIGKILLed after ``PROCESS_TERM_GRACE_SECONDS``.
 
     Args:
         worktree_path: Absolute path to the worktree directory.
 
     Returns:
-        A dict with ``method`` (str), ``terminated`` (int), ``warning`` (str).
+        A dict with ``method`` (str), ``terminated`` (int), ``killed`` (int,
+        processes that needed SIGKILL) and ``warning`` (str).
     """
     result: dict[str, Any] = {
         "method": "none",
         "terminated": 0,
+        "killed": 0,
         "warning": "",
     }
 
     abs_path = str(Path(worktree_path).resolve())
 
     # Try wl cleanup-worktree first
-    wl_result = run_cmd(
-        ["wl", "cleanup-worktree", abs_path],
-        check=False,
-        timeout=30,
-    )
+    try:
+        wl_result = run_cmd(
+            ["wl", "cleanup-worktree", abs_path],
+            check=False,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired) as exc:
+        wl_result = subprocess.CompletedProcess(["wl"], 127, "", str(exc))
     if wl_result.returncode == 0:
         result["method"] = "wl_cleanup_worktree"
         try:
@@ -994,17 +1491,28 @@ def cleanup_worktree_processes(worktree_path: str) -> dict[str, Any]:
             result["terminated"] = 1  # Assume success if exit code is 0
         return result
 
-    # If wl cleanup-worktree is unavailable (exit code != 0), try pgrep fallback
+    # If wl cleanup-worktree is unavailable (exit code != 0), scan processes
     LOG.warning(
         "wl cleanup-worktree unavailable (exit %d: %s); "
         "falling back to process scan",
         wl_result.returncode,
         wl_result.stderr.strip() or "command not found",
     )
-    result["method"] = "pgrep_fallback"
 
+    if Path(_PROC_ROOT).is_dir():
+        result["method"] = "proc_scan"
+        pids = _worktree_pids(abs_path)
+        if not pids:
+            result["warning"] = "wl cleanup-worktree unavailable; no processes found in /proc"
+            return result
+        result["terminated"] = len(pids)
+        result["killed"] = _terminate_pids(pids, _process_groups_to_kill(pids))
+        result["warning"] = "wl cleanup-worktree unavailable; used /proc scan fallback."
+        return result
+
+    result["method"] = "pgrep_fallback"
     try:
-        # Find processes with cwd matching the worktree path
+        # No /proc (e.g. macOS): match command lines instead of cwds
         pgrep_result = run_cmd(
             ["pgrep", "-f", abs_path],
             check=False,
@@ -1012,34 +1520,13 @@ def cleanup_worktree_processes(worktree_path: str) -> dict[str, Any]:
             capture=True,
         )
         if pgrep_result.returncode == 0 and pgrep_result.stdout.strip():
-            pids = [
-                int(pid) for pid in pgrep_result.stdout.strip().split()
-                if pid.isdigit()
-            ]
-            # Exclude the current process
             current_pid = os.getpid()
-            for pid in pids:
-                if pid == current_pid:
-                    continue
-                try:
-                    os.kill(pid, signal.SIGTERM)
-                    result["terminated"] += 1
-                except (OSError, PermissionError):
-                    pass
-
-            # Give processes time to terminate
-            if result["terminated"] > 0:
-                time.sleep(2)
-
-            # Force kill any remaining
-            for pid in pids:
-                if pid == current_pid:
-                    continue
-                try:
-                    os.kill(pid, signal.SIGKILL)
-                except (OSError, PermissionError):
-                    pass
-
+            pids = {
+                int(pid) for pid in pgrep_result.stdout.strip().split()
+                if pid.isdigit() and int(pid) != current_pid
+            }
+            result["terminated"] = len(pids)
+            result["killed"] = _terminate_pids(pids, set())
             result["warning"] = (
                 "wl cleanup-worktree unavailable; used pgrep fallback. "
                 "Result may be incomplete."
@@ -1125,22 +1612,29 @@ def _has_test_script(cwd: str) -> bool:
     return bool(_package_script(cwd, "test"))
 
 
-def run_build(cwd: str) -> dict[str, Any]:
+def run_build(cwd: str, use_cache: bool = True) -> dict[str, Any]:
     """Run the project build script.
 
     Repos whose root package.json has no ``build`` script (e.g. Python-only
     projects) skip the build step: it is reported as a no-op with
     ``success: True`` so the finish phase proceeds to tests → commit → push
-    instead of aborting. Repos WITH a build script run ``npm run build``
-    unchanged — a real build failure still blocks finish.
+    instead of aborting. Repos WITH a build script run ``npm run build`` —
+    a real build failure still blocks finish — unless the build cache
+    (``skill.build_cache``) shows the same build script already succeeded in
+    this worktree over unchanged inputs (lockfile, tracked sources), which
+    is reported as a cache hit. ``IMPLEMENT_NO_BUILD_CACHE=1`` or
+    ``use_cache=False`` always builds.
 
     Args:
         cwd: Working directory (worktree root).
+        use_cache: Consult and update the build cache.
 
     Returns:
         A dict with ``success`` (bool), ``stdout`` (str), ``stderr`` (str),
-        ``exit_code`` (int), and ``skipped`` (bool) — ``skipped`` is True
-        when the build step was bypassed because no build script exists.
+        ``exit_code`` (int), ``skipped`` (bool) and ``cached`` (bool) —
+        ``skipped`` is True when the build step was bypassed because no
+        build script exists or the build cache hit; ``cached`` only for the
+        latter.
     """
     if not _has_build_script(cwd):
         msg = "No build script in package.json — skipping build step (no-op)."
@@ -1151,7 +1645,27 @@ def run_build(cwd: str) -> dict[str, Any]:
             "stderr": "",
             "exit_code": 0,
             "skipped": True,
+            "cached": False,
         }
+
+    inputs = None
+    cache_command = f"npm run build{_BUILD_CACHE_SEPARATOR}{_package_script(cwd, 'build')}"
+    if use_cache and os.environ.get("IMPLEMENT_NO_BUILD_CACHE", "") not in ("1", "true"):
+        from skill import build_cache
+
+        inputs = build_cache.compute_input_hash(cwd)
+        if inputs and build_cache.lookup(cache_command, inputs, cwd=cwd):
+            msg = "Build inputs unchanged since the last successful build — skipping build (cache hit)."
+            LOG.info(msg)
+            return {
+                "success": True,
+                "stdout": msg,
+                "stderr": "",
+                "exit_code": 0,
+                "skipped": True,
+                "cached": True,
+            }
+
     result = run_cmd(
         ["npm", "run", "build"],
         cwd=cwd,
@@ -1159,12 +1673,17 @@ def run_build(cwd: str) -> dict[str, Any]:
         timeout=300,
         capture=True,
     )
+    if inputs and result.returncode == 0:
+        from skill import build_cache
+
+        build_cache.store(cache_command, inputs, cwd=cwd)
     return {
         "success": result.returncode == 0,
         "stdout": result.stdout.strip(),
         "stderr": result.stderr.strip(),
         "exit_code": result.returncode,
         "skipped": False,
+        "cached": False,
     }
 
 
@@ -1628,6 +2147,290 @@ def remove_state(worktree_path: str) -> None:
         LOG.debug("State file removed: %s", state_path)
 
 
+def finish_state_path(work_item_id: str, repo_root: str | None = None) -> Path:
+    """Path of the finish checkpoint for *work_item_id* in the main checkout.
+
+    Args:
+        work_item_id: The work item ID.
+        repo_root: Main repo root (defaults to discovery from the current
+            directory).
+
+    Returns:
+        ``<repo>/.worklog/worktrees/.implement_finish_<id>.json``.
+    """
+    root = Path(repo_root or _get_repo_root() or Path.cwd())
+    name = FINISH_STATE_FILE_NAME.format(work_item_id=work_item_id)
+    return root / DEFAULT_WORKTREE_DIR / name
+
+
+def read_finish_checkpoint(work_item_id: str, repo_root: str | None = None) -> ImplementState | None:
+    """Read the finish checkpoint left by an interrupted ``finish``.
+
+    Args:
+        work_item_id: The work item ID.
+        repo_root: Main repo root (see :func:`finish_state_path`).
+
+    Returns:
+        ``ImplementState`` if found, else ``None``.
+    """
+    path = finish_state_path(work_item_id, repo_root)
+    if not path.exists():
+        return None
+    try:
+        return ImplementState.from_dict(json.loads(path.read_text()))
+    except (json.JSONDecodeError, ValueError, KeyError) as exc:
+        LOG.warning("Failed to read finish checkpoint %s: %s", path, exc)
+        return None
+
+
+def remove_finish_checkpoint(work_item_id: str, repo_root: str | None = None) -> None:
+    """Remove the finish checkpoint of *work_item_id*, if any."""
+    finish_state_path(work_item_id, repo_root).unlink(missing_ok=True)
+
+
+def _record_finish_step(state: ImplementState, step: str, **data: Any) -> None:
+    """Mark finish *step* complete and persist the state.
+
+    Written to the worktree state file while the worktree exists, and always
+    to the finish checkpoint in the main checkout so the record survives the
+    worktree's removal.
+    """
+    state.finish_steps[step] = {
+        "completed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        **data,
+    }
+    if Path(state.worktree_path).is_dir():
+        write_state(state, state.worktree_path)
+    path = finish_state_path(state.work_item_id, state.repo_root)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(state.to_dict(), indent=2))
+    except OSError as exc:
+        LOG.warning("Failed to write finish checkpoint %s: %s", path, exc)
+
+
+def _branch_commit(repo_root: str, branch: str) -> str | None:
+    """Full commit id of local *branch*, or None."""
+    result = run_cmd(
+        ["git", "rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"],
+        cwd=repo_root, check=False,
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _finish_resume_step(state: ImplementState, branch: str) -> str:
+    """First finish step that is not complete (or no longer valid).
+
+    - ``refactor``/``build``/``tests`` are valid while the working tree
+      fingerprint (:func:`git_worktree_tree_id`) equals the one recorded
+      when the step completed; any edit since re-runs from ``refactor``.
+    - ``commit`` is valid while the branch still points at the recorded
+      commit and the worktree (if it still exists) has no edits since; it
+      implies the steps before it.
+    - Later steps are valid once recorded. When every step is recorded the
+      run resumes at ``push`` (a repeated push of the same commit is a
+      no-op).
+
+    Args:
+        state: State with ``finish_steps`` from a previous run.
+        branch: The work item branch.
+
+    Returns:
+        A name from ``FINISH_STEPS``.
+    """
+    steps = state.finish_steps
+    worktree_exists = Path(state.worktree_path).is_dir()
+    fingerprint = git_worktree_tree_id(state.worktree_path) if worktree_exists else None
+    commit = steps.get("commit")
+    if (
+        commit is not None
+        and commit.get("sha")
+        and _branch_commit(state.repo_root, branch) == commit["sha"]
+        and (not worktree_exists or fingerprint == commit.get("fingerprint"))
+    ):
+        for step in FINISH_STEPS[FINISH_STEPS.index("commit") + 1:]:
+            if step not in steps:
+                return step
+        return "push"
+    if not worktree_exists:
+        return "refactor"
+    for step in ("refactor", "build", "tests"):
+        recorded = steps.get(step)
+        if recorded is None or fingerprint is None or recorded.get("fingerprint") != fingerprint:
+            return step
+    return "commit"
+
+
+def parent_state_path(work_item_id: str, repo_root: str | None = None) -> Path:
+    """Path of the scheduler state file for parent *work_item_id*.
+
+    Args:
+        work_item_id: The parent work item ID.
+        repo_root: Main repo root (defaults to discovery from the current
+            directory).
+
+    Returns:
+        ``<repo>/.worklog/worktrees/.implement_parent_<id>.json``.
+    """
+    root = Path(repo_root or _get_repo_root() or Path.cwd())
+    name = PARENT_STATE_FILE_NAME.format(work_item_id=work_item_id)
+    return root / DEFAULT_WORKTREE_DIR / name
+
+
+def read_parent_state(path: Path) -> dict[str, Any]:
+    """Read a parent scheduler state file.
+
+    Args:
+        path: State file path (see :func:`parent_state_path`).
+
+    Returns:
+        The state dict (``parent_id``, ``max_parallel`` and ``children``:
+        child id → ``status``, ``worktree_path``, ``branch``,
+        ``started_at`` and, once terminal, ``finished_at``); an empty state
+        when the file is missing or unreadable.
+    """
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError) as exc:
+        if path.exists():
+            LOG.warning("Failed to read parent state file %s: %s", path, exc)
+        return {"children": {}}
+    if not isinstance(data, dict) or not isinstance(data.get("children"), dict):
+        return {"children": {}}
+    return data
+
+
+def write_parent_state(path: Path, state: dict[str, Any]) -> None:
+    """Write a parent scheduler state file.
+
+    Args:
+        path: State file path (see :func:`parent_state_path`).
+        state: The state dict (see :func:`read_parent_state`).
+    """
+    state["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(state, indent=2))
+    LOG.debug("Parent state written to %s", path)
+
+
+# ---------------------------------------------------------------------------
+# Deferred push (phase_parent --defer-push)
+# ---------------------------------------------------------------------------
+#
+# Without deferral every child finish pushes to dev and then checks out and
+# pulls dev in the main checkout. With ``--defer-push`` the parent state
+# file holds a ``stack`` of finished child branches: each child forks from
+# the top of the stack, is rebased onto it before finish builds and tests
+# (when siblings finished first) and is appended instead of pushed, so the
+# pushed top is exactly what the last child built and tested. Once every child is terminal the
+# parent pushes the top of the stack to dev in one ``git push`` and restores
+# the main checkout once.
+
+
+def _deferred_parent_state(state: ImplementState) -> tuple[Path, dict[str, Any]] | None:
+    """Parent state file and contents when *state*'s parent defers pushes."""
+    if not state.parent_id:
+        return None
+    path = parent_state_path(state.parent_id, state.repo_root)
+    parent_state = read_parent_state(path)
+    if not parent_state.get("deferred_push"):
+        return None
+    return path, parent_state
+
+
+def _stack_top(parent_state: dict[str, Any]) -> str | None:
+    """Branch at the top of a parent's deferred-push stack, or None."""
+    stack = parent_state.get("stack") or []
+    return stack[-1]["branch"] if stack else None
+
+
+def _is_ancestor(worktree_path: str, ancestor: str, descendant: str) -> bool:
+    result = run_cmd(
+        ["git", "merge-base", "--is-ancestor", ancestor, descendant],
+        cwd=worktree_path, check=False,
+    )
+    return result.returncode == 0
+
+
+def _based_on(worktree_path: str, top: str) -> bool:
+    """True when stacked branch *top* is an ancestor of the worktree's HEAD."""
+    return _is_ancestor(worktree_path, top, "HEAD")
+
+
+def _rebase_onto_stack(worktree_path: str, top: str) -> bool:
+    """Move the worktree branch onto stacked branch *top* (no-op if based on it).
+
+    Runs before finish builds, tests and commits the child, so the work is
+    usually still uncommitted: a branch without commits of its own is
+    fast-forwarded with ``git reset --keep`` (local changes are kept; it
+    refuses when they touch files the stack changed). A branch with its own
+    commits is rebased, which needs a clean tree — nothing is ever stashed.
+
+    Returns:
+        False when the branch could not be moved (a failed rebase is
+        aborted, leaving the branch as it was).
+    """
+    if _based_on(worktree_path, top):
+        return True
+    if _is_ancestor(worktree_path, "HEAD", top):
+        LOG.info("Fast-forwarding onto stacked branch %s...", top)
+        result = run_cmd(["git", "reset", "--keep", top], cwd=worktree_path, check=False)
+        if result.returncode != 0:
+            LOG.error("Moving onto %s failed: %s", top, result.stderr.strip())
+            return False
+        return True
+    dirty = run_cmd(
+        ["git", "status", "--porcelain", "--untracked-files=no"], cwd=worktree_path, check=False
+    )
+    if dirty.stdout.strip():
+        LOG.error(
+            "Cannot rebase onto %s: the branch has its own commits and uncommitted changes",
+            top,
+        )
+        return False
+    LOG.info("Rebasing onto stacked branch %s...", top)
+    result = run_cmd(["git", "rebase", top], cwd=worktree_path, check=False)
+    if result.returncode != 0:
+        LOG.error("Rebase onto %s failed: %s", top, result.stderr.strip())
+        run_cmd(["git", "rebase", "--abort"], cwd=worktree_path, check=False)
+        return False
+    return True
+
+
+def _push_deferred_stack(
+    path: Path, parent_state: dict[str, Any], repo_root: str
+) -> dict[str, Any]:
+    """Push the top of a deferred-push stack to dev and restore the checkout.
+
+    Args:
+        path: Parent state file.
+        parent_state: Its contents (updated with ``pushed_at``/``pushed_commit``).
+        repo_root: Main checkout root.
+
+    Returns:
+        ``success``, ``branch``, ``commit`` and the stacked ``children``.
+    """
+    stack = parent_state.get("stack") or []
+    top = stack[-1]
+    result = {
+        "success": True,
+        "branch": top["branch"],
+        "commit": top.get("commit", ""),
+        "children": [entry["id"] for entry in stack],
+    }
+    if parent_state.get("pushed_commit") == top.get("commit"):
+        return result
+    LOG.info("Pushing %d stacked children (%s) to dev...", len(stack), top["branch"])
+    if not git_push_to_dev(repo_root, top["branch"]):
+        result["success"] = False
+        return result
+    _restore_repo_state(repo_root)
+    parent_state["pushed_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    parent_state["pushed_commit"] = top.get("commit", "")
+    write_parent_state(path, parent_state)
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Phase implementations
 # ---------------------------------------------------------------------------
@@ -1774,8 +2577,17 @@ def phase_start(
     wt_path = worktree_path_override or worktree_path_for(work_item_id, slug)
     branch = branch_name_for(work_item_id, slug)
 
-    LOG.info("Creating worktree at %s from branch %s...", wt_path, parent_branch)
-    if not git_worktree_add(branch, wt_path, parent_branch):
+    pooled = False
+    if not worktree_path_override and worktree_pool_size() > 0:
+        pool_root = _get_repo_root()
+        pooled = bool(pool_root) and _claim_pooled_worktree(
+            branch, wt_path, parent_branch, pool_root
+        )
+    if pooled:
+        LOG.info("Reusing pooled worktree at %s for branch %s", wt_path, branch)
+    else:
+        LOG.info("Creating worktree at %s from branch %s...", wt_path, parent_branch)
+    if not pooled and not git_worktree_add(branch, wt_path, parent_branch):
         msg = f"Failed to create worktree at {wt_path} from {parent_branch}"
         LOG.error(msg)
         report["success"] = False
@@ -1793,7 +2605,26 @@ def phase_start(
     # Auto-symlink the main checkout's node_modules into the worktree so
     # dist-spawning tests resolve dependencies without manual setup. Never
     # fatal: skip when either side lacks node_modules (SA-0MSGS763C006SM1B).
-    _ensure_node_modules_symlink(abs_wt_path, _get_repo_root())
+    main_root = _get_repo_root()
+    _ensure_node_modules_symlink(abs_wt_path, main_root)
+    # Reuse the remaining dependency directories (nested node_modules,
+    # virtualenvs, tool caches) when their lockfiles match; see
+    # skill/shared/worktree_provision.py. Never fatal.
+    if main_root:
+        from skill.shared.worktree_provision import provision_worktree
+
+        provisioned = provision_worktree(abs_wt_path, main_root)
+        report["provisioned"] = provisioned
+        if provisioned["entries"]:
+            LOG.info(
+                "Provisioned dependency dirs in %.2fs (est. %.0fs install saved): %s",
+                provisioned["seconds"],
+                provisioned["saved_seconds"],
+                ", ".join(
+                    f"{e['path']}={e.get('method') or e.get('reason')}"
+                    for e in provisioned["entries"]
+                ),
+            )
 
     # Update status with stage via shared helper
     try:
@@ -1819,9 +2650,13 @@ def phase_start(
         started_at=time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
     )
     write_state(state, abs_wt_path)
+    worktree_registry.register(repo_root, work_item_id, abs_wt_path, branch)
+    # A checkpoint from an earlier, unfinished attempt no longer applies.
+    remove_finish_checkpoint(work_item_id, repo_root)
 
     report["worktree_path"] = abs_wt_path
     report["branch"] = branch
+    report["pooled"] = pooled
     report["title"] = title
     report["message"] = f"Worktree created at {abs_wt_path}. Switch to the worktree and implement."
 
@@ -1855,12 +2690,14 @@ def phase_finish(
     commit_msg_override: str | None = None,
     max_retry: int = DEFAULT_MAX_RETRY,
     verbose: bool = False,
+    from_step: str | None = None,
 ) -> dict[str, Any]:
     """Phase 2: Complete the implementation.
 
     Steps:
     0. Worktree placement gate (refuse if changes were made outside the worktree)
-    1. Read state to find worktree
+    1. Read state to find worktree (children of a ``--defer-push`` parent
+       are then rebased onto the parent's stack)
     2. Refactor step (unless --no-refactor)
     3. Build
     4. Test (with fix-and-re-run loop)
@@ -1875,6 +2712,12 @@ def phase_finish(
     ``phase_start``. If the current directory is outside the worktree and the
     main checkout holds uncommitted changes, finish refuses (step 0).
 
+    Each completed step is checkpointed in the state file (and in
+    ``finish_state_path`` once the worktree is gone). A re-run resumes at
+    the first step that is incomplete or invalidated by later edits (see
+    ``_finish_resume_step``), e.g. straight at the push after a network
+    failure.
+
     Args:
         work_item_id: The work item ID.
         json_output: If True, output JSON.
@@ -1882,6 +2725,8 @@ def phase_finish(
         commit_msg_override: Custom commit message.
         max_retry: Max test-fix retries.
         verbose: Enable verbose logging.
+        from_step: Start at this step (a name from ``FINISH_STEPS``) instead
+            of the checkpointed resume point.
 
     Returns:
         Dict with result information.
@@ -1894,8 +2739,15 @@ def phase_finish(
         "message": "",
     }
 
-    # ── Step 0: Find worktree (from state or directory scan) ──────
+    # ── Step 0: Find worktree (from state, directory scan or checkpoint) ──
     worktree_path = _discover_worktree(work_item_id)
+    checkpoint = None
+    if not worktree_path:
+        # The worktree is removed before the push; resume from the
+        # checkpoint left in the main checkout.
+        checkpoint = read_finish_checkpoint(work_item_id)
+        if checkpoint is not None:
+            worktree_path = checkpoint.worktree_path
     if not worktree_path:
         msg = (
             f"Cannot find worktree for {work_item_id}. "
@@ -1910,14 +2762,28 @@ def phase_finish(
         return report
 
     # Read state for metadata
-    state = read_state(worktree_path)
+    state = checkpoint or read_state(worktree_path) or ImplementState(
+        work_item_id=work_item_id,
+        worktree_path=worktree_path,
+        repo_root=_get_repo_root() or str(Path.cwd().resolve()),
+    )
 
     report["worktree_path"] = worktree_path
     # Compute branch name from the worktree
     branch = Path(worktree_path).name  # e.g., wl-SA-xxx-slug
 
+    resume_at = from_step or (
+        _finish_resume_step(state, branch) if state.finish_steps else FINISH_STEPS[0]
+    )
+    report["resume_step"] = resume_at
+    if resume_at != FINISH_STEPS[0]:
+        LOG.info("Resuming finish at step '%s'", resume_at)
+
+    def pending(step: str) -> bool:
+        return FINISH_STEPS.index(step) >= FINISH_STEPS.index(resume_at)
+
     # Check we're in the right directory
-    if not Path(worktree_path).exists():
+    if pending("commit") and not Path(worktree_path).exists():
         msg = f"Worktree directory does not exist: {worktree_path}"
         report["success"] = False
         report["message"] = msg
@@ -1932,9 +2798,9 @@ def phase_finish(
     # `implement.py start`. If changes were made in the main checkout
     # instead, refuse rather than silently build/test/commit an empty
     # worktree and mark the item in_review.
-    violation = _worktree_placement_violation(
+    violation = pending("commit") and _worktree_placement_violation(
         worktree_path,
-        parent_branch=state.parent_branch if state else DEFAULT_PARENT_BRANCH,
+        parent_branch=state.parent_branch,
     )
     if violation:
         msg = violation
@@ -1957,8 +2823,48 @@ def phase_finish(
             print(f"\n⛔ {msg}\n")
         return report
 
+    # ── Step 0.6: Rebase onto the deferred-push stack ──────────────
+    # Children of a --defer-push parent reach dev as one stack, so each is
+    # built and tested on top of the siblings stacked before it. Moving
+    # HEAD invalidates the build and test checkpoints.
+    repo_root = state.repo_root
+    deferred = _deferred_parent_state(state)
+    top = _stack_top(deferred[1]) if deferred else None
+    if top and top != branch and pending("commit"):
+        before = _branch_commit(repo_root, branch)
+        if not _rebase_onto_stack(worktree_path, top):
+            msg = f"Rebase onto stacked branch {top} failed"
+            LOG.error(msg)
+            report["success"] = False
+            report["message"] = msg
+            wl_add_comment(
+                work_item_id,
+                f"{msg} during finish phase. Resolve the conflict with the "
+                f"stacked siblings in {worktree_path} and re-run finish.",
+            )
+            try:
+                StatusLifecycle.update_status(work_item_id, "open")
+            except RuntimeError:
+                LOG.error("Failed to reset work item %s status to open", work_item_id)
+            if json_output:
+                print(format_json_output(report))
+            return report
+        if _branch_commit(repo_root, branch) != before:
+            report["steps"]["rebase"] = {"onto": top}
+            state.finish_steps.pop("build", None)
+            state.finish_steps.pop("tests", None)
+            if "refactor" in state.finish_steps:
+                _record_finish_step(
+                    state, "refactor", fingerprint=git_worktree_tree_id(worktree_path)
+                )
+            if FINISH_STEPS.index(resume_at) > FINISH_STEPS.index("build"):
+                resume_at = "build"
+                report["resume_step"] = resume_at
+
     # ── Step 1: Refactor step ──────────────────────────────────────
-    if not no_refactor:
+    if not pending("refactor"):
+        report["steps"]["refactor"] = {"skipped": True, "reason": "checkpoint"}
+    elif not no_refactor:
         LOG.info("Running refactor step...")
         refactor_result = run_refactor(work_item_id, worktree_path)
         report["steps"]["refactor"] = refactor_result
@@ -1967,10 +2873,17 @@ def phase_finish(
     else:
         report["steps"]["refactor"] = {"skipped": True, "reason": "no_refactor_flag"}
         LOG.info("Refactor step skipped (--no-refactor)")
+    if pending("refactor"):
+        _record_finish_step(
+            state, "refactor", fingerprint=git_worktree_tree_id(worktree_path)
+        )
 
     # ── Step 2: Build ──────────────────────────────────────────────
-    LOG.info("Running build...")
-    build_result = run_build(worktree_path)
+    if pending("build"):
+        LOG.info("Running build...")
+        build_result = run_build(worktree_path)
+    else:
+        build_result = {"success": True, "skipped": True, "reason": "checkpoint"}
     report["steps"]["build"] = build_result
     if not build_result["success"]:
         msg = f"Build failed (exit code {build_result['exit_code']})"
@@ -1990,11 +2903,17 @@ def phase_finish(
         if json_output:
             print(format_json_output(report))
         return report
+    if pending("build"):
+        _record_finish_step(state, "build", fingerprint=git_worktree_tree_id(worktree_path))
 
     # ── Step 3: Test with fix-and-re-run loop ──────────────────────
-    LOG.info("Running test suite...")
     test_attempts = 0
-    test_result = run_tests(worktree_path)
+    if pending("tests"):
+        LOG.info("Running test suite...")
+        test_result = run_tests(worktree_path)
+    else:
+        test_result = {"success": True, "skipped": True}
+    tests_skipped_by_user = False
     report["steps"]["tests"] = []
     report["steps"]["tests"].append({
         "attempt": test_attempts + 1,
@@ -2063,6 +2982,7 @@ def phase_finish(
         if choice == "skip":
             LOG.warning("Tests skipped by user choice")
             test_result["success"] = True
+            tests_skipped_by_user = True
             report["steps"]["tests"][-1]["skipped"] = True
             break
 
@@ -2093,55 +3013,100 @@ def phase_finish(
         return report
 
     LOG.info("All tests passed")
+    if pending("tests") and not tests_skipped_by_user:
+        _record_finish_step(state, "tests", fingerprint=git_worktree_tree_id(worktree_path))
 
     try:
         with StatusLifecycle(work_item_id, target_stage="in_review"):
             # ── Step 4: Commit ─────────────────────────────────────────────
-            commit_msg = commit_msg_override or f"{work_item_id}: Implementation complete"
-            LOG.info("Committing changes...")
-            if not git_commit(worktree_path, commit_msg):
-                raise RuntimeError("git commit failed")
-
-            commit_hash = git_get_commit_hash(worktree_path)
-            report["steps"]["commit"] = {
-                "hash": commit_hash,
-                "message": commit_msg,
-            }
-            LOG.info("Committed at %s", commit_hash)
+            if pending("commit"):
+                # A sibling stacked during build/tests: what was tested is
+                # no longer what the parent would push.
+                top = _stack_top(read_parent_state(deferred[0])) if deferred else None
+                if top and top != branch and not _based_on(worktree_path, top):
+                    raise RuntimeError(
+                        f"Stacked branch {top} moved during build/tests; re-run finish "
+                        "to rebase, rebuild and retest"
+                    )
+                commit_msg = commit_msg_override or f"{work_item_id}: Implementation complete"
+                LOG.info("Committing changes...")
+                if not git_commit(worktree_path, commit_msg):
+                    raise RuntimeError("git commit failed")
+
+                commit_hash = git_get_commit_hash(worktree_path)
+                report["steps"]["commit"] = {
+                    "hash": commit_hash,
+                    "message": commit_msg,
+                }
+                _record_finish_step(
+                    state, "commit",
+                    hash=commit_hash,
+                    sha=_branch_commit(repo_root, branch),
+                    fingerprint=git_worktree_tree_id(worktree_path),
+                )
+                worktree_registry.set_state(repo_root, work_item_id, "committed")
+                LOG.info("Committed at %s", commit_hash)
+            else:
+                recorded = state.finish_steps.get("commit", {})
+                sha = recorded.get("sha") or _branch_commit(repo_root, branch)
+                commit_hash = recorded.get("hash") or (sha[:7] if sha else "unknown")
+                report["steps"]["commit"] = {"hash": commit_hash, "skipped": True}
 
             # ── Step 5: Clean up worktree processes ────────────────────────
-            LOG.info("Cleaning up worktree processes...")
-            cleanup_result = cleanup_worktree_processes(worktree_path)
-            report["steps"]["cleanup"] = cleanup_result
-            if cleanup_result.get("warning"):
-                LOG.warning("Process cleanup warning: %s", cleanup_result["warning"])
-
-            # ── Step 6: Remove worktree ────────────────────────────────────
-            LOG.info("Removing worktree...")
-            remove_state(worktree_path)
-            if not _remove_worktree(
-                worktree_path,
-                repo_root=state.repo_root if state else None,
-            ):
-                msg = f"Failed to remove worktree at {worktree_path}"
-                LOG.warning(msg)
-                report["steps"]["worktree_removed"] = False
+            if pending("cleanup") and Path(worktree_path).exists():
+                LOG.info("Cleaning up worktree processes...")
+                cleanup_result = cleanup_worktree_processes(worktree_path)
+                report["steps"]["cleanup"] = cleanup_result
+                if cleanup_result.get("warning"):
+                    LOG.warning("Process cleanup warning: %s", cleanup_result["warning"])
+            if pending("cleanup"):
+                _record_finish_step(state, "cleanup")
+
+            # ── Step 6: Remove (or recycle) worktree ───────────────────────
+            if pending("remove_worktree") and Path(worktree_path).exists():
+                LOG.info("Removing worktree...")
+                remove_state(worktree_path)
+                if not _release_worktree(worktree_path, repo_root=repo_root):
+                    msg = f"Failed to remove worktree at {worktree_path}"
+                    LOG.warning(msg)
+                    report["steps"]["worktree_removed"] = False
+            if pending("remove_worktree"):
+                worktree_registry.unregister(repo_root, work_item_id)
+                _record_finish_step(state, "remove_worktree")
 
             # ── Step 7: Restore repo state ─────────────────────────────────
-            repo_root = (
-                state.repo_root
-                if state
-                else (_get_repo_root() or str(Path.cwd().resolve()))
-            )
-            _restore_repo_state(repo_root)
-
-            # ── Step 8: Push to dev ────────────────────────────────────────
-            LOG.info("Pushing to dev...")
-            if not git_push_to_dev(repo_root, branch):
-                raise RuntimeError("git push to dev failed.")
-
-            report["steps"]["push"] = {"success": True, "hash": commit_hash}
-            LOG.info("Push to dev succeeded")
+            if pending("restore"):
+                if deferred is None:
+                    _restore_repo_state(repo_root)
+                _record_finish_step(state, "restore")
+
+            # ── Step 8: Push to dev (or stack for the parent's push) ───────
+            if deferred is not None:
+                parent_state = read_parent_state(deferred[0])
+                stack = [
+                    e for e in parent_state.get("stack") or [] if e.get("id") != work_item_id
+                ]
+                stack.append({
+                    "id": work_item_id,
+                    "branch": branch,
+                    "commit": _branch_commit(repo_root, branch) or "",
+                })
+                parent_state["stack"] = stack
+                write_parent_state(deferred[0], parent_state)
+                report["steps"]["push"] = {
+                    "deferred": True,
+                    "parent": state.parent_id,
+                    "stack_size": len(stack),
+                    "hash": commit_hash,
+                }
+                LOG.info("Stacked %s for the deferred push of %s", branch, state.parent_id)
+            else:
+                LOG.info("Pushing to dev...")
+                if not git_push_to_dev(repo_root, branch):
+                    raise RuntimeError("git push to dev failed.")
+                report["steps"]["push"] = {"success": True, "hash": commit_hash}
+                LOG.info("Push to dev succeeded")
+            _record_finish_step(state, "push")
 
             # StatusLifecycle.__exit__ sets status=completed, stage=in_review
 
@@ -2158,7 +3123,8 @@ def phase_finish(
             wl_add_comment(
                 work_item_id,
                 f"Push to dev failed. Commit {commit_hash} is local. "
-                f"Push manually: git push origin {branch}:refs/heads/dev",
+                f"Re-run `implement.py finish {work_item_id}` to resume at the push, "
+                f"or push manually: git push origin {branch}:refs/heads/dev",
             )
         elif "git commit failed" in msg:
             wl_add_comment(work_item_id, "Commit failed during finish phase.")
@@ -2168,6 +3134,8 @@ def phase_finish(
             LOG.error(msg)
         return report
 
+    remove_finish_checkpoint(work_item_id, repo_root)
+
     #── Step 9: Add completion comment ─────────────────────────────
     wl_add_comment(
         work_item_id,
@@ -2177,6 +3145,11 @@ def phase_finish(
     report["success"] = True
     report["hash"] = commit_hash
     report["message"] = f"Implementation complete. Commit {commit_hash} pushed to dev."
+    if deferred is not None:
+        report["message"] = (
+            f"Implementation complete. Commit {commit_hash} stacked for the "
+            f"deferred push of parent {state.parent_id}."
+        )
 
     if json_output:
         print(format_json_output(report))
@@ -2234,8 +3207,10 @@ def phase_abort(
         LOG.info("Cleaning up worktree at %s...", worktree_path)
         cleanup_worktree_processes(worktree_path)
         remove_state(worktree_path)
-        _remove_worktree(worktree_path)
+        _release_worktree(worktree_path)
         report["worktree_path"] = worktree_path
+    worktree_registry.unregister(Path.cwd(), work_item_id)
+    remove_finish_checkpoint(work_item_id)
 
     # ── Step 3: Restore repo state ─────────────────────────────────
     repo_root = str(Path.cwd().resolve())
@@ -2260,6 +3235,8 @@ def phase_parent(
     no_refactor: bool = False,
     parent_branch: str = DEFAULT_PARENT_BRANCH,
     verbose: bool = False,
+    max_parallel: int = 1,
+    defer_push: bool = False,
 ) -> dict[str, Any]:
     """Phase: implement a parent work item by recursing into its children.
 
@@ -2284,10 +3261,26 @@ def phase_parent(
        that child with the standard workflow (``implement.py finish
        <child>``), then re-invokes this phase for the next child.
 
+    Scheduler mode (*max_parallel* > 1) starts the whole ready frontier —
+    every child whose in-chain blockers are terminal — up to *max_parallel*
+    children in progress at once, each in its own worktree. Started children
+    are tracked in a parent-level state file (``parent_state_path``); each
+    re-invocation marks the ones that reached a terminal status as finished
+    and starts the dependents they released.
+
+    Deferred-push mode (*defer_push*, remembered in the parent state file)
+    stacks the children locally instead of pushing each one: every child
+    forks from the previously finished child's branch, ``finish`` rebases it
+    onto the stack top and appends it without pushing or restoring the main
+    checkout, and step 5 pushes the top of the stack to dev in one ``git
+    push`` before advancing the parent.
+
     Worktree isolation is preserved per child: every child is implemented in
     its own worktree created by ``phase_start`` (never the main checkout);
     sequential children reuse/rotate the same ``.worklog/worktrees``
-    machinery. No worktree is created for the parent itself.
+    machinery (with the worktree pool enabled, each finished child's
+    worktree is parked and claimed by the next child). No worktree is
+    created for the parent itself.
 
     Args:
         work_item_id: The parent work item ID.
@@ -2295,11 +3288,15 @@ def phase_parent(
         no_refactor: If True, skip the refactor step for started children.
         parent_branch: Parent branch for child worktrees.
         verbose: Enable verbose logging.
+        max_parallel: Children allowed in progress at once (1: start one
+            child per invocation).
+        defer_push: Stack the children and push them together at the end.
 
     Returns:
         Dict with the recursion plan: per-child classifications, the next
         child started (with its worktree), or parent advancement when all
-        children are terminal.
+        children are terminal. Scheduler mode adds ``ready_children``,
+        ``in_flight``, ``started_children`` and ``parent_state_path``.
     """
     report: dict[str, Any] = {
         "phase": "parent",
@@ -2370,14 +3367,15 @@ def phase_parent(
     # ── Step 5: Classify children ──────────────────────────────────
     classifications: list[dict[str, Any]] = []
     blockers_map: dict[str, list[dict[str, Any]]] = {}
+    in_chain_ids = {str(c.get("id")) for c in children}
+    # Outbound (depends-on) edges of every child: what each is blocked by.
+    fetched = wl_dep_blockers_many([str(c.get("id", "")) for c in children])
     for child in children:
         cid = str(child.get("id", ""))
-        # Outbound (depends-on) edges: what this child is blocked by.
-        child_blockers = wl_dep_blockers(cid) if cid else []
+        child_blockers = fetched.get(cid, [])
         blockers_map[cid] = child_blockers
         # Blockers outside the children set (e.g. cross-project) are
         # coordination notes, not in-chain edges (SA-0MSQBM2FK005NW1T).
-        in_chain_ids = {str(c.get("id")) for c in children}
         external = [
             str(b.get("id"))
             for b in child_blockers
@@ -2409,8 +3407,69 @@ def phase_parent(
             print()
         return report
 
+    # ── Step 5.6: Scheduler state (--max-parallel > 1) ─────────────
+    # Children started by earlier invocations are tracked in a parent-level
+    # state file; those that reached a terminal status since are marked
+    # finished and the children they unblocked are reported as released.
+    # The same file holds the deferred-push stack (--defer-push).
+    parent_state_file = parent_state_path(work_item_id)
+    parent_state = read_parent_state(parent_state_file)
+    if defer_push and not parent_state.get("deferred_push"):
+        parent_state["parent_id"] = work_item_id
+        parent_state["deferred_push"] = True
+        write_parent_state(parent_state_file, parent_state)
+    deferring = bool(parent_state.get("deferred_push"))
+    if deferring:
+        report["deferred_push"] = {
+            "stack": [e["id"] for e in parent_state.get("stack") or []],
+        }
+    if max_parallel > 1:
+        parent_state["parent_id"] = work_item_id
+        parent_state["max_parallel"] = max_parallel
+        tracked = parent_state.setdefault("children", {})
+        status_by_id = {c["id"]: c["status"] for c in classifications}
+        newly_finished = set()
+        for cid, entry in tracked.items():
+            status = status_by_id.get(cid, entry.get("status", ""))
+            if _is_terminal_status(status) and not entry.get("finished_at"):
+                entry["finished_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+                newly_finished.add(cid)
+            entry["status"] = status
+        released = [
+            str(c.get("id", ""))
+            for c in _ready_children(ordered_children, blockers_map)
+            if any(
+                str(b.get("id")) in newly_finished
+                for b in blockers_map.get(str(c.get("id", "")), [])
+            )
+        ]
+        report["parent_state_path"] = str(parent_state_file)
+        if released:
+            report["released_children"] = released
+        write_parent_state(parent_state_file, parent_state)
+
     # ── Step 6: All children terminal → advance the parent ─────────
     if all(c["action"] == "skip-terminal" for c in classifications):
+        if deferring and parent_state.get("stack"):
+            pushed = _push_deferred_stack(
+                parent_state_file,
+                parent_state,
+                _get_repo_root() or str(Path.cwd().resolve()),
+            )
+            report["deferred_push"] = pushed
+            if not pushed["success"]:
+                msg = (
+                    f"Deferred push of {work_item_id}'s children failed. "
+                    f"Re-run `implement.py parent {work_item_id}` to retry, or "
+                    f"push manually: git push origin {pushed['branch']}:refs/heads/dev"
+                )
+                report["success"] = False
+                report["message"] = msg
+                if json_output:
+                    print(format_json_output(report))
+                else:
+                    LOG.error(msg)
+                return report
         parent_status = str(parent.get("status", ""))
         already_terminal = _is_terminal_status(parent_status)
         if not already_terminal:
@@ -2456,24 +3515,38 @@ def phase_parent(
             print()
         return report
 
-    # ── Step 7: Start the next child (claim + worktree) ────────────
-    next_child = _next_child_to_implement(ordered_children, blockers_map)
-    if next_child is None:
-        # No startable child: every remaining child is terminal, in progress
-        # elsewhere, or blocked by a non-terminal sibling.
-        blocked = [
-            c["id"]
-            for c in classifications
-            if c["action"] not in ("skip-terminal", "skip-in-progress")
-        ]
-        report["message"] = (
-            f"No child of {work_item_id} is currently startable: "
-            f"non-terminal children not in progress are blocked by "
-            f"non-terminal siblings or unavailable. Re-run this phase "
-            f"after one completes."
-        )
-        if blocked:
-            report["blocked_children"] = blocked
+    # ── Step 7: Start the next child (or the ready frontier) ───────
+    ready = _ready_children(ordered_children, blockers_map)
+    in_flight = [c["id"] for c in classifications if c["action"] == "skip-in-progress"]
+    if max_parallel > 1:
+        report["ready_children"] = [str(c.get("id", "")) for c in ready]
+        report["in_flight"] = in_flight
+        to_start = ready[: max(0, max_parallel - len(in_flight))]
+    else:
+        to_start = ready[:1]
+    if not to_start:
+        if ready:
+            report["message"] = (
+                f"{len(in_flight)} children of {work_item_id} are in progress "
+                f"(--max-parallel {max_parallel}). Re-run this phase after "
+                f"one completes."
+            )
+        else:
+            # No startable child: every remaining child is terminal, in
+            # progress elsewhere, or blocked by a non-terminal sibling.
+            blocked = [
+                c["id"]
+                for c in classifications
+                if c["action"] not in ("skip-terminal", "skip-in-progress")
+            ]
+            report["message"] = (
+                f"No child of {work_item_id} is currently startable: "
+                f"non-terminal children not in progress are blocked by "
+                f"non-terminal siblings or unavailable. Re-run this phase "
+                f"after one completes."
+            )
+            if blocked:
+                report["blocked_children"] = blocked
         if json_output:
             print(format_json_output(report))
         else:
@@ -2484,20 +3557,40 @@ def phase_parent(
             print()
         return report
 
-    next_id = next_child.get("id", "")
-    LOG.info("Starting next child %s of parent %s...", next_id, work_item_id)
-    start_result = phase_start(
-        next_id,
-        json_output=False,
-        no_refactor=no_refactor,
-        parent_branch=parent_branch,
-        verbose=verbose,
-    )
-    if not start_result.get("success"):
-        msg = (
-            f"Failed to start child {next_id}: "
-            f"{start_result.get('message', 'unknown error')}"
+    started: list[dict[str, Any]] = []
+    failed: list[dict[str, Any]] = []
+    # Deferred push: fork from the last stacked child, not the parent branch.
+    base_branch = (_stack_top(parent_state) if deferring else None) or parent_branch
+    for child in to_start:
+        child_id = str(child.get("id", ""))
+        LOG.info("Starting child %s of parent %s...", child_id, work_item_id)
+        start_result = phase_start(
+            child_id,
+            json_output=False,
+            no_refactor=no_refactor,
+            parent_branch=base_branch,
+            verbose=verbose,
         )
+        if start_result.get("success") and deferring:
+            child_state = read_state(start_result.get("worktree_path", ""))
+            if child_state is not None:
+                child_state.parent_id = work_item_id
+                write_state(child_state, child_state.worktree_path)
+        if start_result.get("success"):
+            started.append({
+                "id": child_id,
+                "worktree_path": start_result.get("worktree_path", ""),
+                "branch": start_result.get("branch", ""),
+            })
+        else:
+            failed.append({
+                "id": child_id,
+                "message": start_result.get("message", "unknown error"),
+            })
+
+    if not started:
+        next_id = failed[0]["id"]
+        msg = f"Failed to start child {next_id}: {failed[0]['message']}"
         LOG.error(msg)
         report["success"] = False
         report["next_child"] = next_id
@@ -2508,32 +3601,59 @@ def phase_parent(
             print(f"\n⛔ {msg}\n")
         return report
 
+    next_id = started[0]["id"]
     report["next_child"] = next_id
-    report["worktree_path"] = start_result.get("worktree_path", "")
-    report["branch"] = start_result.get("branch", "")
-    report["message"] = (
-        f"Started child {next_id}. Implement it in "
-        f"{start_result.get('worktree_path', '')}, then run "
-        f"`implement.py finish {next_id}`, then re-run "
-        f"`implement.py parent {work_item_id}` for the next child."
-    )
+    report["worktree_path"] = started[0]["worktree_path"]
+    report["branch"] = started[0]["branch"]
+    if max_parallel > 1:
+        report["started_children"] = started
+        if failed:
+            report["failed_children"] = failed
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        for entry in started:
+            parent_state["children"][entry["id"]] = {
+                "status": "in_progress",
+                "worktree_path": entry["worktree_path"],
+                "branch": entry["branch"],
+                "started_at": now,
+            }
+        write_parent_state(parent_state_file, parent_state)
+
+    if len(started) == 1:
+        report["message"] = (
+            f"Started child {next_id}. Implement it in "
+            f"{report['worktree_path']}, then run "
+            f"`implement.py finish {next_id}`, then re-run "
+            f"`implement.py parent {work_item_id}` for the next child."
+        )
+    else:
+        report["message"] = (
+            f"Started {len(started)} independent children "
+            f"({', '.join(e['id'] for e in started)}). Implement each in its "
+            f"worktree and run `implement.py finish <child>`; re-run "
+            f"`implement.py parent {work_item_id}` as they finish to start "
+            f"the children they unblock."
+        )
 
     if json_output:
         print(format_json_output(report))
     else:
-        print()
-        print("=" * 60)
-        print(f"  Implement child: {next_id} (of {work_item_id})")
-        print("=" * 60)
-        print(f"  Worktree: {report['worktree_path']}")
-        print(f"  Branch:   {report['branch']}")
-        print()
-        print("  Next steps:")
-        print(f"  1. cd {report['worktree_path']}")
-        print("  2. Write tests and implementation code")
-        print(f"  3. Run: python3 scripts/implement.py finish {next_id}")
-        print(f"  4. Re-run: python3 scripts/implement.py parent {work_item_id}")
-        print()
+        for entry in started:
+            print()
+            print("=" * 60)
+            print(f"  Implement child: {entry['id']} (of {work_item_id})")
+            print("=" * 60)
+            print(f"  Worktree: {entry['worktree_path']}")
+            print(f"  Branch:   {entry['branch']}")
+            print()
+            print("  Next steps:")
+            print(f"  1. cd {entry['worktree_path']}")
+            print("  2. Write tests and implementation code")
+            print(f"  3. Run: python3 scripts/implement.py finish {entry['id']}")
+            print(f"  4. Re-run: python3 scripts/implement.py parent {work_item_id}")
+            print()
+        for entry in failed:
+            print(f"\n⛔ Failed to start child {entry['id']}: {entry['message']}\n")
 
     return report
 
@@ -2639,7 +3759,9 @@ def _discover_worktree(work_item_id: str) -> str | None:
     Checks:
     1. State file in a known worktree path
     2. Current directory (if inside a matching worktree)
-    3. Scan .worklog/worktrees/ for matching directories
+    3. The worktree registry (``skill/shared/worktree_registry.py``), from
+       anywhere in the repository
+    4. Scan .worklog/worktrees/ for matching directories (outside git)
 
     Safety: will NOT return a path that looks like the main working tree
     (where ``.git`` is a directory).  This prevents catastrophic deletion
@@ -2679,6 +3801,13 @@ def _discover_worktree(work_item_id: str) -> str | None:
         )
         return None
 
+    entry = worktree_registry.lookup(cwd, work_item_id)
+    if entry is not None:
+        if _is_worktree(Path(entry["path"])):
+            return entry["path"]
+        LOG.warning("Registered worktree %s is not a linked worktree; skipping", entry["path"])
+        return None
+
     # Scan .worklog/worktrees/ for directories matching wl-<work_item_id>-*
     repo_root = Path.cwd().resolve()
     worktrees_dir = repo_root / DEFAULT_WORKTREE_DIR
@@ -2748,6 +3877,23 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default=None,
         help="Override worktree path",
     )
+    parser.add_argument(
+        "--defer-push",
+        action="store_true",
+        help="parent: stack children locally and push them together at the end",
+    )
+    parser.add_argument(
+        "--from-step",
+        choices=FINISH_STEPS,
+        default=None,
+        help="finish: start at this step instead of the checkpointed resume point",
+    )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=1,
+        help="parent: children to keep in progress at once (default: 1)",
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -2815,6 +3961,7 @@ def _main(argv: list[str] | None = None) -> int:
             commit_msg_override=args.commit_msg,
             max_retry=args.max_retry,
             verbose=args.verbose,
+            from_step=args.from_step,
         )
     elif args.action == "abort":
         result = phase_abort(
@@ -2829,6 +3976,8 @@ def _main(argv: list[str] | None = None) -> int:
             no_refactor=args.no_refactor,
             parent_branch=args.parent_branch,
             verbose=args.verbose,
+            max_parallel=args.max_parallel,
+            defer_push=args.defer_push,
         )
     else:
         LOG.error("Unknown action: %s", args.action)
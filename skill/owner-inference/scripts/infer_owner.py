@@ -4,9 +4,11 @@
 Heuristics (in order of preference):
 1. Override map — `.worklog/triage/owner-map.yaml` for explicit mappings.
 2. CODEOWNERS — parse GitHub-style CODEOWNERS if present.
-3. Git blame — most-frequent author of the failing file.
-4. Recent commits — most-frequent author touching the file in the last N commits.
-5. Fallback — return `Build` with confidence 0.0.
+3. Ownership index — heaviest author of the file (or its nearest directory)
+   by changed lines, from the shared per-repo index (skill/shared/ownership_index.py).
+4. Git blame — most-frequent author of the failing file.
+5. Recent commits — most-frequent author touching the file in the last N commits.
+6. Fallback — return `Build` with confidence 0.0.
 
 Usage:
     python3 infer_owner.py '{"repo_path": ".", "file_path": "tests/test_foo.py"}'
@@ -18,8 +20,16 @@ import json
 import os
 import subprocess
 import sys
+from pathlib import Path
 from typing import Any
 
+_REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from skill.shared.codeowners import load_codeowners
+from skill.shared.ownership_index import load_ownership_index
+
 DEFAULT_FALLBACK = "Build"
 DEFAULT_CONFIDENCE_THRESHOLD = 0.3
 DEFAULT_RECENT_COMMITS = 50
@@ -77,62 +87,75 @@ def check_owner_map(repo_path: str, file_path: str) -> tuple[str, float, str] |
 
 
 def parse_codeowners(repo_path: str) -> list:
-    """Parse CODEOWNERS file and return list of (pattern, owners) tuples."""
-    candidates = [
-        os.path.join(repo_path, "CODEOWNERS"),
-        os.path.join(repo_path, ".github", "CODEOWNERS"),
-        os.path.join(repo_path, "docs", "CODEOWNERS"),
-    ]
-    codeowners_path = None
-    for c in candidates:
-        if os.path.isfile(c):
-            codeowners_path = c
-            break
-    if not codeowners_path:
+    """Parse CODEOWNERS file and return list of (pattern, owners) tuples.
+
+    Rules without owners (which un-own their paths) are included with an
+    empty owner list.
+    """
+    codeowners = load_codeowners(repo_path)
+    if codeowners is None:
         return []
-    rules = []
-    try:
-        with open(codeowners_path) as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split()
-                if len(parts) >= 2:
-                    pattern = parts[0]
-                    owners = [p.lstrip("@") for p in parts[1:]]
-                    rules.append((pattern, owners))
-    except Exception:  # noqa: BLE001, S110
-        pass
-    return rules
+    return [(rule.pattern, list(rule.owners)) for rule in codeowners.rules]
 
 
 def check_codeowners(
     repo_path: str, file_path: str
 ) -> tuple[str, float, str] | None:
-    """Match file_path against CODEOWNERS rules (last match wins)."""
-    rules = parse_codeowners(repo_path)
-    if not rules:
+    """Match file_path against CODEOWNERS rules (last match wins).
+
+    Uses the compiled matcher from ``skill/shared/codeowners.py``
+    (gitignore-style patterns, cached by file mtime).
+    """
+    codeowners = load_codeowners(repo_path)
+    if codeowners is None:
         return None
-    from fnmatch import fnmatch
+    rel = os.path.relpath(os.path.join(repo_path, file_path), repo_path)
+    rule = codeowners.rule_for(rel)
+    if rule is None or not rule.owners:
+        return None
+    return (
+        rule.owners[0],
+        0.8,
+        f"CODEOWNERS matched pattern '{rule.pattern}'",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Ownership index
+# ---------------------------------------------------------------------------
+
+
+def check_ownership_index(
+    repo_path: str, file_path: str
+) -> tuple[str, float, str] | None:
+    """Heaviest author of file_path by changed lines, from the ownership index.
 
-    matched_owners = None
-    matched_pattern = None
-    for pattern, owners in rules:
-        # CODEOWNERS patterns: leading / means repo root, otherwise match anywhere
-        check_pattern = pattern.lstrip("/")
-        if fnmatch(file_path, check_pattern) or fnmatch(
-            file_path, "**/" + check_pattern
-        ):
-            matched_owners = owners
-            matched_pattern = pattern
-    if matched_owners:
+    File-level weights are scaled like git blame (max 0.7); when the file has
+    no history in the indexed window, its nearest directory with history is
+    used, scaled like recent commits (max 0.5).
+    """
+    index = load_ownership_index(repo_path)
+    if index is None or index.root is None:
+        return None
+    full_path = os.path.abspath(os.path.join(repo_path, file_path))
+    rel = os.path.relpath(full_path, index.root).replace(os.sep, "/")
+    if rel.startswith("../"):
+        return None
+    owner = index.top_owner(rel)
+    if owner is None or owner["total"] <= 0:
+        return None
+    share = round(owner["lines"] / owner["total"], 2)
+    if owner["scope"] == "file":
         return (
-            matched_owners[0],
-            0.8,
-            f"CODEOWNERS matched pattern '{matched_pattern}'",
+            owner["author"],
+            min(share * 0.7, 0.7),
+            f"ownership index: {owner['lines']}/{owner['total']} changed lines",
         )
-    return None
+    return (
+        owner["author"],
+        min(share * 0.5, 0.5),
+        f"ownership index: {owner['lines']}/{owner['total']} changed lines under {owner['path']}/",
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -230,6 +253,7 @@ def infer_owner(
     heuristics = [
         ("owner_map", lambda: check_owner_map(repo_path, file_path)),
         ("codeowners", lambda: check_codeowners(repo_path, file_path)),
+        ("ownership_index", lambda: check_ownership_index(repo_path, file_path)),
         ("git_blame", lambda: check_git_blame(repo_path, file_path)),
         ("recent_commits", lambda: check_recent_commits(repo_path, file_path)),
     ]
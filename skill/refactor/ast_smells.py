@@ -0,0 +1,410 @@
+"""In-process Python AST smell detector.
+
+A fast, dependency-free smell source for ``detect_smells(mode="ast")``. It
+needs no linter binary or language server, so smell detection keeps working
+when ruff is missing, and it is cheap enough to run on every implement
+finish.
+
+Provides:
+  - analyze_files(): Analyze Python files (process pool for many files) and
+    return findings in the standard smell finding schema.
+  - analyze_source(): Analyze one source string (used by the pool workers).
+
+Detected smells (codes follow the equivalent ruff / pylint rules so that
+findings dedupe against real linter output on ``(file, line, code)``):
+
+  ========  =========================================  ===================
+  Code      Smell                                      smell_type
+  ========  =========================================  ===================
+  C901      High cyclomatic complexity                 complex_function
+  PLR0913   Too many parameters                        long_parameter_list
+  PLR0915   Long function (lines)                      long_method
+  PLR1702   Deeply nested blocks                       deep_nesting
+  R0801     Duplicated block (normalized-AST hash)     duplicate_code
+  ========  =========================================  ===================
+
+Duplicate detection hashes a normalized dump of every function and
+compound statement spanning at least ``min_duplicate_lines`` lines: names
+bound inside the block (parameters, assignment and loop targets, nested
+defs) are renamed by first occurrence and docstrings dropped, so copies that
+only differ in local names still match. Callees, globals and builtins keep
+their names, so blocks calling different functions do not. Matches are reported
+across all analyzed files; a block nested inside an already reported
+duplicate is not reported again.
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Thresholds
+# ---------------------------------------------------------------------------
+
+DEFAULT_AST_RULES: dict[str, Any] = {
+    "enabled": True,
+    # Also run alongside an available ruff in hybrid/linter mode. By default
+    # the AST source only stands in for ruff when ruff is not installed.
+    "with_linter": False,
+    "max_function_lines": 60,
+    "max_nesting": 4,
+    "max_complexity": 10,
+    "max_parameters": 6,
+    "min_duplicate_lines": 6,
+    # Below this many files the analysis runs in-process; at or above it
+    # the files are spread over a process pool.
+    "parallel_threshold": 16,
+}
+
+AST_CODE_SMELL_TYPES: dict[str, str] = {
+    "C901": "complex_function",
+    "PLR0913": "long_parameter_list",
+    "PLR0915": "long_method",
+    "PLR1702": "deep_nesting",
+    "R0801": "duplicate_code",
+}
+
+_AST_CODE_SEVERITY: dict[str, str] = {
+    "C901": "medium",
+    "PLR0913": "low",
+    "PLR0915": "medium",
+    "PLR1702": "medium",
+    "R0801": "medium",
+}
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_NESTING_NODES = (
+    ast.If, ast.For, ast.AsyncFor, ast.While, ast.With, ast.AsyncWith,
+    ast.Try, ast.Match,
+) + ((ast.TryStar,) if hasattr(ast, "TryStar") else ())
+_BLOCK_NODES = _FUNCTION_NODES + _NESTING_NODES + (ast.ClassDef,)
+
+
+# ---------------------------------------------------------------------------
+# Metrics
+# ---------------------------------------------------------------------------
+
+
+def _own_nodes(func: ast.AST):
+    """Yield the nodes of *func*'s body, not descending into nested scopes."""
+    stack = list(ast.iter_child_nodes(func))
+    while stack:
+        node = stack.pop()
+        yield node
+        if isinstance(node, (*_FUNCTION_NODES, ast.ClassDef, ast.Lambda)):
+            continue
+        stack.extend(ast.iter_child_nodes(node))
+
+
+def _cyclomatic_complexity(func: ast.AST) -> int:
+    """McCabe-style complexity: 1 + decision points in *func*'s own body."""
+    complexity = 1
+    for node in _own_nodes(func):
+        if isinstance(node, (ast.If, ast.IfExp, ast.For, ast.AsyncFor,
+                             ast.While, ast.ExceptHandler, ast.Assert)):
+            complexity += 1
+        elif isinstance(node, ast.BoolOp):
+            complexity += len(node.values) - 1
+        elif isinstance(node, ast.comprehension):
+            complexity += 1 + len(node.ifs)
+        elif isinstance(node, ast.match_case):
+            complexity += 1
+    return complexity
+
+
+def _max_nesting(node: ast.AST, depth: int = 0) -> int:
+    """Deepest compound-statement nesting below *node* (nested defs excluded)."""
+    deepest = depth
+    for child in ast.iter_child_nodes(node):
+        if isinstance(child, (*_FUNCTION_NODES, ast.ClassDef, ast.Lambda)):
+            continue
+        if isinstance(child, _NESTING_NODES):
+            # ``elif`` is an If nested in orelse; it is not deeper nesting.
+            is_elif = (
+                isinstance(node, ast.If) and isinstance(child, ast.If)
+                and len(node.orelse) == 1 and node.orelse[0] is child
+            )
+            deepest = max(deepest, _max_nesting(child, depth if is_elif else depth + 1))
+        else:
+            deepest = max(deepest, _max_nesting(child, depth))
+    return deepest
+
+
+def _parameter_count(func: ast.FunctionDef | ast.AsyncFunctionDef) -> int:
+    """Count declared parameters, ignoring a leading ``self`` / ``cls``."""
+    args = func.args
+    positional = [*args.posonlyargs, *args.args]
+    if positional and positional[0].arg in ("self", "cls"):
+        positional = positional[1:]
+    count = len(positional) + len(args.kwonlyargs)
+    count += int(args.vararg is not None) + int(args.kwarg is not None)
+    return count
+
+
+# ---------------------------------------------------------------------------
+# Normalized-AST hashing (duplicate detection)
+# ---------------------------------------------------------------------------
+
+
+def _local_names(node: ast.AST) -> set[str]:
+    """Names bound inside *node*: parameters, store targets and nested defs.
+
+    Names declared ``global`` / ``nonlocal`` are excluded; they refer to
+    bindings outside the block.
+    """
+    bound: set[str] = set()
+    outer: set[str] = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name) and isinstance(child.ctx, (ast.Store, ast.Del)):
+            bound.add(child.id)
+        elif isinstance(child, ast.arg):
+            bound.add(child.arg)
+        elif isinstance(child, (*_FUNCTION_NODES, ast.ClassDef)):
+            bound.add(child.name)
+        elif isinstance(child, (ast.Global, ast.Nonlocal)):
+            outer.update(child.names)
+    return bound - outer
+
+
+class _Normalizer(ast.NodeTransformer):
+    """Rename local identifiers by first occurrence and strip docstrings.
+
+    Only names bound inside the hashed block are renamed; callees, globals
+    and builtins keep their names, so blocks that call different functions
+    do not hash alike.
+    """
+
+    def __init__(self, local_names: set[str]) -> None:
+        self._local_names = local_names
+        self._names: dict[str, str] = {}
+
+    def _rename(self, name: str) -> str:
+        if name not in self._local_names:
+            return name
+        return self._names.setdefault(name, f"v{len(self._names)}")
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        return ast.Name(id=self._rename(node.id), ctx=node.ctx)
+
+    def visit_arg(self, node: ast.arg) -> ast.AST:
+        return ast.arg(arg=self._rename(node.arg), annotation=None)
+
+    def _strip_docstring(self, node: ast.AST) -> ast.AST:
+        body = getattr(node, "body", None)
+        if (
+            body
+            and isinstance(body[0], ast.Expr)
+            and isinstance(body[0].value, ast.Constant)
+            and isinstance(body[0].value.value, str)
+        ):
+            node.body = body[1:] or [ast.Pass()]
+        return node
+
+    def _visit_def(self, node: ast.AST) -> ast.AST:
+        node = self._strip_docstring(node)
+        node.name = self._rename(node.name)
+        node.decorator_list = []
+        if hasattr(node, "returns"):
+            node.returns = None
+        return self.generic_visit(node)
+
+    visit_FunctionDef = _visit_def
+    visit_AsyncFunctionDef = _visit_def
+    visit_ClassDef = _visit_def
+
+
+def _block_hash(node: ast.AST) -> str:
+    """Hash *node* after local identifier renaming (location info excluded)."""
+    normalized = _Normalizer(_local_names(node)).visit(copy.deepcopy(node))
+    dump = ast.dump(normalized, annotate_fields=False, include_attributes=False)
+    return hashlib.sha1(dump.encode()).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Per-file analysis
+# ---------------------------------------------------------------------------
+
+
+def _finding(file: str, line: int, code: str, message: str) -> dict[str, Any]:
+    return {
+        "file": file,
+        "line": line,
+        "severity": _AST_CODE_SEVERITY.get(code, "medium"),
+        "message": message,
+        "source": "ast",
+        "smell_type": AST_CODE_SMELL_TYPES.get(code, "unknown"),
+        "code": code,
+    }
+
+
+def analyze_source(
+    source: str,
+    file: str,
+    rules: dict[str, Any] | None = None,
+) -> tuple[list[dict[str, Any]], list[tuple[str, int, int]]]:
+    """Analyze one Python source string.
+
+    Args:
+        source: The Python source text.
+        file: The path reported in findings.
+        rules: AST thresholds (``DEFAULT_AST_RULES`` keys); missing keys
+               fall back to the defaults.
+
+    Returns:
+        ``(findings, blocks)`` where *blocks* are ``(hash, start, end)``
+        tuples for duplicate detection across files. A file that does not
+        parse yields no findings and no blocks.
+    """
+    cfg = {**DEFAULT_AST_RULES, **(rules or {})}
+    try:
+        tree = ast.parse(source, filename=file)
+    except (SyntaxError, ValueError):
+        return [], []
+
+    findings: list[dict[str, Any]] = []
+    blocks: list[tuple[str, int, int]] = []
+    min_dup = int(cfg["min_duplicate_lines"])
+
+    for node in ast.walk(tree):
+        if isinstance(node, _FUNCTION_NODES):
+            name = node.name
+            length = (node.end_lineno or node.lineno) - node.lineno + 1
+            if length > cfg["max_function_lines"]:
+                findings.append(_finding(
+                    file, node.lineno, "PLR0915",
+                    f"Function `{name}` is {length} lines long "
+                    f"(> {cfg['max_function_lines']})",
+                ))
+            complexity = _cyclomatic_complexity(node)
+            if complexity > cfg["max_complexity"]:
+                findings.append(_finding(
+                    file, node.lineno, "C901",
+                    f"Function `{name}` has cyclomatic complexity "
+                    f"{complexity} (> {cfg['max_complexity']})",
+                ))
+            depth = _max_nesting(node)
+            if depth > cfg["max_nesting"]:
+                findings.append(_finding(
+                    file, node.lineno, "PLR1702",
+                    f"Function `{name}` nests blocks {depth} levels deep "
+                    f"(> {cfg['max_nesting']})",
+                ))
+            params = _parameter_count(node)
+            if params > cfg["max_parameters"]:
+                findings.append(_finding(
+                    file, node.lineno, "PLR0913",
+                    f"Function `{name}` takes {params} parameters "
+                    f"(> {cfg['max_parameters']})",
+                ))
+
+        if isinstance(node, _BLOCK_NODES):
+            end = node.end_lineno or node.lineno
+            if end - node.lineno + 1 >= min_dup:
+                blocks.append((_block_hash(node), node.lineno, end))
+
+    return findings, blocks
+
+
+def _analyze_path(
+    path: str,
+    rules: dict[str, Any] | None,
+) -> tuple[str, list[dict[str, Any]], list[tuple[str, int, int]]]:
+    """Pool worker: read and analyze one file (unreadable files are skipped)."""
+    try:
+        with open(path, encoding="utf-8", errors="replace") as fh:
+            source = fh.read()
+    except OSError:
+        return path, [], []
+    findings, blocks = analyze_source(source, path, rules)
+    return path, findings, blocks
+
+
+def _duplicate_findings(
+    blocks_by_file: dict[str, list[tuple[str, int, int]]],
+) -> list[dict[str, Any]]:
+    """Report blocks whose normalized hash occurs more than once.
+
+    Larger blocks are claimed first; an occurrence that lies inside a range
+    already reported for the same file is skipped, so a duplicated function
+    is reported once rather than once per nested statement.
+    """
+    occurrences: dict[str, list[tuple[str, int, int]]] = {}
+    for file, blocks in blocks_by_file.items():
+        for digest, start, end in blocks:
+            occurrences.setdefault(digest, []).append((file, start, end))
+
+    groups = [occ for occ in occurrences.values() if len(occ) > 1]
+    groups.sort(key=lambda occ: occ[0][2] - occ[0][1], reverse=True)
+
+    covered: dict[str, list[tuple[int, int]]] = {}
+    findings: list[dict[str, Any]] = []
+    for occ in groups:
+        fresh = [
+            (f, s, e) for f, s, e in occ
+            if not any(cs <= s and e <= ce for cs, ce in covered.get(f, ()))
+        ]
+        if len(fresh) < 2:
+            continue
+        for file, start, end in fresh:
+            covered.setdefault(file, []).append((start, end))
+            others = ", ".join(
+                f"{f}:{s}" for f, s, _e in fresh if (f, s) != (file, start)
+            )
+            findings.append(_finding(
+                file, start, "R0801",
+                f"Duplicated block (lines {start}-{end}) also at {others}",
+            ))
+    return findings
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def analyze_files(
+    files: list[str],
+    rules: dict[str, Any] | None = None,
+    max_workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """Analyze Python *files* and return smell findings.
+
+    Non-Python and missing files are ignored. When the number of files
+    reaches ``parallel_threshold`` they are analyzed on a process pool
+    (*max_workers*, default ``os.cpu_count()``); otherwise in-process.
+
+    Args:
+        files: File paths to analyze.
+        rules: AST thresholds (see ``DEFAULT_AST_RULES``).
+        max_workers: Optional process pool size.
+
+    Returns:
+        A list of finding dicts with keys ``file``, ``line``, ``severity``,
+        ``message``, ``source`` (``"ast"``), ``smell_type``, ``code``.
+    """
+    cfg = {**DEFAULT_AST_RULES, **(rules or {})}
+    py_files = [f for f in files if f.endswith((".py", ".pyi")) and os.path.isfile(f)]
+    if not py_files:
+        return []
+
+    if len(py_files) >= int(cfg["parallel_threshold"]):
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            results = list(pool.map(
+                _analyze_path, py_files, [cfg] * len(py_files),
+                chunksize=max(1, len(py_files) // ((max_workers or os.cpu_count() or 1) * 4)),
+            ))
+    else:
+        results = [_analyze_path(f, cfg) for f in py_files]
+
+    findings: list[dict[str, Any]] = []
+    blocks_by_file: dict[str, list[tuple[str, int, int]]] = {}
+    for path, file_findings, blocks in results:
+        findings.extend(file_findings)
+        blocks_by_file[path] = blocks
+    findings.extend(_duplicate_findings(blocks_by_file))
+    return findings
@@ -5,6 +5,8 @@ code smells and prevent duplicate work item creation.
 
 Provides:
   - inject_refactor_comment(): Inject a REFACTOR comment into a source file.
+  - inject_refactor_comments(): Inject comments for many smells, one read
+    and one atomic write per file.
   - has_existing_comment(): Check if a REFACTOR comment already exists for a
     given smell type.
   - get_comment_style(): Determine the comment style for a given file path.
@@ -30,6 +32,9 @@ from __future__ import annotations
 import logging
 import os
 import re
+import stat
+import tempfile
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -403,53 +408,152 @@ def inject_refactor_comment(
         ``True`` if the comment was successfully injected, ``False`` if it
         was skipped (duplicate), the file doesn't exist, or an error occurred.
     """
-    # Validate inputs
-    if not file_path or not work_item_id:
-        LOG.warning("Invalid arguments: file_path=%r, work_item_id=%r", file_path, work_item_id)
-        return False
+    outcome = inject_refactor_comments([(file_path, smell, work_item_id)])[0]
+    return outcome["injected"]
 
-    if not os.path.isfile(file_path):
-        LOG.warning("File does not exist: %s", file_path)
-        return False
 
-    smell_type = smell.get("smell_type", "unknown")
+def inject_refactor_comments(
+    entries: Iterable[tuple[str, dict[str, Any], str]],
+) -> list[dict[str, Any]]:
+    """Inject REFACTOR comments for many smells, one read and write per file.
 
-    # Check for existing duplicate comment
-    if has_existing_comment(file_path, smell_type):
-        LOG.info(
-            "Skipping injection for %s in %s: duplicate REFACTOR comment exists",
-            smell_type,
-            file_path,
-        )
-        return False
+    Entries are grouped by file. Each file is read once, its existing
+    REFACTOR smell types are collected once, every new comment block is
+    placed at the top of the file and the result is written back
+    atomically (temp file + ``os.replace``) once. The file ends up exactly
+    as if :func:`inject_refactor_comment` had been called for each entry in
+    order: a later smell of a type already commented (in the file, or
+    earlier in the batch) is skipped as a duplicate.
 
-    # Determine comment style
-    style = get_comment_style(file_path)
+    Args:
+        entries: ``(file_path, smell, work_item_id)`` tuples.
+
+    Returns:
+        One outcome per entry, in input order: ``file``, ``smell_type``,
+        ``work_item_id``, ``injected`` (bool), ``reason`` (``"injected"``,
+        ``"invalid_arguments"``, ``"missing_file"``, ``"duplicate"``,
+        ``"read_error"`` or ``"write_error"``) and ``lines_added`` (lines
+        inserted above the original content of the file, so callers can
+        shift line numbers of findings they still hold).
+    """
+    entries = list(entries)
+    outcomes: list[dict[str, Any]] = []
+    by_file: dict[str, list[int]] = {}
+    for file_path, smell, work_item_id in entries:
+        outcome = {
+            "file": file_path,
+            "smell_type": smell.get("smell_type", "unknown"),
+            "work_item_id": work_item_id,
+            "injected": False,
+            "reason": "",
+            "lines_added": 0,
+        }
+        outcomes.append(outcome)
+        # Validate inputs
+        if not file_path or not work_item_id:
+            LOG.warning("Invalid arguments: file_path=%r, work_item_id=%r", file_path, work_item_id)
+            outcome["reason"] = "invalid_arguments"
+            continue
+        by_file.setdefault(file_path, []).append(len(outcomes) - 1)
+
+    for file_path, indices in by_file.items():
+        _inject_into_file(file_path, [(outcomes[i], entries[i][1]) for i in indices])
+    return outcomes
+
+
+def _inject_into_file(
+    file_path: str,
+    pending: list[tuple[dict[str, Any], dict[str, Any]]],
+) -> None:
+    """Apply every pending ``(outcome, smell)`` injection to one file."""
 
-    # Build the comment block
-    comment_block = _build_comment_block(work_item_id, smell, style)
+    def fail(reason: str) -> None:
+        for outcome, _smell in pending:
+            if not outcome["reason"]:
+                outcome["reason"] = reason
+
+    if not os.path.isfile(file_path):
+        LOG.warning("File does not exist: %s", file_path)
+        fail("missing_file")
+        return
 
     try:
         with open(file_path, "r", encoding="utf-8", errors="replace") as f:
             original_content = f.read()
     except (OSError, UnicodeDecodeError) as exc:
         LOG.warning("Failed to read %s: %s", file_path, exc)
-        return False
+        fail("read_error")
+        return
 
-    # Place comment at the top of the file
-    new_content = comment_block + original_content
+    existing = {
+        match.group(2).strip().lower()
+        for match in REFACTOR_PATTERN.finditer(original_content)
+    }
+    # Determine comment style
+    style = get_comment_style(file_path)
 
+    blocks: list[str] = []
+    accepted: list[dict[str, Any]] = []
+    for outcome, smell in pending:
+        smell_type = outcome["smell_type"]
+        # Check for existing duplicate comment
+        if smell_type.lower() in existing:
+            LOG.info(
+                "Skipping injection for %s in %s: duplicate REFACTOR comment exists",
+                smell_type,
+                file_path,
+            )
+            outcome["reason"] = "duplicate"
+            continue
+        existing.add(smell_type.lower())
+        blocks.append(_build_comment_block(outcome["work_item_id"], smell, style))
+        accepted.append(outcome)
+
+    if not blocks:
+        return
+
+    # Each injection goes on top of the file, so the last one ends up first.
+    header = "".join(reversed(blocks))
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(new_content)
-    except (OSError, PermissionError) as exc:
+        _atomic_write(file_path, header + original_content)
+    except OSError as exc:
         LOG.warning("Failed to write to %s: %s", file_path, exc)
-        return False
+        for outcome in accepted:
+            outcome["reason"] = "write_error"
+        return
+
+    lines_added = header.count("\n")
+    for outcome in accepted:
+        outcome["injected"] = True
+        outcome["reason"] = "injected"
+        outcome["lines_added"] = lines_added
+        LOG.info(
+            "Injected REFACTOR comment for %s into %s (work item: %s)",
+            outcome["smell_type"],
+            file_path,
+            outcome["work_item_id"],
+        )
 
-    LOG.info(
-        "Injected REFACTOR comment for %s into %s (work item: %s)",
-        smell_type,
-        file_path,
-        work_item_id,
-    )
-    return True
+
+def _atomic_write(file_path: str, content: str) -> None:
+    """Replace *file_path* with *content* via a temp file and ``os.replace``.
+
+    Read-only files are refused (``PermissionError``): replacing the
+    directory entry would otherwise bypass the file's own permissions.
+    """
+    mode = os.stat(file_path).st_mode
+    if not mode & 0o222 or not os.access(file_path, os.W_OK):
+        raise PermissionError(f"file is read-only: {file_path}")
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".refactor-comment-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.chmod(tmp, stat.S_IMODE(mode))
+        os.replace(tmp, file_path)
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,609 @@
+"""Cross-file duplicate-code index for the refactor step.
+
+Builds a per-repo fingerprint index of every tracked source file and answers
+"which spans of these (session) files are copied elsewhere in the repo?"
+without re-reading the rest of the tree on every run.
+
+Fingerprints follow the winnowing scheme used by MOSS: each file is
+tokenized (comments dropped, string and number literals normalized), every
+run of ``K_GRAM`` tokens is hashed with a rolling hash, and from each window
+of ``WINDOW`` consecutive hashes the minimum is kept. Any shared run of at
+least ``K_GRAM + WINDOW - 1`` tokens is guaranteed to share a fingerprint.
+
+Provides:
+  - DuplicateIndex: The SQLite-backed index (``refresh()`` + ``duplicates_for()``).
+  - find_duplicate_smells(): Refresh the repo index and return duplicate
+    spans in the given files as smell findings.
+  - index_path(): Where the index for a repo is stored.
+
+Storage and incremental updates:
+
+- **Per-repo storage outside the work tree**, resolved by
+  :func:`skill.shared.repo_index.index_path`:
+  ``<git-dir>/duplicate-index.sqlite3`` (worktree-aware), so the
+  ``git add -A`` of ``implement.py finish`` never stages it. Non-git trees
+  fall back to ``<repo>/.duplicate-index.sqlite3``.
+- **Incremental by content hash**: ``refresh()`` stats every listed file and
+  only reads files whose size/mtime changed; of those, only files whose
+  content digest changed have their fingerprints replaced. Deleted files
+  are dropped. Large batches are fingerprinted on a process pool.
+- Fingerprints shared by more than ``max_occurrences`` files (license
+  headers, generated boilerplate) are ignored at query time.
+
+Usage:
+
+    from skill.refactor.duplicate_index import find_duplicate_smells
+
+    findings = find_duplicate_smells(["skill/cleanup/scripts/lib.py"])
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from skill.shared import repo_index
+
+LOG = logging.getLogger("refactor.duplicate_index")
+
+INDEX_FILENAME = "duplicate-index.sqlite3"
+
+# Bump when tokenization or fingerprinting changes; a stale index is rebuilt.
+_INDEX_VERSION = 1
+K_GRAM = 24
+WINDOW = 8
+
+# Files larger than this are skipped (minified bundles, generated code).
+MAX_FILE_BYTES = 512 * 1024
+
+# Below this many changed files, fingerprinting runs in-process.
+PARALLEL_THRESHOLD = 64
+
+SOURCE_EXTENSIONS: tuple[str, ...] = (
+    ".py", ".pyi", ".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx",
+    ".sh", ".bash", ".go", ".rs", ".java", ".kt", ".cs", ".rb", ".php",
+    ".c", ".h", ".cc", ".cpp", ".hpp", ".swift", ".scala",
+)
+
+# Directories never indexed when walking a non-git tree.
+_PRUNE_DIRS = {".git", "node_modules", ".venv", "venv", "__pycache__",
+               ".worklog", "dist", "build", ".mypy_cache", ".pytest_cache"}
+
+DEFAULT_DUPLICATE_RULES: dict[str, Any] = {
+    "enabled": True,
+    # Minimum span (in lines of the queried file) reported as a duplicate.
+    "min_lines": 6,
+    # Fingerprints present in more files than this are treated as boilerplate.
+    "max_occurrences": 20,
+}
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<comment>\#[^\n]*|//[^\n]*|/\*.*?\*/)
+  | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*'|`(?:\\.|[^`\\])*`)
+  | (?P<number>\b\d[\w.]*)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<op>[^\s\w])
+    """,
+    re.S | re.X,
+)
+
+_MASK64 = (1 << 64) - 1
+# SQLite integers are signed 64-bit; fingerprints are stored as 63-bit values.
+_MASK63 = (1 << 63) - 1
+_BASE = 1_000_003
+_BASE_POW = pow(_BASE, K_GRAM - 1, 1 << 64)
+
+# Max SQLite host parameters per ``IN (...)`` query.
+_SQL_BATCH = 500
+
+
+# ---------------------------------------------------------------------------
+# Fingerprinting
+# ---------------------------------------------------------------------------
+
+
+@lru_cache(maxsize=1 << 16)
+def _token_hash(token: str) -> int:
+    return int.from_bytes(
+        hashlib.blake2b(token.encode(), digest_size=8).digest(), "little",
+    )
+
+
+def _tokenize(text: str) -> list[tuple[int, int]]:
+    """Return ``(token_hash, line)`` pairs with literals normalized."""
+    tokens: list[tuple[int, int]] = []
+    line = 1
+    pos = 0
+    for match in _TOKEN_RE.finditer(text):
+        line += text.count("\n", pos, match.start())
+        pos = match.start()
+        kind = match.lastgroup
+        if kind == "comment":
+            continue
+        if kind == "string":
+            token = "\x00str"
+        elif kind == "number":
+            token = "\x00num"
+        else:
+            token = match.group()
+        tokens.append((_token_hash(token), line))
+    return tokens
+
+
+def fingerprint_text(text: str) -> list[tuple[int, int, int]]:
+    """Winnow *text* into ``(hash, start_line, end_line)`` fingerprints."""
+    tokens = _tokenize(text)
+    if len(tokens) < K_GRAM:
+        return []
+
+    grams: list[int] = []
+    h = 0
+    for i, (tok, _line) in enumerate(tokens):
+        if i >= K_GRAM:
+            h = (h - tokens[i - K_GRAM][0] * _BASE_POW) & _MASK64
+        h = (h * _BASE + tok) & _MASK64
+        if i >= K_GRAM - 1:
+            grams.append(h & _MASK63)
+
+    fingerprints: list[tuple[int, int, int]] = []
+    width = min(WINDOW, len(grams))
+    chosen = last = -1
+    for start in range(len(grams) - width + 1):
+        stop = start + width
+        # Rightmost minimum, so runs of equal hashes select one position.
+        if chosen < start:
+            chosen = start
+            for j in range(start + 1, stop):
+                if grams[j] <= grams[chosen]:
+                    chosen = j
+        elif grams[stop - 1] <= grams[chosen]:
+            chosen = stop - 1
+        if chosen != last:
+            last = chosen
+            fingerprints.append(
+                (grams[chosen], tokens[chosen][1], tokens[chosen + K_GRAM - 1][1]),
+            )
+    return fingerprints
+
+
+def _fingerprint_path(path: str) -> tuple[str, list[tuple[int, int, int]]] | None:
+    """Pool worker: return ``(digest, fingerprints)`` or None if unreadable."""
+    try:
+        data = Path(path).read_bytes()
+    except OSError:
+        return None
+    digest = hashlib.sha1(data).hexdigest()
+    return digest, fingerprint_text(data.decode("utf-8", errors="replace"))
+
+
+# ---------------------------------------------------------------------------
+# Storage location and file listing
+# ---------------------------------------------------------------------------
+
+
+def _run_git(cwd: str, *args: str) -> str | None:
+    """Run a git command in *cwd*, returning stdout or None on failure."""
+    try:
+        proc = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=120,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def index_path(repo_root: str | Path) -> Path:
+    """Resolve where the duplicate index for *repo_root* is stored."""
+    path = repo_index.index_path(repo_root, filename=INDEX_FILENAME)
+    if path is not None:
+        return path
+    return Path(repo_root).resolve() / f".{INDEX_FILENAME}"
+
+
+def list_source_files(repo_root: str | Path) -> list[str]:
+    """List indexable source files under *repo_root* (repo-relative paths).
+
+    Uses ``git ls-files`` (tracked plus untracked, honouring ``.gitignore``)
+    and falls back to a pruned directory walk outside git.
+    """
+    root = str(Path(repo_root).resolve())
+    out = _run_git(root, "ls-files", "-z", "--cached", "--others",
+                   "--exclude-standard")
+    if out is not None:
+        paths = [p for p in out.split("\0") if p]
+    else:
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in _PRUNE_DIRS]
+            rel = os.path.relpath(dirpath, root)
+            for name in filenames:
+                paths.append(name if rel == "." else os.path.join(rel, name))
+    return sorted({p for p in paths if p.endswith(SOURCE_EXTENSIONS)})
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    digest TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fingerprints (
+    hash INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    start_line INTEGER NOT NULL,
+    end_line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS fingerprints_hash ON fingerprints (hash);
+CREATE INDEX IF NOT EXISTS fingerprints_file ON fingerprints (file_id);
+"""
+
+
+class DuplicateIndex:
+    """SQLite-backed winnowing fingerprint index for one repository.
+
+    Paths are stored relative to *repo_root*. Use as a context manager or
+    call :meth:`close` when done.
+    """
+
+    def __init__(self, repo_root: str | Path, path: str | Path | None = None) -> None:
+        self.repo_root = Path(repo_root).resolve()
+        self.path = Path(path) if path is not None else index_path(self.repo_root)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def __enter__(self) -> DuplicateIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _init_schema(self) -> None:
+        params = f"{_INDEX_VERSION}:{K_GRAM}:{WINDOW}"
+        self._db.executescript(_SCHEMA)
+        row = self._db.execute(
+            "SELECT value FROM meta WHERE key = 'params'",
+        ).fetchone()
+        if row is None or row[0] != params:
+            with self._db:
+                self._db.execute("DELETE FROM fingerprints")
+                self._db.execute("DELETE FROM files")
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('params', ?)",
+                    (params,),
+                )
+
+    # -- updates -------------------------------------------------------------
+
+    def refresh(
+        self,
+        files: list[str] | None = None,
+        *,
+        max_workers: int | None = None,
+    ) -> dict[str, int]:
+        """Bring the index up to date.
+
+        Args:
+            files: Repo-relative paths to refresh. ``None`` refreshes the
+                   whole repo (see :func:`list_source_files`) and drops
+                   entries for files that no longer exist.
+            max_workers: Optional process pool size for fingerprinting.
+
+        Returns:
+            Counts: ``scanned``, ``fingerprinted``, ``unchanged``,
+            ``removed``.
+        """
+        full = files is None
+        paths = list_source_files(self.repo_root) if full else list(files)
+        known = {
+            path: (file_id, digest, mtime_ns, size)
+            for file_id, path, digest, mtime_ns, size in self._db.execute(
+                "SELECT id, path, digest, mtime_ns, size FROM files",
+            )
+        }
+        stats = {"scanned": len(paths), "fingerprinted": 0, "unchanged": 0,
+                 "removed": 0}
+
+        stale: list[tuple[str, int, int]] = []
+        gone: list[str] = []
+        for rel in paths:
+            try:
+                st = os.stat(self.repo_root / rel)
+            except OSError:
+                gone.append(rel)
+                continue
+            if st.st_size > MAX_FILE_BYTES:
+                gone.append(rel)
+                continue
+            entry = known.get(rel)
+            if entry and entry[2] == st.st_mtime_ns and entry[3] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+            stale.append((rel, st.st_mtime_ns, st.st_size))
+
+        if full:
+            listed = set(paths)
+            gone.extend(p for p in known if p not in listed)
+
+        results = self._fingerprint([rel for rel, _m, _s in stale], max_workers)
+
+        with self._db:
+            for rel in gone:
+                if rel in known:
+                    self._delete(known[rel][0])
+                    stats["removed"] += 1
+            for (rel, mtime_ns, size), result in zip(stale, results):
+                entry = known.get(rel)
+                if result is None:
+                    if entry:
+                        self._delete(entry[0])
+                        stats["removed"] += 1
+                    continue
+                digest, fingerprints = result
+                if entry and entry[1] == digest:
+                    self._db.execute(
+                        "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                        (mtime_ns, size, entry[0]),
+                    )
+                    stats["unchanged"] += 1
+                    continue
+                if entry:
+                    self._delete(entry[0])
+                file_id = self._db.execute(
+                    "INSERT INTO files (path, digest, mtime_ns, size) "
+                    "VALUES (?, ?, ?, ?)",
+                    (rel, digest, mtime_ns, size),
+                ).lastrowid
+                self._db.executemany(
+                    "INSERT INTO fingerprints (hash, file_id, start_line, end_line) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(h, file_id, s, e) for h, s, e in fingerprints],
+                )
+                stats["fingerprinted"] += 1
+        return stats
+
+    def _fingerprint(
+        self,
+        paths: list[str],
+        max_workers: int | None,
+    ) -> list[tuple[str, list[tuple[int, int, int]]] | None]:
+        abs_paths = [str(self.repo_root / p) for p in paths]
+        if len(abs_paths) < PARALLEL_THRESHOLD:
+            return [_fingerprint_path(p) for p in abs_paths]
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(
+                _fingerprint_path, abs_paths,
+                chunksize=max(1, len(abs_paths) // (workers * 4)),
+            ))
+
+    def _delete(self, file_id: int) -> None:
+        self._db.execute("DELETE FROM fingerprints WHERE file_id = ?", (file_id,))
+        self._db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    # -- queries -------------------------------------------------------------
+
+    def file_count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def duplicates_for(
+        self,
+        files: list[str],
+        *,
+        min_lines: int = DEFAULT_DUPLICATE_RULES["min_lines"],
+        max_occurrences: int = DEFAULT_DUPLICATE_RULES["max_occurrences"],
+    ) -> list[dict[str, Any]]:
+        """Return spans of *files* that also occur in other indexed files.
+
+        Args:
+            files: Repo-relative paths (must already be indexed).
+            min_lines: Minimum span length, in lines of the queried file.
+            max_occurrences: Ignore fingerprints present in more files.
+
+        Returns:
+            Dicts with ``file``, ``start``, ``end``, ``other_file``,
+            ``other_start``, ``other_end``, ordered by file then line.
+        """
+        ids = dict(self._db.execute("SELECT path, id FROM files"))
+        paths = {file_id: path for path, file_id in ids.items()}
+        spans: list[dict[str, Any]] = []
+        for rel in files:
+            file_id = ids.get(rel)
+            if file_id is None:
+                continue
+            own = self._db.execute(
+                "SELECT hash, start_line, end_line FROM fingerprints "
+                "WHERE file_id = ? ORDER BY start_line",
+                (file_id,),
+            ).fetchall()
+            others = self._occurrences(
+                {h for h, _s, _e in own}, file_id, max_occurrences,
+            )
+            pairs: dict[int, list[tuple[int, int, int, int]]] = {}
+            for h, start, end in own:
+                for other_id, o_start, o_end in others.get(h, ()):
+                    pairs.setdefault(other_id, []).append((start, end, o_start, o_end))
+            for other_id, matches in pairs.items():
+                for q_start, q_end, o_start, o_end in _merge_spans(matches):
+                    if q_end - q_start + 1 >= min_lines:
+                        spans.append({
+                            "file": rel,
+                            "start": q_start,
+                            "end": q_end,
+                            "other_file": paths[other_id],
+                            "other_start": o_start,
+                            "other_end": o_end,
+                        })
+        spans.sort(key=lambda s: (s["file"], s["start"], s["other_file"]))
+        return spans
+
+    def _occurrences(
+        self,
+        hashes: set[int],
+        file_id: int,
+        max_occurrences: int,
+    ) -> dict[int, list[tuple[int, int, int]]]:
+        """Map each hash to its occurrences in files other than *file_id*."""
+        found: dict[int, list[tuple[int, int, int]]] = {}
+        hash_list = list(hashes)
+        for i in range(0, len(hash_list), _SQL_BATCH):
+            batch = hash_list[i:i + _SQL_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            for h, other_id, start, end in self._db.execute(
+                "SELECT hash, file_id, start_line, end_line FROM fingerprints "
+                f"WHERE hash IN ({placeholders})",
+                batch,
+            ):
+                found.setdefault(h, []).append((other_id, start, end))
+        result: dict[int, list[tuple[int, int, int]]] = {}
+        for h, occ in found.items():
+            if len({other_id for other_id, _s, _e in occ}) > max_occurrences:
+                continue
+            rest = [o for o in occ if o[0] != file_id]
+            if rest:
+                result[h] = rest
+        return result
+
+
+def _merge_spans(
+    matches: list[tuple[int, int, int, int]],
+) -> list[tuple[int, int, int, int]]:
+    """Merge ``(q_start, q_end, o_start, o_end)`` matches into contiguous spans.
+
+    Consecutive fingerprints overlap or touch on both sides of a real copy,
+    so a match extends the current span when it starts within (or directly
+    after) the span in the queried file and in the other file.
+    """
+    merged: list[list[int]] = []
+    for q_start, q_end, o_start, o_end in sorted(matches):
+        for span in reversed(merged[-4:]):
+            if (
+                q_start <= span[1] + 1
+                and span[2] <= o_start <= span[3] + 1
+            ):
+                span[1] = max(span[1], q_end)
+                span[3] = max(span[3], o_end)
+                break
+        else:
+            merged.append([q_start, q_end, o_start, o_end])
+    return [tuple(span) for span in merged]
+
+
+# ---------------------------------------------------------------------------
+# Smell findings
+# ---------------------------------------------------------------------------
+
+
+def find_duplicate_smells(
+    files: list[str],
+    repo_root: str | Path | None = None,
+    rules: dict[str, Any] | None = None,
+    index: DuplicateIndex | None = None,
+) -> list[dict[str, Any]]:
+    """Report spans of *files* duplicated elsewhere in the repo.
+
+    The repo index is refreshed incrementally first (a full build on the
+    first run, a stat pass afterwards).
+
+    Args:
+        files: File paths (absolute or relative to the current directory).
+        repo_root: Repository root; defaults to the git toplevel of the
+                   current directory.
+        rules: Duplicate thresholds (``DEFAULT_DUPLICATE_RULES`` keys).
+        index: An open index to use instead of the repo's default one.
+
+    Returns:
+        Smell finding dicts (``source`` ``"duplicate_index"``, ``code``
+        ``"R0801"``, ``smell_type`` ``"duplicate_code"``), one per
+        duplicated span; the message lists every other location.
+    """
+    cfg = {**DEFAULT_DUPLICATE_RULES, **(rules or {})}
+    if not cfg.get("enabled", True):
+        return []
+
+    existing = [f for f in files if f.endswith(SOURCE_EXTENSIONS) and os.path.isfile(f)]
+    if not existing:
+        return []
+
+    if repo_root is None:
+        top = _run_git(os.getcwd(), "rev-parse", "--show-toplevel")
+        repo_root = top.strip() if top else os.getcwd()
+    root = Path(repo_root).resolve()
+
+    rel_to_orig: dict[str, str] = {}
+    for f in existing:
+        try:
+            rel_to_orig[os.path.relpath(Path(f).resolve(), root)] = f
+        except ValueError:
+            continue
+    rel_to_orig = {r: f for r, f in rel_to_orig.items() if not r.startswith("..")}
+    if not rel_to_orig:
+        return []
+
+    own_index = index is None
+    idx = index or DuplicateIndex(root)
+    try:
+        idx.refresh()
+        spans = idx.duplicates_for(
+            list(rel_to_orig),
+            min_lines=int(cfg["min_lines"]),
+            max_occurrences=int(cfg["max_occurrences"]),
+        )
+    except sqlite3.Error as exc:
+        LOG.warning("Duplicate index unavailable: %s", exc)
+        return []
+    finally:
+        if own_index:
+            idx.close()
+
+    grouped: dict[tuple[str, int], dict[str, Any]] = {}
+    for span in spans:
+        key = (span["file"], span["start"])
+        group = grouped.setdefault(key, {"end": span["end"], "others": []})
+        group["end"] = max(group["end"], span["end"])
+        group["others"].append(
+            f"{span['other_file']}:{span['other_start']}-{span['other_end']}",
+        )
+    return [
+        {
+            "file": rel_to_orig[rel],
+            "line": start,
+            "severity": "medium",
+            "message": (
+                f"Lines {start}-{group['end']} duplicate "
+                + ", ".join(group["others"])
+            ),
+            "source": "duplicate_index",
+            "smell_type": "duplicate_code",
+            "code": "R0801",
+        }
+        for (rel, start), group in grouped.items()
+    ]
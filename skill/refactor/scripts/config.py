@@ -61,6 +61,8 @@ DEFAULT_SMELL_TYPES: list[str] = [
     "feature_envy",
     "inappropriate_intimacy",
     "shotgun_surgery",
+    "long_parameter_list",
+    "deep_nesting",
 ]
 
 
@@ -43,7 +43,8 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 from skill.code_review.scripts.linter_runner import probe_linter
-from skill.refactor.comment_injection import inject_refactor_comment
+from skill.refactor.comment_injection import inject_refactor_comments
+from skill.refactor.duplicate_index import find_duplicate_smells
 from skill.refactor.session_boundary import (
     get_changed_files,
     get_untracked_files,
@@ -308,6 +309,38 @@ def run_smell_detection(
     )
 
 
+def run_duplicate_detection(
+    files: list[str],
+    config: dict[str, Any] | None,
+    known: list[dict[str, Any]] | None = None,
+) -> list[dict[str, Any]]:
+    """Report spans of *files* duplicated elsewhere in the repository.
+
+    Queries the incremental cross-file duplicate index
+    (:mod:`skill.refactor.duplicate_index`); thresholds come from the
+    ``duplicates`` section of the rules.
+
+    Args:
+        files: List of file paths to analyze.
+        config: Optional configuration dict.
+        known: Findings already reported; duplicates of their
+               ``(file, line, code)`` are dropped.
+
+    Returns:
+        A list of ``duplicate_code`` smell finding dicts.
+    """
+    if not files:
+        return []
+
+    rules = (config or load_rules()).get("duplicates", {})
+    seen = {(f.get("file"), f.get("line"), f.get("code")) for f in known or []}
+    return [
+        finding
+        for finding in find_duplicate_smells(files, rules=rules)
+        if (finding["file"], finding["line"], finding["code"]) not in seen
+    ]
+
+
 def remediate_pre_existing(
     smells: list[dict[str, Any]],
     work_item_id: str | None,
@@ -344,14 +377,15 @@ def remediate_pre_existing(
     created_ids = create_smell_work_items(smells)
     result["work_items_created"] = created_ids
 
-    # Inject REFACTOR comments for successfully created work items
-    for smell in smells:
+    # Inject REFACTOR comments for successfully created work items; all
+    # comments for one file are applied in a single read and write.
+    entries = []
+    for smell_index, smell in enumerate(smells):
         file_path = smell.get("file", "")
         if not file_path:
             continue
 
         # Find the matching work item ID (by index)
-        smell_index = smells.index(smell)
         smell_work_item_id = (
             created_ids[smell_index]
             if smell_index < len(created_ids)
@@ -367,14 +401,17 @@ def remediate_pre_existing(
             result["comment_errors"] += 1
             continue
 
-        success = inject_refactor_comment(file_path, smell, smell_work_item_id)
-        if success:
+        entries.append((file_path, smell, smell_work_item_id))
+
+    for outcome in inject_refactor_comments(entries):
+        if outcome["injected"]:
             result["comments_injected"] += 1
         else:
             LOG.warning(
-                "Failed to inject comment for %s in %s",
-                smell.get("smell_type", "unknown"),
-                file_path,
+                "Failed to inject comment for %s in %s (%s)",
+                outcome["smell_type"],
+                outcome["file"],
+                outcome["reason"],
             )
             result["comment_errors"] += 1
 
@@ -466,6 +503,11 @@ def refactor_pipeline(
         no_linter=no_linter,
         no_llm=no_llm,
     )
+    smells = smells + run_duplicate_detection(
+        files=session["all_files"],
+        config=config,
+        known=smells,
+    )
     report["smells_detected"] = smells
     report["summary"]["total_smells"] = len(smells)
 
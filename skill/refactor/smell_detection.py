@@ -4,6 +4,8 @@ Provides:
   - detect_smells(): Main entry point for hybrid smell detection.
   - detect_linter_smells(): Linter-based code smell detection.
   - detect_llm_smells(): LLM-based design/architectural smell detection.
+  - detect_ast_smells(): In-process Python AST smell detection (no linter
+    binary required).
   - load_rules(): Load smell detection rules from config or defaults.
   - classify_smell_severity(): Map raw severity to normalised level.
 
@@ -30,12 +32,16 @@ from typing import Any
 
 from skill.code_review.scripts.linter_runner import (
     classify_finding as _classify_linter_finding,
-)
-from skill.code_review.scripts.linter_runner import (
     probe_linter,
     run_eslint,
     run_ruff,
 )
+from skill.refactor.ast_smells import (
+    AST_CODE_SMELL_TYPES,
+    DEFAULT_AST_RULES,
+    analyze_files,
+)
+from skill.refactor.duplicate_index import DEFAULT_DUPLICATE_RULES
 
 LOG = logging.getLogger("refactor.smell_detection")
 
@@ -70,6 +76,8 @@ DEFAULT_RULES: dict[str, Any] = {
         "temperature": 0.1,
         "max_tokens": 2000,
     },
+    "ast": dict(DEFAULT_AST_RULES),
+    "duplicates": dict(DEFAULT_DUPLICATE_RULES),
     "severity_mapping": {
         "critical": {"priority": "critical", "color": "red"},
         "high": {"priority": "high", "color": "orange"},
@@ -88,9 +96,13 @@ DEFAULT_RULES: dict[str, Any] = {
         "feature_envy",
         "inappropriate_intimacy",
         "shotgun_surgery",
+        "long_parameter_list",
+        "deep_nesting",
     ],
 }
 
+VALID_MODES = ("linter", "llm", "hybrid", "ast")
+
 # ---------------------------------------------------------------------------
 # Finding key constants
 # ---------------------------------------------------------------------------
@@ -148,8 +160,11 @@ def detect_smells(
 
     Args:
         files: List of file paths to analyze.
-        mode: Detection mode — ``"linter"``, ``"llm"``, or ``"hybrid"``
-              (default).
+        mode: Detection mode — ``"linter"``, ``"llm"``, ``"ast"``, or
+              ``"hybrid"`` (default).  ``"ast"`` runs only the in-process
+              Python AST detector.  In ``"linter"`` and ``"hybrid"`` mode
+              the AST detector stands in for ruff on Python files when ruff
+              is not installed (or always, with ``rules["ast"]["with_linter"]``).
         rules: Optional rules configuration. If ``None``, defaults are loaded
                via :func:`load_rules`.
         llm_client: Optional LLM client for LLM-based detection.  Must have
@@ -163,11 +178,12 @@ def detect_smells(
 
     Raises:
         ValueError: If *mode* is not one of ``"linter"``, ``"llm"``,
-                    ``"hybrid"``.
+                    ``"hybrid"``, ``"ast"``.
     """
-    if mode not in ("linter", "llm", "hybrid"):
+    if mode not in VALID_MODES:
         raise ValueError(
-            f"Invalid mode: '{mode}'. Expected 'linter', 'llm', or 'hybrid'."
+            f"Invalid mode: '{mode}'. "
+            "Expected 'linter', 'llm', 'hybrid', or 'ast'."
         )
 
     if rules is None:
@@ -184,6 +200,19 @@ def detect_smells(
             )
             all_findings.extend(linter_findings)
 
+    ast_rules = rules.get("ast", {})
+    if ast_rules.get("enabled", True) and (
+        mode == "ast"
+        or (
+            mode in ("linter", "hybrid")
+            and (
+                ast_rules.get("with_linter", False)
+                or not probe_linter("ruff").get("available")
+            )
+        )
+    ):
+        all_findings.extend(detect_ast_smells(files=files, rules=rules))
+
     if mode in ("llm", "hybrid"):
         llm_enabled = rules.get("llm", {}).get("enabled", True)
         if llm_enabled and llm_client is not None:
@@ -340,6 +369,29 @@ def detect_linter_smells(
     return _deduplicate_findings(findings)
 
 
+def detect_ast_smells(
+    files: list[str],
+    rules: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    """Detect code smells in Python files by walking their AST in-process.
+
+    Thresholds come from ``rules["ast"]`` (see
+    :data:`skill.refactor.ast_smells.DEFAULT_AST_RULES`).  Large file sets
+    are analyzed on a process pool.
+
+    Args:
+        files: List of file paths to analyze (non-Python files are ignored).
+        rules: Optional rules configuration.
+
+    Returns:
+        A list of finding dicts with ``source`` set to ``"ast"``.
+    """
+    if not files:
+        return []
+    ast_rules = (rules or {}).get("ast", {})
+    return _deduplicate_findings(analyze_files(files, rules=ast_rules))
+
+
 def detect_llm_smells(
     files: list[str],
     llm_client: Any,
@@ -534,7 +586,7 @@ def _linter_code_to_smell_type(linter: str, code: str) -> str:
     """Map a linter rule code to a generalised smell type.
 
     Args:
-        linter: The linter name (``"ruff"``, ``"eslint"``).
+        linter: The linter name (``"ruff"``, ``"eslint"``, ``"ast"``).
         code: The linter rule code (e.g. ``"F401"``, ``"E302"``).
 
     Returns:
@@ -573,4 +625,6 @@ def _linter_code_to_smell_type(linter: str, code: str) -> str:
 
     if linter == "eslint":
         return "lint"
+    if linter == "ast":
+        return AST_CODE_SMELL_TYPES.get(code, "unknown")
     return "unknown"
@@ -10,6 +10,8 @@ Provides:
   - build_smell_title(): Generate a work item title from a smell.
   - build_smell_description(): Generate a work item description from a smell.
   - has_existing_smell_comment(): Check for existing REFACTOR comments.
+  - existing_smell_comments(): Smell types of all REFACTOR comments in a file.
+  - fetch_worklog_smell_index(): Existing Refactor items keyed by smell.
 
 Usage:
 
@@ -34,6 +36,7 @@ import os
 import re
 import shutil
 import subprocess
+from collections.abc import Callable
 from typing import Any
 
 LOG = logging.getLogger("refactor.workitem_creation")
@@ -144,6 +147,34 @@ def build_smell_description(smell: dict[str, Any]) -> str:
     return "\n".join(p for p in parts if p)
 
 
+def existing_smell_comments(file_path: str) -> set[str]:
+    """Return the smell types of all REFACTOR comments in a source file.
+
+    Args:
+        file_path: Path to the source file to scan.
+
+    Returns:
+        Lowercased smell types (empty when the file is missing, unreadable
+        or has no REFACTOR comments).
+    """
+    if not os.path.isfile(file_path):
+        return set()
+
+    try:
+        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            content = f.read()
+    except (OSError, UnicodeDecodeError):
+        return set()
+
+    if not content.strip():
+        return set()
+
+    return {
+        match.group(2).strip().lower()
+        for match in REFACTOR_COMMENT_PATTERN.finditer(content)
+    }
+
+
 def has_existing_smell_comment(file_path: str, smell_type: str) -> bool:
     """Check if a source file already has a REFACTOR comment for a smell type.
 
@@ -157,43 +188,77 @@ def has_existing_smell_comment(file_path: str, smell_type: str) -> bool:
         ``True`` if a REFACTOR comment with the given smell type exists,
         ``False`` otherwise.
     """
-    if not os.path.isfile(file_path):
-        return False
+    return smell_type.lower() in existing_smell_comments(file_path)
 
-    try:
-        with open(file_path, "r", encoding="utf-8", errors="replace") as f:
-            content = f.read()
-    except (OSError, UnicodeDecodeError):
-        return False
 
-    if not content.strip():
-        return False
+def smell_key(file_path: Any, line: Any, code: Any) -> tuple[str, str, str]:
+    """Canonical ``(file, line, code)`` key identifying one smell occurrence.
 
-    # Check for REFACTOR comments matching the smell type
-    for match in REFACTOR_COMMENT_PATTERN.finditer(content):
-        matched_smell_type = match.group(2).strip().lower()
-        if matched_smell_type == smell_type.lower():
-            return True
+    Paths are normalized (``./`` and duplicate separators removed) and the
+    key is case-insensitive, like the substring match it replaces.
+    """
+    path = os.path.normpath(str(file_path or "")) if file_path else ""
+    return (path.lower(), str(line if line is not None else 0), str(code or "").lower())
 
-    return False
 
+# Structured fields written by build_smell_description().
+_DESCRIPTION_FIELD_PATTERN = re.compile(
+    r"^- \*\*(File|Line|Code):\*\* `?(.*?)`?$", re.MULTILINE
+)
 
-def _has_existing_worklog_item(smell: dict[str, Any]) -> bool:
-    """Check if a work item already exists in the worklog for this smell.
 
-    Queries the worklog database for Refactor-tagged items and checks if any
-    existing item matches the same (file, line, code) combination.  This is a
-    secondary safety net when the REFACTOR comment check is insufficient
-    (e.g. the source file was deleted after the work item was created).
+class WorklogSmellIndex:
+    """Existing Refactor work items keyed by canonical smell key.
 
-    Args:
-        smell: A smell finding dict with ``file``, ``line``, and ``code`` keys.
+    Items whose description carries the structured ``File``/``Line`` fields
+    of :func:`build_smell_description` are indexed by :func:`smell_key`;
+    other (hand-written or legacy) items keep the substring match on title
+    and description.
+    """
+
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self.keys: set[tuple[str, str, str]] = set()
+        self._unstructured: list[str] = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            title = item.get("title", "") or ""
+            description = item.get("description", "") or ""
+            fields = dict(_DESCRIPTION_FIELD_PATTERN.findall(description))
+            if "File" in fields and "Line" in fields:
+                self.keys.add(smell_key(fields["File"], fields["Line"], fields.get("Code", "")))
+            else:
+                self._unstructured.append((title + " " + description).lower())
+
+    def add(self, smell: dict[str, Any]) -> None:
+        """Record *smell* as tracked (e.g. after creating its work item)."""
+        self.keys.add(smell_key(smell.get("file"), smell.get("line", 0), smell.get("code")))
+
+    def contains(self, smell: dict[str, Any]) -> bool:
+        """True if a work item already tracks the smell's (file, line, code)."""
+        target_file = smell.get("file", "")
+        target_line = smell.get("line", 0)
+        target_code = smell.get("code", "")
+        if smell_key(target_file, target_line, target_code) in self.keys:
+            return True
+        for combined in self._unstructured:
+            # Check if the description or title references the same file, line, and code
+            if target_file.lower() in combined and target_code.lower() in combined:  # noqa: SIM102
+                # Also check line number if it appears
+                if str(target_line) in combined:
+                    return True
+        return False
+
+
+def fetch_worklog_smell_index() -> WorklogSmellIndex | None:
+    """Load every Refactor-tagged work item once (``wl list``) into an index.
 
     Returns:
-        ``True`` if a matching work item already exists, ``False`` otherwise.
+        The index, or ``None`` when ``wl`` is unavailable or its output
+        cannot be parsed (duplicate checks then pass).
     """
     if not shutil.which("wl"):
-        return False
+        return None
 
     try:
         result = subprocess.run(  # noqa: PLW1510
@@ -203,39 +268,43 @@ def _has_existing_worklog_item(smell: dict[str, Any]) -> bool:
             timeout=15,
         )
     except (FileNotFoundError, subprocess.TimeoutExpired, OSError):
-        return False
+        return None
 
     if result.returncode != 0:
-        return False
+        return None
 
     try:
         data = json.loads(result.stdout)
     except (json.JSONDecodeError, ValueError):
-        return False
+        return None
 
     # Extract existing work items
     work_items = data.get("workItems", data.get("data", []))
     if not isinstance(work_items, list):
-        return False
+        return None
+    return WorklogSmellIndex(work_items)
 
-    target_file = smell.get("file", "")
-    target_line = smell.get("line", 0)
-    target_code = smell.get("code", "")
 
-    for item in work_items:
-        if not isinstance(item, dict):
-            continue
-        title = item.get("title", "") or ""
-        description = item.get("description", "") or ""
-        combined = (title + " " + description).lower()
+def _has_existing_worklog_item(
+    smell: dict[str, Any], index: WorklogSmellIndex | None = None
+) -> bool:
+    """Check if a work item already exists in the worklog for this smell.
+
+    Queries the worklog database for Refactor-tagged items and checks if any
+    existing item matches the same (file, line, code) combination.  This is a
+    secondary safety net when the REFACTOR comment check is insufficient
+    (e.g. the source file was deleted after the work item was created).
 
-        # Check if the description or title references the same file, line, and code
-        if target_file.lower() in combined and target_code.lower() in combined:  # noqa: SIM102
-            # Also check line number if it appears
-            if str(target_line) in combined:
-                return True
+    Args:
+        smell: A smell finding dict with ``file``, ``line``, and ``code`` keys.
+        index: A pre-fetched :class:`WorklogSmellIndex`; fetched when omitted.
 
-    return False
+    Returns:
+        ``True`` if a matching work item already exists, ``False`` otherwise.
+    """
+    if index is None:
+        index = fetch_worklog_smell_index()
+    return index is not None and index.contains(smell)
 
 
 def create_smell_work_item(smell: dict[str, Any]) -> str | None:
@@ -259,6 +328,23 @@ def create_smell_work_item(smell: dict[str, Any]) -> str | None:
         The work item ID if creation succeeded, or ``None`` if it was
         skipped (duplicate) or failed.
     """
+    if _skip_smell(smell, existing_smell_comments, fetch_worklog_smell_index):
+        return None
+    return _wl_create_smell(smell)
+
+
+def _skip_smell(
+    smell: dict[str, Any],
+    comments_for: Callable[[str], set[str]],
+    worklog_index: Callable[[], WorklogSmellIndex | None],
+) -> bool:
+    """Apply the creation guards; True when the smell must be skipped.
+
+    Args:
+        smell: A smell finding dict.
+        comments_for: Returns the REFACTOR comment smell types of a file.
+        worklog_index: Returns the index of existing Refactor items.
+    """
     file_path = smell.get("file", "")
     smell_type = smell.get("smell_type", "unknown")
 
@@ -270,26 +356,33 @@ def create_smell_work_item(smell: dict[str, Any]) -> str | None:
             smell_type,
             file_path,
         )
-        return None
+        return True
 
     # Guard 2: Check for duplicate REFACTOR comment in source file
-    if file_path and has_existing_smell_comment(file_path, smell_type):
+    if file_path and smell_type.lower() in comments_for(file_path):
         LOG.info(
             "Skipping creation for %s in %s: duplicate REFACTOR comment exists",
             smell_type,
             file_path,
         )
-        return None
+        return True
 
     # Guard 3: Check worklog database for existing items (AC3)
-    if _has_existing_worklog_item(smell):
+    index = worklog_index()
+    if index is not None and index.contains(smell):
         LOG.info(
             "Skipping creation for %s in %s: existing worklog item found",
             smell_type,
             file_path,
         )
-        return None
+        return True
+
+    return False
+
 
+def _wl_create_smell(smell: dict[str, Any]) -> str | None:
+    """Run ``wl create`` for *smell*; return the new work item id or None."""
+    smell_type = smell.get("smell_type", "unknown")
     title = build_smell_title(smell)
     description = build_smell_description(smell)
     priority = severity_to_priority(smell.get("severity", "medium"))
@@ -353,8 +446,12 @@ def create_smell_work_items(
 ) -> list[str]:
     """Batch-create Worklog work items for a list of code smells.
 
-    Each smell is checked for duplicate REFACTOR comments before creation.
-    Duplicates are skipped silently.
+    Applies the same guards as :func:`create_smell_work_item`, in bulk:
+    Refactor-tagged work items are fetched once (on the first smell that
+    reaches the worklog check) and indexed by canonical (file, line, code)
+    key, and each source file is read once for its REFACTOR comments.
+    Smells repeated within the batch create a single item. Duplicates are
+    skipped silently.
 
     Args:
         smells: A list of smell finding dicts.
@@ -363,9 +460,25 @@ def create_smell_work_items(
         A list of work item IDs that were successfully created (duplicates
         and failures are excluded).
     """
+    comments: dict[str, set[str]] = {}
+    loaded: list[WorklogSmellIndex | None] = []
+
+    def comments_for(file_path: str) -> set[str]:
+        if file_path not in comments:
+            comments[file_path] = existing_smell_comments(file_path)
+        return comments[file_path]
+
+    def worklog_index() -> WorklogSmellIndex | None:
+        if not loaded:
+            loaded.append(fetch_worklog_smell_index() or WorklogSmellIndex([]))
+        return loaded[0]
+
     results: list[str] = []
     for smell in smells:
-        work_item_id = create_smell_work_item(smell)
+        if _skip_smell(smell, comments_for, worklog_index):
+            continue
+        work_item_id = _wl_create_smell(smell)
         if work_item_id is not None:
             results.append(work_item_id)
+            worklog_index().add(smell)
     return results
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Compiled CODEOWNERS matcher.
+
+Owner inference matched each path with ``fnmatch`` against every rule (and
+``"**/" + pattern``), re-reading the file per lookup. That got directory
+patterns, anchoring and ``**`` segments wrong and scanned every rule for
+every path. This module compiles the rules once into a single regular
+expression with last-match-wins semantics.
+
+Usage::
+
+    from skill.shared.codeowners import load_codeowners
+
+    codeowners = load_codeowners(repo_root)
+    if codeowners is not None:
+        owners = codeowners.owners_for(["src/app.py", "docs/index.md"])
+
+Pattern semantics (gitignore-style, as GitHub applies them)
+----------------------------------------------------------
+
+- A pattern matches a path, or any directory containing it (``docs``
+  owns everything under ``docs/``).
+- A leading or inner ``/`` anchors the pattern at the repository root;
+  otherwise it matches at any depth (``*.py``, ``build/``).
+- A trailing ``/`` matches directories only, i.e. paths below them.
+- ``*`` and ``?`` never match ``/``. A leading ``**/`` matches in every
+  directory, an inner ``/**/`` matches zero or more directories and a
+  trailing ``/**`` matches everything inside. Other ``**`` act like ``*``.
+- ``[``, ``]``, ``!`` and ``\\`` are literal (GitHub does not support
+  character ranges, negation or escapes).
+- The last matching rule wins. A rule without owners un-owns its paths.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+# Searched in this order; the first existing file is used.
+CODEOWNERS_LOCATIONS = ("CODEOWNERS", ".github/CODEOWNERS", "docs/CODEOWNERS")
+
+# CODEOWNERS path -> (mtime_ns, compiled matcher).
+_CACHE: dict[str, tuple[int, CodeOwners]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One CODEOWNERS line."""
+
+    pattern: str
+    owners: tuple[str, ...]
+    line: int
+
+
+def pattern_regex(pattern: str) -> str:
+    """Translate one CODEOWNERS *pattern* into a full-path regex (no anchors)."""
+    dir_only = pattern.endswith("/")
+    body = pattern.strip("/")
+    anchored = pattern.startswith("/") or "/" in body
+
+    out: list[str] = []
+    i = 0
+    n = len(body)
+    while i < n:
+        if body.startswith("**", i):
+            at_start = i == 0
+            at_end = i + 2 == n
+            before_slash = at_start or body[i - 1] == "/"
+            after_slash = at_end or body[i + 2] == "/"
+            if before_slash and after_slash:
+                if at_end:
+                    out.append(".*")          # trailing /** : everything inside
+                    i += 2
+                else:
+                    out.append("(?:.*/)?")    # leading **/ or inner /**/
+                    i += 3
+                continue
+            out.append("[^/]*")
+            i += 2
+            continue
+        ch = body[i]
+        if ch == "*":
+            out.append("[^/]*")
+        elif ch == "?":
+            out.append("[^/]")
+        else:
+            out.append(re.escape(ch))
+        i += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    suffix = "/.*" if dir_only else "(?:/.*)?"
+    return prefix + "".join(out) + suffix
+
+
+class CodeOwners:
+    """CODEOWNERS rules compiled into one last-match-wins regex."""
+
+    def __init__(self, rules: Iterable[Rule]) -> None:
+        self.rules: list[Rule] = list(rules)
+        # Alternatives in reverse file order: the first alternative that
+        # matches is the last matching rule.
+        alternatives = [
+            f"(?P<r{idx}>{pattern_regex(rule.pattern)})"
+            for idx, rule in reversed(list(enumerate(self.rules)))
+        ]
+        self._regex = re.compile("|".join(alternatives)) if alternatives else None
+        self._memo: dict[str, Rule | None] = {}
+
+    @classmethod
+    def from_text(cls, text: str) -> CodeOwners:
+        """Parse CODEOWNERS *text* (comments, blank lines and inline ``#`` ignored)."""
+        rules = []
+        for lineno, raw in enumerate(text.splitlines(), start=1):
+            line = raw.split(" #", 1)[0].strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split()
+            owners = tuple(p.lstrip("@") for p in parts[1:])
+            rules.append(Rule(pattern=parts[0], owners=owners, line=lineno))
+        return cls(rules)
+
+    def rule_for(self, path: str) -> Rule | None:
+        """The last rule matching repo-relative *path* (None when unmatched)."""
+        path = path.replace(os.sep, "/").lstrip("/")
+        if path in self._memo:
+            return self._memo[path]
+        rule = None
+        if self._regex is not None:
+            match = self._regex.fullmatch(path)
+            if match is not None:
+                rule = self.rules[int(match.lastgroup[1:])]
+        self._memo[path] = rule
+        return rule
+
+    def owners(self, path: str) -> tuple[str, ...]:
+        """Owners of *path* (empty when unmatched or un-owned)."""
+        rule = self.rule_for(path)
+        return rule.owners if rule is not None else ()
+
+    def owners_for(self, paths: Iterable[str]) -> dict[str, Rule | None]:
+        """Matching rule for each of *paths*, in one pass."""
+        return {path: self.rule_for(path) for path in paths}
+
+
+def find_codeowners(repo_path: str | Path) -> Path | None:
+    """Return the CODEOWNERS file of *repo_path* (see ``CODEOWNERS_LOCATIONS``)."""
+    for location in CODEOWNERS_LOCATIONS:
+        candidate = Path(repo_path) / location
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def load_codeowners(repo_path: str | Path) -> CodeOwners | None:
+    """Return the compiled CODEOWNERS of *repo_path*, or None when there is none.
+
+    The matcher is cached per file and recompiled only when its mtime changes.
+    """
+    path = find_codeowners(repo_path)
+    if path is None:
+        return None
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = str(path.resolve())
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+        codeowners = CodeOwners.from_text(text)
+        _CACHE[key] = (mtime_ns, codeowners)
+        return codeowners
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""Persistent per-repo ownership index (path -> author weights).
+
+Owner inference ran ``git blame --porcelain`` and a ``git log`` per queried
+file, which is slow on large files with long history and repeated for every
+failure triaged. This module derives author weights for every path (and,
+aggregated, every directory) from one ``git log --numstat`` pass over the
+last ``DEFAULT_WINDOW`` commits, so owner lookups are dictionary reads.
+
+Usage::
+
+    from skill.shared.ownership_index import load_ownership_index
+
+    index = load_ownership_index(repo_root)
+    if index is not None:
+        owner = index.top_owner("tests/test_foo.py")
+
+Storage and freshness
+---------------------
+
+The index is stored next to the repo term index, in the worktree-aware git
+dir (``<git-dir>/ownership-index.json``; writes are atomic), so it is never
+part of the work tree. It records the last indexed commit: when ``HEAD``
+descends from it only ``git log <indexed>..HEAD`` is read and added;
+otherwise (rewritten history) or once the indexed range grows past twice
+the window, it is rebuilt. Within one process the loaded index is reused
+per repository until ``HEAD`` moves.
+
+Weights
+-------
+
+Each author's weight for a path is ``[commits, changed_lines]`` (added plus
+deleted lines from ``--numstat``; binary changes count one line). Merge
+commits are skipped and renames are not followed (``--no-renames``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+from skill.shared.repo_index import index_path, repo_toplevel
+
+INDEX_FILENAME = "ownership-index.json"
+_INDEX_VERSION = 1
+
+# Commits read on a full build.
+DEFAULT_WINDOW = 2000
+
+# Record / field separators in the ``git log`` format.
+_RS = "\x1e"
+_FS = "\x1f"
+
+# repo path -> (HEAD when loaded, index)
+_LOADED: dict[str, tuple[str | None, OwnershipIndex | None]] = {}
+_LOADED_LOCK = threading.Lock()
+
+
+def _git_text(root: str | Path, *args: str) -> str | None:
+    """Run a git command against *root*, returning stdout text or None on failure."""
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(root), "-c", "core.quotePath=false", *args],
+            capture_output=True,
+            encoding="utf-8",
+            errors="surrogateescape",
+            timeout=300,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def _top(weights: dict[str, list[int]]) -> tuple[str, int, int] | None:
+    """Return ``(author, author_lines, total_lines)`` for the heaviest author.
+
+    Ties on changed lines go to the author with more commits, then by name.
+    """
+    if not weights:
+        return None
+    author = min(weights, key=lambda a: (-weights[a][1], -weights[a][0], a))
+    total = sum(w[1] for w in weights.values())
+    return author, weights[author][1], total
+
+
+class OwnershipIndex:
+    """Author weights per path, built from ``git log --numstat``."""
+
+    def __init__(self) -> None:
+        # Work-tree root the paths are relative to (set by load_ownership_index).
+        self.root: Path | None = None
+        self.head: str | None = None
+        self.window: int = DEFAULT_WINDOW
+        self.commits: int = 0
+        # path -> author -> [commits, changed_lines]
+        self.files: dict[str, dict[str, list[int]]] = {}
+        self._dirs: dict[str, dict[str, list[int]]] | None = None
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    # -- updates -------------------------------------------------------------
+
+    def add_log(self, log: str) -> int:
+        """Add the commits of one ``git log`` output (see :func:`_log_args`).
+
+        Returns:
+            Number of commits added.
+        """
+        added = 0
+        for record in log.split(_RS):
+            lines = record.split("\n")
+            header = lines[0]
+            if _FS not in header:
+                continue
+            _sha, author = header.split(_FS, 1)
+            added += 1
+            for line in lines[1:]:
+                parts = line.split("\t", 2)
+                if len(parts) != 3 or not parts[2]:
+                    continue
+                ins, dels, path = parts
+                churn = (int(ins) + int(dels)) if ins.isdigit() and dels.isdigit() else 1
+                weight = self.files.setdefault(path, {}).setdefault(author, [0, 0])
+                weight[0] += 1
+                weight[1] += churn
+        self.commits += added
+        if added:
+            self._dirs = None
+        return added
+
+    def refresh(self, repo_root: str | Path) -> dict[str, Any]:
+        """Bring the index up to date with ``HEAD`` of *repo_root*.
+
+        Returns:
+            ``head``, ``full`` (rebuilt from the last ``window`` commits) and
+            ``commits_added``.
+        """
+        stats: dict[str, Any] = {"head": None, "full": False, "commits_added": 0}
+        out = _git_text(repo_root, "rev-parse", "--verify", "-q", "HEAD")
+        head = out.strip() if out else None
+        stats["head"] = head
+        if head is None or head == self.head:
+            return stats
+
+        log = None
+        if self.head and self.commits < 2 * self.window:
+            ancestor = subprocess.run(
+                ["git", "-C", str(repo_root), "merge-base", "--is-ancestor", self.head, head],
+                capture_output=True,
+                check=False,
+            ).returncode == 0
+            if ancestor:
+                log = _git_text(repo_root, *_log_args(), f"{self.head}..{head}")
+        if log is None:
+            stats["full"] = True
+            self.files = {}
+            self.commits = 0
+            self._dirs = None
+            log = _git_text(repo_root, *_log_args(), f"-n{self.window}", head)
+            if log is None:
+                return stats
+        stats["commits_added"] = self.add_log(log)
+        self.head = head
+        return stats
+
+    # -- queries -------------------------------------------------------------
+
+    def _build_dirs(self) -> dict[str, dict[str, list[int]]]:
+        if self._dirs is None:
+            dirs: dict[str, dict[str, list[int]]] = {}
+            for path, authors in self.files.items():
+                parent = os.path.dirname(path)
+                while parent:
+                    bucket = dirs.setdefault(parent, {})
+                    for author, (commits, churn) in authors.items():
+                        weight = bucket.setdefault(author, [0, 0])
+                        weight[0] += commits
+                        weight[1] += churn
+                    parent = os.path.dirname(parent)
+            self._dirs = dirs
+        return self._dirs
+
+    def file_weights(self, path: str) -> dict[str, list[int]]:
+        """Author weights for *path* (empty when untouched in the window)."""
+        return self.files.get(path, {})
+
+    def dir_weights(self, directory: str) -> dict[str, list[int]]:
+        """Author weights summed over every path under *directory*."""
+        return self._build_dirs().get(directory.strip("/"), {})
+
+    def top_owner(self, path: str) -> dict[str, Any] | None:
+        """Heaviest author of *path*, falling back to its nearest directory.
+
+        Returns:
+            ``author``, ``lines``, ``total``, ``scope`` (``"file"`` or
+            ``"dir"``) and ``path`` (the file or directory weighed), or None
+            when neither the file nor any parent directory has history.
+        """
+        top = _top(self.file_weights(path))
+        if top is not None:
+            return {"author": top[0], "lines": top[1], "total": top[2],
+                    "scope": "file", "path": path}
+        parent = os.path.dirname(path)
+        while parent:
+            top = _top(self.dir_weights(parent))
+            if top is not None:
+                return {"author": top[0], "lines": top[1], "total": top[2],
+                        "scope": "dir", "path": parent}
+            parent = os.path.dirname(parent)
+        return None
+
+    # -- persistence ---------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: str | Path) -> OwnershipIndex:
+        """Load an index from *path*; a missing or corrupt file yields an empty index."""
+        index = cls()
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return index
+        files = data.get("files")
+        if isinstance(files, dict):
+            index.files = files
+            index.head = data.get("head")
+            index.window = int(data.get("window") or DEFAULT_WINDOW)
+            index.commits = int(data.get("commits") or 0)
+        return index
+
+    def save(self, path: str | Path) -> None:
+        """Atomically write the index to *path*."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {"version": _INDEX_VERSION, "head": self.head, "window": self.window,
+             "commits": self.commits, "files": self.files},
+            separators=(",", ":"),
+        )
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".ownership-index-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def _log_args() -> tuple[str, ...]:
+    return ("log", "--no-merges", "--no-renames", "--numstat",
+            f"--format={_RS}%H{_FS}%an")
+
+
+def load_ownership_index(repo_path: str | Path) -> OwnershipIndex | None:
+    """Return an up-to-date ownership index for the repo containing *repo_path*.
+
+    The first call per repository in a process refreshes and persists the
+    index; later calls (e.g. one per failure of a triage batch, possibly from
+    several threads) return the same in-memory index while ``HEAD`` is
+    unchanged. Once ``HEAD`` moves, the next call extends the index with the
+    new commits and returns a new object; indexes handed out earlier are not
+    mutated.
+
+    Returns:
+        The index, or None outside a git work tree or when the repository
+        has no commits.
+    """
+    key = str(Path(repo_path).resolve())
+    out = _git_text(repo_path, "rev-parse", "--verify", "-q", "HEAD")
+    head = out.strip() if out else None
+    with _LOADED_LOCK:
+        cached = _LOADED.get(key)
+        if cached is not None and cached[0] == head:
+            return cached[1]
+        root = repo_toplevel(repo_path)
+        location = index_path(root, INDEX_FILENAME) if root is not None else None
+        index: OwnershipIndex | None = None
+        if location is not None:
+            index = OwnershipIndex.load(location)
+            index.root = root
+            stats = index.refresh(root)
+            if index.head is None:
+                index = None
+            elif stats["commits_added"] or stats["full"]:
+                try:
+                    index.save(location)
+                except OSError:
+                    pass  # best-effort persistence; the in-memory index is still valid
+        _LOADED[key] = (head, index)
+        return index
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""Persistent per-repo term index (file -> terms, term -> files).
+
+Several tools answer "which files in this repo mention these terms?":
+find-related's ``search_repo`` re-read the whole tree on every run, the
+audit ``scan.py`` helper shelled out to rg/grep per query, and the audit
+file-scope manifest re-ran ``git ls-files`` for every manifest. This module
+keeps one inverted index per repository that all of them share.
+
+Usage::
+
+    from skill.shared.repo_index import open_repo_index
+
+    index = open_repo_index(repo_root)
+    if index is not None:
+        with index:
+            index.refresh()
+            hits = index.search(["semaphore", "fanout"], prefix=True)
+
+Storage and freshness
+---------------------
+
+The index is a SQLite file at ``<git-dir>/repo-index.sqlite3``
+(worktree-aware). Anything under the git dir is untracked by definition, so
+the index can never be staged by a ``git add -A`` in the work tree it
+describes. Only git work trees are indexed; :func:`open_repo_index` returns
+None elsewhere so callers fall back to scanning.
+
+Terms are stored per **blob hash** (git's object id), so identical content
+at several paths or across commits is tokenized once. The committed layer
+mirrors the ``HEAD`` tree: a full ``git ls-tree`` on first build, then
+``git diff --name-only <indexed-commit> HEAD`` to find the paths whose blob
+may have moved. New blobs are read in one ``git cat-file --batch`` stream.
+The working-tree layer (``refresh(worktree=True)``) overlays modified,
+deleted and untracked-but-not-ignored files from ``git status``; their
+blob hashes are computed in-process and cached by size/mtime.
+
+Binary blobs (NUL in the first ``BINARY_SNIFF_BYTES``) and blobs larger
+than ``MAX_FILE_BYTES`` are listed as files but carry no terms.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import subprocess
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+INDEX_FILENAME = "repo-index.sqlite3"
+
+# Bump when tokenization changes; a stale index is rebuilt.
+_INDEX_VERSION = 1
+
+MAX_FILE_BYTES = 2 * 1024 * 1024
+BINARY_SNIFF_BYTES = 8192
+
+# Terms outside this length range are not indexed (short noise, base64 runs).
+MIN_TERM_LENGTH = 3
+MAX_TERM_LENGTH = 64
+
+_TERM_RE = re.compile(rb"[a-z0-9]+")
+
+# Upper bound for prefix queries: sorts after every term character.
+_PREFIX_END = "~"
+
+# Paths per ``git ls-tree`` invocation / SQLite ``IN (...)`` list.
+_BATCH = 500
+
+
+def tokenize(data: bytes) -> set[str]:
+    """Return the distinct lowercased alphanumeric terms of *data*."""
+    return {
+        t.decode("ascii")
+        for t in _TERM_RE.findall(data.lower())
+        if MIN_TERM_LENGTH <= len(t) <= MAX_TERM_LENGTH
+    }
+
+
+def blob_hash(data: bytes) -> str:
+    """Return the git blob object id of *data* (``git hash-object``)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data, usedforsecurity=False).hexdigest()
+
+
+def _is_text(data: bytes) -> bool:
+    return len(data) <= MAX_FILE_BYTES and b"\0" not in data[:BINARY_SNIFF_BYTES]
+
+
+def _run_git(root: str | Path, *args: str) -> bytes | None:
+    """Run a git command against *root*, returning raw stdout or None on failure."""
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(root), "--literal-pathspecs", *args],
+            capture_output=True,
+            timeout=120,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout
+
+
+def _decode(raw: bytes) -> str:
+    return raw.decode("utf-8", "surrogateescape")
+
+
+def repo_toplevel(path: str | Path) -> Path | None:
+    """Return the work-tree root containing *path*, or None outside git."""
+    out = _run_git(path, "rev-parse", "--show-toplevel")
+    if not out or not out.strip():
+        return None
+    return Path(_decode(out.strip()))
+
+
+def index_path(repo_root: str | Path, filename: str = INDEX_FILENAME) -> Path | None:
+    """Resolve where the term index for *repo_root* is stored (None outside git).
+
+    The index lives in the worktree-aware git dir, never in the work tree.
+    Other per-repo indexes pass their own *filename* to share the location.
+    """
+    repo_root = Path(repo_root).resolve()
+    out = _run_git(repo_root, "rev-parse", "--git-dir")
+    if not out or not out.strip():
+        return None
+    git_dir = Path(_decode(out.strip()))
+    if not git_dir.is_absolute():
+        git_dir = repo_root / git_dir
+    return git_dir / filename
+
+
+def _cat_blobs(root: Path, hashes: Iterable[str]) -> Iterator[tuple[str, bytes]]:
+    """Stream ``(hash, content)`` for *hashes* from one ``git cat-file --batch``.
+
+    Requests are written on a helper thread so a large request list cannot
+    deadlock against a full stdout pipe. Missing objects are skipped.
+    """
+    request = "".join(f"{h}\n" for h in hashes).encode("ascii")
+    if not request:
+        return
+    proc = subprocess.Popen(
+        ["git", "-C", str(root), "cat-file", "--batch"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+
+    def feed() -> None:
+        try:
+            proc.stdin.write(request)
+        except OSError:
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    writer = threading.Thread(target=feed, daemon=True)
+    writer.start()
+    try:
+        while True:
+            header = proc.stdout.readline()
+            if not header:
+                break
+            parts = header.split()
+            if len(parts) != 3:
+                continue  # "<hash> missing"
+            size = int(parts[2])
+            content = proc.stdout.read(size)
+            proc.stdout.read(1)  # trailing newline
+            yield parts[0].decode("ascii"), content
+    finally:
+        writer.join()
+        proc.stdout.close()
+        proc.wait()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS blobs (
+    id INTEGER PRIMARY KEY,
+    hash TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS terms (
+    id INTEGER PRIMARY KEY,
+    term TEXT UNIQUE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term_id INTEGER NOT NULL,
+    blob_id INTEGER NOT NULL,
+    PRIMARY KEY (term_id, blob_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_blob ON postings (blob_id);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    blob_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_blob ON files (blob_id);
+CREATE TABLE IF NOT EXISTS overlay (
+    path TEXT PRIMARY KEY,
+    blob_id INTEGER,
+    size INTEGER,
+    mtime_ns INTEGER
+);
+"""
+
+
+class RepoIndex:
+    """SQLite-backed inverted index over one git work tree.
+
+    Paths are repo-relative (to the work-tree root). Use as a context
+    manager or call :meth:`close` when done.
+    """
+
+    def __init__(self, repo_root: str | Path, path: str | Path | None = None) -> None:
+        self.repo_root = Path(repo_root).resolve()
+        resolved = Path(path) if path is not None else index_path(self.repo_root)
+        if resolved is None:
+            raise ValueError(f"not a git work tree: {self.repo_root}")
+        self.path = resolved
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    def __enter__(self) -> RepoIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def _init_schema(self) -> None:
+        self._db.executescript(_SCHEMA)
+        if self._meta("version") != str(_INDEX_VERSION):
+            with self._db:
+                for table in ("postings", "terms", "blobs", "files", "overlay", "meta"):
+                    self._db.execute(f"DELETE FROM {table}")  # noqa: S608 -- fixed names
+                self._set_meta("version", str(_INDEX_VERSION))
+
+    def _meta(self, key: str) -> str | None:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str | None) -> None:
+        if value is None:
+            self._db.execute("DELETE FROM meta WHERE key = ?", (key,))
+        else:
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value),
+            )
+
+    @property
+    def head(self) -> str | None:
+        """The commit the committed layer was last synced to."""
+        return self._meta("head")
+
+    # -- updates -------------------------------------------------------------
+
+    def refresh(self, worktree: bool = True) -> dict[str, Any]:
+        """Bring the index up to date with ``HEAD`` (and the working tree).
+
+        Args:
+            worktree: Also sync the working-tree overlay from ``git status``.
+
+        Returns:
+            ``head``, ``full`` (committed layer rebuilt from ``ls-tree``),
+            ``paths_changed`` (committed paths re-synced), ``blobs_indexed``
+            (new blobs tokenized) and ``overlay`` (working-tree entries).
+        """
+        stats: dict[str, Any] = {"head": None, "full": False, "paths_changed": 0,
+                                 "blobs_indexed": 0, "overlay": 0}
+        out = _run_git(self.repo_root, "rev-parse", "--verify", "-q", "HEAD")
+        head = _decode(out).strip() if out else None
+        stats["head"] = head
+        with self._db:
+            if head != self.head:
+                self._sync_committed(head, stats)
+            if worktree:
+                stats["overlay"] = self._sync_worktree(stats)
+        return stats
+
+    def _sync_committed(self, head: str | None, stats: dict[str, Any]) -> None:
+        previous = self.head
+        changed: list[str] | None = None
+        if previous and head:
+            out = _run_git(self.repo_root, "diff", "--name-only", "-z", "--no-renames",
+                           previous, head)
+            if out is not None:
+                changed = [_decode(p) for p in out.split(b"\0") if p]
+
+        if changed is None:
+            stats["full"] = True
+            entries = self._ls_tree(head, None) if head else {}
+            self._db.execute("DELETE FROM files")
+            paths: Iterable[str] = entries
+        else:
+            entries = {}
+            for i in range(0, len(changed), _BATCH):
+                entries.update(self._ls_tree(head, changed[i:i + _BATCH]))
+            self._db.executemany(
+                "DELETE FROM files WHERE path = ?",
+                [(p,) for p in changed if p not in entries],
+            )
+            paths = changed
+        stats["paths_changed"] = len(list(paths))
+
+        blob_ids = self._ensure_blobs({h: size for h, size in entries.values()}, stats)
+        self._db.executemany(
+            "INSERT OR REPLACE INTO files (path, blob_id) VALUES (?, ?)",
+            [(p, blob_ids[h]) for p, (h, _size) in entries.items()],
+        )
+        self._set_meta("head", head)
+
+    def _ls_tree(self, head: str | None, paths: list[str] | None) -> dict[str, tuple[str, int]]:
+        """Return ``{path: (blob, size)}`` for regular-file blobs at *head*."""
+        if head is None:
+            return {}
+        args = ["ls-tree", "-r", "-l", "-z", head]
+        if paths is not None:
+            args += ["--", *paths]
+        out = _run_git(self.repo_root, *args)
+        entries: dict[str, tuple[str, int]] = {}
+        for record in (out or b"").split(b"\0"):
+            meta, _, path = record.partition(b"\t")
+            fields = meta.split()
+            # <mode> <type> <object> <size>; skip symlinks and submodules.
+            if len(fields) != 4 or fields[1] != b"blob" or fields[0] == b"120000":
+                continue
+            entries[_decode(path)] = (fields[2].decode("ascii"), int(fields[3]))
+        return entries
+
+    def _ensure_blobs(self, sizes: dict[str, int], stats: dict[str, Any]) -> dict[str, int]:
+        """Return blob ids for *sizes* (hash -> size), tokenizing unseen blobs."""
+        ids = self._blob_ids(sizes)
+        missing = [h for h in sizes if h not in ids]
+        fetch = [h for h in missing if sizes[h] <= MAX_FILE_BYTES]
+        for h in missing:
+            if sizes[h] > MAX_FILE_BYTES:
+                ids[h] = self._insert_blob(h, None)
+        for h, content in _cat_blobs(self.repo_root, fetch):
+            ids[h] = self._insert_blob(h, content)
+            stats["blobs_indexed"] += 1
+        for h in fetch:
+            if h not in ids:  # object missing from the repo
+                ids[h] = self._insert_blob(h, None)
+        return ids
+
+    def _blob_ids(self, hashes: Iterable[str]) -> dict[str, int]:
+        hashes = list(hashes)
+        ids: dict[str, int] = {}
+        for i in range(0, len(hashes), _BATCH):
+            chunk = hashes[i:i + _BATCH]
+            marks = ",".join("?" * len(chunk))
+            ids.update(self._db.execute(
+                f"SELECT hash, id FROM blobs WHERE hash IN ({marks})", chunk,  # noqa: S608
+            ).fetchall())
+        return ids
+
+    def _insert_blob(self, h: str, content: bytes | None) -> int:
+        cur = self._db.execute("INSERT INTO blobs (hash) VALUES (?)", (h,))
+        blob_id = cur.lastrowid
+        assert blob_id is not None
+        if content is not None and _is_text(content):
+            terms = sorted(tokenize(content))
+            self._db.executemany(
+                "INSERT OR IGNORE INTO terms (term) VALUES (?)", [(t,) for t in terms],
+            )
+            term_ids = self._term_ids(terms, prefix=False)
+            self._db.executemany(
+                "INSERT OR IGNORE INTO postings (term_id, blob_id) VALUES (?, ?)",
+                [(tid, blob_id) for tid in term_ids],
+            )
+        return blob_id
+
+    def _term_ids(self, terms: list[str], prefix: bool) -> dict[int, str]:
+        """Map term ids to the query term they satisfy (exact or prefix)."""
+        found: dict[int, str] = {}
+        if prefix:
+            for term in terms:
+                for (tid,) in self._db.execute(
+                    "SELECT id FROM terms WHERE term >= ? AND term < ?",
+                    (term, term + _PREFIX_END),
+                ):
+                    found.setdefault(tid, term)
+            return found
+        for i in range(0, len(terms), _BATCH):
+            chunk = terms[i:i + _BATCH]
+            marks = ",".join("?" * len(chunk))
+            for tid, term in self._db.execute(
+                f"SELECT id, term FROM terms WHERE term IN ({marks})", chunk,  # noqa: S608
+            ):
+                found[tid] = term
+        return found
+
+    def _sync_worktree(self, stats: dict[str, Any]) -> int:
+        """Replace the overlay with the working-tree state from ``git status``."""
+        out = _run_git(self.repo_root, "status", "--porcelain=v1", "-z",
+                       "--untracked-files=all", "--no-renames")
+        if out is None:
+            return 0
+        cached = {
+            path: (blob_id, size, mtime)
+            for path, blob_id, size, mtime in self._db.execute(
+                "SELECT path, blob_id, size, mtime_ns FROM overlay",
+            )
+        }
+        # The index itself (and its -wal/-shm files) may live in the work tree.
+        own = str(self.path.resolve())
+        rows: list[tuple[str, int | None, int | None, int | None]] = []
+        for record in out.split(b"\0"):
+            if len(record) < 4:
+                continue
+            path = _decode(record[3:])
+            full = self.repo_root / path
+            if str(full).startswith(own):
+                continue
+            try:
+                st = full.lstat()
+            except OSError:
+                rows.append((path, None, None, None))  # deleted in the work tree
+                continue
+            if not full.is_file() or full.is_symlink():
+                continue
+            hit = cached.get(path)
+            if hit and hit[0] is not None and hit[1] == st.st_size and hit[2] == st.st_mtime_ns:
+                rows.append((path, hit[0], st.st_size, st.st_mtime_ns))
+                continue
+            if st.st_size > MAX_FILE_BYTES:
+                # Listed without terms; keyed by stat so it is never read.
+                h, content = f"large:{st.st_size}:{st.st_mtime_ns}", None
+            else:
+                try:
+                    content = full.read_bytes()
+                except OSError:
+                    continue
+                h = blob_hash(content)
+            blob_id = self._blob_ids([h]).get(h)
+            if blob_id is None:
+                blob_id = self._insert_blob(h, content)
+                stats["blobs_indexed"] += 1
+            rows.append((path, blob_id, st.st_size, st.st_mtime_ns))
+        self._db.execute("DELETE FROM overlay")
+        self._db.executemany(
+            "INSERT OR REPLACE INTO overlay (path, blob_id, size, mtime_ns) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        return len(rows)
+
+    # -- queries -------------------------------------------------------------
+
+    def _overlay(self) -> dict[str, int | None]:
+        return dict(self._db.execute("SELECT path, blob_id FROM overlay"))
+
+    def files(self, worktree: bool = True) -> list[str]:
+        """Return every indexed path, sorted.
+
+        With *worktree* the overlay applies: files deleted in the work tree
+        are dropped and untracked, non-ignored files are included.
+        """
+        paths = {p for (p,) in self._db.execute("SELECT path FROM files")}
+        if worktree:
+            for path, blob_id in self._overlay().items():
+                if blob_id is None:
+                    paths.discard(path)
+                else:
+                    paths.add(path)
+        return sorted(paths)
+
+    def file_count(self, worktree: bool = True) -> int:
+        return len(self.files(worktree))
+
+    def search(
+        self,
+        terms: Iterable[str],
+        *,
+        prefix: bool = False,
+        worktree: bool = True,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return files containing any of *terms*, most distinct matches first.
+
+        Args:
+            terms: Query terms (case-insensitive).
+            prefix: Also match indexed terms that start with a query term
+                (``script`` matches ``scripts``).
+            worktree: Apply the working-tree overlay (see :meth:`files`).
+            limit: Maximum number of results (all when None).
+
+        Returns:
+            Dicts with ``file`` and ``matches`` (the query terms found,
+            sorted), ranked by descending match count, then path.
+        """
+        originals: dict[str, str] = {}
+        for term in terms:
+            if term:
+                originals.setdefault(term.lower(), term)
+        if not originals:
+            return []
+        term_ids = self._term_ids(sorted(originals), prefix=prefix)
+
+        blob_terms: dict[int, set[str]] = {}
+        ids = list(term_ids)
+        for i in range(0, len(ids), _BATCH):
+            chunk = ids[i:i + _BATCH]
+            marks = ",".join("?" * len(chunk))
+            for term_id, blob_id in self._db.execute(
+                f"SELECT term_id, blob_id FROM postings WHERE term_id IN ({marks})",  # noqa: S608
+                chunk,
+            ):
+                blob_terms.setdefault(blob_id, set()).add(term_ids[term_id])
+
+        effective: dict[str, int] = {}
+        blobs = list(blob_terms)
+        for i in range(0, len(blobs), _BATCH):
+            chunk = blobs[i:i + _BATCH]
+            marks = ",".join("?" * len(chunk))
+            effective.update(self._db.execute(
+                f"SELECT path, blob_id FROM files WHERE blob_id IN ({marks})",  # noqa: S608
+                chunk,
+            ).fetchall())
+        if worktree:
+            for path, blob_id in self._overlay().items():
+                if blob_id is not None and blob_id in blob_terms:
+                    effective[path] = blob_id
+                else:
+                    effective.pop(path, None)
+
+        results = [
+            {"file": path, "matches": sorted(originals[t] for t in blob_terms[blob_id])}
+            for path, blob_id in effective.items()
+        ]
+        results.sort(key=lambda r: (-len(r["matches"]), r["file"]))
+        return results[:limit] if limit is not None else results
+
+
+def open_repo_index(path: str | Path) -> RepoIndex | None:
+    """Open the term index of the git work tree containing *path*.
+
+    Returns None outside a git work tree or when the index file cannot be
+    opened; a corrupt index file is discarded and rebuilt.
+    """
+    root = repo_toplevel(path)
+    if root is None:
+        return None
+    location = index_path(root)
+    if location is None:
+        return None
+    for _attempt in range(2):
+        try:
+            return RepoIndex(root, path=location)
+        except sqlite3.DatabaseError:
+            try:
+                location.unlink()
+            except OSError:
+                return None
+        except (OSError, sqlite3.Error):
+            return None
+    return None
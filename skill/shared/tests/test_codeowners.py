@@ -0,0 +1,113 @@
+"""Unit tests for skill/shared/codeowners.py.
+
+Covers pattern translation (anchoring, directory-only patterns, ``*``,
+``?`` and ``**`` segments, literal brackets), last-match-wins and owner-less
+rules, parsing, bulk lookups, file discovery and the mtime cache.
+"""
+
+import os
+
+import pytest
+
+from skill.shared import codeowners as co
+from skill.shared.codeowners import CodeOwners, find_codeowners, load_codeowners
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache(monkeypatch):
+    monkeypatch.setattr(co, "_CACHE", {})
+
+
+def _matches(pattern, path):
+    return CodeOwners.from_text(f"{pattern} @o").rule_for(path) is not None
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "expected"),
+    [
+        # Unanchored names match at any depth, and everything below them.
+        ("*.js", "app.js", True),
+        ("*.js", "web/static/app.js", True),
+        ("docs", "docs/index.md", True),
+        ("docs", "src/docs/index.md", True),
+        ("docs", "docsite/index.md", False),
+        # Leading or inner slash anchors at the root.
+        ("/docs", "src/docs/index.md", False),
+        ("src/app", "src/app/main.py", True),
+        ("src/app", "lib/src/app/main.py", False),
+        # Trailing slash: directories only.
+        ("build/", "build/out.o", True),
+        ("build/", "pkg/build/out.o", True),
+        ("build/", "build", False),
+        # * and ? stop at slashes (fnmatch let them cross).
+        ("docs/*.md", "docs/guide.md", True),
+        ("docs/*.md", "docs/api/guide.md", False),
+        ("file?.txt", "file1.txt", True),
+        ("file?.txt", "file/.txt", False),
+        # ** segments.
+        ("**/logs", "logs/a.log", True),
+        ("**/logs", "deep/nested/logs/a.log", True),
+        ("src/**/test", "src/test/a.py", True),
+        ("src/**/test", "src/a/b/test/a.py", True),
+        ("src/**", "src/a/b.py", True),
+        ("src/**", "lib/src/a.py", False),
+        ("a**b", "axyb", True),
+        ("a**b", "ax/yb", False),
+        # GitHub treats brackets literally.
+        ("[abc].py", "[abc].py", True),
+        ("[abc].py", "a.py", False),
+    ],
+)
+def test_pattern_semantics(pattern, path, expected):
+    assert _matches(pattern, path) is expected
+
+
+def test_last_match_wins_and_ownerless_rules():
+    owners = CodeOwners.from_text(
+        "# global\n"
+        "*       @everyone\n"
+        "*.py    @python-team @backup  # inline comment\n"
+        "/vendor/\n"
+    )
+    assert owners.owners("README.md") == ("everyone",)
+    assert owners.owners("pkg/mod.py") == ("python-team", "backup")
+    assert owners.owners("vendor/lib.py") == ()
+    rule = owners.rule_for("vendor/lib.py")
+    assert rule.pattern == "/vendor/" and rule.line == 4
+
+
+def test_owners_for_bulk_lookup():
+    owners = CodeOwners.from_text("\n".join(f"/pkg{i}/ @team{i}" for i in range(500)))
+    paths = [f"pkg{i}/mod_{j}.py" for i in range(0, 500, 5) for j in range(10)]
+    result = owners.owners_for(paths)
+    assert len(result) == len(paths)
+    assert result["pkg45/mod_3.py"].owners == ("team45",)
+    assert owners.owners_for(["elsewhere/x.py"]) == {"elsewhere/x.py": None}
+
+
+def test_empty_file_matches_nothing():
+    assert CodeOwners.from_text("# only comments\n\n").rule_for("a.py") is None
+
+
+def test_find_codeowners_location_order(tmp_path):
+    assert find_codeowners(tmp_path) is None
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "CODEOWNERS").write_text("* @docs\n")
+    assert find_codeowners(tmp_path) == tmp_path / "docs" / "CODEOWNERS"
+    (tmp_path / "CODEOWNERS").write_text("* @root\n")
+    assert find_codeowners(tmp_path) == tmp_path / "CODEOWNERS"
+
+
+def test_load_codeowners_cached_by_mtime(tmp_path):
+    path = tmp_path / "CODEOWNERS"
+    path.write_text("* @first\n")
+    first = load_codeowners(tmp_path)
+    assert load_codeowners(tmp_path) is first
+
+    path.write_text("* @second\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = load_codeowners(tmp_path)
+    assert second is not first
+    assert second.owners("a.py") == ("second",)
+    assert load_codeowners(tmp_path / "missing") is None
@@ -0,0 +1,166 @@
+"""Unit tests for skill/shared/ownership_index.py.
+
+Covers ``git log --numstat`` parsing into per-path author weights, directory
+aggregation and fallback, incremental extension from the indexed commit,
+rebuilds after rewritten history, persistence and the per-process cache.
+"""
+
+import os
+import subprocess
+
+import pytest
+
+from skill.shared import ownership_index
+from skill.shared.ownership_index import (
+    INDEX_FILENAME,
+    OwnershipIndex,
+    load_ownership_index,
+)
+
+
+def _git(root, *args, author="Alice"):
+    subprocess.run(
+        ["git", "-C", str(root), "-c", f"user.name={author}",
+         "-c", "user.email=t@example.invalid", *args],
+        check=True, capture_output=True,
+    )
+
+
+def _commit(root, author, message="c"):
+    _git(root, "add", "-A", author=author)
+    _git(root, "commit", "-q", "-m", message, author=author)
+
+
+def _head(root):
+    return subprocess.run(
+        ["git", "-C", str(root), "rev-parse", "HEAD"],
+        check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_process_cache(monkeypatch):
+    monkeypatch.setattr(ownership_index, "_LOADED", {})
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    (root / "src" / "sched").mkdir(parents=True)
+    _git(root, "init", "-q")
+    (root / "src" / "sched" / "queue.py").write_text("a\nb\nc\nd\n")
+    (root / "README.md").write_text("readme\n")
+    _commit(root, "Alice")
+    (root / "src" / "sched" / "queue.py").write_text("a\nB\nc\nd\n")
+    (root / "src" / "sched" / "timer.py").write_text("t\n")
+    _commit(root, "Bob")
+    return root
+
+
+def test_file_weights_from_numstat(repo):
+    index = OwnershipIndex()
+    stats = index.refresh(repo)
+    assert stats == {"head": _head(repo), "full": True, "commits_added": 2}
+    # Alice added 4 lines; Bob changed one (1 added + 1 deleted).
+    assert index.file_weights("src/sched/queue.py") == {"Alice": [1, 4], "Bob": [1, 2]}
+    owner = index.top_owner("src/sched/queue.py")
+    assert owner == {"author": "Alice", "lines": 4, "total": 6,
+                     "scope": "file", "path": "src/sched/queue.py"}
+
+
+def test_directory_weights_and_fallback(repo):
+    index = OwnershipIndex()
+    index.refresh(repo)
+    assert index.dir_weights("src") == {"Alice": [1, 4], "Bob": [2, 3]}
+    owner = index.top_owner("src/sched/new_module.py")
+    assert owner["scope"] == "dir"
+    assert owner["path"] == "src/sched"
+    assert owner["author"] == "Alice"
+    # Top-level files have no directory to fall back to.
+    assert index.top_owner("CHANGELOG.md") is None
+
+
+def test_incremental_refresh_reads_only_new_commits(repo):
+    index = OwnershipIndex()
+    index.refresh(repo)
+    (repo / "src" / "sched" / "timer.py").write_text("t\nu\nv\n")
+    _commit(repo, "Carol")
+    stats = index.refresh(repo)
+    assert stats["full"] is False
+    assert stats["commits_added"] == 1
+    assert index.file_weights("src/sched/timer.py") == {"Bob": [1, 1], "Carol": [1, 2]}
+    assert index.refresh(repo)["commits_added"] == 0
+
+
+def test_rewritten_history_rebuilds(repo):
+    index = OwnershipIndex()
+    index.refresh(repo)
+    (repo / "README.md").write_text("amended\n")
+    _git(repo, "commit", "-q", "-a", "--amend", "-m", "rewritten", author="Dave")
+    stats = index.refresh(repo)
+    assert stats["full"] is True
+    assert index.commits == 2
+
+
+def test_window_bounds_full_build(repo):
+    index = OwnershipIndex()
+    index.window = 1
+    index.refresh(repo)
+    assert index.commits == 1
+    assert "README.md" not in index.files
+
+
+def test_binary_changes_count_one_line(repo):
+    (repo / "logo.png").write_bytes(b"\x89PNG\0\0\x01")
+    _commit(repo, "Erin")
+    index = OwnershipIndex()
+    index.refresh(repo)
+    assert index.file_weights("logo.png") == {"Erin": [1, 1]}
+
+
+def test_load_persists_and_reuses_per_process(repo):
+    index = load_ownership_index(repo / "src")
+    assert index is not None
+    assert index.root == repo.resolve()
+    assert load_ownership_index(repo / "src") is index
+    saved = repo / ".git" / INDEX_FILENAME
+    assert saved.is_file()
+
+    reloaded = OwnershipIndex.load(saved)
+    assert reloaded.head == _head(repo)
+    assert reloaded.files == index.files
+    # A fresh process picks up the persisted index without rebuilding.
+    assert reloaded.refresh(repo)["commits_added"] == 0
+
+
+def test_load_picks_up_new_commits(repo):
+    index = load_ownership_index(repo)
+    assert index.top_owner("README.md")["author"] == "Alice"
+
+    (repo / "README.md").write_text("rewritten\nby\ncarol\n")
+    _commit(repo, "Carol")
+    fresh = load_ownership_index(repo)
+    assert fresh is not index
+    assert fresh.head == _head(repo)
+    assert fresh.top_owner("README.md")["author"] == "Carol"
+    assert index.top_owner("README.md")["author"] == "Alice"
+    assert load_ownership_index(repo) is fresh
+
+
+def test_load_outside_git_or_without_commits(tmp_path):
+    plain = tmp_path / "plain"
+    plain.mkdir()
+    assert load_ownership_index(plain) is None
+    empty = tmp_path / "empty"
+    empty.mkdir()
+    _git(empty, "init", "-q")
+    assert load_ownership_index(empty) is None
+
+
+def test_corrupt_index_file_is_rebuilt(repo):
+    path = repo / ".git" / INDEX_FILENAME
+    path.write_text("{not json")
+    index = load_ownership_index(repo)
+    assert index is not None
+    assert index.top_owner("src/sched/queue.py")["author"] == "Alice"
+    assert os.path.getsize(path) > len("{not json")
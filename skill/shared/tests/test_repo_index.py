@@ -0,0 +1,184 @@
+"""Unit tests for skill/shared/repo_index.py.
+
+Covers tokenization and git-compatible blob hashing, the committed layer
+(full build, incremental sync from ``git diff``, blob dedupe, binary and
+oversized blobs), the working-tree overlay from ``git status``, term and
+prefix queries, and index-file location / corruption handling.
+"""
+
+import subprocess
+
+import pytest
+
+from skill.shared import repo_index
+from skill.shared.repo_index import (
+    INDEX_FILENAME,
+    RepoIndex,
+    blob_hash,
+    index_path,
+    open_repo_index,
+    tokenize,
+)
+
+
+def _git(root, *args):
+    subprocess.run(
+        ["git", "-C", str(root), "-c", "user.name=t", "-c", "user.email=t@example.invalid",
+         *args],
+        check=True, capture_output=True,
+    )
+
+
+def _commit(root, message="c"):
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", message)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    (root / "src").mkdir()
+    (root / "src" / "fanout.py").write_text("SEMAPHORE = bound_fanout()\n")
+    (root / "src" / "copy.py").write_text("SEMAPHORE = bound_fanout()\n")
+    (root / "README.md").write_text("Scripts for the audit runner.\n")
+    (root / "logo.png").write_bytes(b"\x89PNG\0semaphore")
+    _commit(root)
+    return root
+
+
+@pytest.fixture
+def index(repo, tmp_path):
+    with RepoIndex(repo, path=tmp_path / "idx.sqlite3") as idx:
+        yield idx
+
+
+def test_tokenize_lowercases_and_bounds_length():
+    assert tokenize(b"Fix CI in wl-list v2 " + b"x" * 70) == {"fix", "list"}
+
+
+def test_blob_hash_matches_git(repo):
+    out = subprocess.run(["git", "-C", str(repo), "hash-object", "README.md"],
+                         capture_output=True, text=True, check=True).stdout.strip()
+    assert blob_hash((repo / "README.md").read_bytes()) == out
+
+
+class TestCommittedLayer:
+    def test_full_build_dedupes_blobs_and_skips_binary_terms(self, index):
+        stats = index.refresh(worktree=False)
+        assert stats["full"] is True
+        assert stats["blobs_indexed"] == 3  # two identical .py files share one blob
+        assert index.files(worktree=False) == [
+            "README.md", "logo.png", "src/copy.py", "src/fanout.py",
+        ]
+        assert [h["file"] for h in index.search(["semaphore"])] == [
+            "src/copy.py", "src/fanout.py",
+        ]
+
+    def test_incremental_sync_from_git_diff(self, repo, index):
+        index.refresh(worktree=False)
+        (repo / "src" / "copy.py").unlink()
+        (repo / "src" / "new.py").write_text("kestrel = 1\n")
+        _commit(repo)
+        stats = index.refresh(worktree=False)
+        assert stats["full"] is False
+        assert stats["paths_changed"] == 2
+        assert stats["blobs_indexed"] == 1
+        assert "src/copy.py" not in index.files(worktree=False)
+        assert index.search(["kestrel"]) == [{"file": "src/new.py", "matches": ["kestrel"]}]
+
+    def test_unchanged_head_is_a_noop(self, index):
+        index.refresh(worktree=False)
+        assert index.refresh(worktree=False)["paths_changed"] == 0
+
+    def test_unreachable_indexed_commit_rebuilds(self, repo, index):
+        index.refresh(worktree=False)
+        with index._db:
+            index._set_meta("head", "0" * 40)
+        assert index.refresh(worktree=False)["full"] is True
+        assert index.search(["audit"])[0]["file"] == "README.md"
+
+    def test_oversized_blob_is_listed_without_terms(self, repo, index, monkeypatch):
+        monkeypatch.setattr(repo_index, "MAX_FILE_BYTES", 10)
+        index.refresh(worktree=False)
+        assert "README.md" in index.files(worktree=False)
+        assert index.search(["audit"]) == []
+
+
+class TestWorktreeOverlay:
+    def test_modified_untracked_and_deleted_files(self, repo, index):
+        (repo / "README.md").write_text("Kestrel notes.\n")
+        (repo / "notes.md").write_text("kestrel\n")
+        (repo / "src" / "fanout.py").unlink()
+        (repo / ".gitignore").write_text("ignored.md\n")
+        (repo / "ignored.md").write_text("kestrel\n")
+        index.refresh()
+        assert [h["file"] for h in index.search(["kestrel"])] == ["README.md", "notes.md"]
+        assert "src/fanout.py" not in index.files()
+        assert [h["file"] for h in index.search(["semaphore"])] == ["src/copy.py"]
+        # The committed layer is untouched by the overlay.
+        assert index.search(["kestrel"], worktree=False) == []
+        assert "src/fanout.py" in index.files(worktree=False)
+
+    def test_unchanged_overlay_files_are_not_rehashed(self, repo, index):
+        (repo / "notes.md").write_text("kestrel\n")
+        index.refresh()
+        assert index.refresh()["blobs_indexed"] == 0
+
+    def test_unborn_head_indexes_work_tree_only(self, tmp_path):
+        _git(tmp_path, "init", "-q")
+        (tmp_path / "a.md").write_text("kestrel\n")
+        with RepoIndex(tmp_path, path=tmp_path / ".idx.sqlite3") as idx:
+            assert idx.refresh()["head"] is None
+            assert idx.search(["kestrel"]) == [{"file": "a.md", "matches": ["kestrel"]}]
+
+
+class TestSearch:
+    def test_prefix_matching_and_ranking(self, index):
+        index.refresh()
+        assert index.search(["script"]) == []
+        hits = index.search(["script", "audit"], prefix=True)
+        assert hits == [{"file": "README.md", "matches": ["audit", "script"]}]
+
+    def test_case_insensitive_and_limit(self, index):
+        index.refresh()
+        assert len(index.search(["SEMAPHORE"], limit=1)) == 1
+
+
+class TestLocation:
+    def test_index_path_is_in_git_dir(self, repo):
+        assert index_path(repo) == repo.resolve() / ".git" / INDEX_FILENAME
+
+    def test_index_path_ignores_worklog_dir(self, repo):
+        (repo / ".worklog").mkdir()
+        assert index_path(repo) == repo.resolve() / ".git" / INDEX_FILENAME
+
+    def test_open_outside_git_returns_none(self, tmp_path):
+        assert open_repo_index(tmp_path) is None
+
+    def test_corrupt_index_is_rebuilt(self, repo):
+        (repo / ".git" / INDEX_FILENAME).write_bytes(b"not a database" * 100)
+        index = open_repo_index(repo / "src")
+        assert index is not None
+        with index:
+            index.refresh()
+            assert index.search(["fanout"])
+
+    def test_refresh_leaves_work_tree_clean(self, repo):
+        (repo / ".worklog").mkdir()
+        index = open_repo_index(repo)
+        with index:
+            index.refresh()
+            assert index.refresh()["blobs_indexed"] == 0
+        status = subprocess.run(["git", "status", "--porcelain"], cwd=repo,
+                                capture_output=True, text=True, check=True)
+        assert status.stdout == ""
+
+    def test_version_change_clears_index(self, repo, index, tmp_path, monkeypatch):
+        index.refresh()
+        index.close()
+        monkeypatch.setattr(repo_index, "_INDEX_VERSION", repo_index._INDEX_VERSION + 1)
+        with RepoIndex(repo, path=tmp_path / "idx.sqlite3") as fresh:
+            assert fresh.head is None
+            assert fresh.files() == []
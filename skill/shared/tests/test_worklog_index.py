@@ -0,0 +1,161 @@
+"""Unit tests for skill/shared/worklog_index.py.
+
+Covers BM25 ranking (field weights, IDF, query weights, exclusion),
+incremental updates keyed on ``updatedAt``, JSON persistence, and the
+store-signature gate that skips the ``wl list`` export when the store is
+unchanged.
+"""
+
+import json
+import subprocess
+
+import pytest
+
+from skill.shared.worklog_index import (
+    INDEX_FILENAME,
+    WorklogIndex,
+    load_worklog_index,
+    store_signature,
+    tokenize,
+)
+
+ITEMS = [
+    {"id": "WL-1", "title": "Bound audit fanout with a semaphore",
+     "description": "Limit concurrent audit children.", "tags": ["audit"],
+     "status": "open", "updatedAt": "2026-01-01"},
+    {"id": "WL-2", "title": "Speed up linter probes",
+     "description": "Cache the semaphore-free probe results.", "tags": [],
+     "status": "completed", "updatedAt": "2026-01-02"},
+    {"id": "WL-3", "title": "Docs cleanup",
+     "description": "Fix links in the audit skill docs.", "tags": ["docs"],
+     "status": "open", "updatedAt": "2026-01-03"},
+]
+
+
+@pytest.fixture
+def index():
+    idx = WorklogIndex()
+    idx.update(ITEMS)
+    return idx
+
+
+@pytest.fixture
+def store(tmp_path):
+    wl_dir = tmp_path / ".worklog"
+    wl_dir.mkdir()
+    (wl_dir / "worklog-data.jsonl").write_text("x\n")
+    return wl_dir
+
+
+def test_tokenize_lowercases_and_drops_short_terms():
+    assert tokenize("Fix CI in wl-list (v2)") == ["fix", "list"]
+
+
+def test_title_match_outranks_description_match(index):
+    hits = index.search(["semaphore"])
+    assert [h["id"] for h in hits] == ["WL-1", "WL-2"]
+    assert hits[0]["score"] > hits[1]["score"] > 0
+
+
+def test_rare_terms_weigh_more(index):
+    # "audit" appears in two items, "fanout" only in WL-1.
+    assert index.search(["fanout"])[0]["score"] > index.search(["audit"])[0]["score"]
+
+
+def test_query_weights_and_exclusion(index):
+    hits = index.search({"semaphore": 0.1, "docs": 5.0})
+    assert hits[0]["id"] == "WL-3"
+    assert "WL-1" not in [h["id"] for h in index.search(["semaphore"], exclude=["WL-1"])]
+
+
+def test_results_carry_title_and_status(index):
+    hit = index.search(["linter"])[0]
+    assert hit == {"id": "WL-2", "title": "Speed up linter probes",
+                   "status": "completed", "score": hit["score"]}
+
+
+def test_update_is_incremental_by_updated_at(index):
+    changed = [dict(ITEMS[0]), dict(ITEMS[1], title="Speed up eslint probes",
+                                    updatedAt="2026-02-01")]
+    stats = index.update(changed)
+    assert stats == {"indexed": 1, "unchanged": 1, "removed": 1}
+    assert index.search(["eslint"])[0]["id"] == "WL-2"
+    assert index.search(["docs"]) == []
+
+
+def test_unchanged_item_keeps_current_status(index):
+    index.update([dict(ITEMS[0], status="completed")])
+    assert index.search(["fanout"])[0]["status"] == "completed"
+
+
+def test_save_and_load_round_trip(index, tmp_path):
+    path = tmp_path / "cache" / INDEX_FILENAME
+    index.signature = "sig"
+    index.save(path)
+    loaded = WorklogIndex.load(path)
+    assert loaded.signature == "sig"
+    assert loaded.search(["semaphore"]) == index.search(["semaphore"])
+
+
+def test_corrupt_index_loads_empty(tmp_path):
+    path = tmp_path / INDEX_FILENAME
+    path.write_text("{not json")
+    assert len(WorklogIndex.load(path)) == 0
+
+
+def test_signature_ignores_cache_dir(store):
+    before = store_signature(store)
+    (store / "cache").mkdir()
+    (store / "cache" / "other.json").write_text("{}")
+    assert store_signature(store) == before
+
+
+class TestLoadWorklogIndex:
+    def test_unresolved_store_returns_none(self):
+        assert load_worklog_index(None, export=lambda: ITEMS) is None
+
+    def test_empty_or_failed_export_returns_none(self, store):
+        assert load_worklog_index(store, export=lambda: None) is None
+        assert load_worklog_index(store, export=lambda: []) is None
+        assert not (store / "cache" / INDEX_FILENAME).exists()
+
+    def test_unchanged_store_skips_export(self, store):
+        calls = []
+
+        def export():
+            calls.append(1)
+            return ITEMS
+
+        first = load_worklog_index(store, export=export)
+        second = load_worklog_index(store, export=export)
+        assert len(calls) == 1
+        assert second.search(["semaphore"]) == first.search(["semaphore"])
+
+    def test_store_change_triggers_export(self, store):
+        load_worklog_index(store, export=lambda: ITEMS)
+        (store / "worklog-data.jsonl").write_text("changed\n")
+        updated = [*ITEMS, {"id": "WL-4", "title": "Kestrel migration",
+                            "updatedAt": "2026-03-01"}]
+        index = load_worklog_index(store, export=lambda: updated)
+        assert index.search(["kestrel"])[0]["id"] == "WL-4"
+        persisted = json.loads((store / "cache" / INDEX_FILENAME).read_text())
+        assert "WL-4" in persisted["docs"]
+
+    def test_store_in_git_repo_keeps_index_in_git_dir(self, store):
+        repo = store.parent
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        assert load_worklog_index(store, export=lambda: ITEMS) is not None
+        assert (repo / ".git" / INDEX_FILENAME).is_file()
+        assert not (store / "cache").exists()
+
+
+def test_idf_orders_terms_by_rarity(index):
+    assert index.idf("fanout") > index.idf("audit") > 0
+    assert WorklogIndex().idf("fanout") == 0.0
+
+
+def test_idf_excludes_items(index):
+    # "fanout" only occurs in WL-1: once WL-1 is excluded it matches nothing.
+    assert index.idf("fanout", exclude=["WL-1"]) == 0.0
+    assert index.idf("kestrel") == 0.0
+    assert index.idf("audit", exclude=["WL-1"]) != index.idf("audit")
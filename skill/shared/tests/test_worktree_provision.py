@@ -0,0 +1,128 @@
+"""Unit tests for skill/shared/worktree_provision.py.
+
+Covers manifest loading and fallback, lockfile-hash gating, copy entries
+being reflinked or skipped (never linked), skipping existing destinations
+and the time-saved report.
+"""
+
+import json
+import os
+import shutil
+
+import pytest
+
+from skill.shared import worktree_provision as wp
+from skill.shared.worktree_provision import (
+    DEFAULT_MANIFEST,
+    MANIFEST_FILENAME,
+    load_manifest,
+    provision_worktree,
+)
+
+
+@pytest.fixture
+def trees(tmp_path):
+    root = tmp_path / "main"
+    worktree = tmp_path / "wt"
+    for base in (root, worktree):
+        (base / "packages" / "ui").mkdir(parents=True)
+        (base / "package-lock.json").write_text('{"lockfileVersion": 3}\n')
+    nm = root / "packages" / "ui" / "node_modules"
+    (nm / "react").mkdir(parents=True)
+    (nm / "react" / "index.js").write_text("module.exports = {};\n")
+    (root / ".venv" / "bin").mkdir(parents=True)
+    (root / "dist").mkdir()
+    (root / "dist" / "app.js").write_text("console.log(1);\n")
+    (root / ".pytest_cache").mkdir()
+    (root / ".pytest_cache" / "README.md").write_text("cache\n")
+    return root, worktree
+
+
+def _entry(report, path):
+    return next(e for e in report["entries"] if e["path"] == path)
+
+
+def test_load_manifest_default_and_custom(tmp_path):
+    assert load_manifest(tmp_path) is DEFAULT_MANIFEST
+    (tmp_path / ".worklog").mkdir()
+    manifest = tmp_path / ".worklog" / MANIFEST_FILENAME
+    manifest.write_text(json.dumps([{"path": "vendor"}, {"mode": "copy"}]))
+    assert load_manifest(tmp_path) == [{"path": "vendor"}]
+    manifest.write_text("{not json")
+    assert load_manifest(tmp_path) is DEFAULT_MANIFEST
+
+
+def _fake_reflink(src, dst):
+    shutil.copytree(src, dst, symlinks=True)
+    return True
+
+
+def test_default_manifest_links_and_copies(trees, monkeypatch):
+    root, worktree = trees
+    monkeypatch.setattr(wp, "_reflink_copy", _fake_reflink)
+    report = provision_worktree(worktree, root)
+
+    nested = _entry(report, "packages/ui/node_modules")
+    assert nested["status"] == "provisioned" and nested["method"] == "symlink"
+    assert (worktree / "packages/ui/node_modules").resolve() == (
+        root / "packages/ui/node_modules"
+    ).resolve()
+
+    dist = _entry(report, "dist")
+    assert dist["status"] == "provisioned" and dist["method"] == "reflink"
+    copied = worktree / "dist" / "app.js"
+    assert not (worktree / "dist").is_symlink()
+    assert not os.path.samefile(copied, root / "dist" / "app.js")
+    # Virtualenvs are not relocatable and are never provisioned by default.
+    assert not any(e["path"] == ".venv" for e in report["entries"])
+    assert not (worktree / ".venv").exists()
+
+
+def test_copy_entries_never_fall_back_to_links(trees, monkeypatch):
+    root, worktree = trees
+    monkeypatch.setattr(wp, "_reflink_copy", lambda src, dst: False)
+    report = provision_worktree(worktree, root)
+    for path in ("dist", ".pytest_cache"):
+        entry = _entry(report, path)
+        assert entry["status"] == "skipped"
+        assert entry["reason"] == "reflink_unsupported"
+        assert not os.path.lexists(worktree / path)
+
+
+def test_lockfile_mismatch_skips(trees):
+    root, worktree = trees
+    (worktree / "package-lock.json").write_text('{"lockfileVersion": 2}\n')
+    report = provision_worktree(worktree, root)
+    assert _entry(report, "dist")["reason"] == "lockfile_mismatch"
+    assert _entry(report, "packages/ui/node_modules")["reason"] == "lockfile_mismatch"
+    assert not (worktree / "dist").exists()
+
+
+def test_existing_destination_and_missing_parent_are_left_alone(trees):
+    root, worktree = trees
+    (worktree / "dist").mkdir()
+    (root / "apps" / "web" / "node_modules").mkdir(parents=True)
+    report = provision_worktree(worktree, root)
+    assert _entry(report, "dist")["reason"] == "exists"
+    assert _entry(report, "apps/web/node_modules")["reason"] == "missing_parent"
+    assert not any((worktree / "dist").iterdir())
+
+
+def test_time_saved(trees, monkeypatch):
+    root, worktree = trees
+    monkeypatch.setattr(wp, "_reflink_copy", _fake_reflink)
+    manifest = [{"path": "dist", "mode": "copy", "lockfiles": ["package-lock.json"],
+                 "install_seconds": 30}]
+    report = provision_worktree(worktree, root, manifest)
+    entry = _entry(report, "dist")
+    assert 0 < entry["saved_seconds"] <= 30
+    assert report["saved_seconds"] == entry["saved_seconds"]
+    report = provision_worktree(
+        worktree, root, [{"path": "packages/*/node_modules", "mode": "symlink"}]
+    )
+    assert "saved_seconds" not in report["entries"][0]
+
+
+def test_main_checkout_is_not_provisioned_into_itself(trees):
+    root, _ = trees
+    assert provision_worktree(root, root)["entries"] == []
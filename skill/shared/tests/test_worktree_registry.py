@@ -0,0 +1,87 @@
+"""Unit tests for skill/shared/worktree_registry.py.
+
+Covers resolving the git common directory from main and linked checkouts,
+register/lookup/unregister, and reconciliation with ``git worktree list``
+(discovering ``wl-`` worktrees created elsewhere, dropping removed ones).
+"""
+
+import json
+import subprocess
+
+import pytest
+
+from skill.shared import worktree_registry as wr
+
+
+def _git(cwd, *args):
+    return subprocess.run(
+        ["git", *args], cwd=str(cwd), check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    (root / "app.py").write_text("x = 1\n")
+    _git(root, "add", "-A")
+    _git(root, "-c", "user.name=T", "-c", "user.email=t@example.invalid",
+         "commit", "-q", "-m", "init")
+    return root.resolve()
+
+
+def _add_worktree(repo, branch):
+    wt = repo / ".worklog" / "worktrees" / branch
+    _git(repo, "worktree", "add", "-q", "-b", branch, str(wt))
+    return wt
+
+
+def test_common_dir_from_linked_worktree(repo, tmp_path):
+    wt = _add_worktree(repo, "wl-SA-1-first")
+    assert wr.git_common_dir(wt / "sub") == repo / ".git"
+    assert wr.git_common_dir(wt) == repo / ".git"
+    assert wr.same_repository(repo, wt)
+    assert not wr.same_repository(repo, tmp_path)
+    assert wr.git_common_dir(tmp_path) is None
+
+
+def test_register_lookup_unregister(repo):
+    wt = _add_worktree(repo, "wl-SA-1-first")
+    wr.register(repo, "SA-1", wt, "wl-SA-1-first")
+    entry = wr.lookup(wt, "SA-1")
+    assert entry["path"] == str(wt)
+    assert entry["state"] == "in_progress"
+    assert wr.owner_of(repo, wt / "app.py") == "SA-1"
+
+    wr.set_state(repo, "SA-1", "committed")
+    assert wr.entries(repo)["SA-1"]["state"] == "committed"
+
+    wr.unregister(repo, "SA-1")
+    data = json.loads(wr.registry_path(repo).read_text())
+    assert "SA-1" not in data["worktrees"]
+
+
+def test_reconcile_discovers_unregistered_worktrees(repo):
+    wt = _add_worktree(repo, "wl-SA-2-second")
+    _add_worktree(repo, "feature-x")
+    entry = wr.lookup(repo, "SA-2")
+    assert entry["path"] == str(wt)
+    assert entry["state"] == "discovered"
+    assert set(wr.entries(repo)) == {"SA-2"}
+
+
+def test_reconcile_drops_removed_worktrees(repo):
+    wt = _add_worktree(repo, "wl-SA-1-first")
+    wr.register(repo, "SA-1", wt, "wl-SA-1-first")
+    _git(repo, "worktree", "remove", "--force", str(wt))
+    assert wr.lookup(repo, "SA-1") is None
+    assert wr.entries(repo) == {}
+
+
+def test_recorded_state_survives_reconcile(repo):
+    wt = _add_worktree(repo, "wl-SA-1-first")
+    wr.register(repo, "SA-1", wt, "wl-SA-1-first", state="committed")
+    _add_worktree(repo, "wl-SA-3-third")
+    assert wr.entries(repo)["SA-1"]["state"] == "committed"
+    assert wr.entries(repo)["SA-3"]["state"] == "discovered"
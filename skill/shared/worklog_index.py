@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""Local BM25 index over Worklog items.
+
+Skills that rank work items by text relevance (find-related) previously ran
+one ``wl search`` subprocess per keyword. This module keeps a local inverted
+index over item titles, descriptions and tags instead, built from a single
+``wl list --json`` export and answered in-process with BM25 scoring.
+
+Usage::
+
+    from skill.shared.worklog_index import load_worklog_index
+
+    index = load_worklog_index(worklog_dir, export=lambda: run_wl_list(flags))
+    if index is not None:
+        hits = index.search(["semaphore", "fanout"], limit=10)
+
+Persistence and freshness
+-------------------------
+
+The index is stored next to the repo term index, in the git dir of the
+repository holding the store (``<git-dir>/worklog-index.json``), so it is
+never part of the work tree; a store outside git keeps it at
+``<worklog-dir>/cache/worklog-index.json``. Writes are atomic (temp file +
+``os.replace``). It records a signature of the store
+(size and mtime of the files directly under ``<worklog-dir>``); when the
+signature is unchanged the index is used as-is and ``wl`` is not invoked at
+all. Otherwise one export is taken and only items whose ``updatedAt``
+changed are re-tokenized; items missing from the export are dropped.
+
+Scoring
+-------
+
+Okapi BM25 (``k1=1.2``, ``b=0.75``) over a single weighted field: title
+terms count ``TITLE_WEIGHT`` times, tag terms ``TAG_WEIGHT`` times and
+description terms once. Query terms may carry weights (e.g. from keyword
+selection); the score is the weighted sum of per-term BM25 contributions.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import tempfile
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+from typing import Any
+
+from skill.shared.repo_index import index_path, repo_toplevel
+
+INDEX_FILENAME = "worklog-index.json"
+_INDEX_VERSION = 1
+
+TITLE_WEIGHT = 3
+TAG_WEIGHT = 2
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Terms shorter than this are not indexed (matches find-related keywords).
+MIN_TERM_LENGTH = 3
+
+_TERM_RE = re.compile(r"[a-z0-9]+")
+
+# Store subdirectories written by skills (not by wl); excluded from the
+# store signature so our own cache writes do not invalidate the index.
+_SIGNATURE_SKIP_DIRS = {"cache", "tmp"}
+
+
+def tokenize(text: str) -> list[str]:
+    """Split *text* into lowercased alphanumeric terms (``MIN_TERM_LENGTH``+)."""
+    return [t for t in _TERM_RE.findall(text.lower()) if len(t) >= MIN_TERM_LENGTH]
+
+
+def _item_terms(item: Mapping[str, Any]) -> dict[str, int]:
+    """Return weighted term frequencies for one work item."""
+    tf: dict[str, int] = {}
+    tags = item.get("tags") or []
+    if isinstance(tags, str):
+        tags = [tags]
+    fields = (
+        (str(item.get("title") or ""), TITLE_WEIGHT),
+        (" ".join(str(t) for t in tags), TAG_WEIGHT),
+        (str(item.get("description") or ""), 1),
+    )
+    for text, weight in fields:
+        for term in tokenize(text):
+            tf[term] = tf.get(term, 0) + weight
+    return tf
+
+
+def store_signature(worklog_dir: str | Path) -> str:
+    """Fingerprint the files directly under *worklog_dir*.
+
+    Any ``wl`` write changes the size or mtime of a store file, so a matching
+    signature means the persisted index is current without asking ``wl``.
+    """
+    parts: list[str] = []
+    try:
+        with os.scandir(worklog_dir) as entries:
+            for entry in sorted(entries, key=lambda e: e.name):
+                if entry.name in _SIGNATURE_SKIP_DIRS:
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                parts.append(f"{entry.name}:{st.st_size}:{st.st_mtime_ns}")
+    except OSError:
+        return ""
+    return "|".join(parts)
+
+
+class WorklogIndex:
+    """In-memory BM25 index of Worklog items, persistable as JSON."""
+
+    def __init__(self) -> None:
+        # id -> {"updatedAt", "title", "status", "tf": {term: weighted tf}}
+        self.docs: dict[str, dict[str, Any]] = {}
+        self.signature: str = ""
+        self._postings: dict[str, dict[str, int]] | None = None
+        self._lengths: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    # -- updates -------------------------------------------------------------
+
+    def update(self, items: Iterable[Mapping[str, Any]]) -> dict[str, int]:
+        """Sync the index with a full export of *items*.
+
+        Items whose ``updatedAt`` is unchanged keep their stored terms; ids
+        absent from *items* are removed.
+
+        Returns:
+            Counts: ``indexed`` (new or changed), ``unchanged``, ``removed``.
+        """
+        stats = {"indexed": 0, "unchanged": 0, "removed": 0}
+        seen: set[str] = set()
+        for item in items:
+            item_id = item.get("id")
+            if not item_id:
+                continue
+            seen.add(item_id)
+            updated_at = item.get("updatedAt")
+            doc = self.docs.get(item_id)
+            if doc is not None and updated_at is not None and doc["updatedAt"] == updated_at:
+                # Status can change without touching text; keep it current.
+                doc["status"] = item.get("status", doc.get("status", ""))
+                stats["unchanged"] += 1
+                continue
+            self.docs[item_id] = {
+                "updatedAt": updated_at,
+                "title": item.get("title", ""),
+                "status": item.get("status", ""),
+                "tf": _item_terms(item),
+            }
+            stats["indexed"] += 1
+        for item_id in [i for i in self.docs if i not in seen]:
+            del self.docs[item_id]
+            stats["removed"] += 1
+        if stats["indexed"] or stats["removed"]:
+            self._postings = None
+        return stats
+
+    def _build_postings(self) -> dict[str, dict[str, int]]:
+        if self._postings is None:
+            postings: dict[str, dict[str, int]] = {}
+            lengths: dict[str, int] = {}
+            for item_id, doc in self.docs.items():
+                tf = doc["tf"]
+                lengths[item_id] = sum(tf.values())
+                for term, count in tf.items():
+                    postings.setdefault(term, {})[item_id] = count
+            self._postings = postings
+            self._lengths = lengths
+        return self._postings
+
+    # -- queries -------------------------------------------------------------
+
+    def idf(self, term: str, exclude: Iterable[str] = ()) -> float:
+        """BM25 inverse document frequency of *term*.
+
+        Items in *exclude* (e.g. the item being analyzed) are left out of
+        the corpus. Returns 0.0 when no remaining item contains *term*: it
+        cannot match anything, so it is worthless as a query term.
+        """
+        postings = self._build_postings()
+        skip = {item_id for item_id in exclude if item_id in self.docs}
+        n_docs = len(self.docs) - len(skip)
+        df = sum(1 for item_id in postings.get(term.lower(), ()) if item_id not in skip)
+        if not n_docs or not df:
+            return 0.0
+        return math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        terms: Mapping[str, float] | Iterable[str],
+        limit: int = 10,
+        exclude: Iterable[str] = (),
+    ) -> list[dict[str, Any]]:
+        """Rank items against *terms* with BM25.
+
+        Args:
+            terms: Query terms, optionally mapped to weights (default 1.0).
+            limit: Maximum number of results.
+            exclude: Item ids to leave out (e.g. the item being analyzed).
+
+        Returns:
+            Dicts with ``id``, ``title``, ``status`` and ``score``, by
+            descending score (ties broken by id for determinism).
+        """
+        weights = dict(terms) if isinstance(terms, Mapping) else dict.fromkeys(terms, 1.0)
+        postings = self._build_postings()
+        n_docs = len(self.docs)
+        if not n_docs or not weights:
+            return []
+        avg_len = (sum(self._lengths.values()) / n_docs) or 1.0
+        skip = set(exclude)
+
+        scores: dict[str, float] = {}
+        for raw_term, weight in weights.items():
+            term = raw_term.lower()
+            docs = postings.get(term)
+            if not docs:
+                continue
+            idf = self.idf(term)
+            for item_id, tf in docs.items():
+                if item_id in skip:
+                    continue
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[item_id] / avg_len)
+                scores[item_id] = scores.get(item_id, 0.0) + (
+                    weight * idf * tf * (BM25_K1 + 1) / (tf + norm)
+                )
+
+        ranked = sorted(scores.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+        return [
+            {
+                "id": item_id,
+                "title": self.docs[item_id].get("title", ""),
+                "status": self.docs[item_id].get("status", ""),
+                "score": round(score, 6),
+            }
+            for item_id, score in ranked
+        ]
+
+    # -- persistence ---------------------------------------------------------
+
+    @classmethod
+    def load(cls, path: str | Path) -> WorklogIndex:
+        """Load an index from *path*; a missing or corrupt file yields an empty index."""
+        index = cls()
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return index
+        if not isinstance(data, dict) or data.get("version") != _INDEX_VERSION:
+            return index
+        docs = data.get("docs")
+        if isinstance(docs, dict):
+            index.docs = docs
+            index.signature = str(data.get("signature", ""))
+        return index
+
+    def save(self, path: str | Path) -> None:
+        """Atomically write the index to *path*."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(
+            {"version": _INDEX_VERSION, "signature": self.signature, "docs": self.docs},
+            separators=(",", ":"),
+        )
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), prefix=".worklog-index-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def worklog_index_path(worklog_dir: str | Path) -> Path:
+    """Resolve where the index for the store at *worklog_dir* is stored."""
+    root = repo_toplevel(worklog_dir)
+    location = index_path(root, INDEX_FILENAME) if root is not None else None
+    if location is not None:
+        return location
+    return Path(worklog_dir) / "cache" / INDEX_FILENAME
+
+
+def load_worklog_index(
+    worklog_dir: str | Path | None,
+    export: Callable[[], list[dict[str, Any]] | None],
+) -> WorklogIndex | None:
+    """Return an up-to-date index for the store at *worklog_dir*.
+
+    Args:
+        worklog_dir: The ``.worklog`` directory of the store (``None`` when it
+            cannot be resolved — no index is used).
+        export: Callable returning every work item of the store (one
+            ``wl list --json``), or ``None`` when the export failed.
+
+    Returns:
+        The index, or ``None`` when no usable index exists (unresolved store,
+        failed or empty export) so callers can fall back to ``wl search``.
+    """
+    if worklog_dir is None:
+        return None
+    path = worklog_index_path(worklog_dir)
+    signature = store_signature(worklog_dir)
+    index = WorklogIndex.load(path)
+    if index.docs and signature and index.signature == signature:
+        return index
+
+    items = export()
+    if not items:
+        return None
+    index.update(items)
+    index.signature = signature
+    try:
+        index.save(path)
+    except OSError:
+        pass  # best-effort persistence; the in-memory index is still valid
+    return index
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""Provision dependency directories into a new git worktree.
+
+A git worktree starts without any gitignored directory, so every worktree
+either reinstalls dependencies (nested workspace ``node_modules``) or
+fails, and starts with cold tool caches and build outputs. This module
+copies or links those directories from the main checkout, driven by a
+manifest.
+
+Usage::
+
+    from skill.shared.worktree_provision import provision_worktree
+
+    report = provision_worktree(worktree_path, repo_root)
+
+Manifest
+--------
+
+``<repo>/.worklog/worktree-provision.json`` (optional; ``DEFAULT_MANIFEST``
+otherwise) is a JSON list of entries::
+
+    {"path": "packages/*/node_modules",   # glob relative to the repo root
+     "mode": "symlink",                   # "symlink" or "copy"
+     "lockfiles": ["package-lock.json"],  # repo-relative, must match to reuse
+     "install_seconds": 90}               # optional fresh-install estimate
+
+Materialization
+---------------
+
+``symlink`` entries are linked to the main checkout (shared, like the
+top-level ``node_modules`` symlink). ``copy`` entries get a private copy
+only as a reflink (copy-on-write clone, ``cp --reflink=always`` /
+``cp -c``); where the filesystem cannot reflink they are skipped
+(``reflink_unsupported``) rather than linked, because hardlinks and
+symlinks would let tools that rewrite files in place (pytest's cache,
+``tsc`` output) change the main checkout.
+
+Virtualenvs are not in the default manifest: a copied venv is not
+relocatable (``bin/pip``, ``bin/pytest`` and ``activate`` keep absolute
+paths to the main checkout's venv), so installing into it would modify
+the original.
+
+Safety
+------
+
+An entry is reused only when every listed lockfile hashes the same in the
+worktree and the main checkout (a lockfile present on one side only is a
+mismatch); otherwise it is skipped so the worktree installs fresh. Existing
+destinations are never replaced. Failures are reported, never raised.
+"""  # noqa: EXE001
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+LOG = logging.getLogger("skill.shared.worktree_provision")
+
+MANIFEST_FILENAME = "worktree-provision.json"
+
+_NPM_LOCKFILES = ["package-lock.json", "npm-shrinkwrap.json", "yarn.lock", "pnpm-lock.yaml"]
+
+# The top-level node_modules is linked by implement.py itself
+# (_ensure_node_modules_symlink) and is not repeated here.
+DEFAULT_MANIFEST: list[dict[str, Any]] = [
+    {"path": "packages/*/node_modules", "mode": "symlink", "lockfiles": _NPM_LOCKFILES},
+    {"path": "apps/*/node_modules", "mode": "symlink", "lockfiles": _NPM_LOCKFILES},
+    {"path": ".pytest_cache", "mode": "copy", "lockfiles": []},
+    {"path": "dist", "mode": "copy", "lockfiles": _NPM_LOCKFILES},
+]
+
+
+def load_manifest(repo_root: str | Path) -> list[dict[str, Any]]:
+    """Return the provisioning manifest of *repo_root*.
+
+    A missing manifest file yields ``DEFAULT_MANIFEST``; an unreadable or
+    malformed one is logged and also yields the default. Entries without a
+    ``path`` are dropped.
+    """
+    path = Path(repo_root) / ".worklog" / MANIFEST_FILENAME
+    if not path.is_file():
+        return DEFAULT_MANIFEST
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        LOG.warning("Ignoring unreadable provisioning manifest %s: %s", path, exc)
+        return DEFAULT_MANIFEST
+    if not isinstance(data, list):
+        LOG.warning("Ignoring provisioning manifest %s: expected a JSON list", path)
+        return DEFAULT_MANIFEST
+    return [e for e in data if isinstance(e, dict) and e.get("path")]
+
+
+def _file_hash(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def lockfiles_match(worktree: Path, repo_root: Path, lockfiles: list[str]) -> bool:
+    """True when every lockfile has the same content in both trees (or neither)."""
+    return all(
+        _file_hash(worktree / name) == _file_hash(repo_root / name) for name in lockfiles
+    )
+
+
+def _reflink_copy(src: Path, dst: Path) -> bool:
+    """Copy-on-write clone of *src* to *dst*; False when unsupported."""
+    if sys.platform == "darwin":
+        cmd = ["cp", "-Rc", str(src), str(dst)]
+    else:
+        cmd = ["cp", "-a", "--reflink=always", str(src), str(dst)]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, timeout=600, check=False)
+    except (OSError, subprocess.TimeoutExpired):
+        proc = None
+    if proc is not None and proc.returncode == 0:
+        return True
+    shutil.rmtree(dst, ignore_errors=True)
+    return False
+
+
+def _materialize(src: Path, dst: Path, mode: str) -> str | None:
+    """Create *dst* from *src*; returns the method used, or None when a
+    ``copy`` entry cannot be cloned (it is never linked instead)."""
+    if mode == "copy":
+        return "reflink" if _reflink_copy(src, dst) else None
+    os.symlink(str(src), str(dst), target_is_directory=True)
+    return "symlink"
+
+
+def provision_worktree(
+    worktree_path: str | Path,
+    repo_root: str | Path,
+    manifest: list[dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Copy or link the manifest's dependency directories into a worktree.
+
+    Args:
+        worktree_path: Root of the new worktree.
+        repo_root: Main checkout root the directories come from.
+        manifest: Manifest entries (defaults to :func:`load_manifest`).
+
+    Returns:
+        ``entries`` (one dict per matched directory: ``path``, ``status``
+        (``"provisioned"`` or ``"skipped"``), ``method`` or ``reason``,
+        ``seconds`` and, when the entry has ``install_seconds``,
+        ``saved_seconds``), ``seconds`` and ``saved_seconds`` totals.
+    """
+    worktree = Path(worktree_path)
+    root = Path(repo_root)
+    entries: list[dict[str, Any]] = []
+    report: dict[str, Any] = {"entries": entries, "seconds": 0.0, "saved_seconds": 0.0}
+    if worktree.resolve() == root.resolve():
+        return report
+    for spec in manifest if manifest is not None else load_manifest(root):
+        mode = spec.get("mode", "copy")
+        lockfiles = list(spec.get("lockfiles") or [])
+        for src in sorted(root.glob(spec["path"])):
+            if not src.is_dir() or src.is_symlink():
+                continue
+            rel = src.relative_to(root)
+            dst = worktree / rel
+            entry: dict[str, Any] = {"path": rel.as_posix(), "status": "skipped"}
+            entries.append(entry)
+            if os.path.lexists(dst):
+                entry["reason"] = "exists"
+            elif not dst.parent.is_dir():
+                entry["reason"] = "missing_parent"
+            elif not lockfiles_match(worktree, root, lockfiles):
+                entry["reason"] = "lockfile_mismatch"
+            if "reason" in entry:
+                continue
+            started = time.monotonic()
+            try:
+                method = _materialize(src, dst, mode)
+            except OSError as exc:
+                entry["reason"] = f"error: {exc}"
+                continue
+            if method is None:
+                entry["reason"] = "reflink_unsupported"
+                continue
+            entry["method"] = method
+            entry["status"] = "provisioned"
+            entry["seconds"] = round(time.monotonic() - started, 3)
+            report["seconds"] += entry["seconds"]
+            if spec.get("install_seconds") is not None:
+                saved = max(0.0, float(spec["install_seconds"]) - entry["seconds"])
+                entry["saved_seconds"] = round(saved, 3)
+                report["saved_seconds"] += entry["saved_seconds"]
+            LOG.info("Provisioned %s into worktree (%s)", rel, entry["method"])
+    report["seconds"] = round(report["seconds"], 3)
+    report["saved_seconds"] = round(report["saved_seconds"], 3)
+    return report
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""Registry of implement worktrees, kept in the git common directory.
+
+Finding the worktree of a work item used to mean rediscovering it on every
+call: ``implement.py`` checked the cwd and globbed ``wl-<id>-*`` under
+``<cwd>/.worklog/worktrees`` (so only from the repo root), and the audit
+launch-context guard ran ``git rev-parse --git-common-dir`` for both
+checkouts. This module keeps one small JSON map per repository instead:
+
+    work item id -> {"path", "branch", "state", "updated_at"}
+
+Usage::
+
+    from skill.shared import worktree_registry
+
+    worktree_registry.register(repo, "SA-1", path, "wl-SA-1-slug")
+    entry = worktree_registry.lookup(repo, "SA-1")
+
+Maintenance
+-----------
+
+``implement.py`` registers a worktree on ``start`` (``in_progress``), marks
+it ``committed`` during ``finish`` and unregisters it when the worktree is
+removed by ``finish``/``abort``.
+
+Staleness
+---------
+
+The registry records the mtime of ``<common-dir>/worktrees`` (git adds and
+removes one admin entry per linked worktree there). When that changes, or a
+looked-up path no longer exists, the registry is reconciled with a single
+``git worktree list --porcelain``: entries whose worktree is gone are
+dropped, and ``wl-<id>-<slug>`` worktrees created by other means are added
+with state ``discovered``. Recorded states survive reconciliation.
+
+The common directory is resolved by reading ``.git`` files (linked
+worktrees point to ``<common>/worktrees/<name>``, which holds a
+``commondir`` file), falling back to ``git rev-parse`` only when that fails.
+Updates hold an advisory ``flock`` (POSIX) and replace the file atomically.
+"""  # noqa: EXE001
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import re
+import subprocess
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None  # type: ignore[assignment]
+
+LOG = logging.getLogger("skill.shared.worktree_registry")
+
+REGISTRY_FILENAME = "implement-worktrees.json"
+_REGISTRY_VERSION = 1
+
+# Branches created by implement.py: wl-<work-item-id>-<slug>.
+_BRANCH_RE = re.compile(r"^wl-([A-Z]+-[A-Za-z0-9_]+)-")
+
+
+def git_common_dir(path: str | Path) -> Path | None:
+    """Return the git common directory of the checkout containing *path*.
+
+    Args:
+        path: Any path inside a main checkout or linked worktree.
+
+    Returns:
+        The resolved common directory, or None outside git.
+    """
+    start = Path(path).resolve()
+    for directory in (start, *start.parents):
+        dot_git = directory / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                text = dot_git.read_text().strip()
+                if not text.startswith("gitdir:"):
+                    break
+                admin = (directory / text[len("gitdir:"):].strip()).resolve()
+                commondir = admin / "commondir"
+                if commondir.is_file():
+                    return (admin / commondir.read_text().strip()).resolve()
+                return admin
+            except OSError:
+                break
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(start), "rev-parse", "--git-common-dir"],
+            capture_output=True, text=True, check=False, timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0 or not proc.stdout.strip():
+        return None
+    return (start / proc.stdout.strip()).resolve()
+
+
+def same_repository(path_a: str | Path, path_b: str | Path) -> bool:
+    """True when both paths are checkouts (main or linked) of one repository."""
+    a = git_common_dir(path_a)
+    return a is not None and a == git_common_dir(path_b)
+
+
+def registry_path(repo: str | Path) -> Path | None:
+    """Location of the registry for the repository containing *repo*."""
+    common = git_common_dir(repo)
+    return common / REGISTRY_FILENAME if common is not None else None
+
+
+def _admin_stamp(common: Path) -> int:
+    try:
+        return (common / "worktrees").stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _read(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {"version": _REGISTRY_VERSION, "stamp": None, "worktrees": {}}
+    if not isinstance(data, dict) or not isinstance(data.get("worktrees"), dict):
+        return {"version": _REGISTRY_VERSION, "stamp": None, "worktrees": {}}
+    return data
+
+
+def _write(path: Path, data: dict[str, Any]) -> None:
+    data["version"] = _REGISTRY_VERSION
+    data["stamp"] = _admin_stamp(path.parent)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(data, indent=2, sort_keys=True))
+        os.replace(tmp, path)
+    except OSError as exc:
+        LOG.warning("Failed to write worktree registry %s: %s", path, exc)
+        tmp.unlink(missing_ok=True)
+
+
+@contextlib.contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock for a read-modify-write of *path*."""
+    if fcntl is None:  # pragma: no cover - non-POSIX
+        yield
+        return
+    try:
+        fd = os.open(path.with_name(f".{path.name}.lock"), os.O_CREAT | os.O_RDWR, 0o644)
+    except OSError:
+        yield
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def _list_worktrees(common: Path) -> dict[str, str] | None:
+    """Map branch name -> path from one ``git worktree list --porcelain``."""
+    try:
+        proc = subprocess.run(
+            ["git", "--git-dir", str(common), "worktree", "list", "--porcelain"],
+            capture_output=True, text=True, check=False, timeout=60,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+    branches: dict[str, str] = {}
+    path = None
+    for line in proc.stdout.splitlines():
+        if line.startswith("worktree "):
+            path = line[len("worktree "):]
+        elif line.startswith("branch refs/heads/") and path is not None:
+            branches[line[len("branch refs/heads/"):]] = path
+    return branches
+
+
+def _reconcile(path: Path, data: dict[str, Any]) -> dict[str, Any]:
+    listed = _list_worktrees(path.parent)
+    if listed is None:
+        return data
+    entries = data["worktrees"]
+    by_branch = {e.get("branch"): wid for wid, e in entries.items()}
+    now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    reconciled: dict[str, dict[str, Any]] = {}
+    for branch, wt_path in listed.items():
+        match = _BRANCH_RE.match(branch)
+        wid = by_branch.get(branch) or (match.group(1) if match else None)
+        if wid is None:
+            continue
+        entry = dict(entries.get(wid) or {"state": "discovered"})
+        if entry.get("branch") not in (None, branch):
+            entry["state"] = "discovered"
+        entry.update(path=str(Path(wt_path).resolve()), branch=branch)
+        entry.setdefault("updated_at", now)
+        reconciled[wid] = entry
+    data["worktrees"] = reconciled
+    LOG.debug("Worktree registry reconciled: %d worktrees", len(reconciled))
+    return data
+
+
+def _read_fresh(path: Path) -> dict[str, Any]:
+    """Read the registry, reconciling it first when it is stale."""
+    data = _read(path)
+    if data.get("stamp") != _admin_stamp(path.parent):
+        data = _reconcile(path, data)
+    return data
+
+
+def entries(repo: str | Path) -> dict[str, dict[str, Any]]:
+    """All registered worktrees of the repository containing *repo*.
+
+    Reconciles with ``git worktree list`` first when the registry is stale.
+    """
+    path = registry_path(repo)
+    if path is None:
+        return {}
+    data = _read(path)
+    if data.get("stamp") != _admin_stamp(path.parent):
+        with _locked(path):
+            data = _read_fresh(path)
+            _write(path, data)
+    return data["worktrees"]
+
+
+def lookup(repo: str | Path, work_item_id: str) -> dict[str, Any] | None:
+    """Registry entry of *work_item_id* whose worktree still exists, or None."""
+    entry = entries(repo).get(work_item_id)
+    if entry is not None and Path(entry["path"]).is_dir():
+        return entry
+    path = registry_path(repo)
+    if path is None:
+        return None
+    with _locked(path):
+        data = _reconcile(path, _read(path))
+        _write(path, data)
+    entry = data["worktrees"].get(work_item_id)
+    return entry if entry is not None and Path(entry["path"]).is_dir() else None
+
+
+def owner_of(repo: str | Path, worktree_path: str | Path) -> str | None:
+    """Work item whose registered worktree contains *worktree_path*, or None."""
+    target = Path(worktree_path).resolve()
+    for wid, entry in entries(repo).items():
+        root = Path(entry["path"])
+        if target == root or root in target.parents:
+            return wid
+    return None
+
+
+def register(
+    repo: str | Path,
+    work_item_id: str,
+    worktree_path: str | Path,
+    branch: str,
+    state: str = "in_progress",
+) -> None:
+    """Record (or replace) the worktree of *work_item_id*."""
+    path = registry_path(repo)
+    if path is None:
+        return
+    with _locked(path):
+        data = _read_fresh(path)
+        data["worktrees"][work_item_id] = {
+            "path": str(Path(worktree_path).resolve()),
+            "branch": branch,
+            "state": state,
+            "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        }
+        _write(path, data)
+
+
+def set_state(repo: str | Path, work_item_id: str, state: str) -> None:
+    """Update the recorded state of a registered worktree (no-op if absent)."""
+    path = registry_path(repo)
+    if path is None:
+        return
+    with _locked(path):
+        data = _read_fresh(path)
+        entry = data["worktrees"].get(work_item_id)
+        if entry is None:
+            return
+        entry["state"] = state
+        entry["updated_at"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        _write(path, data)
+
+
+def unregister(repo: str | Path, work_item_id: str) -> None:
+    """Forget the worktree of *work_item_id*."""
+    path = registry_path(repo)
+    if path is None:
+        return
+    with _locked(path):
+        data = _read_fresh(path)
+        data["worktrees"].pop(work_item_id, None)
+        _write(path, data)
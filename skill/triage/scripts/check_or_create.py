@@ -12,14 +12,20 @@ Matching heuristics (in order of preference):
 
 If multiple candidates match, prefer the most recent. If ambiguity remains,
 attach a comment to the most recent candidate and alert triage.
+
+The JSON argument is one failure payload, or a JSON array of payloads to
+triage a whole run at once (one candidate listing, one coalesced comment per
+matched issue); the output is then an array of results in input order.
 """  # noqa: EXE001
 
+import bisect
 import json
 import re
 import shlex
 import subprocess
 import sys
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -30,6 +36,9 @@ if str(REPO_ROOT) not in sys.path:
 from skill.scripts.failure_notice import FailureNotice
 from skill.test_runner import canonicalize_quiet_pytest_command
 
+# Concurrent owner-inference lookups (git blame + git log) in batch mode.
+OWNER_INFERENCE_WORKERS = 4
+
 # ---------------------------------------------------------------------------
 # WL CLI helpers
 # ---------------------------------------------------------------------------
@@ -303,76 +312,159 @@ def _extract_top_frame(stack_trace: str) -> str | None:
     return None
 
 
-def match_heuristic_1(candidates: list[dict], test_name: str) -> dict | None:
+class CandidateIndex:
+    """Lookup structures over one candidate set, built once for all failures.
+
+    Only incomplete candidates are kept, ordered most recent first (ties keep
+    the listing order, as the stable sort in the heuristics always did), so
+    the first hit of any lookup is the preferred match:
+
+    - test names (heuristic 1) and commit hashes / CI URLs (heuristic 3) are
+      found with one ``str.find`` over a concatenation of every candidate's
+      text, mapped back to the candidate by offset — exact substring
+      semantics without a Python-level loop over candidates;
+    - title-token overlap (heuristic 2) is counted from an inverted index of
+      title tokens, so only candidates sharing enough tokens are checked for
+      the stack-trace top frame.
+
+    Candidates added later (issues planned earlier in a batch) rank after
+    the existing ones, like items appended to the candidate list.
+    """
+
+    # Separates candidates (and title from body) in the concatenated text;
+    # never part of a test name, hash or URL.
+    _SEP = "\0"
+
+    def __init__(self, candidates: list[dict]) -> None:
+        self.items: list[dict] = sorted(
+            (c for c in candidates if _is_incomplete(c)), key=_updated_at, reverse=True
+        )
+        self._title_tokens: dict[str, set[int]] = {}
+        for pos, item in enumerate(self.items):
+            self._index_tokens(pos, item)
+        self._stale = True
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, item: dict) -> None:
+        """Append *item* at the lowest precedence."""
+        if not _is_incomplete(item):
+            return
+        self.items.append(item)
+        self._index_tokens(len(self.items) - 1, item)
+        self._stale = True
+
+    def _index_tokens(self, pos: int, item: dict) -> None:
+        for token in _tokenize(_get_field(item, "title")):
+            self._title_tokens.setdefault(token, set()).add(pos)
+
+    def _texts(self) -> None:
+        """(Re)build the concatenated texts and their offset tables."""
+        if not self._stale:
+            return
+        names: list[str] = []
+        refs: list[str] = []
+        self._name_starts: list[int] = []
+        self._ref_starts: list[int] = []
+        name_len = ref_len = 0
+        for item in self.items:
+            title = _get_field(item, "title")
+            body = _get_field(item, "description")
+            # Heuristic 1 matches title OR body; heuristic 3 matches the
+            # space-joined title and body (a reference may span the join).
+            name_text = f"{title}{self._SEP}{body}{self._SEP}"
+            ref_text = f"{title} {body}{self._SEP}"
+            self._name_starts.append(name_len)
+            self._ref_starts.append(ref_len)
+            names.append(name_text)
+            refs.append(ref_text)
+            name_len += len(name_text)
+            ref_len += len(ref_text)
+        self._names = "".join(names)
+        self._refs = "".join(refs)
+        self._stale = False
+
+    @staticmethod
+    def _first(text: str, starts: list[int], needle: str) -> int | None:
+        """Position of the first candidate whose text contains *needle*."""
+        if not needle:
+            return None
+        offset = text.find(needle)
+        if offset < 0:
+            return None
+        return bisect.bisect_right(starts, offset) - 1
+
+    def by_test_name(self, test_name: str) -> dict | None:
+        """Heuristic 1 lookup: most recent candidate naming *test_name*."""
+        self._texts()
+        pos = self._first(self._names, self._name_starts, test_name)
+        return None if pos is None else self.items[pos]
+
+    def by_tokens_and_frame(self, test_tokens: set, top_frame: str) -> dict | None:
+        """Heuristic 2 lookup: enough title-token overlap and *top_frame* in body."""
+        counts: dict[int, int] = {}
+        for token in test_tokens:
+            for pos in self._title_tokens.get(token, ()):
+                counts[pos] = counts.get(pos, 0) + 1
+        needed = max(1, len(test_tokens) * 0.5)
+        for pos in sorted(p for p, n in counts.items() if n >= needed):
+            if top_frame in _get_field(self.items[pos], "description"):
+                return self.items[pos]
+        return None
+
+    def by_reference(self, commit_hash: str | None, ci_url: str | None) -> dict | None:
+        """Heuristic 3 lookup: most recent candidate citing the commit or CI URL."""
+        self._texts()
+        hits = [
+            pos for pos in (
+                self._first(self._refs, self._ref_starts, commit_hash or ""),
+                self._first(self._refs, self._ref_starts, ci_url or ""),
+            )
+            if pos is not None
+        ]
+        return self.items[min(hits)] if hits else None
+
+
+def _as_index(candidates: list[dict] | CandidateIndex) -> CandidateIndex:
+    return candidates if isinstance(candidates, CandidateIndex) else CandidateIndex(candidates)
+
+
+def match_heuristic_1(candidates: list[dict] | CandidateIndex, test_name: str) -> dict | None:
     """Heuristic 1: Exact test name match in title or body."""
-    matches = []
-    for c in candidates:
-        if not _is_incomplete(c):
-            continue
-        title = _get_field(c, "title")
-        body = _get_field(c, "description")
-        if test_name and (test_name in title or test_name in body):
-            matches.append(c)
-    if not matches:
+    if not test_name:
         return None
-    # Prefer most recent
-    matches.sort(key=_updated_at, reverse=True)
-    return matches[0]
+    return _as_index(candidates).by_test_name(test_name)
 
 
 def match_heuristic_2(
-    candidates: list[dict], test_name: str, stack_trace: str
+    candidates: list[dict] | CandidateIndex,
+    test_name: str,
+    stack_trace: str,
+    top_frame: str | None = None,
 ) -> dict | None:
-    """Heuristic 2: Title token overlap + matching stacktrace top-frame."""
+    """Heuristic 2: Title token overlap + matching stacktrace top-frame.
+
+    *top_frame* may be passed when already extracted from *stack_trace*.
+    """
     if not stack_trace:
         return None
-    top_frame = _extract_top_frame(stack_trace)
+    top_frame = top_frame or _extract_top_frame(stack_trace)
     if not top_frame:
         return None
     test_tokens = _tokenize(test_name) if test_name else set()
     if not test_tokens:
         return None
-
-    matches = []
-    for c in candidates:
-        if not _is_incomplete(c):
-            continue
-        title_tokens = _tokenize(_get_field(c, "title"))
-        overlap = test_tokens & title_tokens
-        if len(overlap) < max(1, len(test_tokens) * 0.5):
-            continue
-        # Check if top frame appears in body
-        body = _get_field(c, "description")
-        if top_frame in body:
-            matches.append(c)
-
-    if not matches:
-        return None
-    matches.sort(key=_updated_at, reverse=True)
-    return matches[0]
+    return _as_index(candidates).by_tokens_and_frame(test_tokens, top_frame)
 
 
 def match_heuristic_3(
-    candidates: list[dict], commit_hash: str | None, ci_url: str | None
+    candidates: list[dict] | CandidateIndex, commit_hash: str | None, ci_url: str | None
 ) -> dict | None:
     """Heuristic 3: CI job URL or failing commit hash match."""
     if not commit_hash and not ci_url:
         return None
-
-    matches = []
-    for c in candidates:
-        if not _is_incomplete(c):
-            continue
-        body = _get_field(c, "description")
-        title = _get_field(c, "title")
-        text = title + " " + body
-        if commit_hash and commit_hash in text or ci_url and ci_url in text:
-            matches.append(c)
-
-    if not matches:
-        return None
-    matches.sort(key=_updated_at, reverse=True)
-    return matches[0]
+    return _as_index(candidates).by_reference(commit_hash, ci_url)
 
 
 # ---------------------------------------------------------------------------
@@ -380,108 +472,269 @@ def match_heuristic_3(
 # ---------------------------------------------------------------------------
 
 
-def check_or_create(payload: dict[str, Any]) -> dict[str, Any]:
-    """Core logic: search for or create a critical test-failure issue.
+def _parse_failure(payload: dict[str, Any]) -> dict[str, Any]:
+    """Normalize one failure payload (flat or nested ``failure_signature``)."""
+    sig = payload.get("failure_signature")
+    if not isinstance(sig, dict):
+        sig = {}
+    failure = {
+        "test_name": payload.get("test_name") or sig.get("test_name"),
+        "stdout_excerpt": payload.get("stdout_excerpt") or sig.get("stdout_excerpt", ""),
+        "stack_trace": payload.get("stack_trace") or sig.get("stack_trace", ""),
+        "commit_hash": payload.get("commit_hash") or sig.get("commit_hash"),
+        "ci_url": payload.get("ci_url") or sig.get("ci_url"),
+        "repo_path": payload.get("repo_path", "."),
+        "file_path": payload.get("file_path") or sig.get("file_path"),
+        "parent_work_item_id": payload.get("parent_work_item_id"),
+    }
+    failure["top_frame"] = (
+        _extract_top_frame(failure["stack_trace"]) if failure["stack_trace"] else None
+    )
+    return failure
 
-    Returns a structured dict with issueId, created, matchedId, reason.
-    
-    Supports parent_work_item_id to create child work items for test failures.
-    """
-    # Parse input — support both flat and nested failure_signature formats
-    sig = payload.get("failure_signature", {})
-    test_name = payload.get("test_name") or sig.get("test_name")
-    stdout_excerpt = payload.get("stdout_excerpt") or sig.get("stdout_excerpt", "")
-    stack_trace = payload.get("stack_trace") or sig.get("stack_trace", "")
-    commit_hash = payload.get("commit_hash") or sig.get("commit_hash")
-    ci_url = payload.get("ci_url") or sig.get("ci_url")
-    repo_path = payload.get("repo_path", ".")
-    file_path = payload.get("file_path") or sig.get("file_path")
-    parent_work_item_id = payload.get("parent_work_item_id")
 
-    if not test_name:
-        return {"error": "test_name is required"}
+def _find_match(
+    index: CandidateIndex, failure: dict[str, Any]
+) -> tuple[dict | None, str | None]:
+    """Run heuristics 1-3 in order; return ``(match, heuristic_name)``."""
+    match = match_heuristic_1(index, failure["test_name"])
+    if match:
+        return match, "exact_test_name"
+    match = match_heuristic_2(
+        index, failure["test_name"], failure["stack_trace"], failure["top_frame"]
+    )
+    if match:
+        return match, "token_overlap_stacktrace"
+    match = match_heuristic_3(index, failure["commit_hash"], failure["ci_url"])
+    if match:
+        return match, "commit_or_ci_url"
+    return None, None
 
-    # Fetch candidates
-    candidates = list_critical_issues()
 
-    # Run heuristics in order
-    heuristic_name = None
-    match = match_heuristic_1(candidates, test_name)
-    if match:
-        heuristic_name = "exact_test_name"
-    if not match:
-        match = match_heuristic_2(candidates, test_name, stack_trace)
-        if match:
-            heuristic_name = "token_overlap_stacktrace"
-    if not match:
-        match = match_heuristic_3(candidates, commit_hash, ci_url)
-        if match:
-            heuristic_name = "commit_or_ci_url"
+def _evidence_lines(failure: dict[str, Any]) -> list[str]:
+    """Evidence block for one failure, as added to a matched issue."""
+    lines: list[str] = []
+    if failure["stdout_excerpt"]:
+        lines += ["", "stdout excerpt:", "```", failure["stdout_excerpt"][:1000], "```"]
+    if failure["stack_trace"]:
+        lines += ["", "Stack trace:", "```", failure["stack_trace"], "```"]
+    if failure["commit_hash"]:
+        lines.append(f"\nFailing commit: {failure['commit_hash']}")
+    return lines
 
-    if match:
-        issue_id = _get_id(match)
-        # Advance stage to intake_complete if still in idea or unset
-        current_stage = _get_field(match, "stage")
-        if not current_stage or current_stage == "idea":
-            run_wl(["update", issue_id, "--stage", "intake_complete", "--json"])
-        # Enhance existing issue with new evidence
-        comment_lines = ["Additional evidence from triage helper:"]
-        if stdout_excerpt:
-            comment_lines += [
-                "",
-                "stdout excerpt:",
-                "```",
-                stdout_excerpt[:1000],
-                "```",
-            ]
-        if stack_trace:
-            comment_lines += ["", "Stack trace:", "```", stack_trace, "```"]
-        if commit_hash:
-            comment_lines.append(f"\nFailing commit: {commit_hash}")
-        add_comment(issue_id, "\n".join(comment_lines))
-        
-        # If parent_work_item_id is provided, add dependency so the existing
-        # issue blocks the parent work item (ensures it gets fixed)
-        if parent_work_item_id:
-            add_dependency(parent_work_item_id, issue_id)
-            emit_event(
-                "triage.issue.blocking_child",
-                {"issueId": issue_id, "parentWorkItemId": parent_work_item_id, "heuristic": heuristic_name}
-            )
-        else:
-            emit_event(
-                "triage.issue.enhanced", {"issueId": issue_id, "heuristic": heuristic_name}
-            )
-        return {
-            "issueId": issue_id,
-            "created": False,
-            "matchedId": issue_id,
-            "reason": f"matched_existing ({heuristic_name})",
-        }
 
-    # No match — create a new issue using the template
-    owner_info = infer_owner(repo_path, file_path)
+def _evidence_comment(failures: list[dict[str, Any]]) -> str:
+    """One comment carrying the evidence of every failure matched to an issue.
+
+    A single failure keeps the original comment layout; several failures
+    are listed under a heading per test name.
+    """
+    comment_lines = ["Additional evidence from triage helper:"]
+    if len(failures) == 1:
+        comment_lines += _evidence_lines(failures[0])
+    else:
+        for failure in failures:
+            comment_lines += ["", f"### {failure['test_name']}"]
+            comment_lines += _evidence_lines(failure)
+    return "\n".join(comment_lines)
+
+
+def _infer_owners(keys: list[tuple[str, str | None]]) -> dict[tuple[str, str | None], dict[str, Any]]:
+    """Infer owners for distinct ``(repo_path, file_path)`` keys in parallel.
+
+    Each key runs ``infer_owner`` once (git blame + git log) however many
+    failures point at the same file.
+    """
+    unique = list(dict.fromkeys(keys))
+    if len(unique) <= 1:
+        return {key: infer_owner(*key) for key in unique}
+    workers = min(OWNER_INFERENCE_WORKERS, len(unique))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        owners = list(pool.map(lambda key: infer_owner(*key), unique))
+    return dict(zip(unique, owners))
+
+
+def _enhance_issue(
+    issue_id: str,
+    item: dict[str, Any],
+    failures: list[dict[str, Any]],
+    heuristic_name: str | None,
+) -> None:
+    """Add the evidence of *failures* to an existing issue.
+
+    Advances the stage to ``intake_complete`` when still in idea or unset,
+    adds one coalesced evidence comment, and makes each distinct parent
+    work item depend on the issue (so it gets fixed).
+    """
+    current_stage = _get_field(item, "stage")
+    if not current_stage or current_stage == "idea":
+        run_wl(["update", issue_id, "--stage", "intake_complete", "--json"])
+    add_comment(issue_id, _evidence_comment(failures))
+
+    parents = [
+        p for p in dict.fromkeys(f["parent_work_item_id"] for f in failures)
+        if p
+    ]
+    for parent_work_item_id in parents:
+        add_dependency(parent_work_item_id, issue_id)
+        emit_event(
+            "triage.issue.blocking_child",
+            {"issueId": issue_id, "parentWorkItemId": parent_work_item_id, "heuristic": heuristic_name}
+        )
+    if not parents:
+        emit_event(
+            "triage.issue.enhanced", {"issueId": issue_id, "heuristic": heuristic_name}
+        )
+
 
+def _create_for_failure(failure: dict[str, Any], owner_info: dict[str, Any]) -> str | None:
+    """Create the critical issue for *failure*; return its id (None on failure)."""
+    test_name = failure["test_name"]
     title = f"[test-failure] {test_name} — failing test"
     body = render_template(
         test_name=test_name,
-        stdout_excerpt=stdout_excerpt,
-        stack_trace=stack_trace,
-        commit_hash=commit_hash,
-        ci_url=ci_url,
+        stdout_excerpt=failure["stdout_excerpt"],
+        stack_trace=failure["stack_trace"],
+        commit_hash=failure["commit_hash"],
+        ci_url=failure["ci_url"],
         owner_info=owner_info,
     )
 
-    created = create_issue(title, body, parent_id=parent_work_item_id)
+    created = create_issue(title, body, parent_id=failure["parent_work_item_id"])
     if not created:
-        return {"error": "failed to create issue via wl create"}
+        return None
 
     new_id = None
     if isinstance(created, dict):
         new_id = created.get("id") or (created.get("workItem") or {}).get("id")
 
     emit_event("triage.issue.created", {"issueId": new_id, "testName": test_name})
-    return {"issueId": new_id, "created": True, "reason": "created_new"}
+    return new_id
+
+
+def check_or_create_batch(payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Triage every failure of a run against one candidate listing.
+
+    Candidates are fetched once (``list_critical_issues``) into a
+    :class:`CandidateIndex` and each failure is matched in order. Issues planned for earlier failures in the batch
+    join the candidate set, so repeated signatures link to the same new
+    issue instead of creating duplicates. Evidence for failures matched to
+    the same issue is coalesced into one comment (one stage update, one
+    dependency per parent), and owner inference for the issues to create
+    runs in parallel, memoized by file. If creating a planned issue fails,
+    the failures matched to it fall back to :func:`check_or_create` one by
+    one.
+
+    Returns one result per payload, in input order, each shaped like the
+    :func:`check_or_create` result. Payloads that are not JSON objects or
+    lack a test name get an ``error`` result at their position.
+    """
+    results: list[dict[str, Any] | None] = [None] * len(payloads)
+    failures: list[dict[str, Any] | None] = []
+    for i, payload in enumerate(payloads):
+        if not isinstance(payload, dict):
+            results[i] = {"error": "failure payload must be a JSON object"}
+            failures.append(None)
+            continue
+        failure = _parse_failure(payload)
+        if not failure["test_name"]:
+            results[i] = {"error": "test_name is required"}
+        failures.append(failure)
+    if all(r is not None for r in results):
+        return results  # type: ignore[return-value]
+
+    index = CandidateIndex(list_critical_issues())
+
+    # Pass 1: match in order. Existing issues collect their failures;
+    # unmatched failures plan a creation whose rendered body becomes a
+    # candidate for the failures after it.
+    matched: dict[str, dict[str, Any]] = {}
+    planned: list[dict[str, Any]] = []
+    for i, failure in enumerate(failures):
+        if results[i] is not None:
+            continue
+        match, heuristic_name = _find_match(index, failure)
+        if match is not None and match.get("_planned") is not None:
+            plan = planned[match["_planned"]]
+            plan["extra"].append((i, heuristic_name))
+            continue
+        if match is not None:
+            issue_id = _get_id(match)
+            group = matched.setdefault(
+                issue_id, {"item": match, "indices": [], "heuristics": []}
+            )
+            group["indices"].append(i)
+            group["heuristics"].append(heuristic_name)
+            continue
+        placeholder = render_template(
+            test_name=failure["test_name"],
+            stdout_excerpt=failure["stdout_excerpt"],
+            stack_trace=failure["stack_trace"],
+            commit_hash=failure["commit_hash"],
+            ci_url=failure["ci_url"],
+            owner_info={},
+        )
+        index.add({
+            "_planned": len(planned),
+            "title": f"[test-failure] {failure['test_name']} — failing test",
+            "description": placeholder,
+            "status": "open",
+        })
+        planned.append({"index": i, "extra": []})
+
+    # Pass 2: enhance matched issues — one update/comment/dep per issue.
+    for issue_id, group in matched.items():
+        group_failures = [failures[i] for i in group["indices"]]
+        _enhance_issue(issue_id, group["item"], group_failures, group["heuristics"][0])
+        for i, heuristic_name in zip(group["indices"], group["heuristics"]):
+            results[i] = {
+                "issueId": issue_id,
+                "created": False,
+                "matchedId": issue_id,
+                "reason": f"matched_existing ({heuristic_name})",
+            }
+
+    # Pass 3: infer owners in parallel, then create the planned issues.
+    owners = _infer_owners([
+        (failures[plan["index"]]["repo_path"], failures[plan["index"]]["file_path"])
+        for plan in planned
+    ])
+    for plan in planned:
+        failure = failures[plan["index"]]
+        owner_info = owners[(failure["repo_path"], failure["file_path"])]
+        new_id = _create_for_failure(failure, owner_info)
+        if new_id is None:
+            results[plan["index"]] = {"error": "failed to create issue via wl create"}
+            # The extras only matched the issue that was never created:
+            # triage each on its own against a fresh candidate listing.
+            for i, _ in plan["extra"]:
+                results[i] = check_or_create(payloads[i])
+            continue
+        results[plan["index"]] = {"issueId": new_id, "created": True, "reason": "created_new"}
+        if not plan["extra"]:
+            continue
+        extra_failures = [failures[i] for i, _ in plan["extra"]]
+        _enhance_issue(new_id, {"stage": "intake_complete"}, extra_failures, plan["extra"][0][1])
+        for i, heuristic_name in plan["extra"]:
+            results[i] = {
+                "issueId": new_id,
+                "created": False,
+                "matchedId": new_id,
+                "reason": f"matched_existing ({heuristic_name})",
+            }
+
+    return results  # type: ignore[return-value]
+
+
+def check_or_create(payload: dict[str, Any]) -> dict[str, Any]:
+    """Core logic: search for or create a critical test-failure issue.
+
+    Returns a structured dict with issueId, created, matchedId, reason.
+    
+    Supports parent_work_item_id to create child work items for test failures.
+    Triaging a whole run's failures? Use :func:`check_or_create_batch`.
+    """
+    return check_or_create_batch([payload])[0]
 
 
 def main():
@@ -520,6 +773,19 @@ def _main():
         print(notice.wrap(err))
         sys.exit(2)
 
+    if isinstance(payload, list):
+        results = check_or_create_batch(payload)
+        errors = [r["error"] for r in results if "error" in r]
+        if errors:
+            notice = FailureNotice(
+                script_name="check_or_create.py",
+                reason=f"{len(errors)} of {len(results)} failures not triaged: {errors[0]}",
+            )
+            print(notice.wrap(json.dumps(results)))
+            sys.exit(2)
+        print(json.dumps(results))
+        return
+
     result = check_or_create(payload)
     if "error" in result:
         notice = FailureNotice(
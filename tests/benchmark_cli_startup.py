@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark start-up cost of the implement.py and audit_runner.py CLIs.
+
+Shell loops invoke these scripts hundreds of times a day, so everything a
+bare ``--help`` pays for is overhead on every call. For each CLI this
+harness measures, in fresh interpreters:
+
+- ``import_ms``      — ``python -X importtime`` cumulative time of importing
+                       the CLI module (median over ``--runs``), against
+                       ``BUDGETS_MS``
+- ``heavy_modules``  — which of ``HEAVY_MODULES`` the import pulled in
+                       (each must only be imported by the code path using it)
+- ``script_help_ms`` — wall time of ``python <script> --help``; the script
+                       is compiled on every call because ``__main__`` is
+                       never cached
+- ``module_help_ms`` — wall time of ``python -m <module> --help``, which
+                       runs from cached bytecode (the pre-compiled entry
+                       point)
+
+Bytecode is written to a temporary ``PYTHONPYCACHEPREFIX`` by one warm-up
+run, so results do not depend on the state of ``__pycache__`` in the tree.
+
+Run (from repo root):
+
+    python3 tests/benchmark_cli_startup.py
+    python3 tests/benchmark_cli_startup.py --runs 15 --json
+"""  # noqa: EXE001
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+CLIS = {
+    "implement": "skill.implement.scripts.implement",
+    "audit_runner": "skill.audit.scripts.audit_runner",
+}
+
+# Cumulative import-time ceilings (ms) with warm bytecode. Both CLIs import
+# in 80-100 ms on a loaded CI container; the headroom absorbs noisy runners,
+# while HEAVY_MODULES catches an eager heavy import deterministically.
+BUDGETS_MS = {
+    "implement": 150.0,
+    "audit_runner": 200.0,
+}
+
+# Modules that cost tens of milliseconds and are only needed on specific
+# code paths (HTTP slot/mode queries, the repo index, parallel fan-out).
+HEAVY_MODULES = ("urllib.request", "http.client", "sqlite3", "concurrent.futures")
+
+DEFAULT_RUNS = int(os.environ.get("CLI_STARTUP_BENCH_RUNS", "5"))
+
+
+def _env(pycache: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = pycache
+    env["PYTHONPATH"] = str(REPO_ROOT)
+    return env
+
+
+def _script_path(module: str) -> Path:
+    return REPO_ROOT.joinpath(*module.split(".")).with_suffix(".py")
+
+
+def measure_import(module: str, env: dict[str, str], cwd: str) -> tuple[float, set[str]]:
+    """Import *module* in a fresh interpreter under ``-X importtime``.
+
+    Returns:
+        (cumulative import time of *module* in ms, names of all modules
+        imported by the process).
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, env=env, cwd=cwd, check=True,
+    )
+    cumulative = None
+    imported = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line.split("|")
+        name = name.strip()
+        imported.add(name)
+        if name == module:
+            cumulative = int(cum) / 1000.0
+    if cumulative is None:
+        raise RuntimeError(f"{module} missing from -X importtime output")
+    return cumulative, imported
+
+
+def _wall_ms(cmd: list[str], env: dict[str, str], cwd: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(cmd, capture_output=True, env=env, cwd=cwd, check=True)
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples)
+
+
+def run_benchmark(runs: int = DEFAULT_RUNS, wall_clock: bool = True) -> dict[str, dict]:
+    """Measure every CLI in ``CLIS``; see the module docstring for fields."""
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        pycache = os.path.join(tmp, "pycache")
+        # Launch from outside any git checkout, as a shell loop in a scratch
+        # directory would; the CLIs must not need the cwd to start.
+        cwd = os.path.join(tmp, "cwd")
+        os.mkdir(cwd)
+        env = _env(pycache)
+        for name, module in CLIS.items():
+            measure_import(module, env, cwd)  # warm-up: writes bytecode
+            samples = []
+            imported: set[str] = set()
+            for _ in range(runs):
+                cumulative, imported = measure_import(module, env, cwd)
+                samples.append(cumulative)
+            result = {
+                "import_ms": round(statistics.median(samples), 1),
+                "budget_ms": BUDGETS_MS[name],
+                "heavy_modules": sorted(m for m in HEAVY_MODULES if m in imported),
+            }
+            if wall_clock:
+                script = str(_script_path(module))
+                result["script_help_ms"] = round(
+                    _wall_ms([sys.executable, script, "--help"], env, cwd, runs), 1
+                )
+                result["module_help_ms"] = round(
+                    _wall_ms([sys.executable, "-m", module, "--help"], env, cwd, runs), 1
+                )
+            results[name] = result
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS,
+                        help=f"samples per measurement (default: {DEFAULT_RUNS})")
+    parser.add_argument("--json", action="store_true", help="emit JSON only")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(runs=args.runs)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    for name, r in results.items():
+        status = "ok" if r["import_ms"] <= r["budget_ms"] and not r["heavy_modules"] else "OVER"
+        print(f"{name}: import {r['import_ms']:.1f} ms (budget {r['budget_ms']:.0f} ms) [{status}]")
+        if r["heavy_modules"]:
+            print(f"  heavy modules imported eagerly: {', '.join(r['heavy_modules'])}")
+        print(f"  --help: script {r['script_help_ms']:.1f} ms, "
+              f"python -m {CLIS[name]} {r['module_help_ms']:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
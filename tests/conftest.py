@@ -69,3 +69,19 @@ def _default_resolvable_ownership():
         audit_runner, "_resolve_owning_project_root", side_effect=_resolvable
     ):
         yield
+
+
+@pytest.fixture(autouse=True)
+def _isolated_linter_probe_cache(monkeypatch):
+    """Keep linter probe results from leaking between tests or to the host.
+
+    ``probe_linter`` memoizes per process and persists to a host-wide JSON
+    cache. Tests patch ``shutil.which`` to simulate (un)available linters,
+    so disable persistence and start every test with an empty memo.
+    """
+    from skill.code_review.scripts import detection
+
+    monkeypatch.setenv(detection.PROBE_CACHE_ENV, "")
+    detection.clear_probe_cache()
+    yield
+    detection.clear_probe_cache()
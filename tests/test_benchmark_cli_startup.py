@@ -0,0 +1,91 @@
+"""Start-up budget tests for the implement.py and audit_runner.py CLIs.
+
+Uses the ``benchmark_cli_startup.py`` harness:
+
+- importing either CLI stays within its ``-X importtime`` budget;
+- neither import pulls in a heavy module (urllib/http, sqlite3,
+  concurrent.futures) that only specific code paths need;
+- importing never spawns ``git``; ``audit_runner.TARGET_PROJECT_ROOT`` is
+  detected on first access instead;
+- both CLIs run as ``python -m <module>`` (the pre-compiled entry point).
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import benchmark_cli_startup as bench  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def results():
+    return bench.run_benchmark(runs=3, wall_clock=False)
+
+
+@pytest.mark.parametrize("name", sorted(bench.CLIS))
+def test_import_within_budget(results, name):
+    assert results[name]["import_ms"] <= bench.BUDGETS_MS[name], results[name]
+
+
+@pytest.mark.parametrize("name", sorted(bench.CLIS))
+def test_no_heavy_modules_at_import(results, name):
+    assert results[name]["heavy_modules"] == []
+
+
+@pytest.fixture
+def git_spy(tmp_path):
+    """PATH with a ``git`` wrapper that logs each invocation."""
+    real_git = subprocess.run(
+        ["sh", "-c", "command -v git"], capture_output=True, text=True, check=True
+    ).stdout.strip()
+    log = tmp_path / "git.log"
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    spy = bin_dir / "git"
+    spy.write_text(f'#!/bin/sh\necho "$@" >> "{log}"\nexec "{real_git}" "$@"\n')
+    spy.chmod(0o755)
+    env = dict(os.environ, PATH=f"{bin_dir}{os.pathsep}{os.environ['PATH']}",
+               PYTHONPATH=str(bench.REPO_ROOT))
+    return env, log
+
+
+def _python(code, env, cwd):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+        env=env, cwd=str(cwd), check=True,
+    ).stdout.strip()
+
+
+def test_import_spawns_no_git(git_spy, tmp_path):
+    env, log = git_spy
+    for module in bench.CLIS.values():
+        _python(f"import {module}", env, bench.REPO_ROOT)
+    assert not log.exists()
+
+
+def test_target_project_root_detected_on_first_access(git_spy):
+    env, log = git_spy
+    root = _python(
+        "from skill.audit.scripts import audit_runner as m\n"
+        "print(m.TARGET_PROJECT_ROOT)\n"
+        "print(m._target_project_root() is m.TARGET_PROJECT_ROOT)",
+        env, bench.REPO_ROOT / "skill",
+    )
+    assert root.splitlines() == [str(bench.REPO_ROOT), "True"]
+    assert log.read_text().splitlines() == ["rev-parse --show-toplevel"]
+
+
+@pytest.mark.parametrize("module", sorted(bench.CLIS.values()))
+def test_module_entry_point(module, tmp_path):
+    env = dict(os.environ, PYTHONPATH=str(bench.REPO_ROOT))
+    proc = subprocess.run(
+        [sys.executable, "-m", module, "--help"],
+        capture_output=True, text=True, env=env, cwd=str(tmp_path),
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "usage:" in proc.stdout
@@ -0,0 +1,109 @@
+"""Unit tests for skill/build_cache.py — the per-worktree build cache.
+
+Covers the input fingerprint (tracked edits, untracked files, ignored files,
+configured globs), record lookup/store, and that a worktree moved by
+``git worktree move`` (as the implement worktree pool does) keeps its record.
+"""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from skill import build_cache
+from skill.build_cache import cache_path, compute_input_hash, lookup, store
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=str(cwd), check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    root = tmp_path / "repo"
+    (root / "src").mkdir(parents=True)
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "t@example.invalid")
+    _git(root, "config", "user.name", "T")
+    (root / ".gitignore").write_text("dist/\n")
+    (root / "package.json").write_text('{"scripts": {"build": "tsc"}}\n')
+    (root / "src" / "app.ts").write_text("export const x = 1;\n")
+    (root / "README.md").write_text("readme\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+    return root
+
+
+def test_hash_tracks_source_changes(repo, monkeypatch):
+    monkeypatch.delenv(build_cache.BUILD_INPUT_GLOBS_ENV, raising=False)
+    base = compute_input_hash(repo)
+    assert base and compute_input_hash(repo) == base
+
+    (repo / "dist").mkdir()
+    (repo / "dist" / "app.js").write_text("built\n")
+    assert compute_input_hash(repo) == base  # ignored outputs are not inputs
+
+    (repo / "src" / "app.ts").write_text("export const x = 2;\n")
+    edited = compute_input_hash(repo)
+    assert edited != base
+
+    (repo / "src" / "new.ts").write_text("export {};\n")
+    assert compute_input_hash(repo) not in (base, edited)
+
+
+def test_globs_limit_inputs(repo):
+    base = compute_input_hash(repo, globs=["src/**"])
+    (repo / "README.md").write_text("changed\n")
+    assert compute_input_hash(repo, globs=["src/**"]) == base
+    (repo / "package.json").write_text('{"scripts": {"build": "tsc -b"}}\n')
+    assert compute_input_hash(repo, globs=["src/**"]) != base
+
+
+def test_not_a_git_tree(tmp_path):
+    assert compute_input_hash(tmp_path) is None
+
+
+def test_store_and_lookup(repo):
+    inputs = compute_input_hash(repo)
+    assert lookup("npm run build", inputs, cwd=repo) is None
+    store("npm run build", inputs, cwd=repo)
+    assert lookup("npm run build", inputs, cwd=repo)["inputs"] == inputs
+    assert lookup("npm run build:prod", inputs, cwd=repo) is None
+    assert lookup("npm run build", "other", cwd=repo) is None
+
+    cache_path(repo).write_text("{corrupt")
+    assert lookup("npm run build", inputs, cwd=repo) is None
+
+
+def test_record_survives_worktree_move(repo, tmp_path):
+    wt = tmp_path / "wt"
+    _git(repo, "worktree", "add", "-q", "--detach", str(wt))
+    inputs = compute_input_hash(wt)
+    store("npm run build", inputs, cwd=wt)
+    assert lookup("npm run build", inputs, cwd=repo) is None  # per worktree
+
+    moved = tmp_path / "parked"
+    _git(repo, "worktree", "move", str(wt), str(moved))
+    assert lookup("npm run build", compute_input_hash(moved), cwd=moved) is not None
+
+
+
+def test_deleted_outputs_force_a_rebuild(repo):
+    import shutil
+
+    (repo / "dist").mkdir()
+    (repo / "dist" / "app.js").write_text("built\n")
+    inputs = compute_input_hash(repo)
+    store("npm run build", inputs, cwd=repo)
+    assert lookup("npm run build", inputs, cwd=repo)["outputs"] == ["dist/"]
+
+    shutil.rmtree(repo / "dist")
+    assert compute_input_hash(repo) == inputs
+    assert lookup("npm run build", inputs, cwd=repo) is None
+
+    (repo / "dist").mkdir()
+    (repo / "dist" / "app.js").write_text("built\n")
+    assert lookup("npm run build", inputs, cwd=repo) is not None
+    _git(repo, "clean", "-fdxq")
+    assert lookup("npm run build", inputs, cwd=repo) is None
@@ -3,6 +3,8 @@
 import json
 import sys
 
+import pytest
+
 import skill.triage.scripts.check_or_create as cc
 
 # ---------------------------------------------------------------------------
@@ -605,3 +607,294 @@ def test_main_cli(monkeypatch, capsys):
     out = json.loads(captured.out)
     assert out["created"] is True
     assert out["issueId"] == "SA-CLI"
+
+
+# ---------------------------------------------------------------------------
+# Batch mode
+# ---------------------------------------------------------------------------
+
+
+def _batch_fake_wl(calls, items, created_ids):
+    """Fake run_wl recording every call; ``create`` pops ids from *created_ids*."""
+
+    def fake_run_wl(args):
+        calls.append(list(args))
+        if args and args[0] == "list":
+            return json.dumps({"success": True, "count": len(items), "workItems": items})
+        if args and args[0] == "create":
+            return json.dumps({"id": created_ids.pop(0)})
+        return "{}"
+
+    return fake_run_wl
+
+
+def test_batch_lists_candidates_once(monkeypatch):
+    """A 50-failure run makes the same two listing calls as a single failure."""
+    calls = []
+    items = [{
+        "id": "SA-EX",
+        "title": "[test-failure] test_batch_0 — failing",
+        "description": "Test name: test_batch_0",
+        "status": "open",
+        "updatedAt": "2026-02-20T00:00:00Z",
+    }]
+    monkeypatch.setattr(
+        cc, "run_wl", _batch_fake_wl(calls, items, [f"SA-N{i}" for i in range(50)])
+    )
+    monkeypatch.setattr(
+        cc, "infer_owner",
+        lambda *a, **kw: {"assignee": "Build", "confidence": 0.0, "reason": "fallback"},
+    )
+
+    results = cc.check_or_create_batch(
+        [{"test_name": f"test_batch_{i}", "stdout_excerpt": "err"} for i in range(50)]
+    )
+
+    assert len(results) == 50
+    assert [c[0] for c in calls].count("list") == 2
+    assert results[0]["matchedId"] == "SA-EX"
+    assert all(r["created"] for r in results[1:])
+    assert [r["issueId"] for r in results[1:]] == [f"SA-N{i}" for i in range(49)]
+
+
+def test_batch_coalesces_evidence_per_matched_issue(monkeypatch):
+    """Failures matching the same issue share one comment and one dependency."""
+    calls = []
+    items = [{
+        "id": "SA-HASH",
+        "title": "[test-failure] flaky suite",
+        "description": "Failing commit: abc123",
+        "status": "open",
+        "updatedAt": "2026-02-20T00:00:00Z",
+    }]
+    monkeypatch.setattr(cc, "run_wl", _batch_fake_wl(calls, items, []))
+
+    results = cc.check_or_create_batch([
+        {"test_name": "test_one", "stdout_excerpt": "one failed",
+         "commit_hash": "abc123", "parent_work_item_id": "SA-PARENT"},
+        {"test_name": "test_two", "stdout_excerpt": "two failed",
+         "commit_hash": "abc123", "parent_work_item_id": "SA-PARENT"},
+    ])
+
+    assert [r["matchedId"] for r in results] == ["SA-HASH", "SA-HASH"]
+    comments = [c for c in calls if c[0] == "comment"]
+    assert len(comments) == 1
+    body = comments[0][comments[0].index("--comment") + 1]
+    assert "### test_one" in body and "one failed" in body
+    assert "### test_two" in body and "two failed" in body
+    assert [c for c in calls if c[0] == "dep"] == [["dep", "add", "SA-PARENT", "SA-HASH", "--json"]]
+    assert len([c for c in calls if c[0] == "update"]) == 1
+
+
+def test_batch_repeated_signature_creates_one_issue(monkeypatch):
+    """A test failing twice in one run links to the issue created for it."""
+    calls = []
+    monkeypatch.setattr(cc, "run_wl", _batch_fake_wl(calls, [], ["SA-NEW", "SA-DUP"]))
+    monkeypatch.setattr(
+        cc, "infer_owner",
+        lambda *a, **kw: {"assignee": "Build", "confidence": 0.0, "reason": "fallback"},
+    )
+
+    results = cc.check_or_create_batch([
+        {"test_name": "test_same", "stdout_excerpt": "first"},
+        {"test_name": "test_same", "stdout_excerpt": "second"},
+    ])
+
+    assert results[0] == {"issueId": "SA-NEW", "created": True, "reason": "created_new"}
+    assert results[1]["created"] is False
+    assert results[1]["matchedId"] == "SA-NEW"
+    assert len([c for c in calls if c[0] == "create"]) == 1
+    comments = [c for c in calls if c[0] == "comment"]
+    assert len(comments) == 1 and comments[0][2] == "SA-NEW"
+
+
+def test_batch_failed_create_retries_matched_failures_alone(monkeypatch):
+    """When the planned create fails, its repeats are triaged on their own."""
+    calls = []
+    creates = iter([None, json.dumps({"id": "SA-RETRY"})])
+
+    def fake_run_wl(args):
+        calls.append(list(args))
+        if args[0] == "list":
+            return json.dumps({"success": True, "count": 0, "workItems": []})
+        if args[0] == "create":
+            return next(creates)
+        return "{}"
+
+    monkeypatch.setattr(cc, "run_wl", fake_run_wl)
+    monkeypatch.setattr(
+        cc, "infer_owner",
+        lambda *a, **kw: {"assignee": "Build", "confidence": 0.0, "reason": "fallback"},
+    )
+
+    results = cc.check_or_create_batch([
+        {"test_name": "test_same", "stdout_excerpt": "first"},
+        {"test_name": "test_same", "stdout_excerpt": "second"},
+    ])
+
+    assert results[0] == {"error": "failed to create issue via wl create"}
+    assert results[1] == {"issueId": "SA-RETRY", "created": True, "reason": "created_new"}
+    assert len([c for c in calls if c[0] == "create"]) == 2
+
+
+def test_batch_owner_inference_memoized_by_file(monkeypatch):
+    """Owner inference runs once per distinct file, whatever the failure count."""
+    inferred = []
+
+    def fake_infer(repo_path, file_path):
+        inferred.append(file_path)
+        return {"assignee": f"owner-of-{file_path}", "confidence": 1.0, "reason": "blame"}
+
+    calls = []
+    monkeypatch.setattr(
+        cc, "run_wl", _batch_fake_wl(calls, [], [f"SA-N{i}" for i in range(6)])
+    )
+    monkeypatch.setattr(cc, "infer_owner", fake_infer)
+
+    results = cc.check_or_create_batch([
+        {"test_name": f"test_owner_{i}", "file_path": f"tests/test_{i % 2}.py"}
+        for i in range(6)
+    ])
+
+    assert all(r["created"] for r in results)
+    assert sorted(inferred) == ["tests/test_0.py", "tests/test_1.py"]
+    creates = [c for c in calls if c[0] == "create"]
+    body = creates[1][creates[1].index("--description") + 1]
+    assert "owner-of-tests/test_1.py" in body
+
+
+def test_batch_reports_invalid_entries_in_place(monkeypatch):
+    """Entries without a test name get an error result at their position."""
+    calls = []
+    monkeypatch.setattr(cc, "run_wl", _batch_fake_wl(calls, [], ["SA-OK"]))
+    monkeypatch.setattr(
+        cc, "infer_owner",
+        lambda *a, **kw: {"assignee": "Build", "confidence": 0.0, "reason": "fallback"},
+    )
+
+    results = cc.check_or_create_batch([{"stdout_excerpt": "x"}, {"test_name": "test_ok"}])
+
+    assert results[0] == {"error": "test_name is required"}
+    assert results[1]["issueId"] == "SA-OK"
+
+
+def test_batch_reports_non_object_entries_in_place(monkeypatch):
+    """Strings, numbers and malformed signatures get an error, not a crash."""
+    calls = []
+    monkeypatch.setattr(cc, "run_wl", _batch_fake_wl(calls, [], ["SA-OK"]))
+    monkeypatch.setattr(
+        cc, "infer_owner",
+        lambda *a, **kw: {"assignee": "Build", "confidence": 0.0, "reason": "fallback"},
+    )
+
+    results = cc.check_or_create_batch([
+        "test_str", 42, None, {"failure_signature": "oops"}, {"test_name": "test_ok"},
+    ])
+
+    error = {"error": "failure payload must be a JSON object"}
+    assert results[:3] == [error, error, error]
+    assert results[3] == {"error": "test_name is required"}
+    assert results[4]["issueId"] == "SA-OK"
+
+
+def test_main_cli_batch_non_object_entry(monkeypatch, capsys):
+    """A non-object array entry exits 2 with per-item results, no traceback."""
+    calls = []
+    monkeypatch.setattr(cc, "run_wl", _batch_fake_wl(calls, [], ["SA-B1"]))
+    monkeypatch.setattr(
+        cc, "infer_owner",
+        lambda *a, **kw: {"assignee": "Build", "confidence": 0.0, "reason": "fallback"},
+    )
+    monkeypatch.setattr(sys, "argv", ["prog", json.dumps([{"test_name": "test_a"}, "x"])])
+
+    with pytest.raises(SystemExit) as exc:
+        cc.main()
+    assert exc.value.code == 2
+    out = capsys.readouterr().out
+    assert "1 of 2 failures not triaged" in out
+    assert "Unhandled exception" not in out
+
+
+def test_main_cli_batch(monkeypatch, capsys):
+    """A JSON array argument runs batch mode and prints an array of results."""
+    calls = []
+    monkeypatch.setattr(cc, "run_wl", _batch_fake_wl(calls, [], ["SA-B1", "SA-B2"]))
+    monkeypatch.setattr(
+        cc, "infer_owner",
+        lambda *a, **kw: {"assignee": "Build", "confidence": 0.0, "reason": "fallback"},
+    )
+    monkeypatch.setattr(
+        sys, "argv",
+        ["prog", json.dumps([{"test_name": "test_a"}, {"test_name": "test_b"}])],
+    )
+
+    cc.main()
+    out = json.loads(capsys.readouterr().out)
+    assert [r["issueId"] for r in out] == ["SA-B1", "SA-B2"]
+
+
+# ---------------------------------------------------------------------------
+# CandidateIndex
+# ---------------------------------------------------------------------------
+
+
+def _linear_match(candidates, predicate):
+    """Reference: filter incomplete, keep predicate hits, most recent first."""
+    matches = [c for c in candidates if cc._is_incomplete(c) and predicate(c)]
+    matches.sort(key=cc._updated_at, reverse=True)
+    return matches[0] if matches else None
+
+
+def _candidate_pool():
+    pool = []
+    for i in range(300):
+        pool.append({
+            "id": f"SA-{i}",
+            "title": f"[test-failure] test_widget_{i % 40} — failing test",
+            "description": (
+                f"Test name: test_widget_{i % 40}\n"
+                f"File \"src/widget_{i % 7}.py\", line {i}\n"
+                f"Failing commit: {i % 13:07x}abc\nCI job: https://ci.example/{i % 11}"
+            ),
+            "status": ("open", "in_progress", "completed")[i % 3],
+            # Repeated timestamps exercise the stable tie order.
+            "updatedAt": f"2026-02-{1 + i % 20:02d}T00:00:00Z",
+        })
+    return pool
+
+
+def test_candidate_index_matches_linear_heuristics():
+    """Index lookups return exactly what the linear heuristic scans returned."""
+    pool = _candidate_pool()
+    index = cc.CandidateIndex(pool)
+    for n in range(45):
+        name = f"test_widget_{n}"
+        assert cc.match_heuristic_1(index, name) is _linear_match(
+            pool, lambda c: name in c["title"] or name in c["description"]
+        )
+        trace = f'File "src/widget_{n % 9}.py", line 3'
+        tokens = cc._tokenize(name)
+        assert cc.match_heuristic_2(index, name, trace) is _linear_match(
+            pool,
+            lambda c: len(tokens & cc._tokenize(c["title"])) >= max(1, len(tokens) * 0.5)
+            and f"src/widget_{n % 9}.py" in c["description"],
+        )
+        commit, url = f"{n % 15:07x}", f"https://ci.example/{n % 12}"
+        assert cc.match_heuristic_3(index, commit, url) is _linear_match(
+            pool,
+            lambda c: commit in c["title"] + " " + c["description"]
+            or url in c["title"] + " " + c["description"],
+        )
+
+
+def test_candidate_index_skips_completed_and_ranks_added_last():
+    index = cc.CandidateIndex([
+        {"id": "SA-DONE", "title": "test_x", "status": "completed", "updatedAt": "2026-03-01"},
+        {"id": "SA-OLD", "title": "test_x", "status": "open", "updatedAt": "2026-01-01"},
+    ])
+    assert len(index) == 1
+    index.add({"id": "SA-PLANNED", "title": "test_x", "status": "open"})
+    assert cc._get_id(index.by_test_name("test_x")) == "SA-OLD"
+    assert index.by_test_name("[test_x") is None
+    index.add({"id": "SA-Y", "title": "test_y", "status": "open"})
+    assert cc._get_id(index.by_test_name("test_y")) == "SA-Y"
@@ -0,0 +1,236 @@
+"""Tests for argument-length-aware chunking of scoped linter runs.
+
+When ``files=`` is passed, markdownlint / eslint / shellcheck (and ruff)
+must split the target list into argv-bounded chunks, run the chunks in
+parallel and merge the JSON outputs so severity classification and the
+fix-mode ``_commit_changes`` semantics are unchanged.
+"""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from skill.code_review.scripts import linter_runner as lr  # noqa: E402
+
+_MOD = "skill.code_review.scripts.linter_runner"
+
+
+def _completed(cmd, returncode=0, stdout=""):
+    return subprocess.CompletedProcess(args=cmd, returncode=returncode,
+                                       stdout=stdout, stderr="")
+
+
+class TestChunkFiles:
+    def test_small_list_is_one_chunk(self):
+        targets = [f"src/f{i}.md" for i in range(10)]
+        assert lr._chunk_files(targets, 20, max_bytes=10_000) == [targets]
+
+    def test_splits_on_byte_budget_and_preserves_order(self):
+        targets = [f"src/{'x' * 40}{i:03d}.md" for i in range(100)]
+        chunks = lr._chunk_files(targets, 50, max_bytes=1_000)
+        assert len(chunks) > 1
+        assert [t for c in chunks for t in c] == targets
+        for chunk in chunks:
+            used = 50 + sum(len(t) + 1 for t in chunk)
+            assert used <= 1_000
+
+    def test_splits_on_cost_across_workers(self, tmp_path):
+        targets = []
+        for i in range(8):
+            p = tmp_path / f"f{i}.sh"
+            p.write_text("x" * 4096)
+            targets.append(str(p))
+        chunks = lr._chunk_files(targets, 0, max_bytes=1_000_000,
+                                 workers=4, min_cost=1)
+        assert len(chunks) == 4
+        assert all(len(c) == 2 for c in chunks)
+
+    def test_oversized_single_path_still_gets_a_chunk(self):
+        chunks = lr._chunk_files(["a" * 500], 10, max_bytes=100)
+        assert chunks == [["a" * 500]]
+
+
+class TestRunBatched:
+    def test_single_chunk_runs_one_command(self):
+        calls = []
+
+        def runner(cmd):
+            calls.append(cmd)
+            return _completed(cmd, stdout="[]")
+
+        lr._run_batched(runner, lambda t: ["eslint", *t], ["a.js", "b.js"])
+        assert calls == [["eslint", "a.js", "b.js"]]
+
+    def test_multiple_chunks_run_in_parallel_and_merge(self):
+        lock = threading.Lock()
+        in_flight = {"now": 0, "peak": 0}
+
+        def runner(cmd):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            files = cmd[1:]
+            out = [{"filePath": f, "messages": []} for f in files]
+            return _completed(cmd, returncode=1, stdout=json.dumps(out))
+
+        targets = [f"f{i:04d}.js" for i in range(200)]
+        with (
+            patch(f"{_MOD}._arg_bytes_budget", return_value=200),
+            patch(f"{_MOD}._lint_workers", return_value=4),
+        ):
+            result = lr._run_batched(runner, lambda t: ["eslint", *t], targets)
+
+        merged = json.loads(result.stdout)
+        assert [r["filePath"] for r in merged] == targets
+        assert result.returncode == 1
+        assert in_flight["peak"] > 1
+
+    def test_failed_chunks_are_dropped(self):
+        def runner(cmd):
+            if "bad.js" in cmd:
+                return _completed(cmd, returncode=2, stdout="garbage")
+            return _completed(cmd, stdout=json.dumps([{"f": cmd[1]}]))
+
+        results = [runner(["eslint", "ok.js"]), runner(["eslint", "bad.js"])]
+        merged = lr._merge_json_results(results)
+        assert json.loads(merged.stdout) == [{"f": "ok.js"}]
+        assert merged.returncode == 0
+
+    def test_split_failed_reruns_failed_chunk_per_file(self):
+        calls = []
+
+        def runner(cmd):
+            calls.append(cmd)
+            if "bad.sh" in cmd:
+                return _completed(cmd, returncode=2, stdout="garbage")
+            return _completed(cmd, returncode=1,
+                              stdout=json.dumps([{"file": f} for f in cmd[1:]]))
+
+        targets = ["a.sh", "bad.sh", "b.sh"]
+        result = lr._run_batched(runner, lambda t: ["shellcheck", *t], targets,
+                                 split_failed=True)
+
+        assert calls == [["shellcheck", *targets],
+                         *(["shellcheck", t] for t in targets)]
+        assert json.loads(result.stdout) == [{"file": "a.sh"}, {"file": "b.sh"}]
+        assert result.returncode == 1
+
+    def test_failed_chunk_is_not_split_by_default(self):
+        calls = []
+
+        def runner(cmd):
+            calls.append(cmd)
+            return _completed(cmd, returncode=2)
+
+        result = lr._run_batched(runner, lambda t: ["eslint", *t], ["a.js", "b.js"])
+        assert len(calls) == 1
+        assert result.returncode == 2
+
+    def test_all_chunks_failed_returns_first_failure(self):
+        failure = _completed(["x"], returncode=2)
+        assert lr._merge_json_results([failure, _completed(["y"], 3)]) is failure
+
+
+class TestScopedLintersUseChunks:
+    def _patches(self, language, linter):
+        return (
+            patch(f"{_MOD}.detect_languages", return_value=[language]),
+            patch(f"{_MOD}.probe_linter",
+                  return_value={"name": linter, "available": True}),
+            patch(f"{_MOD}._arg_bytes_budget", return_value=300),
+        )
+
+    def test_markdownlint_chunks_and_classifies(self):
+        targets = [f"docs/page{i:03d}.md" for i in range(60)]
+        md_calls = []
+
+        def runner(cmd, cwd=None):
+            if cmd[0] != "markdownlint":
+                return _completed(cmd)
+            md_calls.append(cmd)
+            files = [a for a in cmd if a.endswith(".md")]
+            out = [{"path": f, "lineNumber": 1, "rule": "MD001",
+                    "severity": "error", "message": "m"} for f in files]
+            return _completed(cmd, returncode=1, stdout=json.dumps(out))
+
+        p1, p2, p3 = self._patches("markdown", "markdownlint")
+        with p1, p2, p3:
+            result = lr.run_markdownlint(str(REPO_ROOT), runner=runner,
+                                         files=targets)
+
+        assert len(md_calls) > 1
+        assert [f["file"] for f in result["findings"]] == targets
+        assert {f["severity"] for f in result["findings"]} == {"high"}
+
+    def test_markdownlint_fix_commits_once_after_all_chunks(self):
+        targets = [f"docs/page{i:03d}.md" for i in range(60)]
+        events = []
+
+        def runner(cmd, cwd=None):
+            if cmd[0] == "git":
+                events.append(("git", cmd[1]))
+                return _completed(cmd, stdout=" M docs/page000.md\n"
+                                  if cmd[1] == "status" else "")
+            events.append(("fix" if "--fix" in cmd else "scan", None))
+            return _completed(cmd, stdout="[]")
+
+        p1, p2, p3 = self._patches("markdown", "markdownlint")
+        with p1, p2, p3:
+            result = lr.run_markdownlint(str(REPO_ROOT), runner=runner,
+                                         fix=True, files=targets)
+
+        kinds = [e[0] for e in events]
+        assert kinds.count("git") == 3  # status, add, commit — once
+        first_git = kinds.index("git")
+        assert all(k == "fix" for k in kinds[:first_git])
+        assert all(k == "scan" for k in kinds[first_git + 3:])
+        assert result["fixes_applied"] is True
+
+    def test_eslint_forwards_files_scope(self):
+        calls = []
+
+        def runner(cmd):
+            calls.append(cmd)
+            return _completed(cmd, stdout="[]")
+
+        p1, p2, p3 = self._patches("javascript", "eslint")
+        with p1, p2, p3:
+            lr.run_eslint(str(REPO_ROOT), runner=runner, files=["src/a.js"])
+
+        assert calls == [["eslint", "src/a.js", "-f", "json", "--quiet"]]
+
+    def test_shellcheck_batches_files_per_invocation(self, tmp_path):
+        for i in range(5):
+            (tmp_path / f"s{i}.sh").write_text("#!/bin/bash\necho hi\n")
+        calls = []
+
+        def runner(cmd):
+            calls.append(cmd)
+            files = cmd[3:]
+            out = [{"file": f, "line": 2, "severity": "warning",
+                    "message": "m", "code": 2086} for f in files]
+            return _completed(cmd, returncode=1, stdout=json.dumps(out))
+
+        with (
+            patch(f"{_MOD}.detect_languages", return_value=["shell"]),
+            patch(f"{_MOD}.probe_linter",
+                  return_value={"name": "shellcheck", "available": True}),
+        ):
+            findings = lr.run_shellcheck(str(tmp_path), runner=runner)
+
+        assert len(calls) == 1
+        assert len(calls[0]) == 3 + 5
+        assert len(findings) == 5
+        assert {f["severity"] for f in findings} == {"medium"}
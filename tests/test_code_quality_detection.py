@@ -10,6 +10,7 @@ The target implementation lives in skill/code_review/scripts/detection.py.
 from __future__ import annotations
 
 import json
+import os
 import sys
 import tempfile
 from pathlib import Path
@@ -239,6 +240,78 @@ class TestProbeLinter:
         mock_which.assert_called_once_with("ruff")
 
 
+class TestProbeLinterCache:
+    """probe_linter() memoizes per process and persists to a JSON cache."""
+
+    @pytest.fixture
+    def detection(self, tmp_path, monkeypatch):
+        from skill.code_review.scripts import detection
+
+        monkeypatch.setenv(detection.PROBE_CACHE_ENV,
+                           str(tmp_path / "probe.json"))
+        detection.clear_probe_cache()
+        return detection
+
+    @pytest.fixture
+    def fake_bin(self, tmp_path, monkeypatch):
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        linter = bin_dir / "fakelint"
+        linter.write_text("#!/bin/sh\n")
+        linter.chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+        return linter
+
+    def test_memoized_within_process(self, detection, fake_bin):
+        with patch("shutil.which", wraps=detection.shutil.which) as which:
+            first = detection.probe_linter("fakelint")
+            second = detection.probe_linter("fakelint")
+        assert first == second == {"name": "fakelint", "available": True}
+        assert which.call_count == 1
+
+    def test_persisted_across_processes(self, detection, fake_bin, tmp_path):
+        detection.probe_linter("fakelint")
+        data = json.loads((tmp_path / "probe.json").read_text())
+        assert any(e.get("binary") == str(fake_bin)
+                   for e in data["entries"].values())
+
+        detection.clear_probe_cache()  # simulate a fresh process
+        with patch("shutil.which") as which:
+            result = detection.probe_linter("fakelint")
+        which.assert_not_called()
+        assert result["available"] is True
+
+    def test_binary_mtime_change_invalidates(self, detection, fake_bin):
+        detection.probe_linter("fakelint")
+        detection.clear_probe_cache()
+        st = fake_bin.stat()
+        os.utime(fake_bin, (st.st_atime, st.st_mtime + 10))
+        with patch("shutil.which", wraps=detection.shutil.which) as which:
+            detection.probe_linter("fakelint")
+        assert which.call_count == 1
+
+    def test_negative_entry_invalidated_by_install(self, detection, fake_bin):
+        assert detection.probe_linter("otherlint")["available"] is False
+        detection.clear_probe_cache()
+        new = fake_bin.parent / "otherlint"
+        new.write_text("#!/bin/sh\n")
+        new.chmod(0o755)
+        st = fake_bin.parent.stat()
+        os.utime(fake_bin.parent, (st.st_atime, st.st_mtime + 10))
+        assert detection.probe_linter("otherlint")["available"] is True
+
+    def test_corrupt_cache_file_is_ignored(self, detection, fake_bin, tmp_path):
+        (tmp_path / "probe.json").write_text("{not json")
+        assert detection.probe_linter("fakelint")["available"] is True
+
+    def test_empty_env_disables_persistence(self, detection, fake_bin,
+                                            tmp_path, monkeypatch):
+        monkeypatch.setenv(detection.PROBE_CACHE_ENV, "")
+        detection.clear_probe_cache()
+        detection.probe_linter("fakelint")
+        assert not (tmp_path / "probe.json").exists()
+
+
 # ===================================================================
 # Integration-style tests (project scanning + linter probing)
 # ===================================================================
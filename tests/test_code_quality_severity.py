@@ -266,8 +266,8 @@ class TestRunLinterFixMode:
 
         result = self.mod._run_linter_fix_mode(
             "ruff", Path("/tmp"), mock_runner,
-            fix_cmd_builder=lambda p: ["ruff", "--fix", str(p)],
-            rescan_cmd_builder=lambda p: ["ruff", str(p)],
+            fix_cmd_builder=lambda t: ["ruff", "--fix", *t],
+            rescan_cmd_builder=lambda t: ["ruff", *t],
             fixes_detected=lambda r, o: False,
             rescan_parser=lambda r: [],
             commit_after_fix=False,
@@ -297,8 +297,8 @@ class TestRunLinterFixMode:
 
         findings, applied = self.mod._run_linter_fix_mode(
             "ruff", Path("/tmp"), mock_runner,
-            fix_cmd_builder=lambda p: ["ruff", "--fix", str(p)],
-            rescan_cmd_builder=lambda p: ["ruff", str(p)],
+            fix_cmd_builder=lambda t: ["ruff", "--fix", *t],
+            rescan_cmd_builder=lambda t: ["ruff", *t],
             fixes_detected=fixes_detected,
             rescan_parser=rescan_parser,
             commit_after_fix=False,
@@ -320,8 +320,8 @@ class TestRunLinterFixMode:
 
         result = self.mod._run_linter_fix_mode(
             "ruff", Path("/tmp"), mock_runner,
-            fix_cmd_builder=lambda p: ["ruff", "--fix", str(p)],
-            rescan_cmd_builder=lambda p: ["ruff", str(p)],
+            fix_cmd_builder=lambda t: ["ruff", "--fix", *t],
+            rescan_cmd_builder=lambda t: ["ruff", *t],
             fixes_detected=lambda r, o: False,
             rescan_parser=lambda r: [],
             commit_after_fix=False,
@@ -596,6 +596,119 @@ def test_search_and_dedup_items_without_score_go_last(monkeypatch):
         assert scored_last_idx < unscored_first_idx, "Scored items must appear before unscored items"
 
 
+# ---------------------------------------------------------------------------
+# Local BM25 index tests
+# ---------------------------------------------------------------------------
+
+
+def _local_index(mod):
+    index = mod.WorklogIndex()
+    index.update([
+        {"id": "REL-001", "title": "Automation script for reports",
+         "status": "open", "updatedAt": "1"},
+        {"id": "REL-002", "title": "Script refactoring task",
+         "status": "completed", "updatedAt": "1"},
+        {"id": "REL-003", "title": "Unrelated docs", "status": "open",
+         "updatedAt": "1"},
+        {"id": "TEST-001", "title": "Automation script", "status": "open",
+         "updatedAt": "1"},
+    ])
+    return index
+
+
+def test_search_local_index_runs_no_wl_search(monkeypatch):
+    """With a local index, one BM25 query replaces per-keyword wl searches."""
+    mod = _import_find_related()
+    calls = []
+    monkeypatch.setattr(mod, "run_wl_search",
+                        lambda *a, **k: calls.append(a) or [])
+
+    results = mod.search_local_index(
+        _local_index(mod), ["automation", "script", "reports"] * 50,
+        exclude_ids=["TEST-001"],
+    )
+    assert calls == []
+    assert [r["id"] for r in results] == ["REL-001", "REL-002"]
+
+
+def test_search_local_index_applies_keyword_weights():
+    """Query weights from keyword selection change the BM25 ranking."""
+    mod = _import_find_related()
+    index = _local_index(mod)
+    by_reports = mod.search_local_index(
+        index, {"reports": 3.0, "refactoring": 0.5}, exclude_ids=["TEST-001"])
+    by_refactoring = mod.search_local_index(
+        index, {"reports": 0.5, "refactoring": 3.0}, exclude_ids=["TEST-001"])
+    assert [r["id"] for r in by_reports] == ["REL-001", "REL-002"]
+    assert [r["id"] for r in by_refactoring] == ["REL-002", "REL-001"]
+
+
+def test_select_keyword_weights_best_first():
+    mod = _import_find_related()
+    weights = mod.select_keyword_weights("Semaphore fanout", "fanout limit")
+    assert list(weights) == ["fanout", "semaphore", "limit"]
+    assert weights["fanout"] > weights["semaphore"] > weights["limit"] > 0
+
+
+def test_search_local_index_semantic_rerank_uses_one_query(monkeypatch):
+    """Semantic re-rank issues a single wl search and fuses ranks (RRF)."""
+    mod = _import_find_related()
+    calls = []
+
+    def mock_search(keyword, use_semantic=False, worklog_flags=None):
+        calls.append((keyword, use_semantic))
+        # Semantic search prefers REL-002 and also returns a non-candidate.
+        return [{"id": "REL-002"}, {"id": "REL-999"}]
+
+    monkeypatch.setattr(mod, "run_wl_search", mock_search)
+    results = mod.search_local_index(
+        _local_index(mod), ["automation", "script"], use_semantic=True,
+        exclude_ids=["TEST-001"],
+    )
+    assert len(calls) == 1
+    assert calls[0][1] is True
+    assert [r["id"] for r in results] == ["REL-002", "REL-001"]
+
+
+def test_load_local_index_falls_back_when_export_fails(monkeypatch, tmp_path):
+    """A failed `wl list` export yields no index (per-keyword search fallback)."""
+    mod = _import_find_related()
+    (tmp_path / ".worklog").mkdir()
+    monkeypatch.setattr(mod, "resolve_worklog_dir", lambda _id: tmp_path / ".worklog")
+
+    def failing(cmd, **kwargs):
+        raise RuntimeError("wl list failed")
+
+    monkeypatch.setattr(mod.subprocess, "check_output", failing)
+    assert mod.load_local_index("TEST-001") is None
+
+
+def test_load_local_index_builds_from_single_export(monkeypatch, tmp_path):
+    """The index is built from one scoped `wl list --json` and persisted."""
+    import json
+
+    mod = _import_find_related()
+    wl_dir = tmp_path / ".worklog"
+    wl_dir.mkdir()
+    (wl_dir / "worklog-data.jsonl").write_text("{}\n")
+    monkeypatch.setattr(mod, "resolve_worklog_dir", lambda _id: wl_dir)
+    calls = []
+
+    def mock_check_output(cmd, **kwargs):
+        calls.append(cmd)
+        return json.dumps({"success": True, "workItems": [
+            {"id": "REL-001", "title": "Automation", "updatedAt": "1"},
+        ]})
+
+    monkeypatch.setattr(mod.subprocess, "check_output", mock_check_output)
+    flags = ["--worklog-dir", str(wl_dir)]
+    first = mod.load_local_index("TEST-001", worklog_flags=flags)
+    second = mod.load_local_index("TEST-001", worklog_flags=flags)
+    assert calls == [["wl", "--worklog-dir", str(wl_dir), "list", "--json"]]
+    assert len(first) == len(second) == 1
+    assert (wl_dir / "cache" / "worklog-index.json").exists()
+
+
 def test_rank_repo_files_by_keyword_match_count(tmp_path):
     """Repo files should be ranked by number of distinct keywords matched (descending)."""
     mod = _import_find_related()
@@ -1033,3 +1146,161 @@ def test_skill_md_documents_status_lifecycle():
     # Must reference StatusLifecycle as the status management mechanism
     assert "StatusLifecycle" in content, "SKILL.md must reference StatusLifecycle for status management"
     assert "status" in content.lower(), "SKILL.md must mention status"
+
+
+# ---------------------------------------------------------------------------
+# Keyword selection and fused fallback search tests
+# ---------------------------------------------------------------------------
+
+
+def test_select_keywords_caps_and_prefers_title_terms():
+    """Selection keeps MAX_QUERY_TERMS terms, title terms first."""
+    mod = _import_find_related()
+    description = " ".join(f"filler{i}" for i in range(40))
+    terms = mod.select_keywords("Semaphore fanout", description)
+    assert len(terms) == mod.MAX_QUERY_TERMS
+    assert terms[:2] == ["fanout", "semaphore"]
+
+
+def test_select_keywords_uses_corpus_idf():
+    """A term common across the corpus loses to a rare one."""
+    mod = _import_find_related()
+    idf = {"script": 0.1, "kestrel": 3.0}.get
+    terms = mod.select_keywords("script kestrel", "", idf=lambda t: idf(t, 1.0), limit=1)
+    assert terms == ["kestrel"]
+
+
+def test_select_keywords_idf_from_local_index():
+    """WorklogIndex.idf plugs in directly as the IDF source."""
+    mod = _import_find_related()
+    index = _local_index(mod)
+    terms = mod.select_keywords("Automation script reports", "", idf=index.idf, limit=1)
+    assert terms == ["reports"]
+
+
+def test_select_keywords_drops_terms_only_the_item_uses():
+    """IDF excluding the analysed item never selects a term unique to it."""
+    mod = _import_find_related()
+    index = mod.WorklogIndex()
+    index.update([
+        {"id": "REL-001", "title": "Automation script", "updatedAt": "1"},
+        {"id": "REL-002", "title": "Unrelated docs", "updatedAt": "1"},
+        {"id": "TEST-001", "title": "Kestrel automation", "updatedAt": "1"},
+    ])
+    terms = mod.select_keywords(
+        "Kestrel automation", "",
+        idf=lambda term: index.idf(term, exclude=["TEST-001"]),
+    )
+    assert terms == ["automation"]
+
+
+def test_title_bigrams_skip_stop_words():
+    mod = _import_find_related()
+    assert mod.title_bigrams("Fix the status lifecycle for find-related") == [
+        "fix status", "status lifecycle",
+    ]
+
+
+def test_build_search_queries_or_combines_terms():
+    mod = _import_find_related()
+    queries = mod.build_search_queries(
+        ["alpha", "beta", "gamma"], ["alpha beta"], terms_per_query=2,
+    )
+    assert queries == ["alpha OR beta", "gamma", "alpha beta"]
+
+
+def test_search_and_dedup_fuses_ranks_across_queries(monkeypatch):
+    """An item returned by several queries outranks a single top hit."""
+    mod = _import_find_related()
+
+    def mock_search(keyword, use_semantic=False, worklog_flags=None):
+        if keyword == "one":
+            return [{"id": "REL-001", "score": -0.1}, {"id": "REL-002", "score": -0.5}]
+        return [{"id": "REL-003", "score": -0.2}, {"id": "REL-002", "score": -0.3}]
+
+    monkeypatch.setattr(mod, "run_wl_search", mock_search)
+    results = mod.search_and_dedup(["one", "two"])
+    assert [r["id"] for r in results] == ["REL-002", "REL-001", "REL-003"]
+
+
+def test_search_and_dedup_bounds_concurrency(monkeypatch):
+    """No more than SEARCH_WORKERS searches run at once."""
+    import threading
+    import time
+
+    mod = _import_find_related()
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def mock_search(keyword, use_semantic=False, worklog_flags=None):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.02)
+        with lock:
+            state["active"] -= 1
+        return []
+
+    monkeypatch.setattr(mod, "run_wl_search", mock_search)
+    monkeypatch.setattr(mod, "SEARCH_WORKERS", 2)
+    mod.search_and_dedup([f"q{i}" for i in range(6)])
+    assert state["peak"] == 2
+
+
+# ---------------------------------------------------------------------------
+# Pruned repository scan tests
+# ---------------------------------------------------------------------------
+
+
+def test_search_repo_does_not_descend_into_excluded_dirs(tmp_path, monkeypatch):
+    """Excluded directories are pruned before descending, not filtered after."""
+    mod = _import_find_related()
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("automation")
+    (tmp_path / "doc.md").write_text("automation")
+    monkeypatch.setattr(mod, "_git_listed_files", lambda root: None)
+
+    scanned = []
+    real_scandir = mod.os.scandir
+    monkeypatch.setattr(mod.os, "scandir",
+                        lambda path: scanned.append(path) or real_scandir(path))
+    assert [m["file"] for m in mod.search_repo(tmp_path, ["automation"])] == ["doc.md"]
+    assert not any("node_modules" in str(p) for p in scanned)
+
+
+def test_search_repo_honours_gitignore(tmp_path):
+    """In a git work tree, ignored files are not scanned; untracked ones are."""
+    mod = _import_find_related()
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text("generated/\n")
+    (tmp_path / "generated").mkdir()
+    (tmp_path / "generated" / "out.md").write_text("automation")
+    (tmp_path / "notes.md").write_text("automation")
+    assert [m["file"] for m in mod.search_repo(tmp_path, ["automation"])] == ["notes.md"]
+
+
+def test_search_repo_skips_binary_and_huge_files(tmp_path, monkeypatch):
+    mod = _import_find_related()
+    monkeypatch.setattr(mod, "MAX_REPO_FILE_BYTES", 100)
+    (tmp_path / "blob.py").write_bytes(b"\0\1automation")
+    (tmp_path / "huge.md").write_text("automation " * 20)
+    (tmp_path / "empty.md").write_text("")
+    (tmp_path / "ok.md").write_text("automation")
+    assert [m["file"] for m in mod.search_repo(tmp_path, ["automation"])] == ["ok.md"]
+
+
+def test_search_repo_matches_overlapping_keywords_case_insensitively(tmp_path):
+    """One combined pass still finds keywords nested in or overlapping others."""
+    mod = _import_find_related()
+    (tmp_path / "a.md").write_text("The SCRIPTS folder; see abcd.")
+    matches = mod.search_repo(tmp_path, ["script", "scripts", "abc", "bcd", "missing"])
+    assert matches == [{"file": "a.md", "matches": ["abc", "bcd", "script", "scripts"]}]
+
+
+def test_search_repo_parallel_scan_matches_serial(tmp_path, monkeypatch):
+    mod = _import_find_related()
+    for i in range(20):
+        (tmp_path / f"f{i:02d}.md").write_text("alpha beta" if i % 3 else "alpha")
+    serial = mod.search_repo(tmp_path, ["alpha", "beta"])
+    monkeypatch.setattr(mod, "REPO_SCAN_PARALLEL_THRESHOLD", 1)
+    assert mod.search_repo(tmp_path, ["alpha", "beta"]) == serial
@@ -24,6 +24,7 @@ from __future__ import annotations
 import importlib.util
 import json
 import shutil
+import subprocess
 import sys
 from pathlib import Path
 
@@ -160,3 +161,39 @@ def test_build_failure_still_blocks_when_build_script_present(
     assert result["success"] is False
     assert result["skipped"] is False
     assert result["exit_code"] != 0
+
+
+# ---------------------------------------------------------------------------
+# Build cache: unchanged inputs since the last successful build → skipped
+# ---------------------------------------------------------------------------
+
+
+def test_build_cache_skips_unchanged_inputs(implement_mod, repo_dir, monkeypatch):
+    """A second build over unchanged inputs is a cache hit; edits rebuild."""
+    _write_package_json(repo_dir, {"scripts": {"build": "tsc"}})
+    (repo_dir / "app.ts").write_text("export const x = 1;\n")
+    for args in (["init", "-q"], ["add", "-A"],
+                 ["-c", "user.name=T", "-c", "user.email=t@example.invalid",
+                  "commit", "-q", "-m", "init"]):
+        subprocess.run(["git", *args], cwd=repo_dir, check=True, capture_output=True)
+    monkeypatch.delenv("IMPLEMENT_NO_BUILD_CACHE", raising=False)
+
+    builds = []
+    exit_codes = iter([1, 0, 0])
+
+    def fake_run_cmd(cmd, **kwargs):
+        builds.append(cmd)
+        return subprocess.CompletedProcess(cmd, next(exit_codes), "out", "")
+
+    monkeypatch.setattr(implement_mod, "run_cmd", fake_run_cmd)
+
+    assert implement_mod.run_build(str(repo_dir))["success"] is False
+    first = implement_mod.run_build(str(repo_dir))  # failures are not cached
+    assert first["success"] is True and first["cached"] is False
+    hit = implement_mod.run_build(str(repo_dir))
+    assert (hit["success"], hit["skipped"], hit["cached"]) == (True, True, True)
+    assert len(builds) == 2
+
+    (repo_dir / "app.ts").write_text("export const x = 2;\n")
+    assert implement_mod.run_build(str(repo_dir))["cached"] is False
+    assert len(builds) == 3
@@ -0,0 +1,202 @@
+"""Tests for deferred push batching (``implement.py parent --defer-push``).
+
+Children of a deferring parent are stacked instead of pushed:
+
+- ``finish`` rebases a child onto the last stacked sibling before building
+  and testing it (invalidating earlier build/test checkpoints) and appends
+  it to the parent's stack, without pushing or restoring the main checkout;
+- once every child is terminal, ``parent`` pushes the top of the stack to
+  dev in one push (a repeated run does not push again);
+- the main-checkout restore is skipped when dev already matches origin.
+"""
+
+import contextlib
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_IMPLEMENT_PY = _REPO_ROOT / "skill" / "implement" / "scripts" / "implement.py"
+
+PARENT = "SA-1"
+CHILDREN = {"SA-2": ("wl-SA-2-first", "first.py"), "SA-3": ("wl-SA-3-second", "second.py")}
+
+
+@pytest.fixture(scope="module")
+def implement_mod():
+    """Load the module-under-test (skill/implement/scripts/implement.py)."""
+    sys.path.insert(0, str(_REPO_ROOT))
+    spec = importlib.util.spec_from_file_location(
+        "implement_under_test_deferred_push", _IMPLEMENT_PY
+    )
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["implement_under_test_deferred_push"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=str(cwd), check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path, implement_mod, monkeypatch) -> Path:
+    """Main checkout on ``dev`` tracking a bare origin, with both children
+    started from dev (as with ``--max-parallel``) under a deferring parent."""
+    origin = tmp_path / "origin.git"
+    _git(tmp_path, "init", "-q", "--bare", str(origin))
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "dev")
+    _git(root, "config", "user.email", "test@test.com")
+    _git(root, "config", "user.name", "Test")
+    (root / ".gitignore").write_text(".worklog/\n.implement_state.json\n")
+    (root / "app.py").write_text("x = 1\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+    _git(root, "remote", "add", "origin", str(origin))
+    _git(root, "push", "-q", "-u", "origin", "dev")
+    root = root.resolve()
+    for cid, (branch, filename) in CHILDREN.items():
+        wt = root / ".worklog" / "worktrees" / branch
+        _git(root, "worktree", "add", "-q", "-b", branch, str(wt), "dev")
+        (wt / filename).write_text(f"# {cid}\n")
+        implement_mod.write_state(
+            implement_mod.ImplementState(
+                work_item_id=cid, worktree_path=str(wt), repo_root=str(root),
+                parent_id=PARENT,
+            ),
+            str(wt),
+        )
+    implement_mod.write_parent_state(
+        implement_mod.parent_state_path(PARENT, str(root)),
+        {"parent_id": PARENT, "deferred_push": True, "children": {}},
+    )
+    monkeypatch.chdir(root)
+    return root
+
+
+@pytest.fixture
+def stubs(implement_mod, monkeypatch):
+    """Stub the non-git finish steps; count pushes and restores."""
+    calls = {"push": 0, "restore": 0, "built": []}
+    real_push = implement_mod.git_push_to_dev
+    real_restore = implement_mod._restore_repo_state
+
+    def push(cwd, branch):
+        calls["push"] += 1
+        return real_push(cwd, branch)
+
+    def restore(repo_root):
+        calls["restore"] += 1
+        return real_restore(repo_root)
+
+    class FakeLifecycle(contextlib.nullcontext):
+        def __init__(self, *args, **kwargs):
+            super().__init__()
+
+        @staticmethod
+        def update_status(*args, **kwargs):
+            return {}
+
+    ok = {"success": True, "exit_code": 0, "stderr": "", "failures": []}
+
+    def build(worktree_path, *args, **kwargs):
+        calls["built"].append(sorted(p.name for p in Path(worktree_path).glob("*.py")))
+        return dict(ok)
+
+    monkeypatch.setattr(implement_mod, "run_refactor", lambda *a, **k: dict(ok))
+    monkeypatch.setattr(implement_mod, "run_build", build)
+    monkeypatch.setattr(implement_mod, "run_tests", lambda *a, **k: dict(ok))
+    monkeypatch.setattr(implement_mod, "git_push_to_dev", push)
+    monkeypatch.setattr(implement_mod, "_restore_repo_state", restore)
+    monkeypatch.setattr(implement_mod, "StatusLifecycle", FakeLifecycle)
+    monkeypatch.setattr(implement_mod, "wl_add_comment", lambda *a, **k: None)
+    monkeypatch.setattr(implement_mod, "cleanup_worktree_processes", lambda p: {})
+    monkeypatch.setattr(implement_mod, "_worktree_placement_violation", lambda *a, **k: None)
+    monkeypatch.setattr(implement_mod, "is_code_freeze_active", lambda: False)
+    return calls
+
+
+def _finish_both(implement_mod):
+    for cid in CHILDREN:
+        report = implement_mod.phase_finish(cid)
+        assert report["success"] is True, report["message"]
+        assert report["steps"]["push"]["deferred"] is True
+
+
+def test_finish_stacks_children_without_pushing(implement_mod, repo, stubs):
+    origin_dev = _git(repo, "rev-parse", "origin/dev")
+    _finish_both(implement_mod)
+
+    state = implement_mod.read_parent_state(implement_mod.parent_state_path(PARENT, str(repo)))
+    assert [e["id"] for e in state["stack"]] == ["SA-2", "SA-3"]
+    # The second child was rebased onto the first.
+    _git(repo, "merge-base", "--is-ancestor", "wl-SA-2-first", "wl-SA-3-second")
+    assert state["stack"][-1]["commit"] == _git(repo, "rev-parse", "wl-SA-3-second")
+    assert (stubs["push"], stubs["restore"]) == (0, 0)
+    # The second child was built on top of the first.
+    assert stubs["built"] == [["app.py", "first.py"], ["app.py", "first.py", "second.py"]]
+    assert _git(repo, "ls-remote", "origin", "refs/heads/dev").split()[0] == origin_dev
+
+
+def test_rebase_invalidates_build_checkpoints(implement_mod, repo, stubs):
+    second = repo / ".worklog" / "worktrees" / "wl-SA-3-second"
+    state = implement_mod.read_state(str(second))
+    fingerprint = implement_mod.git_worktree_tree_id(str(second))
+    for step in ("refactor", "build", "tests"):
+        implement_mod._record_finish_step(state, step, fingerprint=fingerprint)
+    _finish_both(implement_mod)
+    # SA-3's checkpoints predate the rebase onto SA-2, so it is rebuilt.
+    assert len(stubs["built"]) == 2
+    assert "first.py" in stubs["built"][1]
+
+
+def test_parent_pushes_stack_once(implement_mod, repo, stubs, monkeypatch):
+    _finish_both(implement_mod)
+    monkeypatch.setattr(implement_mod, "wl_show", lambda wid: {"id": PARENT, "status": "in_progress"})
+    monkeypatch.setattr(
+        implement_mod, "wl_show_children",
+        lambda wid: [{"id": cid, "status": "completed", "stage": "in_review"} for cid in CHILDREN],
+    )
+    monkeypatch.setattr(implement_mod, "wl_dep_blockers_many", lambda ids: {})
+
+    report = implement_mod.phase_parent(PARENT)
+    assert report["success"] is True
+    assert report["parent_advanced"] is True
+    assert report["deferred_push"]["children"] == ["SA-2", "SA-3"]
+    top = _git(repo, "rev-parse", "wl-SA-3-second")
+    assert _git(repo, "ls-remote", "origin", "refs/heads/dev").split()[0] == top
+    assert stubs["push"] == 1
+
+    implement_mod.phase_parent(PARENT)
+    assert stubs["push"] == 1
+
+
+def test_restore_skipped_when_dev_matches_origin(implement_mod, repo, monkeypatch, tmp_path):
+    commands = []
+    real_run_cmd = implement_mod.run_cmd
+
+    def recording_run_cmd(cmd, *args, **kwargs):
+        commands.append(cmd[1])
+        return real_run_cmd(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(implement_mod, "run_cmd", recording_run_cmd)
+    implement_mod._restore_repo_state(str(repo))
+    assert "pull" not in commands
+
+    other = tmp_path / "other"
+    _git(tmp_path, "clone", "-q", "-b", "dev", str(tmp_path / "origin.git"), str(other))
+    (other / "upstream.py").write_text("z = 1\n")
+    _git(other, "add", "-A")
+    _git(other, "-c", "user.name=U", "-c", "user.email=u@example.invalid", "commit", "-q", "-m", "up")
+    _git(other, "push", "-q", "origin", "dev")
+
+    implement_mod._restore_repo_state(str(repo))
+    assert "pull" in commands
+    assert (repo / "upstream.py").exists()
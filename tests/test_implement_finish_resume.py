@@ -0,0 +1,189 @@
+"""Tests for the resumable implement.py finish pipeline.
+
+Each completed finish step is checkpointed in the state file (and, because
+the worktree is removed before the push, in
+``.worklog/worktrees/.implement_finish_<id>.json``):
+
+- the working-tree fingerprint is content-based, so it is unchanged by
+  committing the changes;
+- refactor/build/tests checkpoints are invalidated by any later edit;
+- a finish that failed at the push resumes at the push, without re-running
+  refactor, build or tests, even though the worktree is already gone;
+- ``--from-step`` overrides the checkpointed resume point.
+"""
+
+import contextlib
+import importlib.util
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_IMPLEMENT_PY = _REPO_ROOT / "skill" / "implement" / "scripts" / "implement.py"
+
+ITEM = "SA-1"
+BRANCH = "wl-SA-1-first"
+
+
+@pytest.fixture(scope="module")
+def implement_mod():
+    """Load the module-under-test (skill/implement/scripts/implement.py)."""
+    sys.path.insert(0, str(_REPO_ROOT))
+    spec = importlib.util.spec_from_file_location(
+        "implement_under_test_finish_resume", _IMPLEMENT_PY
+    )
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["implement_under_test_finish_resume"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=str(cwd), check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path, implement_mod, monkeypatch) -> Path:
+    """Repo with a ``dev`` branch and a started worktree for ``SA-1``."""
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "test@test.com")
+    _git(root, "config", "user.name", "Test")
+    (root / ".gitignore").write_text(".worklog/\n.implement_state.json\n")
+    (root / "app.py").write_text("x = 1\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+    _git(root, "branch", "dev")
+    wt = root / ".worklog" / "worktrees" / BRANCH
+    _git(root, "worktree", "add", "-q", "-b", BRANCH, str(wt), "dev")
+    root = root.resolve()
+    implement_mod.write_state(
+        implement_mod.ImplementState(
+            work_item_id=ITEM, worktree_path=str(wt.resolve()), repo_root=str(root)
+        ),
+        str(wt),
+    )
+    monkeypatch.chdir(root)
+    return root
+
+
+@pytest.fixture
+def pipeline(implement_mod, monkeypatch):
+    """Stub the slow / external finish steps and count their calls."""
+    calls = {"refactor": 0, "build": 0, "tests": 0, "push": 0}
+    push_results = []
+
+    def counted(name, result):
+        def run(*args, **kwargs):
+            calls[name] += 1
+            return dict(result)
+        return run
+
+    def push(cwd, branch):
+        calls["push"] += 1
+        return push_results.pop(0) if push_results else True
+
+    class FakeLifecycle(contextlib.nullcontext):
+        def __init__(self, *args, **kwargs):
+            super().__init__()
+
+        @staticmethod
+        def update_status(*args, **kwargs):
+            return {}
+
+    monkeypatch.setattr(implement_mod, "run_refactor", counted("refactor", {"success": True}))
+    monkeypatch.setattr(
+        implement_mod, "run_build",
+        counted("build", {"success": True, "exit_code": 0, "stderr": ""}),
+    )
+    monkeypatch.setattr(
+        implement_mod, "run_tests",
+        counted("tests", {"success": True, "failures": [], "stderr": ""}),
+    )
+    monkeypatch.setattr(implement_mod, "git_push_to_dev", push)
+    monkeypatch.setattr(implement_mod, "StatusLifecycle", FakeLifecycle)
+    monkeypatch.setattr(implement_mod, "wl_add_comment", lambda *a, **k: None)
+    monkeypatch.setattr(implement_mod, "cleanup_worktree_processes", lambda p: {})
+    monkeypatch.setattr(implement_mod, "_restore_repo_state", lambda root: None)
+    monkeypatch.setattr(implement_mod, "_worktree_placement_violation", lambda *a, **k: None)
+    return calls, push_results
+
+
+def test_fingerprint_is_stable_across_commit(implement_mod, repo):
+    wt = repo / ".worklog" / "worktrees" / BRANCH
+    clean = implement_mod.git_worktree_tree_id(str(wt))
+    (wt / "app.py").write_text("x = 2\n")
+    (wt / "new.py").write_text("y = 1\n")
+    edited = implement_mod.git_worktree_tree_id(str(wt))
+    assert edited != clean
+    assert implement_mod.git_commit(str(wt), "change")
+    assert implement_mod.git_worktree_tree_id(str(wt)) == edited
+    # The state file is never part of the fingerprint.
+    assert _git(wt, "ls-tree", "-r", "--name-only", edited).split() == [
+        ".gitignore", "app.py", "new.py",
+    ]
+
+
+def test_edits_invalidate_checkpoints(implement_mod, repo):
+    wt = repo / ".worklog" / "worktrees" / BRANCH
+    state = implement_mod.read_state(str(wt))
+    fingerprint = implement_mod.git_worktree_tree_id(str(wt))
+    for step in ("refactor", "build", "tests"):
+        implement_mod._record_finish_step(state, step, fingerprint=fingerprint)
+    assert implement_mod._finish_resume_step(state, BRANCH) == "commit"
+    assert implement_mod.read_state(str(wt)).finish_steps.keys() == {
+        "refactor", "build", "tests",
+    }
+    (wt / "app.py").write_text("x = 3\n")
+    assert implement_mod._finish_resume_step(state, BRANCH) == "refactor"
+
+
+def test_push_failure_resumes_at_push(implement_mod, repo, pipeline):
+    calls, push_results = pipeline
+    wt = repo / ".worklog" / "worktrees" / BRANCH
+    (wt / "app.py").write_text("x = 2\n")
+    push_results.append(False)
+
+    first = implement_mod.phase_finish(ITEM)
+    assert first["success"] is False
+    assert not wt.exists()
+    checkpoint = implement_mod.finish_state_path(ITEM, str(repo))
+    recorded = json.loads(checkpoint.read_text())["finish_steps"]
+    assert list(recorded) == [
+        "refactor", "build", "tests", "commit", "cleanup", "remove_worktree", "restore",
+    ]
+    assert recorded["commit"]["sha"] == _git(repo, "rev-parse", BRANCH)
+
+    second = implement_mod.phase_finish(ITEM)
+    assert second["success"] is True
+    assert second["resume_step"] == "push"
+    assert second["steps"]["commit"]["hash"] == first["steps"]["commit"]["hash"]
+    assert calls == {"refactor": 1, "build": 1, "tests": 1, "push": 2}
+    assert not checkpoint.exists()
+
+
+def test_from_step_overrides_checkpoint(implement_mod, repo, pipeline):
+    calls, _ = pipeline
+    wt = repo / ".worklog" / "worktrees" / BRANCH
+    state = implement_mod.read_state(str(wt))
+    fingerprint = implement_mod.git_worktree_tree_id(str(wt))
+    for step in ("refactor", "build", "tests"):
+        implement_mod._record_finish_step(state, step, fingerprint=fingerprint)
+
+    report = implement_mod.phase_finish(ITEM, from_step="tests")
+    assert report["success"] is True
+    assert report["steps"]["build"]["reason"] == "checkpoint"
+    assert calls == {"refactor": 0, "build": 0, "tests": 1, "push": 1}
+
+
+def test_from_step_flag_parsed(implement_mod):
+    args = implement_mod.parse_args(["finish", ITEM, "--from-step", "push"])
+    assert args.from_step == "push"
+    with pytest.raises(SystemExit):
+        implement_mod.parse_args(["finish", ITEM, "--from-step", "deploy"])
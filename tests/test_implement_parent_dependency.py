@@ -143,6 +143,39 @@ class TestResolveOrder:
         assert err is None
         assert len(ordered) == 2
 
+    def test_wide_epic_orders_by_sort_index_among_ready(self, implement_mod):
+        """Hundreds of children: blockers first, ties by (sortIndex, id)."""
+        n = 600
+        children = [_child(f"SA-{i:04d}", sort_index=(n - i) % 7) for i in range(n)]
+        # Every child depends on the one ten before it.
+        blockers = {f"SA-{i:04d}": [_blocker(f"SA-{i - 10:04d}")] for i in range(10, n)}
+        ordered, err = implement_mod._resolve_implementation_order(children, blockers)
+        assert err is None
+        ids = [c["id"] for c in ordered]
+        position = {cid: idx for idx, cid in enumerate(ids)}
+        assert len(ids) == n
+        assert all(position[f"SA-{i - 10:04d}"] < position[f"SA-{i:04d}"] for i in range(10, n))
+        roots = [c for c in children if int(c["id"][3:]) < 10]
+        expected_first = min(roots, key=lambda c: (c["sortIndex"], c["id"]))
+        assert ids[0] == expected_first["id"]
+
+
+class TestDependencyFetch:
+    def test_fetches_each_child_once_concurrently(self, implement_mod):
+        seen = []
+
+        def fake_wl_dep_blockers(child_id, **_):
+            seen.append(child_id)
+            return [_blocker("SA-ROOT")] if child_id != "SA-ROOT" else []
+
+        ids = ["SA-ROOT", "SA-A", "SA-B", "SA-A", ""]
+        with mock.patch.object(implement_mod, "wl_dep_blockers", side_effect=fake_wl_dep_blockers):
+            fetched = implement_mod.wl_dep_blockers_many(ids)
+        assert sorted(seen) == ["SA-A", "SA-B", "SA-ROOT"]
+        assert list(fetched) == ["SA-ROOT", "SA-A", "SA-B"]
+        assert fetched["SA-A"] == [_blocker("SA-ROOT")]
+        assert fetched["SA-ROOT"] == []
+
 
 # ===========================================================================
 # phase_parent — dependency-aware next-child selection
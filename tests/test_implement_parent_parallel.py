@@ -0,0 +1,140 @@
+"""Tests for the implement.py parent scheduler mode (``--max-parallel``).
+
+Contract:
+
+- ``_ready_children`` returns the full ready frontier: every non-terminal,
+  not-in-progress child whose in-chain blockers are all terminal.
+- With ``max_parallel`` > 1, one ``phase_parent`` invocation starts up to
+  N ready children (each through ``phase_start``), counting children
+  already in progress against N.
+- Started children are tracked in a parent-level state file; children
+  that reach a terminal status are marked finished and the dependents they
+  unblock are reported as released and started on the next invocation.
+- ``max_parallel=1`` keeps the one-child-per-invocation behaviour and
+  writes no state file.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_IMPLEMENT_PY = _REPO_ROOT / "skill" / "implement" / "scripts" / "implement.py"
+
+_PARENT = "SA-PARENT001"
+
+
+@pytest.fixture(scope="module")
+def implement_mod():
+    """Load the module-under-test (skill/implement/scripts/implement.py)."""
+    sys.path.insert(0, str(_REPO_ROOT))
+    spec = importlib.util.spec_from_file_location(
+        "implement_under_test_parent_parallel", _IMPLEMENT_PY
+    )
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["implement_under_test_parent_parallel"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class Epic:
+    """Canned worklog for one parent; children finish when told to."""
+
+    def __init__(self, mod, tmp_path: Path, specs: list[tuple[str, list[str]]]):
+        self.mod = mod
+        self.root = tmp_path
+        self.status = {cid: "open" for cid, _ in specs}
+        self.blockers = {cid: [{"id": b} for b in deps] for cid, deps in specs}
+        self.started: list[str] = []
+
+    def _children(self):
+        return [
+            {"id": cid, "title": cid, "status": status, "sortIndex": idx}
+            for idx, (cid, status) in enumerate(self.status.items())
+        ]
+
+    def _phase_start(self, child_id, **kwargs):
+        self.started.append(child_id)
+        self.status[child_id] = "in_progress"
+        return {"success": True, "worktree_path": f"/wt/{child_id}", "branch": f"wl-{child_id}"}
+
+    def finish(self, *child_ids):
+        for cid in child_ids:
+            self.status[cid] = "in_review"
+
+    def run(self, max_parallel: int) -> dict:
+        with (
+            mock.patch.object(self.mod, "wl_show", return_value={"id": _PARENT, "status": "open"}),
+            mock.patch.object(self.mod, "wl_show_children", side_effect=lambda *a, **k: self._children()),
+            mock.patch.object(self.mod, "wl_dep_blockers", side_effect=lambda cid, **k: self.blockers[cid]),
+            mock.patch.object(self.mod, "phase_start", side_effect=self._phase_start),
+            mock.patch.object(self.mod.StatusLifecycle, "update_status", return_value={}),
+            mock.patch.object(self.mod, "wl_add_comment", return_value=True),
+            mock.patch.object(self.mod, "is_code_freeze_active", return_value=False),
+            mock.patch.object(self.mod, "_get_repo_root", return_value=str(self.root)),
+        ):
+            return self.mod.phase_parent(_PARENT, json_output=True, max_parallel=max_parallel)
+
+    def state(self) -> dict:
+        return json.loads(self.mod.parent_state_path(_PARENT, str(self.root)).read_text())
+
+
+def test_ready_frontier(implement_mod):
+    children = [
+        {"id": "SA-A", "status": "in_review"},
+        {"id": "SA-B", "status": "open"},
+        {"id": "SA-C", "status": "open"},
+        {"id": "SA-D", "status": "in_progress"},
+        {"id": "SA-E", "status": "open"},
+    ]
+    blockers = {"SA-B": [{"id": "SA-A"}], "SA-E": [{"id": "SA-B"}]}
+    ready = implement_mod._ready_children(children, blockers)
+    assert [c["id"] for c in ready] == ["SA-B", "SA-C"]
+
+
+def test_starts_ready_frontier_up_to_limit(implement_mod, tmp_path, capsys):
+    epic = Epic(implement_mod, tmp_path, [
+        ("SA-A", []), ("SA-B", []), ("SA-C", []), ("SA-D", ["SA-A", "SA-B"]),
+    ])
+    report = epic.run(max_parallel=2)
+    assert epic.started == ["SA-A", "SA-B"]
+    assert [c["id"] for c in report["started_children"]] == ["SA-A", "SA-B"]
+    assert report["next_child"] == "SA-A"
+    assert set(epic.state()["children"]) == {"SA-A", "SA-B"}
+
+    # Both slots are busy: nothing more starts.
+    report = epic.run(max_parallel=2)
+    assert epic.started == ["SA-A", "SA-B"]
+    assert report["in_flight"] == ["SA-A", "SA-B"]
+    assert "next_child" not in report
+
+
+def test_terminal_blockers_release_dependents(implement_mod, tmp_path, capsys):
+    epic = Epic(implement_mod, tmp_path, [
+        ("SA-A", []), ("SA-B", []), ("SA-D", ["SA-A", "SA-B"]),
+    ])
+    epic.run(max_parallel=3)
+    epic.finish("SA-A")
+    report = epic.run(max_parallel=3)
+    assert "SA-D" not in epic.started
+    assert epic.state()["children"]["SA-A"]["finished_at"]
+
+    epic.finish("SA-B")
+    report = epic.run(max_parallel=3)
+    assert report["released_children"] == ["SA-D"]
+    assert epic.started == ["SA-A", "SA-B", "SA-D"]
+    assert epic.state()["children"]["SA-B"]["status"] == "in_review"
+
+
+def test_single_child_mode_unchanged(implement_mod, tmp_path, capsys):
+    epic = Epic(implement_mod, tmp_path, [("SA-A", []), ("SA-B", [])])
+    report = epic.run(max_parallel=1)
+    assert epic.started == ["SA-A"]
+    assert "started_children" not in report
+    assert not implement_mod.parent_state_path(_PARENT, str(tmp_path)).exists()
@@ -0,0 +1,141 @@
+"""Tests for implement.py worktree process cleanup (``/proc`` fallback).
+
+When ``wl cleanup-worktree`` is unavailable, ``cleanup_worktree_processes``
+scans ``/proc`` for processes rooted in the worktree:
+
+- processes whose cwd, or any open file, is inside the worktree are found;
+- process groups led by such a process are killed as a whole, reaching
+  workers that live elsewhere;
+- exit is polled, so cleanup returns as soon as the processes are gone, and
+  SIGTERM-ignoring processes are SIGKILLed after the grace period;
+- the calling process and its ancestors are never targeted.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_IMPLEMENT_PY = _REPO_ROOT / "skill" / "implement" / "scripts" / "implement.py"
+
+pytestmark = pytest.mark.skipif(not Path("/proc/self/cwd").exists(), reason="needs /proc")
+
+
+@pytest.fixture(scope="module")
+def implement_mod():
+    """Load the module-under-test (skill/implement/scripts/implement.py)."""
+    sys.path.insert(0, str(_REPO_ROOT))
+    spec = importlib.util.spec_from_file_location(
+        "implement_under_test_process_cleanup", _IMPLEMENT_PY
+    )
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["implement_under_test_process_cleanup"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+@pytest.fixture
+def no_wl(implement_mod, monkeypatch):
+    """Make ``wl cleanup-worktree`` unavailable."""
+    real_run_cmd = implement_mod.run_cmd
+
+    def fake_run_cmd(cmd, *args, **kwargs):
+        if cmd[0] == "wl":
+            return subprocess.CompletedProcess(cmd, 127, "", "wl: not found")
+        return real_run_cmd(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(implement_mod, "run_cmd", fake_run_cmd)
+
+
+@pytest.fixture
+def worktree(tmp_path):
+    wt = tmp_path / "wt"
+    wt.mkdir()
+    return wt
+
+
+@pytest.fixture
+def spawned():
+    procs = []
+
+    def spawn(script, cwd):
+        proc = subprocess.Popen(
+            ["sh", "-c", script], cwd=cwd, stdout=subprocess.PIPE,
+            text=True, start_new_session=True,
+        )
+        procs.append(proc)
+        return proc
+
+    yield spawn
+    for proc in procs:
+        if proc.poll() is None:
+            os.killpg(proc.pid, 9)
+        proc.wait()
+
+
+def _gone(pid):
+    try:
+        state = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()[0]
+    except OSError:
+        return True
+    return state == "Z"
+
+
+def test_cwd_match_terminates_promptly(implement_mod, no_wl, worktree, spawned):
+    proc = spawned("exec sleep 30", worktree)
+    time.sleep(0.1)
+    started = time.monotonic()
+    result = implement_mod.cleanup_worktree_processes(str(worktree))
+    assert time.monotonic() - started < 1.5
+    assert result["method"] == "proc_scan"
+    assert result["terminated"] == 1
+    assert result["killed"] == 0
+    assert proc.wait(timeout=5) != 0
+
+
+def test_open_file_match(implement_mod, no_wl, worktree, tmp_path, spawned):
+    (worktree / "log.txt").write_text("")
+    proc = spawned(f"exec 3<'{worktree}/log.txt'; exec sleep 30", tmp_path)
+    time.sleep(0.1)
+    assert proc.pid in implement_mod._worktree_pids(str(worktree))
+    implement_mod.cleanup_worktree_processes(str(worktree))
+    assert proc.wait(timeout=5) != 0
+
+
+def test_process_group_is_killed(implement_mod, no_wl, worktree, spawned):
+    # The worker leaves the worktree but stays in the leader's group.
+    proc = spawned("(cd / && exec sleep 30) & echo $!; wait", worktree)
+    worker = int(proc.stdout.readline())
+    deadline = time.monotonic() + 5
+    while os.readlink(f"/proc/{worker}/cwd") != "/" and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert worker not in implement_mod._worktree_pids(str(worktree))
+    implement_mod.cleanup_worktree_processes(str(worktree))
+    proc.wait(timeout=5)
+    deadline = time.monotonic() + 5
+    while not _gone(worker) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert _gone(worker)
+
+
+def test_sigterm_ignored_escalates_to_sigkill(
+    implement_mod, no_wl, worktree, spawned, monkeypatch
+):
+    monkeypatch.setattr(implement_mod, "PROCESS_TERM_GRACE_SECONDS", 0.3)
+    proc = spawned("trap '' TERM; echo ready; while :; do sleep 1; done", worktree)
+    proc.stdout.readline()
+    result = implement_mod.cleanup_worktree_processes(str(worktree))
+    assert result["killed"] >= 1
+    assert proc.wait(timeout=5) == -9
+
+
+def test_own_process_and_ancestors_excluded(implement_mod, worktree, monkeypatch):
+    monkeypatch.chdir(worktree)
+    pids = implement_mod._worktree_pids(str(worktree))
+    assert os.getpid() not in pids
+    assert os.getppid() not in pids
@@ -96,6 +96,22 @@ def _make_skill_layout(tmp_path: Path, use_symlink: bool) -> tuple[Path, Path]:
     (skill_pkg / "test_cache.py").write_text(real_tc)
     real_tr = (_REPO_ROOT / "skill" / "test_runner.py").read_text()
     (skill_pkg / "test_runner.py").write_text(real_tr)
+    # Provide the build cache module — implement.py's run_build() skips
+    # rebuilds over unchanged inputs through it.
+    real_bc = (_REPO_ROOT / "skill" / "build_cache.py").read_text()
+    (skill_pkg / "build_cache.py").write_text(real_bc)
+    # Provide the worktree provisioning module — phase_start reuses the
+    # main checkout's dependency directories through it.
+    real_wp = (
+        _REPO_ROOT / "skill" / "shared" / "worktree_provision.py"
+    ).read_text()
+    (skill_pkg / "shared" / "worktree_provision.py").write_text(real_wp)
+    # Provide the worktree registry module — _discover_worktree and the
+    # start/finish/abort phases look worktrees up through it.
+    real_wr = (
+        _REPO_ROOT / "skill" / "shared" / "worktree_registry.py"
+    ).read_text()
+    (skill_pkg / "shared" / "worktree_registry.py").write_text(real_wr)
     (skill_pkg / "__init__.py").touch()
     (skill_pkg / "shared" / "__init__.py").touch()
 
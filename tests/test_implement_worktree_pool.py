@@ -0,0 +1,144 @@
+"""Tests for the implement.py warm worktree pool.
+
+With ``IMPLEMENT_WORKTREE_POOL_SIZE`` > 0, ``finish``/``abort`` park the
+finished worktree (reset, detached) under ``.worklog/worktrees/.pool``
+instead of removing it, and ``start`` claims a parked worktree by moving it
+to the canonical path and switching it to the new branch:
+
+- recycled worktrees are reset: tracked changes and untracked files are
+  dropped, ignored build outputs are kept;
+- a claimed worktree is on the new branch, at the parent branch HEAD;
+- the pool never grows past its configured size;
+- unhealthy pool entries are discarded, and a failed switch parks the
+  worktree again so the caller can fall back to ``git worktree add``.
+"""
+
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_IMPLEMENT_PY = _REPO_ROOT / "skill" / "implement" / "scripts" / "implement.py"
+
+
+@pytest.fixture(scope="module")
+def implement_mod():
+    """Load the module-under-test (skill/implement/scripts/implement.py)."""
+    sys.path.insert(0, str(_REPO_ROOT))
+    spec = importlib.util.spec_from_file_location(
+        "implement_under_test_worktree_pool", _IMPLEMENT_PY
+    )
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules["implement_under_test_worktree_pool"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=str(cwd), check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """Repo with a ``dev`` branch and a started worktree ``wl-SA-1-first``."""
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q")
+    _git(root, "config", "user.email", "test@test.com")
+    _git(root, "config", "user.name", "Test")
+    (root / ".gitignore").write_text("build/\n.worklog/\n")
+    (root / "app.py").write_text("x = 1\n")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "init")
+    _git(root, "branch", "dev")
+    _git(root, "worktree", "add", "-q", "--track", "-b", "wl-SA-1-first",
+         ".worklog/worktrees/wl-SA-1-first", "dev")
+    return root.resolve()
+
+
+@pytest.fixture
+def pool_size(monkeypatch):
+    def set_size(size):
+        monkeypatch.setenv("IMPLEMENT_WORKTREE_POOL_SIZE", str(size))
+    set_size(1)
+    return set_size
+
+
+def test_pool_size_setting(implement_mod, monkeypatch):
+    monkeypatch.delenv("IMPLEMENT_WORKTREE_POOL_SIZE", raising=False)
+    assert implement_mod.worktree_pool_size() == 0
+    monkeypatch.setenv("IMPLEMENT_WORKTREE_POOL_SIZE", "3")
+    assert implement_mod.worktree_pool_size() == 3
+    monkeypatch.setenv("IMPLEMENT_WORKTREE_POOL_SIZE", "lots")
+    assert implement_mod.worktree_pool_size() == 0
+
+
+def test_recycle_then_claim(implement_mod, repo, pool_size):
+    wt = repo / ".worklog" / "worktrees" / "wl-SA-1-first"
+    (wt / "app.py").write_text("x = 2\n")
+    (wt / "scratch.txt").write_text("untracked\n")
+    (wt / "build").mkdir()
+    (wt / "build" / "out.o").write_text("warm\n")
+
+    assert implement_mod._recycle_worktree(str(wt), str(repo)) is True
+    assert not wt.exists()
+    [entry] = implement_mod._pool_entries(str(repo))
+    assert implement_mod._pool_worktree_healthy(entry)
+    assert not (entry / "scratch.txt").exists()
+    assert (entry / "build" / "out.o").exists()
+
+    # dev moves on between the two items.
+    (repo / "app.py").write_text("x = 3\n")
+    _git(repo, "commit", "-q", "-am", "advance")
+    _git(repo, "branch", "-f", "dev", "HEAD")
+
+    claimed = implement_mod._claim_pooled_worktree(
+        "wl-SA-2-next", ".worklog/worktrees/wl-SA-2-next", "dev", str(repo)
+    )
+    assert claimed is True
+    new_wt = repo / ".worklog" / "worktrees" / "wl-SA-2-next"
+    assert _git(new_wt, "branch", "--show-current") == "wl-SA-2-next"
+    assert _git(new_wt, "rev-parse", "HEAD") == _git(repo, "rev-parse", "dev")
+    assert (new_wt / "app.py").read_text() == "x = 3\n"
+    assert (new_wt / "build" / "out.o").exists()
+    assert implement_mod._pool_entries(str(repo)) == []
+
+
+def test_pool_does_not_grow_past_size(implement_mod, repo, pool_size):
+    pool_size(0)
+    wt = repo / ".worklog" / "worktrees" / "wl-SA-1-first"
+    assert implement_mod._recycle_worktree(str(wt), str(repo)) is False
+    pool_size(1)
+    _git(repo, "worktree", "add", "-q", "--detach",
+         ".worklog/worktrees/.pool/wt-existing", "dev")
+    assert implement_mod._recycle_worktree(str(wt), str(repo)) is False
+    assert wt.exists()
+
+
+def test_unhealthy_entries_are_discarded(implement_mod, repo, pool_size):
+    stray = repo / ".worklog" / "worktrees" / ".pool" / "wt-stray"
+    stray.mkdir(parents=True)
+    (stray / "leftover.txt").write_text("not a worktree\n")
+    claimed = implement_mod._claim_pooled_worktree(
+        "wl-SA-2-next", ".worklog/worktrees/wl-SA-2-next", "dev", str(repo)
+    )
+    assert claimed is False
+    assert not stray.exists()
+
+
+def test_failed_switch_parks_worktree_again(implement_mod, repo, pool_size):
+    wt = repo / ".worklog" / "worktrees" / "wl-SA-1-first"
+    assert implement_mod._recycle_worktree(str(wt), str(repo)) is True
+    [entry] = implement_mod._pool_entries(str(repo))
+    # The branch already exists, so `git switch -c` fails.
+    claimed = implement_mod._claim_pooled_worktree(
+        "wl-SA-1-first", ".worklog/worktrees/wl-SA-1-again", "dev", str(repo)
+    )
+    assert claimed is False
+    assert implement_mod._pool_entries(str(repo)) == [entry]
+    assert not (repo / ".worklog" / "worktrees" / "wl-SA-1-again").exists()
@@ -1,8 +1,12 @@
 """Unit tests for the owner-inference skill (infer_owner.py)."""
 
+import os
 import subprocess
 
+import pytest
+
 import skill.owner_inference.scripts.infer_owner as io
+from skill.shared.codeowners import CodeOwners
 
 # ---------------------------------------------------------------------------
 # Owner map tests
@@ -236,3 +240,83 @@ def test_infer_owner_threshold(tmp_path):
     result = io.infer_owner(str(tmp_path), "nonexistent.py", confidence_threshold=2.0)
     assert result["assignee"] == "Build"
     assert result["heuristic"] == "fallback"
+
+
+# ---------------------------------------------------------------------------
+# Ownership index
+# ---------------------------------------------------------------------------
+
+
+def _commit_as(root, author, files):
+    for name, text in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    git = ["git", "-c", f"user.name={author}", "-c", "user.email=x@test.com"]
+    subprocess.run([*git, "add", "."], cwd=str(root), capture_output=True, check=True)
+    subprocess.run([*git, "commit", "-m", author], cwd=str(root), capture_output=True, check=True)
+
+
+def test_ownership_index_heaviest_author(tmp_path):
+    """The index attributes a file to the author with the most changed lines."""
+    subprocess.run(["git", "init"], cwd=str(tmp_path), capture_output=True, check=True)
+    _commit_as(tmp_path, "Author A", {"pkg/mod.py": "1\n2\n3\n4\n"})
+    _commit_as(tmp_path, "Author B", {"pkg/mod.py": "1\n2\n3\n4\n5\n"})
+    result = io.check_ownership_index(str(tmp_path), "pkg/mod.py")
+    assert result is not None
+    assignee, confidence, reason = result
+    assert assignee == "Author A"
+    assert confidence == pytest.approx(0.56)  # 4/5 changed lines, blame-scaled
+    assert "ownership index" in reason
+
+
+def test_ownership_index_directory_fallback(tmp_path):
+    """A file without history falls back to its directory's heaviest author."""
+    subprocess.run(["git", "init"], cwd=str(tmp_path), capture_output=True, check=True)
+    _commit_as(tmp_path, "Author D", {"pkg/a.py": "x\n", "pkg/b.py": "y\n"})
+    (tmp_path / "pkg" / "new.py").write_text("z\n")
+    result = io.infer_owner(str(tmp_path / "pkg"), "new.py")
+    assert result["assignee"] == "Author D"
+    assert result["confidence"] == 0.5
+    assert result["heuristic"] == "ownership_index"
+    assert "under pkg/" in result["reason"]
+
+
+def test_codeowners_reparsed_only_when_changed(tmp_path, monkeypatch):
+    """The compiled CODEOWNERS matcher is reused until the file's mtime changes."""
+    codeowners = tmp_path / "CODEOWNERS"
+    codeowners.write_text("*.py @first-team\n")
+    assert io.check_codeowners(str(tmp_path), "a.py")[0] == "first-team"
+
+    parsed = []
+    real_from_text = CodeOwners.from_text.__func__
+    monkeypatch.setattr(
+        CodeOwners, "from_text",
+        classmethod(lambda cls, text: parsed.append(text) or real_from_text(cls, text)),
+    )
+    assert io.check_codeowners(str(tmp_path), "b.py")[0] == "first-team"
+    assert parsed == []
+
+    codeowners.write_text("*.py @second-team\n")
+    stat = codeowners.stat()
+    os.utime(codeowners, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert io.check_codeowners(str(tmp_path), "b.py")[0] == "second-team"
+    assert len(parsed) == 1
+
+
+def test_codeowners_gitignore_semantics(tmp_path):
+    """Anchoring, directory patterns and ** follow gitignore rules."""
+    (tmp_path / "CODEOWNERS").write_text(
+        "* @default\n"
+        "/build/ @root-build\n"
+        "docs @docs-team\n"
+        "src/**/fixtures/ @fixtures-team\n"
+        "src/vendor/ \n"
+    )
+    owner = lambda p: (io.check_codeowners(str(tmp_path), p) or (None,))[0]  # noqa: E731
+    assert owner("build/out.o") == "root-build"
+    assert owner("pkg/build/out.o") == "default"          # anchored to root
+    assert owner("pkg/docs/guide.md") == "docs-team"      # unanchored: any depth
+    assert owner("src/fixtures/a.json") == "fixtures-team"  # ** spans zero dirs
+    assert owner("src/a/b/fixtures/a.json") == "fixtures-team"
+    assert owner("src/vendor/lib.py") is None             # rule without owners
@@ -1072,3 +1072,143 @@ class TestQualityEpicCreation:
         call_str = " ".join(str(a) for a in epic_create[0])
         assert "--priority" in call_str
         assert "low" in call_str
+
+
+# ===================================================================
+# Tests: bulk mode (QualityEpicStore + batched Worklog writes)
+# ===================================================================
+
+
+class TestQualityEpicBulkMode:
+    """A run makes a constant number of Worklog reads, whatever the size."""
+
+    def _runner(self, existing_titles=(), priority="low", show_fails=False):
+        import threading
+
+        lock = threading.Lock()
+        calls: list[list[str]] = []
+
+        def fake_runner(cmd, **kwargs):
+            with lock:
+                calls.append(list(cmd))
+            if cmd[:2] == ["wl", "list"]:
+                items = []
+                if "open" in cmd:
+                    items = [{
+                        "id": "SA-EPIC", "title": EXPECTED_EPIC_TITLE,
+                        "status": "open", "issueType": "epic",
+                        "createdAt": "2026-01-01T00:00:00.000Z",
+                    }]
+                return _fake_proc(stdout=json.dumps(
+                    {"success": True, "workItems": items}))
+            if cmd[:2] == ["wl", "show"]:
+                if show_fails:
+                    return _fake_proc(returncode=1, stderr="show failed")
+                return _fake_proc(stdout=json.dumps({
+                    "success": True,
+                    "workItem": {"id": "SA-EPIC", "priority": priority},
+                    "children": [{"title": t} for t in existing_titles],
+                }))
+            if "--title" in cmd:
+                if "boom" in cmd[cmd.index("--title") + 1]:
+                    return _fake_proc(returncode=1, stderr="boom")
+            return _fake_proc(stdout=json.dumps(
+                {"success": True, "workItem": {"id": "SA-NEW"}}))
+
+        return fake_runner, calls
+
+    @staticmethod
+    def _findings(n, severity="medium"):
+        return [
+            {"severity": severity, "file": f"src/m{i}.py", "line": i,
+             "message": "x", "linter": "ruff", "code": "E501"}
+            for i in range(n)
+        ]
+
+    def test_reads_are_constant_for_200_findings(self):
+        from skill.code_review.scripts import create_quality_epics as mod
+
+        runner, calls = self._runner()
+        result = mod.create_epics_for_findings(self._findings(200),
+                                               runner=runner)
+
+        reads = [c for c in calls if c[1] in ("list", "show")]
+        assert len(reads) <= 3
+        assert result["children_created"] == 200
+
+    def test_existing_children_are_diffed_in_memory(self):
+        from skill.code_review.scripts import create_quality_epics as mod
+
+        findings = self._findings(10)
+        existing = [mod._finding_title(f) for f in findings[:7]]
+        runner, calls = self._runner(existing_titles=existing)
+        result = mod.create_epics_for_findings(findings, runner=runner)
+
+        creates = [c for c in calls if c[1] == "create"]
+        assert result["children_created"] == 3
+        assert len(creates) == 3
+
+    def test_duplicate_findings_in_one_run_create_once(self):
+        from skill.code_review.scripts import create_quality_epics as mod
+
+        runner, calls = self._runner()
+        findings = self._findings(1) * 5
+        result = mod.create_epics_for_findings(findings, runner=runner)
+
+        assert result["children_created"] == 1
+
+    def test_priority_escalated_from_snapshot_without_extra_show(self):
+        from skill.code_review.scripts import create_quality_epics as mod
+
+        runner, calls = self._runner(priority="low")
+        mod.create_epics_for_findings(self._findings(3, "high"), runner=runner)
+
+        shows = [c for c in calls if c[1] == "show"]
+        updates = [c for c in calls if c[1] == "update"]
+        assert len(shows) == 1
+        assert updates == [["wl", "update", "SA-EPIC", "--priority", "high",
+                            "--json"]]
+
+    def test_no_escalation_when_epic_priority_unknown(self):
+        from skill.code_review.scripts import create_quality_epics as mod
+
+        runner, calls = self._runner(show_fails=True)
+        result = mod.create_epics_for_findings(self._findings(2, "critical"),
+                                               runner=runner)
+
+        assert result["children_created"] == 2
+        assert not [c for c in calls if c[1] == "update"]
+
+    def test_no_escalation_when_every_create_fails(self, capsys):
+        from skill.code_review.scripts import create_quality_epics as mod
+
+        runner, calls = self._runner(priority="low")
+        findings = self._findings(2, "high")
+        for finding in findings:
+            finding["message"] = "boom"
+        result = mod.create_epics_for_findings(findings, runner=runner)
+
+        assert result["children_created"] == 0
+        assert not [c for c in calls if c[1] == "update"]
+        assert "failed to create child task" in capsys.readouterr().err
+
+    def test_failed_create_is_reported_not_raised(self, capsys):
+        from skill.code_review.scripts import create_quality_epics as mod
+
+        runner, _calls = self._runner()
+        findings = self._findings(2)
+        findings[0]["message"] = "boom"
+        result = mod.create_epics_for_findings(findings, runner=runner)
+
+        assert result["children_created"] == 1
+        assert "failed to create child task" in capsys.readouterr().err
+
+    def test_write_workers_env_serialises(self, monkeypatch):
+        from skill.code_review.scripts import create_quality_epics as mod
+
+        monkeypatch.setenv(mod.WL_WRITE_WORKERS_ENV, "1")
+        runner, calls = self._runner()
+        mod.create_epics_for_findings(self._findings(4), runner=runner)
+
+        titles = [c[c.index("--title") + 1] for c in calls if c[1] == "create"]
+        assert titles == [mod._finding_title(f) for f in self._findings(4)]
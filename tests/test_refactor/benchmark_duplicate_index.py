@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Benchmark the cross-file duplicate-code index on a generated repo.
+
+Generates a synthetic source tree (default 100k Python files; every
+``PLANT_EVERY``-th file carries a copy-pasted block shared with exactly one
+other file), then measures:
+
+- ``build``        — first full ``refresh()`` (every file fingerprinted)
+- ``noop_refresh`` — a second full ``refresh()`` with nothing changed
+                     (stat pass only; this is the per-run cost in practice)
+- ``incremental``  — full ``refresh()`` after rewriting a few files
+- ``query``        — ``duplicates_for()`` over a session-sized file set
+
+and checks that every planted copy is reported. Output is JSON.
+
+Run (from repo root):
+
+    python3 tests/test_refactor/benchmark_duplicate_index.py
+    python3 tests/test_refactor/benchmark_duplicate_index.py --files 20000
+    DUPLICATE_INDEX_BENCH_FILES=5000 python3 tests/test_refactor/benchmark_duplicate_index.py
+
+No network access is required. The fixture is generated in a temp dir
+(outside git, so the index walks the tree) and removed on exit.
+"""  # noqa: EXE001
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from skill.refactor.duplicate_index import DuplicateIndex  # noqa: E402
+
+DEFAULT_FILES = int(os.environ.get("DUPLICATE_INDEX_BENCH_FILES", "100000"))
+
+# Every PLANT_EVERY-th file carries a copy of PLANTED_BLOCK; consecutive
+# planted files form pairs sharing the same variant, so no block is common
+# enough to be discarded as boilerplate.
+PLANT_EVERY = 997
+
+# Files per generated directory.
+FILES_PER_DIR = 500
+
+# Files rewritten for the incremental measurement / queried as a "session".
+CHANGED_FILES = 10
+SESSION_FILES = 20
+
+PLANTED_BLOCK = '''
+def reconcile_ledger(entries, opening_balance):
+    balance = opening_balance
+    rejected = []
+    for entry in entries:
+        if entry.amount is None or entry.account is None:
+            rejected.append(entry)
+            continue
+        if entry.kind == "credit":
+            balance += entry.amount
+        elif entry.kind == "debit":
+            balance -= entry.amount
+        else:
+            rejected.append(entry)
+    return balance, rejected
+'''
+
+
+def _module_source(i: int) -> str:
+    """Return a unique, realistic-looking module body for file *i*."""
+    return (
+        f'"""Generated module {i}."""\n\n'
+        f"import os\n\n"
+        f"LIMIT_{i} = {i % 97}\n\n\n"
+        f"def load_{i}(path_{i}):\n"
+        f"    with open(path_{i}) as handle_{i}:\n"
+        f"        rows_{i} = [r.strip() for r in handle_{i} if r]\n"
+        f"    return rows_{i}[:LIMIT_{i}]\n\n\n"
+        f"class Service{i}:\n"
+        f"    def __init__(self, store_{i}):\n"
+        f"        self.store_{i} = store_{i}\n\n"
+        f"    def fetch_{i}(self, key_{i}):\n"
+        f"        value_{i} = self.store_{i}.get(key_{i})\n"
+        f"        if value_{i} is None:\n"
+        f"            value_{i} = os.environ.get(key_{i}, '')\n"
+        f"        return value_{i}\n"
+    )
+
+
+def _rel(i: int) -> str:
+    return f"src/pkg{i // FILES_PER_DIR:04d}/mod_{i:06d}.py"
+
+
+def generate_fixture(root: Path, count: int) -> dict:
+    """Write *count* modules under *root*; return fixture metadata."""
+    planted = []
+    for i in range(count):
+        path = root / _rel(i)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        source = _module_source(i)
+        if i % PLANT_EVERY == 0:
+            variant = len(planted) // 2
+            source += "\n" + PLANTED_BLOCK.replace("entry", f"entry{variant}")
+            planted.append(_rel(i))
+        path.write_text(source)
+    return {"files": count, "planted": planted}
+
+
+def _timed(fn):
+    t0 = time.monotonic()
+    result = fn()
+    return result, round(time.monotonic() - t0, 4)
+
+
+def run_benchmark(root: Path, count: int) -> dict:
+    """Generate a fixture under *root* and measure index operations."""
+    fixture = generate_fixture(root, count)
+    planted = fixture["planted"]
+    index_file = root / ".bench-index.sqlite3"
+
+    with DuplicateIndex(root, path=index_file) as index:
+        build_stats, build = _timed(index.refresh)
+        noop_stats, noop = _timed(index.refresh)
+
+        changed = [_rel(i) for i in range(1, 1 + min(CHANGED_FILES, count - 1))]
+        for rel in changed:
+            path = root / rel
+            path.write_text(path.read_text() + "\n\nEXTRA = 1\n")
+        incr_stats, incremental = _timed(index.refresh)
+
+        candidates = planted[:2] + [_rel(i) for i in range(SESSION_FILES)]
+        session = list(dict.fromkeys(candidates))[:SESSION_FILES]
+        spans, query = _timed(lambda: index.duplicates_for(session))
+
+    planted_in_session = [p for p in session if p in planted]
+    reported = {s["file"] for s in spans}
+    return {
+        "files": count,
+        "planted_copies": len(planted),
+        "index_bytes": index_file.stat().st_size,
+        "seconds": {
+            "build": build,
+            "noop_refresh": noop,
+            "incremental": incremental,
+            "query": query,
+        },
+        "refresh_stats": {
+            "build": build_stats,
+            "noop_refresh": noop_stats,
+            "incremental": incr_stats,
+        },
+        "session_files": len(session),
+        "duplicate_spans": len(spans),
+        "planted_found": all(p in reported for p in planted_in_session)
+        if len(planted) > 1 else True,
+        "noop_speedup_x": round(build / noop, 1) if noop > 0 else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=DEFAULT_FILES,
+                        help=f"Number of generated files (default {DEFAULT_FILES})")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="duplicate-index-bench-") as tmp:
+        report = run_benchmark(Path(tmp), max(2, args.files))
+    print(json.dumps(report, indent=2))
+    return 0 if report["planted_found"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""Tests for the in-process Python AST smell detector.
+
+These tests verify that:
+- Long functions, deep nesting, high complexity and long parameter lists
+  are reported with the standard finding schema
+- Duplicated blocks are found across files via normalized-AST hashing and
+  reported once per duplicated unit (not per nested statement)
+- ``detect_smells(mode="ast")`` runs without any linter binary
+- Hybrid mode falls back to the AST source when ruff is unavailable
+- Large file sets go through the process pool with identical results
+
+The target implementation lives in skill/refactor/ast_smells.py.
+"""
+from __future__ import annotations
+
+import ast
+import sys
+import textwrap
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from skill.refactor import ast_smells  # noqa: E402
+from skill.refactor.smell_detection import (  # noqa: E402
+    REQUIRED_FINDING_KEYS,
+    VALID_SEVERITIES,
+    _linter_code_to_smell_type,
+    detect_smells,
+)
+
+_SMELL_MOD = "skill.refactor.smell_detection"
+
+
+def _codes(findings):
+    return sorted(f["code"] for f in findings)
+
+
+def _write(path: Path, source: str) -> str:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(source))
+    return str(path)
+
+
+_DUPLICATED = """
+def {name}(items):
+    total = 0
+    for item in items:
+        if item > 0:
+            total += item
+        else:
+            total -= item
+    return total
+"""
+
+
+class TestAnalyzeSource:
+    def test_clean_source_has_no_findings(self):
+        findings, _ = ast_smells.analyze_source(
+            "def f(a, b):\n    return a + b\n", "x.py",
+        )
+        assert findings == []
+
+    def test_syntax_error_is_skipped(self):
+        assert ast_smells.analyze_source("def (:\n", "bad.py") == ([], [])
+
+    def test_long_function(self):
+        body = "".join(f"    x{i} = {i}\n" for i in range(10))
+        findings, _ = ast_smells.analyze_source(
+            f"def f():\n{body}", "x.py", {"max_function_lines": 5},
+        )
+        assert _codes(findings) == ["PLR0915"]
+        assert findings[0]["smell_type"] == "long_method"
+        assert findings[0]["line"] == 1
+
+    def test_too_many_parameters_ignores_self(self):
+        src = "class A:\n    def m(self, a, b, c):\n        pass\n"
+        findings, _ = ast_smells.analyze_source(src, "x.py", {"max_parameters": 3})
+        assert findings == []
+        findings, _ = ast_smells.analyze_source(src, "x.py", {"max_parameters": 2})
+        assert _codes(findings) == ["PLR0913"]
+
+    def test_deep_nesting_does_not_count_elif(self):
+        flat = textwrap.dedent("""
+            def f(x):
+                if x == 1:
+                    return 1
+                elif x == 2:
+                    return 2
+                elif x == 3:
+                    return 3
+                elif x == 4:
+                    return 4
+        """)
+        nested = textwrap.dedent("""
+            def f(x):
+                for a in x:
+                    for b in a:
+                        if b:
+                            while b:
+                                b -= 1
+        """)
+        rules = {"max_nesting": 3, "max_complexity": 99}
+        assert ast_smells.analyze_source(flat, "x.py", rules)[0] == []
+        findings, _ = ast_smells.analyze_source(nested, "x.py", rules)
+        assert _codes(findings) == ["PLR1702"]
+        assert "4 levels" in findings[0]["message"]
+
+    def test_cyclomatic_complexity(self):
+        src = textwrap.dedent("""
+            def f(a, b):
+                if a and b:
+                    pass
+                for x in a:
+                    pass
+                try:
+                    pass
+                except ValueError:
+                    pass
+                return [y for y in b if y]
+        """)
+        tree_func = ast.parse(src).body[0]
+        # 1 + if + and + for + except + comprehension(for + if)
+        assert ast_smells._cyclomatic_complexity(tree_func) == 7
+        findings, _ = ast_smells.analyze_source(src, "x.py", {"max_complexity": 6})
+        assert _codes(findings) == ["C901"]
+        assert findings[0]["smell_type"] == "complex_function"
+
+    def test_nested_function_is_measured_separately(self):
+        src = textwrap.dedent("""
+            def outer():
+                def inner(a):
+                    if a:
+                        return 1
+                    if not a:
+                        return 2
+                return inner
+        """)
+        funcs = [n for n in ast.walk(ast.parse(src))
+                 if isinstance(n, ast.FunctionDef)]
+        assert [ast_smells._cyclomatic_complexity(f) for f in funcs] == [1, 3]
+
+    def test_findings_match_schema(self):
+        findings, _ = ast_smells.analyze_source(
+            "def f(a, b, c):\n    pass\n", "x.py", {"max_parameters": 1},
+        )
+        for finding in findings:
+            assert set(finding) == REQUIRED_FINDING_KEYS
+            assert finding["severity"] in VALID_SEVERITIES
+            assert finding["source"] == "ast"
+
+
+class TestDuplicateDetection:
+    def test_duplicate_across_files_with_renamed_identifiers(self, tmp_path):
+        a = _write(tmp_path / "a.py", _DUPLICATED.format(name="sum_a"))
+        b = _write(
+            tmp_path / "b.py",
+            _DUPLICATED.format(name="sum_b").replace("total", "acc"),
+        )
+        findings = ast_smells.analyze_files([a, b])
+        dups = [f for f in findings if f["code"] == "R0801"]
+        # One finding per copy of the function, not per nested block.
+        assert sorted(f["file"] for f in dups) == [a, b]
+        assert all(f["line"] == 2 for f in dups)
+        assert all(f["smell_type"] == "duplicate_code" for f in dups)
+        assert f"{b}:2" in next(f for f in dups if f["file"] == a)["message"]
+
+    def test_docstrings_do_not_prevent_matches(self, tmp_path):
+        with_doc = _DUPLICATED.format(name="f").replace(
+            "(items):\n", '(items):\n    """Sum."""\n',
+        )
+        a = _write(tmp_path / "a.py", with_doc)
+        b = _write(tmp_path / "b.py", _DUPLICATED.format(name="g"))
+        dups = [f for f in ast_smells.analyze_files([a, b]) if f["code"] == "R0801"]
+        assert len(dups) == 2
+
+    def test_different_logic_is_not_duplicate(self, tmp_path):
+        a = _write(tmp_path / "a.py", _DUPLICATED.format(name="f"))
+        b = _write(
+            tmp_path / "b.py",
+            _DUPLICATED.format(name="g").replace("total -= item", "total *= item"),
+        )
+        assert ast_smells.analyze_files([a, b]) == []
+
+    def test_different_callees_are_not_duplicate(self, tmp_path):
+        a = _write(tmp_path / "a.py", _DUPLICATED.format(name="f").replace(
+            "total += item", "total += abs(item)"))
+        b = _write(tmp_path / "b.py", _DUPLICATED.format(name="g").replace(
+            "total += item", "total += round(item)"))
+        assert ast_smells.analyze_files([a, b]) == []
+
+    def test_small_blocks_are_ignored(self, tmp_path):
+        a = _write(tmp_path / "a.py", "def f(x):\n    return x\n")
+        b = _write(tmp_path / "b.py", "def g(y):\n    return y\n")
+        assert ast_smells.analyze_files([a, b]) == []
+
+
+class TestAnalyzeFiles:
+    def test_non_python_and_missing_files_are_ignored(self, tmp_path):
+        js = _write(tmp_path / "a.js", "function f() {}\n")
+        assert ast_smells.analyze_files([js, str(tmp_path / "nope.py")]) == []
+
+    def test_process_pool_matches_serial(self, tmp_path):
+        files = [
+            _write(tmp_path / f"m{i}.py", _DUPLICATED.format(name=f"f{i}"))
+            for i in range(4)
+        ]
+        serial = ast_smells.analyze_files(files, {"parallel_threshold": 100})
+        pooled = ast_smells.analyze_files(
+            files, {"parallel_threshold": 2}, max_workers=2,
+        )
+        assert len(serial) == 4
+        assert pooled == serial
+
+
+class TestDetectSmellsAstMode:
+    @pytest.fixture
+    def smelly_file(self, tmp_path):
+        params = ", ".join(f"p{i}" for i in range(9))
+        return _write(tmp_path / "smelly.py", f"def f({params}):\n    pass\n")
+
+    def test_ast_mode_needs_no_linter(self, smelly_file):
+        with patch(f"{_SMELL_MOD}.probe_linter") as probe:
+            findings = detect_smells([smelly_file], mode="ast")
+        probe.assert_not_called()
+        assert _codes(findings) == ["PLR0913"]
+        assert findings[0]["source"] == "ast"
+
+    def test_ast_mode_can_be_disabled(self, smelly_file):
+        rules = {"ast": {"enabled": False}}
+        assert detect_smells([smelly_file], mode="ast", rules=rules) == []
+
+    def test_hybrid_falls_back_to_ast_without_ruff(self, smelly_file):
+        with patch(f"{_SMELL_MOD}.probe_linter",
+                   return_value={"available": False}):
+            findings = detect_smells([smelly_file], mode="hybrid")
+        assert _codes(findings) == ["PLR0913"]
+
+    def test_hybrid_skips_ast_when_ruff_available(self, smelly_file):
+        with (
+            patch(f"{_SMELL_MOD}.probe_linter", return_value={"available": True}),
+            patch(f"{_SMELL_MOD}.detect_linter_smells", return_value=[]),
+        ):
+            assert detect_smells([smelly_file], mode="hybrid") == []
+
+    def test_with_linter_runs_ast_alongside_ruff(self, smelly_file):
+        rules = {"ast": {"with_linter": True}}
+        with (
+            patch(f"{_SMELL_MOD}.probe_linter", return_value={"available": True}),
+            patch(f"{_SMELL_MOD}.detect_linter_smells", return_value=[]),
+        ):
+            findings = detect_smells([smelly_file], mode="linter", rules=rules)
+        assert _codes(findings) == ["PLR0913"]
+
+    def test_ast_codes_map_to_smell_types(self):
+        assert _linter_code_to_smell_type("ast", "C901") == "complex_function"
+        assert _linter_code_to_smell_type("ast", "R0801") == "duplicate_code"
+        assert _linter_code_to_smell_type("ast", "X999") == "unknown"
@@ -1249,3 +1249,113 @@ class TestIntegrationScenario:
         assert "security" in content
         assert "unused_variable" in content
         assert "documentation" in content
+
+
+# ---------------------------------------------------------------------------
+# Tests: Batch Injection
+# ---------------------------------------------------------------------------
+
+
+class TestBatchInjection:
+    """inject_refactor_comments: one read and one write per file."""
+
+    @staticmethod
+    def _smells(file_path: Path) -> list[dict[str, Any]]:
+        return [
+            {"file": str(file_path), "line": n, "severity": "low",
+             "message": f"Smell {n}", "source": "linter",
+             "smell_type": smell_type, "code": "X"}
+            for n, smell_type in enumerate(
+                ["security", "unused_variable", "documentation"], start=1
+            )
+        ]
+
+    def test_matches_sequential_injection(self, temp_dir: Path):
+        """A batch leaves each file exactly as sequential injections would."""
+        comment_mod = _import_comment_injection()
+        batch_file = temp_dir / "batch.py"
+        seq_file = temp_dir / "seq.py"
+        for path in (batch_file, seq_file):
+            path.write_text("x = 1\n")
+
+        smells = self._smells(batch_file)
+        outcomes = comment_mod.inject_refactor_comments(
+            [(str(batch_file), smell, f"SA-{n}") for n, smell in enumerate(smells)]
+        )
+        for n, smell in enumerate(smells):
+            comment_mod.inject_refactor_comment(str(seq_file), smell, f"SA-{n}")
+
+        assert batch_file.read_text() == seq_file.read_text()
+        assert [o["reason"] for o in outcomes] == ["injected"] * 3
+        assert len({o["lines_added"] for o in outcomes}) == 1
+        added = outcomes[0]["lines_added"]
+        assert batch_file.read_text().splitlines()[added] == "x = 1"
+
+    def test_reads_and_writes_each_file_once(self, temp_dir: Path, monkeypatch):
+        """Several smells in one file cost a single write."""
+        comment_mod = _import_comment_injection()
+        file_path = temp_dir / "busy.py"
+        file_path.write_text("x = 1\n")
+
+        writes = []
+        real_write = comment_mod._atomic_write
+        monkeypatch.setattr(
+            comment_mod, "_atomic_write",
+            lambda path, content: (writes.append(path), real_write(path, content)),
+        )
+        comment_mod.inject_refactor_comments(
+            [(str(file_path), smell, "SA-1") for smell in self._smells(file_path)]
+        )
+        assert writes == [str(file_path)]
+
+    def test_duplicates_in_file_and_batch_are_skipped(
+        self, temp_dir: Path, sample_smell: dict[str, Any]
+    ):
+        """Smell types already commented, or repeated in the batch, are skipped."""
+        comment_mod = _import_comment_injection()
+        file_path = temp_dir / "dup.py"
+        file_path.write_text("x = 1\n")
+        assert comment_mod.inject_refactor_comment(str(file_path), sample_smell, "SA-1")
+
+        other = dict(sample_smell, smell_type="complexity")
+        outcomes = comment_mod.inject_refactor_comments([
+            (str(file_path), sample_smell, "SA-2"),
+            (str(file_path), other, "SA-3"),
+            (str(file_path), other, "SA-4"),
+        ])
+        assert [o["reason"] for o in outcomes] == ["duplicate", "injected", "duplicate"]
+        assert "SA-4" not in file_path.read_text()
+
+    def test_per_entry_outcomes_in_input_order(
+        self, temp_dir: Path, sample_smell: dict[str, Any]
+    ):
+        """Failures are reported per entry without affecting other files."""
+        comment_mod = _import_comment_injection()
+        good = temp_dir / "good.py"
+        good.write_text("x = 1\n")
+        readonly = temp_dir / "readonly.py"
+        readonly.write_text("y = 2\n")
+        readonly.chmod(0o444)
+
+        outcomes = comment_mod.inject_refactor_comments([
+            (str(temp_dir / "missing.py"), sample_smell, "SA-1"),
+            (str(good), sample_smell, ""),
+            (str(readonly), sample_smell, "SA-2"),
+            (str(good), sample_smell, "SA-3"),
+        ])
+        assert [o["reason"] for o in outcomes] == [
+            "missing_file", "invalid_arguments", "write_error", "injected",
+        ]
+        assert [o["injected"] for o in outcomes] == [False, False, False, True]
+        assert readonly.read_text() == "y = 2\n"
+        assert not [p for p in temp_dir.iterdir() if p.name.startswith(".refactor-comment-")]
+
+    def test_preserves_file_mode(self, temp_dir: Path, sample_smell: dict[str, Any]):
+        """The atomic replace keeps the original permission bits."""
+        comment_mod = _import_comment_injection()
+        script = temp_dir / "run.sh"
+        script.write_text("#!/bin/sh\necho hi\n")
+        script.chmod(0o755)
+        outcome = comment_mod.inject_refactor_comments([(str(script), sample_smell, "SA-1")])[0]
+        assert outcome["injected"] is True
+        assert script.stat().st_mode & 0o777 == 0o755
@@ -0,0 +1,229 @@
+"""Tests for the cross-file duplicate-code index.
+
+These tests verify that:
+- Winnowing fingerprints are stable and literal-insensitive
+- refresh() is incremental: unchanged files are not re-read, rewritten
+  files with identical content keep their fingerprints, deleted files drop
+- Copied spans are reported across files with line ranges on both sides,
+  and boilerplate shared by too many files is ignored
+- find_duplicate_smells() returns standard smell findings
+- refactor_pipeline folds duplicate findings into the detected smells
+- The benchmark harness runs on a small fixture and finds planted copies
+
+The target implementation lives in skill/refactor/duplicate_index.py.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import benchmark_duplicate_index as bench  # noqa: E402
+
+from skill.refactor import duplicate_index as di  # noqa: E402
+from skill.refactor.smell_detection import REQUIRED_FINDING_KEYS  # noqa: E402
+
+_COPIED = '''
+def merge_settings(defaults, overrides):
+    result = dict(defaults)
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = merge_settings(result[key], value)
+        elif value is None:
+            result.pop(key, None)
+        else:
+            result[key] = value
+    return result
+'''
+
+
+def _write(root: Path, rel: str, text: str) -> str:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    return rel
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    _write(tmp_path, "a/settings.py", "import os\n\n" + _COPIED)
+    _write(tmp_path, "b/config.py", '"""Config."""\nX = 1\n\n\n' + _COPIED)
+    _write(tmp_path, "c/other.py", "def unrelated(x):\n    return x * 2\n")
+    return tmp_path
+
+
+@pytest.fixture
+def index(repo: Path):
+    with di.DuplicateIndex(repo, path=repo / ".idx.sqlite3") as idx:
+        yield idx
+
+
+class TestFingerprints:
+    def test_short_text_has_no_fingerprints(self):
+        assert di.fingerprint_text("x = 1\n") == []
+
+    def test_literals_are_normalized(self):
+        a = _COPIED.replace("dict(defaults)", "dict(defaults)  # copy")
+        b = _COPIED + "\nLIMIT = 10\nNAME = 'a'\n"
+        c = _COPIED + "\nLIMIT = 99\nNAME = 'zzz'\n"
+        assert di.fingerprint_text(a) == di.fingerprint_text(_COPIED)
+        assert [h for h, _s, _e in di.fingerprint_text(b)] == [
+            h for h, _s, _e in di.fingerprint_text(c)
+        ]
+
+    def test_line_ranges_track_source(self):
+        fps = di.fingerprint_text("\n\n\n" + _COPIED)
+        assert min(s for _h, s, _e in fps) >= 4
+        assert all(s <= e for _h, s, e in fps)
+
+
+class TestRefresh:
+    def test_full_build_then_noop(self, index):
+        assert index.refresh()["fingerprinted"] == 3
+        stats = index.refresh()
+        assert stats["fingerprinted"] == 0
+        assert stats["unchanged"] == 3
+
+    def test_unchanged_files_are_not_read(self, index):
+        index.refresh()
+        with patch.object(di, "_fingerprint_path") as fingerprint:
+            index.refresh()
+        fingerprint.assert_not_called()
+
+    def test_touched_but_identical_file_keeps_fingerprints(self, repo, index):
+        index.refresh()
+        path = repo / "a/settings.py"
+        os.utime(path, ns=(1, 1))
+        stats = index.refresh()
+        assert stats["fingerprinted"] == 0
+        assert index.duplicates_for(["a/settings.py"])
+
+    def test_changed_file_is_refingerprinted(self, repo, index):
+        index.refresh()
+        (repo / "b/config.py").write_text("def different(y):\n    return y\n")
+        assert index.refresh()["fingerprinted"] == 1
+        assert index.duplicates_for(["a/settings.py"]) == []
+
+    def test_deleted_file_is_removed(self, repo, index):
+        index.refresh()
+        (repo / "b/config.py").unlink()
+        assert index.refresh()["removed"] == 1
+        assert index.file_count() == 2
+
+    def test_params_change_rebuilds(self, repo, index):
+        index.refresh()
+        index.close()
+        with patch.object(di, "_INDEX_VERSION", di._INDEX_VERSION + 1):
+            with di.DuplicateIndex(repo, path=repo / ".idx.sqlite3") as fresh:
+                assert fresh.file_count() == 0
+
+
+class TestDuplicatesFor:
+    def test_reports_span_on_both_sides(self, index):
+        index.refresh()
+        [span] = index.duplicates_for(["a/settings.py"])
+        assert span["other_file"] == "b/config.py"
+        # The copy starts 2 lines later in b/config.py than in a/settings.py.
+        assert span["other_start"] - span["start"] == 2
+        assert span["end"] - span["start"] >= 6
+
+    def test_min_lines_filters_short_spans(self, index):
+        index.refresh()
+        assert index.duplicates_for(["a/settings.py"], min_lines=100) == []
+
+    def test_boilerplate_is_ignored(self, repo):
+        for i in range(4):
+            _write(repo, f"d/copy{i}.py", _COPIED)
+        with di.DuplicateIndex(repo, path=repo / ".idx.sqlite3") as idx:
+            idx.refresh()
+            assert idx.duplicates_for(["a/settings.py"], max_occurrences=3) == []
+            assert len(idx.duplicates_for(["a/settings.py"], max_occurrences=10)) == 5
+
+
+class TestFindDuplicateSmells:
+    def test_findings_use_standard_schema(self, repo, index, monkeypatch):
+        monkeypatch.chdir(repo)
+        findings = di.find_duplicate_smells(
+            ["a/settings.py", "c/other.py"], repo_root=repo, index=index,
+        )
+        assert len(findings) == 1
+        finding = findings[0]
+        assert set(finding) == REQUIRED_FINDING_KEYS
+        assert finding["file"] == "a/settings.py"
+        assert finding["smell_type"] == "duplicate_code"
+        assert "b/config.py:" in finding["message"]
+
+    def test_disabled_or_missing_files_return_nothing(self, repo, index):
+        assert di.find_duplicate_smells(
+            [str(repo / "a/settings.py")], repo_root=repo, index=index,
+            rules={"enabled": False},
+        ) == []
+        assert di.find_duplicate_smells(
+            [str(repo / "missing.py")], repo_root=repo, index=index,
+        ) == []
+
+    def test_index_path_is_in_git_dir(self, tmp_path):
+        subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+        (tmp_path / ".worklog").mkdir()
+        assert di.index_path(tmp_path) == (
+            tmp_path.resolve() / ".git" / "duplicate-index.sqlite3"
+        )
+
+    def test_default_index_leaves_work_tree_clean(self, repo):
+        subprocess.run(["git", "init", "-q", str(repo)], check=True)
+        subprocess.run(["git", "add", "-A"], cwd=repo, check=True)
+        (repo / ".worklog").mkdir()
+        di.find_duplicate_smells([str(repo / "a" / "settings.py")], repo_root=repo)
+        status = subprocess.run(["git", "status", "--porcelain"], cwd=repo,
+                                capture_output=True, text=True, check=True)
+        assert "duplicate-index" not in status.stdout
+        assert (repo / ".git" / "duplicate-index.sqlite3").is_file()
+
+
+class TestPipelineIntegration:
+    def test_duplicates_are_added_to_smells(self):
+        dup = {"file": "a.py", "line": 3, "severity": "medium", "message": "m",
+               "source": "duplicate_index", "smell_type": "duplicate_code",
+               "code": "R0801"}
+        with (
+            patch("skill.refactor.scripts.refactor.detect_session_files",
+                  return_value={"changed": [], "untracked": ["a.py"],
+                                "all_files": ["a.py"]}),
+            patch("skill.refactor.scripts.refactor.auto_fix_files",
+                  return_value={"fixes_applied": False, "fixed_findings": []}),
+            patch("skill.refactor.scripts.refactor.run_smell_detection",
+                  return_value=[]),
+            patch("skill.refactor.scripts.refactor.find_duplicate_smells",
+                  return_value=[dup]),
+            patch("skill.refactor.scripts.refactor.remediate_pre_existing",
+                  return_value={"work_items_created": [], "comments_injected": 0,
+                                "comment_errors": 0}),
+        ):
+            from skill.refactor.scripts.refactor import refactor_pipeline
+
+            report = refactor_pipeline()
+        assert report["smells_detected"] == [dup]
+
+    def test_known_findings_are_not_repeated(self):
+        from skill.refactor.scripts.refactor import run_duplicate_detection
+
+        dup = {"file": "a.py", "line": 3, "code": "R0801"}
+        with patch("skill.refactor.scripts.refactor.find_duplicate_smells",
+                   return_value=[dict(dup)]):
+            assert run_duplicate_detection(["a.py"], {}, known=[dup]) == []
+
+
+def test_benchmark_finds_planted_copies(tmp_path):
+    report = bench.run_benchmark(tmp_path, 2100)
+    assert report["planted_found"] is True
+    assert report["refresh_stats"]["noop_refresh"]["fingerprinted"] == 0
+    assert report["refresh_stats"]["incremental"]["fingerprinted"] == bench.CHANGED_FILES
@@ -1057,6 +1057,118 @@ class TestBatchWorkItemCreation:
         assert results[0] == "SA-0MOCK5678X000WORK"
 
 
+class TestBulkDuplicateDetection:
+    """Batch creation fetches Refactor items once and reads each file once."""
+
+    @staticmethod
+    def _smell(path, line, code="F401", smell_type="unused_import"):
+        return {
+            "file": str(path), "line": line, "severity": "medium",
+            "message": "`os` imported but unused", "source": "linter",
+            "smell_type": smell_type, "code": code,
+        }
+
+    @staticmethod
+    def _fake_wl(monkeypatch, existing_items):
+        """Fake ``wl``: list returns *existing_items*, create hands out ids."""
+        import skill.refactor.workitem_creation as wc
+
+        calls: list[list[str]] = []
+
+        def _fake_run(cmd, *args, **kwargs):
+            calls.append(list(cmd))
+            if cmd[:2] == ["wl", "list"]:
+                return _cp(stdout=json.dumps({"success": True, "workItems": existing_items}))
+            if cmd[:2] == ["wl", "create"]:
+                n = sum(1 for c in calls if c[:2] == ["wl", "create"])
+                return _cp(stdout=json.dumps({"workItem": {"id": f"SA-NEW{n}"}}))
+            raise FileNotFoundError(cmd[0])
+
+        monkeypatch.setattr(wc.shutil, "which", lambda name: "/usr/bin/wl")
+        monkeypatch.setattr(subprocess, "run", _fake_run)
+        return calls
+
+    def test_lists_refactor_items_once(self, monkeypatch, temp_dir):
+        from skill.refactor.workitem_creation import create_smell_work_items
+
+        source = temp_dir / "mod.py"
+        source.write_text("import os\n")
+        calls = self._fake_wl(monkeypatch, [])
+
+        results = create_smell_work_items([self._smell(source, n) for n in range(1, 101)])
+
+        assert len(results) == 100
+        assert sum(1 for c in calls if c[:2] == ["wl", "list"]) == 1
+
+    def test_existing_items_matched_by_canonical_key(self, monkeypatch, temp_dir):
+        from skill.refactor.workitem_creation import (
+            build_smell_description,
+            create_smell_work_items,
+        )
+
+        source = temp_dir / "mod.py"
+        source.write_text("import os\n")
+        tracked = self._smell(source, 3)
+        # Recorded with a non-normalized path and a different case.
+        recorded = dict(tracked, file=str(temp_dir / "." / "MOD.py"))
+        calls = self._fake_wl(monkeypatch, [{
+            "id": "SA-OLD", "title": "Refactor: Unused Import in mod.py",
+            "description": build_smell_description(recorded),
+        }])
+
+        # Line 30 shares every substring with line 3 but is a different key.
+        results = create_smell_work_items([tracked, self._smell(source, 30)])
+
+        assert results == ["SA-NEW1"]
+        created = [c for c in calls if c[:2] == ["wl", "create"]]
+        assert "- **Line:** 30" in created[0][created[0].index("--description") + 1]
+
+    def test_unstructured_items_use_substring_match(self, monkeypatch, temp_dir):
+        from skill.refactor.workitem_creation import create_smell_work_items
+
+        source = temp_dir / "mod.py"
+        source.write_text("import os\n")
+        self._fake_wl(monkeypatch, [{
+            "id": "SA-HAND", "title": "Clean up imports",
+            "description": f"F401 at {source} line 7",
+        }])
+
+        assert create_smell_work_items([self._smell(source, 7)]) == []
+
+    def test_reads_each_source_file_once(self, monkeypatch, temp_dir):
+        import skill.refactor.workitem_creation as wc
+
+        source = temp_dir / "mod.py"
+        source.write_text(
+            "# <!-- REFACTOR-SA-1\n# smell: security\n# -->\nimport os\n"
+        )
+        self._fake_wl(monkeypatch, [])
+        reads: list[str] = []
+        real = wc.existing_smell_comments
+        monkeypatch.setattr(
+            wc, "existing_smell_comments", lambda path: reads.append(path) or real(path)
+        )
+
+        smells = [self._smell(source, n) for n in range(1, 6)]
+        smells.append(self._smell(source, 9, code="S105", smell_type="security"))
+        results = wc.create_smell_work_items(smells)
+
+        assert reads == [str(source)]
+        assert len(results) == 5  # the security smell already has a comment
+
+    def test_repeated_smell_in_batch_created_once(self, monkeypatch, temp_dir):
+        from skill.refactor.workitem_creation import create_smell_work_items
+
+        source = temp_dir / "mod.py"
+        source.write_text("import os\n")
+        calls = self._fake_wl(monkeypatch, [])
+
+        results = create_smell_work_items([self._smell(source, 4), self._smell(source, 4)])
+
+        assert results == ["SA-NEW1"]
+        assert sum(1 for c in calls if c[:2] == ["wl", "create"]) == 1
+
+
 # ---------------------------------------------------------------------------
 # Tests: Error Handling
 # ---------------------------------------------------------------------------